@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,10 +11,19 @@ _src_path = _file_path.parents[3]  # Go up to src directory
 if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
+from ImagePRO.human_analysis.inference import inference_image
+from ImagePRO.human_analysis.roi_tracking import RoiTracker
+from ImagePRO.human_analysis.speed_profiles import (
+    DEFAULT_SPEED_PROFILE,
+    SpeedProfile,
+    profile_settings,
+)
 from ImagePRO.utils.image import Image
+from ImagePRO.utils.live import run_live
 from ImagePRO.utils.result import Result
 
 import cv2
+import numpy as np
 
 if TYPE_CHECKING:  # mediapipe is imported lazily inside the functions
     import mediapipe as mp
@@ -29,7 +39,9 @@ def detect_body_pose(
     *,
     min_confidence: float = DEFAULT_CONFIDENCE,
     landmarks_idx: list[int] | None = None,
-    pose_obj: mp.solutions.pose.Pose | None = None
+    pose_obj: mp.solutions.pose.Pose | None = None,
+    inference_max_side: int | None = None,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
 ) -> Result:
     """Detect body landmarks in an image using MediaPipe Pose.
 
@@ -47,6 +59,15 @@ def detect_body_pose(
         pose_obj: Pre-initialized pose detector.
             If None, creates new instance.
             Default: None
+        inference_max_side: Downscale the image so its longest side is at
+            most this many pixels before color conversion and inference.
+            Landmarks are normalized, so they stay valid for the original
+            image, and annotations are drawn at full resolution.
+            Default: None (full resolution)
+        speed_profile: "fast", "balanced" or "accurate"; selects the Pose
+            model_complexity (0, 1 or 2) when pose_obj is None, see
+            ``speed_profiles``.
+            Default: "balanced"
 
     Returns:
         Result object with detections and visualization:
@@ -58,6 +79,8 @@ def detect_body_pose(
         TypeError: If image is not an Image instance
         ValueError: If min_confidence not in [0,1]
         TypeError: If landmarks_idx is not list[int]
+        ValueError: If inference_max_side is not a positive integer
+        ValueError: If speed_profile is unknown
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
@@ -71,6 +94,10 @@ def detect_body_pose(
     ):
         raise TypeError("'landmarks_idx' must be a list of integers")
 
+    inference_frame = inference_image(image, inference_max_side)
+
+    settings = profile_settings(speed_profile, "body_pose")
+
     try:
         import mediapipe as mp
     except ImportError as err:
@@ -85,7 +112,8 @@ def detect_body_pose(
     if pose_obj is None:
         pose_obj = mp_pose.Pose(
             min_detection_confidence=min_confidence,
-            static_image_mode=True
+            static_image_mode=True,
+            **settings
         )
 
     # Use all landmarks if none specified
@@ -95,7 +123,7 @@ def detect_body_pose(
     # Prepare image
     h, w = image.shape[:2]
     img_copy = image._data.copy()
-    img_rgb = cv2.cvtColor(img_copy, cv2.COLOR_BGR2RGB)
+    img_rgb = inference_frame.as_rgb()
 
     # Detect pose
     result = pose_obj.process(img_rgb)
@@ -131,20 +159,57 @@ def detect_body_pose(
             "source": image,
             "operation": "detect_body_pose",
             "min_confidence": min_confidence,
-            "landmarks_idx": landmarks_idx
+            "landmarks_idx": landmarks_idx,
+            "inference_max_side": inference_max_side,
+            "speed_profile": speed_profile
         }
     )
 
 
-def detect_body_pose_live() -> None:
+def detect_body_pose_live(
+    *,
+    source: int | str | Path | Iterable[np.ndarray] = 0,
+    display: bool = True,
+    max_frames: int | None = None,
+    overlay: bool = False,
+    track_roi: bool = False,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
+) -> Result:
     """Start live webcam feed with real-time body pose detection.
 
     Opens the default camera and shows pose landmarks in real-time.
+    Capture, inference and display run on separate threads (see
+    ``run_live``), so a slow frame never stalls the camera.
     Press ESC to exit the application.
 
+    Args:
+        source: Camera index, video file, image directory, or iterable
+            of BGR frames.
+            Default: 0 (default camera)
+        display: Show the annotated frames in a window.
+            Default: True
+        max_frames: Stop after this many frames.
+            Default: None (until ESC or the end of the source)
+        overlay: Draw FPS and per-stage latency percentiles on the frames.
+            Default: False
+        track_roi: Analyze the full frame only every few frames (or when
+            the subject is lost) and a crop around it in between, see
+            ``RoiTracker``. Runs the model in static image mode.
+            Default: False
+        speed_profile: "fast", "balanced" or "accurate", see
+            ``detect_body_pose``.
+            Default: "balanced"
+
+    Returns:
+        Result object with loop statistics in meta, including per-stage
+        latency percentiles and FPS (see ``run_live``)
+
     Raises:
+        ValueError: If speed_profile is unknown
         RuntimeError: If camera cannot be accessed
     """
+    settings = profile_settings(speed_profile, "body_pose")
+
     try:
         import mediapipe as mp
     except ImportError as err:
@@ -153,47 +218,45 @@ def detect_body_pose_live() -> None:
             'detection. Install it with: pip install "ImagePRO-Python[mediapipe]"'
         ) from err
 
-    # Initialize camera
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    if not cap.isOpened():
-        raise RuntimeError("Cannot access webcam")
-
     # Initialize pose detector in tracking mode
     pose_obj = mp.solutions.pose.Pose(
         min_detection_confidence=DEFAULT_CONFIDENCE,
-        static_image_mode=False
+        static_image_mode=track_roi,
+        **settings
     )
 
-    try:
-        while True:
-            # Get frame
-            success, frame = cap.read()
-            if not success:
-                print("Failed to capture frame, skipping...")
-                continue
-
-            # Process frame
-            try:
-                result = detect_body_pose(
-                    image=Image.from_array(frame),
-                    min_confidence=DEFAULT_CONFIDENCE,
-                    pose_obj=pose_obj
-                )
-                display_frame = result.image
-            except (TypeError, ValueError):
-                # Fall back to raw frame if detection fails
-                display_frame = frame
-
-            # Show result
-            cv2.imshow('ImagePRO - Live Body Pose Detection', display_frame)
-
-            # Check for ESC key
-            if cv2.waitKey(5) & 0xFF == 27:
-                break
-    finally:
-        # Clean up resources
-        cap.release()
-        cv2.destroyAllWindows()
+    def analyze(image: Image) -> Result:
+        return detect_body_pose(
+            image=image,
+            min_confidence=DEFAULT_CONFIDENCE,
+            pose_obj=pose_obj,
+            speed_profile=speed_profile
+        )
+
+    tracker = RoiTracker(analyze) if track_roi else None
+
+    def infer(image: Image) -> Result | None:
+        try:
+            return tracker.process(image) if tracker is not None else analyze(image)
+        except (TypeError, ValueError):
+            return None
+
+    def postprocess(frame: np.ndarray, result: Result | None) -> np.ndarray:
+        # Fall back to raw frame if detection fails
+        return result.image if result is not None and result.image is not None else frame
+
+    return run_live(
+        source,
+        preprocess=Image.from_array,
+        infer=infer,
+        postprocess=postprocess,
+        render=lambda frame, annotated: annotated,
+        window_name="ImagePRO - Live Body Pose Detection",
+        display=display,
+        max_frames=max_frames,
+        camera_api=cv2.CAP_DSHOW,
+        overlay=overlay
+    )
 
 
 if __name__ == "__main__":
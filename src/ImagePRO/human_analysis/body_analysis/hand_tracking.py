@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,10 +11,19 @@ _src_path = _file_path.parents[3]  # Go up to src directory
 if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
+from ImagePRO.human_analysis.inference import inference_image
+from ImagePRO.human_analysis.roi_tracking import RoiTracker
+from ImagePRO.human_analysis.speed_profiles import (
+    DEFAULT_SPEED_PROFILE,
+    SpeedProfile,
+    profile_settings,
+)
 from ImagePRO.utils.image import Image
+from ImagePRO.utils.live import run_live
 from ImagePRO.utils.result import Result
 
 import cv2
+import numpy as np
 
 if TYPE_CHECKING:  # mediapipe is imported lazily inside the functions
     import mediapipe as mp
@@ -32,7 +42,9 @@ def detect_hands(
     max_hands: int = DEFAULT_MAX_HANDS,
     min_confidence: float = DEFAULT_MIN_CONFIDENCE,
     landmarks_idx: list[int] | None = None,
-    hands_obj: mp.solutions.hands.Hands | None = None
+    hands_obj: mp.solutions.hands.Hands | None = None,
+    inference_max_side: int | None = None,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
 ) -> Result:
     """Detect hand landmarks in an image using MediaPipe Hands.
 
@@ -53,6 +65,15 @@ def detect_hands(
         hands_obj: Pre-initialized hand detector.
             If None, creates new instance.
             Default: None
+        inference_max_side: Downscale the image so its longest side is at
+            most this many pixels before color conversion and inference.
+            Landmarks are normalized, so they stay valid for the original
+            image, and annotations are drawn at full resolution.
+            Default: None (full resolution)
+        speed_profile: "fast", "balanced" or "accurate"; "fast" selects
+            the lighter Hands model (model_complexity 0) when hands_obj is
+            None, see ``speed_profiles``.
+            Default: "balanced"
 
     Returns:
         Result object with detections and visualization:
@@ -65,6 +86,8 @@ def detect_hands(
         ValueError: If max_hands is not positive
         ValueError: If min_confidence not in [0,1]
         TypeError: If landmarks_idx is not list[int]
+        ValueError: If inference_max_side is not a positive integer
+        ValueError: If speed_profile is unknown
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
@@ -81,6 +104,10 @@ def detect_hands(
     ):
         raise TypeError("'landmarks_idx' must be a list of integers")
 
+    inference_frame = inference_image(image, inference_max_side)
+
+    settings = profile_settings(speed_profile, "hands")
+
     try:
         import mediapipe as mp
     except ImportError as err:
@@ -96,7 +123,8 @@ def detect_hands(
         hands_obj = mp_hands.Hands(
             min_detection_confidence=min_confidence,
             max_num_hands=max_hands,
-            static_image_mode=True
+            static_image_mode=True,
+            **settings
         )
 
     # Use all landmarks if none specified
@@ -105,7 +133,7 @@ def detect_hands(
 
     # Prepare image
     img_copy = image._data.copy()
-    img_rgb = cv2.cvtColor(img_copy, cv2.COLOR_BGR2RGB)
+    img_rgb = inference_frame.as_rgb()
 
     # Detect hands
     results = hands_obj.process(img_rgb)
@@ -147,18 +175,29 @@ def detect_hands(
             "operation": "detect_hands",
             "max_hands": max_hands,
             "min_confidence": min_confidence,
-            "landmarks_idx": landmarks_idx
+            "landmarks_idx": landmarks_idx,
+            "inference_max_side": inference_max_side,
+            "speed_profile": speed_profile
         }
     )
 
 
 def detect_hands_live(
     max_hands: int = DEFAULT_MAX_HANDS,
-    min_confidence: float = DEFAULT_MIN_CONFIDENCE
-) -> None:
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    *,
+    source: int | str | Path | Iterable[np.ndarray] = 0,
+    display: bool = True,
+    max_frames: int | None = None,
+    overlay: bool = False,
+    track_roi: bool = False,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
+) -> Result:
     """Start live webcam feed with real-time hand detection.
 
     Opens the default camera and shows hand landmarks in real-time.
+    Capture, inference and display run on separate threads (see
+    ``run_live``), so a slow frame never stalls the camera.
     Press ESC to exit.
 
     Args:
@@ -168,6 +207,26 @@ def detect_hands_live(
         min_confidence: Detection confidence threshold.
             Must be between 0 and 1.
             Default: 0.7
+        source: Camera index, video file, image directory, or iterable
+            of BGR frames.
+            Default: 0 (default camera)
+        display: Show the annotated frames in a window.
+            Default: True
+        max_frames: Stop after this many frames.
+            Default: None (until ESC or the end of the source)
+        overlay: Draw FPS and per-stage latency percentiles on the frames.
+            Default: False
+        track_roi: Analyze the full frame only every few frames (or when
+            the subject is lost) and a crop around it in between, see
+            ``RoiTracker``. Runs the model in static image mode.
+            Default: False
+        speed_profile: "fast", "balanced" or "accurate", see
+            ``detect_hands``.
+            Default: "balanced"
+
+    Returns:
+        Result object with loop statistics in meta, including per-stage
+        latency percentiles and FPS (see ``run_live``)
 
     Raises:
         ValueError: If parameters are invalid
@@ -180,6 +239,8 @@ def detect_hands_live(
     if not isinstance(min_confidence, (int, float)) or not (0.0 <= min_confidence <= 1.0):
         raise ValueError("'min_confidence' must be between 0.0 and 1.0")
 
+    settings = profile_settings(speed_profile, "hands")
+
     try:
         import mediapipe as mp
     except ImportError as err:
@@ -188,45 +249,43 @@ def detect_hands_live(
             'tracking. Install it with: pip install "ImagePRO-Python[mediapipe]"'
         ) from err
 
-    # Initialize camera
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    if not cap.isOpened():
-        raise RuntimeError("Cannot access webcam")
-
     # Initialize hand detector in tracking mode
     hands_obj = mp.solutions.hands.Hands(
         min_detection_confidence=min_confidence,
         max_num_hands=max_hands,
-        static_image_mode=False
+        static_image_mode=track_roi,
+        **settings
     )
 
-    try:
-        while True:
-            # Get frame
-            success, frame = cap.read()
-            if not success:
-                print("Failed to capture frame, skipping...")
-                continue
-
-            # Process frame
-            result = detect_hands(
-                image=Image.from_array(frame),
-                max_hands=max_hands,
-                min_confidence=min_confidence,
-                hands_obj=hands_obj
-            )
-            display_frame = result.image if result.image is not None else frame
-
-            # Show result
-            cv2.imshow('ImagePRO - Live Hand Detection', display_frame)
-
-            # Check for ESC key
-            if cv2.waitKey(5) & 0xFF == 27:
-                break
-    finally:
-        # Clean up resources
-        cap.release()
-        cv2.destroyAllWindows()
+    def analyze(image: Image) -> Result:
+        return detect_hands(
+            image=image,
+            max_hands=max_hands,
+            min_confidence=min_confidence,
+            hands_obj=hands_obj,
+            speed_profile=speed_profile
+        )
+
+    tracker = RoiTracker(analyze) if track_roi else None
+
+    def infer(image: Image) -> Result:
+        return tracker.process(image) if tracker is not None else analyze(image)
+
+    def postprocess(frame: np.ndarray, result: Result) -> np.ndarray:
+        return result.image if result.image is not None else frame
+
+    return run_live(
+        source,
+        preprocess=Image.from_array,
+        infer=infer,
+        postprocess=postprocess,
+        render=lambda frame, annotated: annotated,
+        window_name="ImagePRO - Live Hand Detection",
+        display=display,
+        max_frames=max_frames,
+        camera_api=cv2.CAP_DSHOW,
+        overlay=overlay
+    )
 
 
 if __name__ == "__main__":
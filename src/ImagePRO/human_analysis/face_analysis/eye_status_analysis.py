@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import math
 import sys
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 # Add src directory to path for absolute imports
 _file_path = Path(__file__).resolve()
@@ -10,19 +14,36 @@ _src_path = _file_path.parents[3]  # Go up to src directory
 if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
-from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh
+from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh, landmark_points
+from ImagePRO.human_analysis.speed_profiles import (
+    DEFAULT_SPEED_PROFILE,
+    SpeedProfile,
+    profile_settings,
+)
 from ImagePRO.utils.image import Image
+from ImagePRO.utils.live import run_live
 from ImagePRO.utils.result import Result
 
 import cv2
+import numpy as np
 
 if TYPE_CHECKING:  # mediapipe is imported lazily inside the functions
     import mediapipe as mp
 
 # Constants
+DEFAULT_MAX_FACES = 1
 DEFAULT_MIN_CONFIDENCE = 0.7
 DEFAULT_THRESHOLD = 0.2
 RIGHT_EYE_INDICES = [386, 374, 263, 362]  # MediaPipe right eye landmarks
+# Six-point EAR landmarks p1..p6 per eye: corner, two upper lid points,
+# corner, two lower lid points (p2/p6 and p3/p5 face each other)
+LEFT_EYE_EAR_INDICES = [33, 160, 158, 133, 153, 144]
+RIGHT_EYE_EAR_INDICES = [362, 385, 387, 263, 373, 380]
+DEFAULT_OPEN_THRESHOLD = 0.25  # Reopening threshold for blink hysteresis
+DEFAULT_MIN_BLINK = 0.05  # seconds
+DEFAULT_MAX_BLINK = 0.5  # seconds; longer closures count as long closures
+DEFAULT_PERCLOS_WINDOW = 60.0  # seconds
+DEFAULT_TRACK_TIMEOUT = 1.0  # seconds a missing face keeps its state
 
 
 def analyze_eye_status(
@@ -31,6 +52,7 @@ def analyze_eye_status(
     min_confidence: float = DEFAULT_MIN_CONFIDENCE,
     threshold: float = DEFAULT_THRESHOLD,
     face_mesh_obj: mp.solutions.face_mesh.FaceMesh | None = None,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
 ) -> Result:
     """Analyze if the right eye is open using Eye Aspect Ratio (EAR).
 
@@ -48,6 +70,9 @@ def analyze_eye_status(
         face_mesh_obj: Pre-initialized face mesh detector.
             If None, creates new instance in static mode.
             Default: None
+        speed_profile: "fast", "balanced" or "accurate" for the FaceMesh
+            created when face_mesh_obj is None, see ``analyze_face_mesh``.
+            Default: "balanced"
 
     Returns:
         Result object with eye status:
@@ -58,6 +83,7 @@ def analyze_eye_status(
     Raises:
         TypeError: If image is not an Image instance
         ValueError: If min_confidence not in [0,1]
+        ValueError: If speed_profile is unknown
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
@@ -67,6 +93,8 @@ def analyze_eye_status(
     if not 0 <= min_confidence <= 1:
         raise ValueError("'min_confidence' must be between 0 and 1")
 
+    settings = profile_settings(speed_profile, "face_mesh")
+
     try:
         import mediapipe as mp
     except ImportError as err:
@@ -82,8 +110,8 @@ def analyze_eye_status(
     if face_mesh_obj is None:
         face_mesh_obj = mp.solutions.face_mesh.FaceMesh(
             min_detection_confidence=min_confidence,
-            refine_landmarks=True,
-            static_image_mode=True
+            static_image_mode=True,
+            **settings
         )
 
     # Get face landmarks
@@ -92,7 +120,8 @@ def analyze_eye_status(
         max_faces=1,
         min_confidence=min_confidence,
         landmarks_idx=RIGHT_EYE_INDICES,
-        face_mesh_obj=face_mesh_obj
+        face_mesh_obj=face_mesh_obj,
+        speed_profile=speed_profile
     )
     landmarks = mesh_result.data
 
@@ -110,16 +139,9 @@ def analyze_eye_status(
             }
         )
 
-    # Map landmarks by index
-    eye_points = {lm[1]: lm for lm in landmarks[0]}
-
-    try:
-        # Extract key points (scale to image dimensions)
-        top_y = eye_points[386][3] * h       # Top of eye
-        bottom_y = eye_points[374][3] * h    # Bottom of eye
-        left_x = eye_points[263][2] * w      # Left corner
-        right_x = eye_points[362][2] * w     # Right corner
-    except KeyError as e:
+    # Gather the eye landmarks of the first face
+    gathered = landmark_points(landmarks, RIGHT_EYE_INDICES)
+    if gathered is None:
         return Result(
             image=None,
             data=None,
@@ -128,19 +150,22 @@ def analyze_eye_status(
                 "operation": "analyze_eye_status",
                 "min_confidence": min_confidence,
                 "threshold": threshold,
-                "error": f"Missing landmark: {e}"
+                "error": f"Missing landmark: expected indices {RIGHT_EYE_INDICES}"
             }
         )
 
+    # Scale to image dimensions: top, bottom, left corner, right corner
+    top, bottom, left, right = gathered[1][0] * (w, h)
+
     # Calculate Eye Aspect Ratio (EAR)
-    vertical_dist = abs(bottom_y - top_y)
-    horizontal_dist = abs(right_x - left_x)
+    vertical_dist = abs(bottom[1] - top[1])
+    horizontal_dist = abs(right[0] - left[0])
 
     # Determine eye state
     is_open = False
     if horizontal_dist > 0:  # Avoid division by zero
         ear = vertical_dist / horizontal_dist
-        is_open = ear > threshold
+        is_open = bool(ear > threshold)
 
     return Result(
         image=None,
@@ -154,27 +179,356 @@ def analyze_eye_status(
     )
 
 
+def compute_eye_aspect_ratios(points: np.ndarray) -> np.ndarray:
+    """Six-point Eye Aspect Ratio of many eyes at once.
+
+    EAR = (|p2 - p6| + |p3 - p5|) / (2 * |p1 - p4|) (Soukupova and Cech,
+    2016); about 0.25-0.35 for an open eye and near 0 for a closed one.
+
+    Args:
+        points: Pixel coordinates of p1..p6, shape (..., 6, 2), e.g.
+            (F, 2, 6, 2) for both eyes of F faces.
+
+    Returns:
+        EAR per eye with the leading shape of points, e.g. (F, 2).
+        Eyes with zero width get 0.
+
+    Raises:
+        ValueError: If the last two dimensions are not (6, 2)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim < 2 or points.shape[-2:] != (6, 2):
+        raise ValueError("'points' must have shape (..., 6, 2)")
+
+    p1, p2, p3, p4, p5, p6 = (points[..., i, :] for i in range(6))
+    vertical = np.linalg.norm(p2 - p6, axis=-1) + np.linalg.norm(p3 - p5, axis=-1)
+    horizontal = 2 * np.linalg.norm(p1 - p4, axis=-1)
+    return np.divide(vertical, horizontal, out=np.zeros_like(vertical), where=horizontal > 0)
+
+
+def analyze_eyes(
+    image: Image,
+    *,
+    max_faces: int = DEFAULT_MAX_FACES,
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    threshold: float = DEFAULT_THRESHOLD,
+    face_mesh_obj: mp.solutions.face_mesh.FaceMesh | None = None,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
+) -> Result:
+    """Six-point EAR of both eyes for every detected face.
+
+    The eye landmarks of all faces are gathered into one (F, 2, 6, 2)
+    array and the ratios are computed in a single vectorized step.
+    A face counts as open if the mean EAR of its eyes exceeds threshold.
+
+    Args:
+        image: Input image to process.
+        max_faces: Maximum number of faces to analyze.
+            Must be positive.
+            Default: 1
+        min_confidence: Detection confidence threshold.
+            Must be between 0 and 1.
+            Default: 0.7
+        threshold: Mean EAR above which the eyes are open.
+            Default: 0.2
+        face_mesh_obj: Pre-initialized face mesh detector.
+            If None, creates new instance in static mode.
+            Default: None
+        speed_profile: "fast", "balanced" or "accurate" for the FaceMesh
+            created when face_mesh_obj is None, see ``analyze_face_mesh``.
+            Default: "balanced"
+
+    Returns:
+        Result object with eye states:
+        - data: List of [face_id, left_ear, right_ear, is_open] per face
+            None if detection fails
+        - meta: Operation info and error details if failed
+
+    Raises:
+        TypeError: If image is not an Image instance
+        TypeError: If min_confidence is not a number
+        ValueError: If max_faces is not positive
+        ValueError: If min_confidence not in [0,1]
+        ValueError: If speed_profile is unknown
+    """
+    if not isinstance(image, Image):
+        raise TypeError("'image' must be an Image instance")
+
+    if not isinstance(max_faces, int) or isinstance(max_faces, bool) or max_faces <= 0:
+        raise ValueError("'max_faces' must be positive")
+
+    if not isinstance(min_confidence, (int, float)):
+        raise TypeError("'min_confidence' must be a number")
+    if not 0 <= min_confidence <= 1:
+        raise ValueError("'min_confidence' must be between 0 and 1")
+
+    meta = {
+        "source": image,
+        "operation": "analyze_eyes",
+        "max_faces": max_faces,
+        "min_confidence": min_confidence,
+        "threshold": threshold
+    }
+
+    # Get face landmarks for both eyes
+    eye_indices = LEFT_EYE_EAR_INDICES + RIGHT_EYE_EAR_INDICES
+    mesh_result = analyze_face_mesh(
+        image=image,
+        max_faces=max_faces,
+        min_confidence=min_confidence,
+        landmarks_idx=eye_indices,
+        face_mesh_obj=face_mesh_obj,
+        speed_profile=speed_profile
+    )
+
+    # Handle no detections
+    if not mesh_result.data:
+        return Result(image=None, data=None, meta={**meta, "error": "No face landmarks detected"})
+
+    gathered = landmark_points(mesh_result.data, eye_indices)
+    if gathered is None:
+        return Result(image=None, data=None, meta={**meta, "error": "Missing required landmarks"})
+
+    # (F, 12, 2) normalized -> (F, 2 eyes, 6 points, 2) pixels
+    face_ids, points = gathered
+    h, w = image.shape[:2]
+    ears = compute_eye_aspect_ratios((points * (w, h)).reshape(len(face_ids), 2, 6, 2))
+    is_open = ears.mean(axis=1) > threshold
+
+    eye_data = [
+        [face_id, float(left), float(right), bool(face_open)]
+        for face_id, (left, right), face_open in zip(face_ids, ears, is_open)
+    ]
+    return Result(image=None, data=eye_data, meta=meta)
+
+
+@dataclass
+class _EyeTrack:
+    """Constant-size blink state of one face."""
+
+    closed: bool = False
+    closed_since: float = 0.0
+    last_seen: float = 0.0
+    blinks: int = 0
+    long_closures: int = 0
+    perclos: float = 0.0
+
+
+class BlinkDetector:
+    """
+    Streaming blink and PERCLOS detection from per-frame EAR.
+
+    Eyes close when the EAR drops below ``close_threshold`` and reopen
+    when it rises above ``open_threshold``; the gap between the two keeps
+    noise around a single threshold from producing extra blinks. A
+    closure lasting ``min_blink`` to ``max_blink`` seconds counts as a
+    blink, a longer one as a long closure (a drowsiness sign).
+
+    PERCLOS, the share of time the eyes are closed, is tracked as an
+    exponential moving average with a time constant of ``perclos_window``
+    seconds, so every face keeps a fixed handful of numbers no matter how
+    long the stream runs or how irregular its frame times are.
+
+    Example:
+        >>> detector = BlinkDetector()
+        >>> for frame in frames:
+        ...     result = analyze_eyes(image=frame, max_faces=4, face_mesh_obj=mesh)
+        ...     rows = result.data or []
+        ...     states = detector.update(
+        ...         [row[0] for row in rows], [(row[1] + row[2]) / 2 for row in rows],
+        ...         timestamp=time.perf_counter())
+
+    Attributes:
+        close_threshold (float): EAR below which the eyes close.
+        open_threshold (float): EAR above which closed eyes reopen.
+        min_blink (float): Shortest closure counted as a blink, in seconds.
+        max_blink (float): Longest closure counted as a blink, in seconds.
+        perclos_window (float): PERCLOS time constant in seconds.
+        track_timeout (float): Seconds a face may be missing before its
+            state is dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        close_threshold: float = DEFAULT_THRESHOLD,
+        open_threshold: float = DEFAULT_OPEN_THRESHOLD,
+        min_blink: float = DEFAULT_MIN_BLINK,
+        max_blink: float = DEFAULT_MAX_BLINK,
+        perclos_window: float = DEFAULT_PERCLOS_WINDOW,
+        track_timeout: float = DEFAULT_TRACK_TIMEOUT
+    ) -> None:
+        """
+        Configure the detector.
+
+        Raises:
+            ValueError: If a setting is not a positive number,
+                open_threshold is below close_threshold, or max_blink is
+                below min_blink.
+        """
+        settings = {
+            "close_threshold": close_threshold,
+            "open_threshold": open_threshold,
+            "min_blink": min_blink,
+            "max_blink": max_blink,
+            "perclos_window": perclos_window,
+            "track_timeout": track_timeout,
+        }
+        for label, value in settings.items():
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+                raise ValueError(f"'{label}' must be a positive number")
+        if open_threshold < close_threshold:
+            raise ValueError("'open_threshold' must not be below 'close_threshold'")
+        if max_blink < min_blink:
+            raise ValueError("'max_blink' must not be below 'min_blink'")
+
+        self.close_threshold = float(close_threshold)
+        self.open_threshold = float(open_threshold)
+        self.min_blink = float(min_blink)
+        self.max_blink = float(max_blink)
+        self.perclos_window = float(perclos_window)
+        self.track_timeout = float(track_timeout)
+        self._tracks: dict[Hashable, _EyeTrack] = {}
+
+    @property
+    def ids(self) -> list[Hashable]:
+        """Ids currently tracked."""
+        return list(self._tracks)
+
+    def reset(self) -> None:
+        """Drop every track."""
+        self._tracks.clear()
+
+    def update(
+        self,
+        ids: Iterable[Hashable],
+        ears: Iterable[float],
+        *,
+        timestamp: float
+    ) -> list[dict[str, Any]]:
+        """
+        Feed one frame of EAR values.
+
+        Args:
+            ids: Face id of every value.
+            ears: EAR per face (e.g. the mean of both eyes).
+            timestamp: Frame time in seconds.
+
+        Returns:
+            list[dict]: Per face, in input order: face_id, ear, closed,
+            blink (a blink ended on this frame), long_closure (a long
+            closure ended on this frame), closed_for (seconds of the
+            current closure, 0 while open), blinks, long_closures and
+            perclos (0-1).
+
+        Raises:
+            ValueError: If ids and ears differ in length.
+        """
+        ids = list(ids)
+        ears = [float(ear) for ear in ears]
+        if len(ids) != len(ears):
+            raise ValueError("'ids' and 'ears' must have the same length")
+
+        states = []
+        for face_id, ear in zip(ids, ears):
+            track = self._tracks.get(face_id)
+            if track is None:
+                track = self._tracks[face_id] = _EyeTrack(last_seen=timestamp)
+
+            # PERCLOS: time-weighted EMA of the state held since the last frame
+            dt = max(timestamp - track.last_seen, 0.0)
+            weight = 1.0 - math.exp(-dt / self.perclos_window)
+            track.perclos += weight * (float(track.closed) - track.perclos)
+            track.last_seen = timestamp
+
+            blink = long_closure = False
+            if not track.closed and ear < self.close_threshold:
+                track.closed = True
+                track.closed_since = timestamp
+            elif track.closed and ear > self.open_threshold:
+                track.closed = False
+                duration = timestamp - track.closed_since
+                if duration > self.max_blink:
+                    long_closure = True
+                    track.long_closures += 1
+                elif duration >= self.min_blink:
+                    blink = True
+                    track.blinks += 1
+
+            states.append({
+                "face_id": face_id,
+                "ear": ear,
+                "closed": track.closed,
+                "blink": blink,
+                "long_closure": long_closure,
+                "closed_for": timestamp - track.closed_since if track.closed else 0.0,
+                "blinks": track.blinks,
+                "long_closures": track.long_closures,
+                "perclos": track.perclos,
+            })
+
+        # Forget faces that have been missing for too long
+        for face_id in [
+            face_id for face_id, track in self._tracks.items()
+            if timestamp - track.last_seen > self.track_timeout
+        ]:
+            del self._tracks[face_id]
+        return states
+
+
 def analyze_eye_status_live(
     *,
     min_confidence: float = DEFAULT_MIN_CONFIDENCE,
-    threshold: float = DEFAULT_THRESHOLD
-) -> None:
-    """Run live eye status detection using webcam feed.
+    threshold: float = DEFAULT_THRESHOLD,
+    source: int | str | Path | Iterable[np.ndarray] = 0,
+    display: bool = True,
+    max_frames: int | None = None,
+    overlay: bool = False,
+    max_faces: int = DEFAULT_MAX_FACES,
+    blink_detector: BlinkDetector | None = None,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
+) -> Result:
+    """Run live eye status and blink detection using webcam feed.
 
-    Opens a window displaying webcam feed with overlaid eye status.
-    Press ESC to exit.
+    Opens a window displaying webcam feed with overlaid eye status,
+    blink count and PERCLOS per face. Frames are captured, analyzed and
+    drawn on separate threads (see ``run_live``). Press ESC to exit.
 
     Args:
         min_confidence: Detection confidence threshold.
             Must be between 0 and 1.
             Default: 0.7
-        threshold: EAR threshold for open vs closed.
-            Eye considered open if EAR > threshold.
+        threshold: Mean six-point EAR above which the eyes are open.
             Default: 0.2
+        source: Camera index, video file, image directory, or iterable
+            of BGR frames.
+            Default: 0 (default camera)
+        display: Show the annotated frames in a window.
+            Default: True
+        max_frames: Stop after this many frames.
+            Default: None (until ESC or the end of the source)
+        overlay: Draw FPS and per-stage latency percentiles on the frames.
+            Default: False
+        max_faces: Maximum number of faces to analyze per frame.
+            Default: 1
+        blink_detector: Detector fed with the mean EAR of every face.
+            Default: None (a BlinkDetector closing below threshold)
+        speed_profile: "fast", "balanced" or "accurate", see
+            ``analyze_face_mesh``.
+            Default: "balanced"
+
+    Returns:
+        Result object with loop statistics in meta, including per-stage
+        latency percentiles and FPS (see ``run_live``), plus "blinks":
+        the final blink state of every tracked face
 
     Raises:
         TypeError: If min_confidence is not a number
         ValueError: If min_confidence not in [0,1]
+        ValueError: If max_faces is not positive
+        ValueError: If threshold is not positive (default detector)
+        TypeError: If blink_detector is not a BlinkDetector
+        ValueError: If speed_profile is unknown
         RuntimeError: If webcam cannot be accessed
     """
     # Validate inputs
@@ -182,6 +536,16 @@ def analyze_eye_status_live(
         raise TypeError("'min_confidence' must be a number")
     if not 0 <= min_confidence <= 1:
         raise ValueError("'min_confidence' must be between 0 and 1")
+    if not isinstance(max_faces, int) or isinstance(max_faces, bool) or max_faces <= 0:
+        raise ValueError("'max_faces' must be positive")
+    if blink_detector is not None and not isinstance(blink_detector, BlinkDetector):
+        raise TypeError("'blink_detector' must be a BlinkDetector instance")
+    settings = profile_settings(speed_profile, "face_mesh")
+
+    if blink_detector is None:
+        blink_detector = BlinkDetector(
+            close_threshold=threshold, open_threshold=max(threshold, DEFAULT_OPEN_THRESHOLD)
+        )
 
     try:
         import mediapipe as mp
@@ -191,62 +555,69 @@ def analyze_eye_status_live(
             'analysis. Install it with: pip install "ImagePRO-Python[mediapipe]"'
         ) from err
 
-    # Initialize webcam
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    if not cap.isOpened():
-        raise RuntimeError("Failed to access webcam")
-
     # Initialize face mesh detector for video
     face_mesh = mp.solutions.face_mesh.FaceMesh(
-        max_num_faces=1,
+        max_num_faces=max_faces,
         min_detection_confidence=min_confidence,
-        refine_landmarks=True,
-        static_image_mode=False  # Optimize for video
+        static_image_mode=False,  # Optimize for video
+        **settings
     )
-
-    try:
-        while True:
-            # Read frame
-            ret, frame = cap.read()
-            if not ret:
-                print("Warning: Failed to read frame, skipping...")
-                continue
-
-            # Process frame
-            try:
-                img = Image.from_array(frame)
-                result = analyze_eye_status(
-                    image=img,
-                    min_confidence=min_confidence,
-                    face_mesh_obj=face_mesh,
-                    threshold=threshold
-                )
-                status = "Open" if result.data else "Closed"
-            except (TypeError, ValueError):
-                status = "No face"
-
-            # Draw results
-            color = (0, 255, 0) if status == "Open" else (0, 0, 255)
-            cv2.putText(
-                frame,
-                f"Eye: {status}",
-                (10, 40),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.7,
-                color,
-                2
+    last_states: dict[Hashable, dict[str, Any]] = {}
+
+    def infer(image: Image) -> list[dict[str, Any]]:
+        timestamp = time.perf_counter()
+        try:
+            result = analyze_eyes(
+                image=image,
+                max_faces=max_faces,
+                min_confidence=min_confidence,
+                threshold=threshold,
+                face_mesh_obj=face_mesh,
+                speed_profile=speed_profile
             )
-
-            # Display frame
-            cv2.imshow("ImagePRO - Eye Status", frame)
-
-            # Check for ESC key
-            if cv2.waitKey(5) & 0xFF == 27:
-                break
-
-    finally:
-        cap.release()
-        cv2.destroyAllWindows()
+            rows = result.data or []
+        except (TypeError, ValueError):
+            rows = []
+
+        # The detector runs on the inference thread only, in frame order
+        states = blink_detector.update(
+            [row[0] for row in rows],
+            [(row[1] + row[2]) / 2 for row in rows],
+            timestamp=timestamp
+        )
+        last_states.update((state["face_id"], state) for state in states)
+        return states
+
+    def render(frame: np.ndarray, states: list[dict[str, Any]]) -> np.ndarray:
+        frame = frame.copy()
+        if not states:
+            cv2.putText(frame, "No face", (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+        for i, state in enumerate(states):
+            status = "Closed" if state["closed"] else "Open"
+            color = (0, 0, 255) if state["closed"] else (0, 255, 0)
+            text = (
+                f"Face {int(state['face_id']) + 1}: {status}, blinks {state['blinks']}, "
+                f"PERCLOS {100 * state['perclos']:.0f}%"
+            )
+            cv2.putText(frame, text, (10, 40 + i * 25), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+        return frame
+
+    result = run_live(
+        source,
+        preprocess=Image.from_array,
+        infer=infer,
+        render=render,
+        window_name="ImagePRO - Eye Status",
+        display=display,
+        max_frames=max_frames,
+        camera_api=cv2.CAP_DSHOW,
+        overlay=overlay
+    )
+    result.meta["blinks"] = {
+        face_id: {key: state[key] for key in ("blinks", "long_closures", "perclos")}
+        for face_id, state in last_states.items()
+    }
+    return result
 
 
 if __name__ == "__main__":
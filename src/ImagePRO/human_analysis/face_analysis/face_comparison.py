@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import sys
+import threading
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 # Add src directory to path for absolute imports
 _file_path = Path(__file__).resolve()
@@ -10,11 +16,10 @@ _src_path = _file_path.parents[3]  # Go up to src directory
 if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
-import os
-
-import cv2
 import numpy as np
 
+from ImagePRO.human_analysis.face_analysis.face_detection import align_faces
+from ImagePRO.utils.atomic_io import write_json_atomic
 from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
 
@@ -25,13 +30,91 @@ if TYPE_CHECKING:  # insightface is imported lazily inside the function
 DEFAULT_SIMILARITY_THRESHOLD = 0.5
 DEFAULT_MODEL_NAME = "buffalo_l"
 DEFAULT_PROVIDER = "CPUExecutionProvider"
+DEFAULT_DET_SIZE = (640, 640)  # Detector input; smaller is faster, finds fewer small faces
+DET_SIZE_STRIDE = 32  # The detector's largest feature stride
+FACE_ANALYSIS_MODULES = ("detection", "recognition")  # Skips landmark/attribute models
+APP_CACHE_SIZE = 4
+DEFAULT_EMBEDDING_BATCH_SIZE = 64  # Aligned crops per recognition call
+DEFAULT_CHECKPOINT_EVERY = 1000  # Images between checkpoints
+EMBEDDING_SIZE = 512  # ArcFace embedding length of the buffalo models
+EMBEDDING_MANIFEST = "embeddings.json"
+
+# Serializes model loading so concurrent first calls share one app
+_app_lock = threading.Lock()
+
+
+def get_face_analysis_app(
+    *,
+    det_size: tuple[int, int] = DEFAULT_DET_SIZE,
+    model_name: str = DEFAULT_MODEL_NAME,
+    provider: str = DEFAULT_PROVIDER
+) -> FaceAnalysis:
+    """Shared, prepared FaceAnalysis with only detection and recognition.
+
+    The first call per setting loads the models, later calls from any
+    thread get the same instance; ONNX Runtime sessions may be run from
+    several threads at once. The landmark and gender/age models of the
+    model pack are never loaded.
+
+    Args:
+        det_size: Detector input (width, height); both multiples of 32.
+            Smaller sizes are faster but miss small faces.
+            Default: (640, 640)
+        model_name: InsightFace model pack.
+            Default: "buffalo_l"
+        provider: ONNX Runtime execution provider.
+            Default: "CPUExecutionProvider"
+
+    Returns:
+        Prepared FaceAnalysis instance, shared by all callers
+
+    Raises:
+        ValueError: If det_size is not two positive multiples of 32
+    """
+    if (
+        not isinstance(det_size, (tuple, list))
+        or len(det_size) != 2
+        or not all(
+            isinstance(side, int) and not isinstance(side, bool)
+            and side > 0 and side % DET_SIZE_STRIDE == 0
+            for side in det_size
+        )
+    ):
+        raise ValueError(f"'det_size' must be two positive multiples of {DET_SIZE_STRIDE}")
+
+    with _app_lock:
+        return _load_face_analysis_app(tuple(det_size), model_name, provider)
+
+
+@lru_cache(maxsize=APP_CACHE_SIZE)
+def _load_face_analysis_app(
+    det_size: tuple[int, int], model_name: str, provider: str
+) -> FaceAnalysis:
+    """Load and prepare a FaceAnalysis; cached by ``get_face_analysis_app``."""
+    try:
+        from insightface.app import FaceAnalysis
+    except ImportError as err:
+        raise ImportError(
+            "The optional 'insightface' dependency is required for face "
+            'comparison. Install it with: pip install '
+            '"ImagePRO-Python[insightface]"'
+        ) from err
+
+    app = FaceAnalysis(
+        name=model_name,
+        allowed_modules=list(FACE_ANALYSIS_MODULES),
+        providers=[provider]
+    )
+    app.prepare(ctx_id=0, det_size=det_size)  # Use CPU
+    return app
 
 
 def compare_faces(
     image_1: Image,
     image_2: Image,
     *,
-    app: FaceAnalysis | None = None
+    app: FaceAnalysis | None = None,
+    det_size: tuple[int, int] = DEFAULT_DET_SIZE
 ) -> Result:
     """Compare two face images to determine if they are the same person.
 
@@ -44,8 +127,10 @@ def compare_faces(
         image_2: Second image to compare.
             Must contain a clearly visible face.
         app: Pre-initialized FaceAnalysis model.
-            If None, creates new instance.
+            If None, uses the shared ``get_face_analysis_app`` instance.
             Default: None
+        det_size: Detector input size of the shared app.
+            Default: (640, 640)
 
     Returns:
         Result object with comparison results:
@@ -57,7 +142,7 @@ def compare_faces(
 
     Raises:
         TypeError: If either image is not an Image instance
-        FileNotFoundError: If image data cannot be loaded
+        ValueError: If det_size is invalid (shared app only)
     """
     # Validate inputs
     if not isinstance(image_1, Image):
@@ -65,86 +150,320 @@ def compare_faces(
     if not isinstance(image_2, Image):
         raise TypeError("'image_2' must be an Image instance")
 
-    try:
-        from insightface.app import FaceAnalysis
-    except ImportError as err:
-        raise ImportError(
-            "The optional 'insightface' dependency is required for face "
-            'comparison. Install it with: pip install '
-            '"ImagePRO-Python[insightface]"'
-        ) from err
-
-    # Initialize model if needed
+    # Load the shared model once per process
     if app is None:
-        app = FaceAnalysis(
-            name=DEFAULT_MODEL_NAME,
-            providers=[DEFAULT_PROVIDER]
-        )
-        app.prepare(ctx_id=0)  # Use CPU
-
-    def save_temp_image(image: Image, temp_name: str) -> str:
-        """Save image data to temporary file if needed."""
-        if image.source_type == 'path':
-            return image.path
-        temp_path = os.path.join(os.getcwd(), temp_name)
-        cv2.imwrite(temp_path, image._data)
-        return temp_path
+        app = get_face_analysis_app(det_size=det_size)
 
-    def load_rgb_image(path: str) -> np.ndarray | None:
-        """Load image file and convert to RGB."""
-        img = cv2.imread(str(path))
-        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB) if img is not None else None
+    # InsightFace models take OpenCV-order BGR input; the conversion is cached on each Image
+    img1 = image_1.as_bgr()
+    img2 = image_2.as_bgr()
 
-    try:
-        # Save images to disk if needed
-        path_1 = save_temp_image(image_1, 'tmp1.jpg')
-        path_2 = save_temp_image(image_2, 'tmp2.jpg')
-
-        # Load and preprocess images
-        img1 = load_rgb_image(path_1)
-        img2 = load_rgb_image(path_2)
-
-        if img1 is None or img2 is None:
-            raise FileNotFoundError("Failed to load one or both images")
-
-        # Detect faces
-        faces1 = app.get(img1)
-        faces2 = app.get(img2)
-
-        # Validate detections
-        if not faces1 or not faces2:
-            return Result(
-                image=None,
-                data=None,
-                meta={
-                    "source": (image_1, image_2),
-                    "operation": "compare_faces",
-                    "error": "No face detected in one or both images"
-                }
-            )
-
-        # Extract embeddings
-        emb1 = faces1[0].embedding
-        emb2 = faces2[0].embedding
-
-        # Calculate similarity
-        similarity = np.dot(emb1, emb2) / (np.linalg.norm(emb1) * np.linalg.norm(emb2))
-        is_match = similarity > DEFAULT_SIMILARITY_THRESHOLD
+    # Detect faces
+    faces1 = app.get(img1)
+    faces2 = app.get(img2)
 
+    # Validate detections
+    if not faces1 or not faces2:
         return Result(
             image=None,
-            data=is_match,
+            data=None,
             meta={
                 "source": (image_1, image_2),
                 "operation": "compare_faces",
-                "similarity": float(similarity),
-                "threshold": DEFAULT_SIMILARITY_THRESHOLD
+                "error": "No face detected in one or both images"
             }
         )
 
-    finally:
-        # Cleanup temporary files
-        if image_1.source_type != 'path' and os.path.exists('tmp1.jpg'):
-            os.remove('tmp1.jpg')
-        if image_2.source_type != 'path' and os.path.exists('tmp2.jpg'):
-            os.remove('tmp2.jpg')
+    # Extract embeddings
+    emb1 = faces1[0].embedding
+    emb2 = faces2[0].embedding
+
+    # Calculate similarity
+    similarity = np.dot(emb1, emb2) / (np.linalg.norm(emb1) * np.linalg.norm(emb2))
+    is_match = similarity > DEFAULT_SIMILARITY_THRESHOLD
+
+    return Result(
+        image=None,
+        data=is_match,
+        meta={
+            "source": (image_1, image_2),
+            "operation": "compare_faces",
+            "similarity": float(similarity),
+            "threshold": DEFAULT_SIMILARITY_THRESHOLD
+        }
+    )
+
+
+def extract_face_embeddings(
+    images: Sequence[Image | str | Path],
+    *,
+    app: FaceAnalysis | None = None,
+    det_size: tuple[int, int] = DEFAULT_DET_SIZE,
+    max_faces: int = 0,
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    normalize: bool = True,
+    checkpoint_dir: str | Path | None = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    resume: bool = True
+) -> Result:
+    """Extract face embeddings from many images with batched recognition.
+
+    ``app.get`` runs the recognition model once per face. Here every
+    image only goes through the detector; its faces are warped into
+    aligned crops (see ``align_faces``) that are stacked into batches of
+    ``batch_size`` and embedded with one recognition call per batch.
+    Images are fed to both models in BGR order, as ``app.get`` in
+    ``compare_faces`` expects, so embeddings of both agree.
+
+    Paths are loaded one at a time, so large enrollment sets never need
+    to fit in memory. With ``checkpoint_dir``, finished embeddings are
+    written to "embeddings_<chunk:05d>.npz" files every
+    ``checkpoint_every`` images and a JSON manifest "embeddings.json"
+    records the progress; it is replaced atomically. Re-running with the
+    same images and settings after a crash continues after the last
+    checkpoint; the manifest stores a fingerprint of the image paths
+    (shape and dtype for in-memory arrays) to refuse a different list.
+
+    Args:
+        images: Image instances or paths, in a fixed order.
+        app: Prepared FaceAnalysis with detection and recognition models.
+            If None, uses the shared ``get_face_analysis_app`` instance.
+            Default: None
+        det_size: Detector input size of the shared app.
+            Default: (640, 640)
+        max_faces: Maximum faces per image, largest first; 0 keeps all.
+            Default: 0
+        batch_size: Aligned crops per recognition call.
+            Default: 64
+        normalize: Scale every embedding to unit length, so cosine
+            similarity becomes a dot product.
+            Default: True
+        checkpoint_dir: Folder for checkpoint files.
+            Default: None (no checkpoints)
+        checkpoint_every: Images between checkpoints.
+            Default: 1000
+        resume: Continue from an existing manifest. If False, the
+            checkpoint folder must not exist yet.
+            Default: True
+
+    Returns:
+        Result object with embeddings:
+        - image: None
+        - data: float32 array of shape (N, 512), one row per face
+        - meta: Operation info; "image_indices" (N,) position of each
+          face's image in images, "boxes" (N, 4) x1, y1, x2, y2,
+          "scores" (N,), "images_without_faces", "read_failures"
+          (indices of paths that could not be loaded) and "resumed_from"
+
+    Raises:
+        TypeError: If images is not a sequence of Image instances or paths
+        ValueError: If a numeric parameter or det_size is out of range
+        ValueError: If an existing manifest was written with other settings
+        FileExistsError: If resume is False and the checkpoint folder exists
+    """
+    if isinstance(images, (str, Path, Image)) or not isinstance(images, Sequence):
+        raise TypeError("'images' must be a sequence of Image instances or paths")
+
+    if not isinstance(max_faces, int) or isinstance(max_faces, bool) or max_faces < 0:
+        raise ValueError("'max_faces' must be a non-negative integer")
+
+    if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size <= 0:
+        raise ValueError("'batch_size' must be a positive integer")
+
+    if not isinstance(checkpoint_every, int) or isinstance(checkpoint_every, bool) or checkpoint_every <= 0:
+        raise ValueError("'checkpoint_every' must be a positive integer")
+
+    if not isinstance(normalize, bool) or not isinstance(resume, bool):
+        raise TypeError("'normalize' and 'resume' must be booleans")
+
+    # Load the shared model once per process
+    if app is None:
+        app = get_face_analysis_app(det_size=det_size)
+
+    manifest = {
+        "items": len(images),
+        "fingerprint": _input_fingerprint(images),
+        "max_faces": max_faces,
+        "normalize": normalize,
+        "next_item": 0,
+        "chunks": [],
+        "images_without_faces": 0,
+        "read_failures": [],
+        "done": False
+    }
+    folder = manifest_path = None
+    if checkpoint_dir is not None:
+        folder = Path(checkpoint_dir)
+        try:
+            folder.mkdir(parents=True, exist_ok=resume)
+        except FileExistsError as e:
+            raise FileExistsError(f"Checkpoint folder already exists: {folder}") from e
+        manifest_path = folder / EMBEDDING_MANIFEST
+        if resume and manifest_path.exists():
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+            settings = ("items", "fingerprint", "max_faces", "normalize")
+            if any(previous.get(key) != manifest[key] for key in settings):
+                raise ValueError(
+                    f"Manifest {manifest_path} was written with different settings; "
+                    "use the same images, max_faces and normalize to resume"
+                )
+            manifest = previous
+    resumed_from = manifest["next_item"]
+
+    # Embeddings of earlier runs, then the chunks of this one
+    chunks = [_read_embedding_chunk(folder / name) for name in manifest["chunks"]]
+    batcher = _EmbeddingBatcher(app.models["recognition"], batch_size, normalize)
+
+    def checkpoint() -> None:
+        chunk = batcher.take()
+        chunks.append(chunk)
+        if folder is None:
+            return
+        if len(chunk["embeddings"]):
+            name = f"embeddings_{len(manifest['chunks']):05d}.npz"
+            _write_embedding_chunk(folder / name, chunk)
+            manifest["chunks"].append(name)
+        write_json_atomic(manifest_path, manifest)
+
+    if not manifest["done"]:
+        for index in range(manifest["next_item"], len(images)):
+            item = images[index]
+            if isinstance(item, (str, Path)):
+                try:
+                    item = Image.from_path(item)
+                except ValueError:
+                    item = None
+            elif not isinstance(item, Image):
+                raise TypeError("'images' must contain Image instances or paths")
+
+            if item is None:
+                manifest["read_failures"].append(index)
+            else:
+                img = item.as_bgr()
+                bboxes, kpss = app.det_model.detect(img, max_num=max_faces, metric="default")
+                if bboxes is None or len(bboxes) == 0:
+                    manifest["images_without_faces"] += 1
+                else:
+                    crops = align_faces(
+                        Image.from_array(img, colorspace="BGR"),
+                        kpss,
+                        size=batcher.crop_size
+                    ).image
+                    batcher.add(crops, index, bboxes)
+
+            manifest["next_item"] = index + 1
+            if manifest["next_item"] % checkpoint_every == 0:
+                checkpoint()
+
+        manifest["done"] = True
+        checkpoint()
+
+    embeddings = [chunk["embeddings"] for chunk in chunks]
+    return Result(
+        image=None,
+        data=(
+            np.concatenate(embeddings)
+            if embeddings else np.empty((0, EMBEDDING_SIZE), dtype=np.float32)
+        ),
+        meta={
+            "source": images,
+            "operation": "extract_face_embeddings",
+            "image_indices": np.concatenate(
+                [chunk["image_indices"] for chunk in chunks] or [np.empty(0, dtype=np.int64)]
+            ),
+            "boxes": np.concatenate(
+                [chunk["boxes"] for chunk in chunks] or [np.empty((0, 4), dtype=np.float32)]
+            ),
+            "scores": np.concatenate(
+                [chunk["scores"] for chunk in chunks] or [np.empty(0, dtype=np.float32)]
+            ),
+            "images_without_faces": manifest["images_without_faces"],
+            "read_failures": manifest["read_failures"],
+            "resumed_from": resumed_from,
+            "batch_size": batch_size,
+            "normalize": normalize,
+            "checkpoint_dir": folder
+        }
+    )
+
+
+class _EmbeddingBatcher:
+    """Collects aligned crops and embeds them in fixed-size batches."""
+
+    def __init__(self, recognizer: Any, batch_size: int, normalize: bool) -> None:
+        self.recognizer = recognizer
+        self.crop_size = int(recognizer.input_size[0])
+        self.normalize = normalize
+        self.crops = np.empty((batch_size, self.crop_size, self.crop_size, 3), dtype=np.uint8)
+        self.filled = 0
+        self.owners: list[int] = []
+        self.boxes: list[np.ndarray] = []
+        self.embedded: list[np.ndarray] = []
+
+    def add(self, crops: np.ndarray, index: int, bboxes: np.ndarray) -> None:
+        """Queue the crops of one image and embed every batch that fills up."""
+        self.owners.extend([index] * len(crops))
+        self.boxes.append(np.asarray(bboxes, dtype=np.float32)[:, :5])
+        start = 0
+        while start < len(crops):
+            count = min(len(crops) - start, len(self.crops) - self.filled)
+            self.crops[self.filled:self.filled + count] = crops[start:start + count]
+            self.filled += count
+            start += count
+            if self.filled == len(self.crops):
+                self.flush()
+
+    def flush(self) -> None:
+        """Embed the queued crops in one recognition call."""
+        if self.filled == 0:
+            return
+        features = np.asarray(
+            self.recognizer.get_feat(list(self.crops[:self.filled])), dtype=np.float32
+        ).reshape(self.filled, -1)
+        if self.normalize:
+            norms = np.linalg.norm(features, axis=1, keepdims=True)
+            features /= np.where(norms > 0, norms, 1.0)
+        self.embedded.append(features)
+        self.filled = 0
+
+    def take(self) -> dict[str, np.ndarray]:
+        """Embed what is queued and return everything collected since the last call."""
+        self.flush()
+        boxes = np.concatenate(self.boxes) if self.boxes else np.empty((0, 5), dtype=np.float32)
+        chunk = {
+            "embeddings": (
+                np.concatenate(self.embedded)
+                if self.embedded else np.empty((0, EMBEDDING_SIZE), dtype=np.float32)
+            ),
+            "image_indices": np.asarray(self.owners, dtype=np.int64),
+            "boxes": boxes[:, :4],
+            "scores": boxes[:, 4]
+        }
+        self.owners, self.boxes, self.embedded = [], [], []
+        return chunk
+
+
+def _input_fingerprint(images: Sequence[Image | str | Path]) -> str:
+    """Digest of the image list, so a resume never mixes two different inputs."""
+    digest = hashlib.sha1()
+    for item in images:
+        if isinstance(item, Image):
+            part = str(item.path) if item.path is not None else f"array:{item.shape}:{item.dtype}"
+        else:
+            part = str(item)
+        digest.update(part.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def _write_embedding_chunk(path: Path, chunk: dict[str, np.ndarray]) -> None:
+    """Write a chunk of embeddings atomically."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        np.savez(file, **chunk)
+    os.replace(tmp_path, path)
+
+
+def _read_embedding_chunk(path: Path) -> dict[str, np.ndarray]:
+    """Load a chunk written by ``_write_embedding_chunk``."""
+    with np.load(path) as chunk:
+        return {key: chunk[key] for key in chunk.files}
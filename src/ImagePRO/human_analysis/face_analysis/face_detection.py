@@ -13,22 +13,207 @@ if str(_src_path) not in sys.path:
 import cv2
 import numpy as np
 
-from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh
+from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh, landmark_points
+from ImagePRO.human_analysis.inference import inference_image
+from ImagePRO.human_analysis.speed_profiles import (
+    DEFAULT_SPEED_PROFILE,
+    SpeedProfile,
+    profile_settings,
+)
+from ImagePRO.pre_processing.crop import crop_many
 from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
 
-if TYPE_CHECKING:  # mediapipe is imported lazily inside analyze_face_mesh
+if TYPE_CHECKING:  # mediapipe is imported lazily inside the functions
     import mediapipe as mp
 
 
 # Constants
 DEFAULT_MAX_FACES = 1
 DEFAULT_MIN_CONFIDENCE = 0.7
+FACE_DETECTION_BACKENDS = ("face_mesh", "face_detection")
+FACE_DETECTION_MODEL = 0  # MediaPipe short-range model (faces within ~2 m)
 FACE_OUTLINE_INDICES = [
     10, 338, 297, 332, 284, 251, 389, 356, 454, 323,
     361, 288, 397, 365, 379, 378, 400, 377, 152, 148,
     176, 149, 150, 136, 164, 163, 153, 157
 ]
+# Eye corners (averaged to eye centers), nose tip and mouth corners
+ALIGNMENT_INDICES = [33, 133, 362, 263, 1, 61, 291]
+DEFAULT_ALIGNED_SIZE = 112
+# Five-point ArcFace template for 112x112 chips: left eye, right eye,
+# nose tip, left and right mouth corner (image left/right)
+ALIGNMENT_TEMPLATE = np.array([
+    [38.2946, 51.6963],
+    [73.5318, 51.5014],
+    [56.0252, 71.7366],
+    [41.5493, 92.3655],
+    [70.7299, 92.2041],
+])
+ALIGNMENT_TEMPLATE.setflags(write=False)
+# FaceDetection keypoints (eye on the image's left, other eye, nose tip,
+# mouth center) on the same template
+DETECTION_ALIGNMENT_TEMPLATE = np.vstack([
+    ALIGNMENT_TEMPLATE[:3], ALIGNMENT_TEMPLATE[3:].mean(axis=0, keepdims=True)
+])
+DETECTION_ALIGNMENT_TEMPLATE.setflags(write=False)
+
+
+def estimate_similarity_transforms(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """Least-squares similarity transforms for many point sets at once.
+
+    Solves Umeyama's closed form (rotation, uniform scale, translation)
+    with one batched SVD over all faces.
+
+    Args:
+        src: Source points per face, shape (F, N, 2).
+        dst: Target points shared by all faces, shape (N, 2).
+
+    Returns:
+        Affine matrices of shape (F, 2, 3) mapping src onto dst.
+
+    Raises:
+        ValueError: If the shapes do not match
+    """
+    src = np.asarray(src, dtype=np.float64)
+    dst = np.asarray(dst, dtype=np.float64)
+    if src.ndim != 3 or src.shape[2] != 2 or dst.shape != src.shape[1:]:
+        raise ValueError("'src' must have shape (F, N, 2) and 'dst' shape (N, 2)")
+
+    count = src.shape[1]
+    src_mean = src.mean(axis=1, keepdims=True)
+    dst_mean = dst.mean(axis=0)
+    src_centered = src - src_mean
+    dst_centered = dst - dst_mean
+
+    covariance = np.einsum("nj,fnk->fjk", dst_centered, src_centered) / count
+    u, singular, vt = np.linalg.svd(covariance)
+    # Flip the weakest axis where needed so R is a rotation, not a reflection
+    sign = np.sign(np.linalg.det(u) * np.linalg.det(vt))
+    sign[sign == 0] = 1.0
+    u[:, :, 1] *= sign[:, None]
+    rotation = u @ vt
+
+    src_variance = (src_centered ** 2).sum(axis=(1, 2)) / count
+    scale = (singular[:, 0] + sign * singular[:, 1]) / np.where(src_variance > 0, src_variance, 1.0)
+
+    matrices = np.empty((len(src), 2, 3))
+    matrices[:, :, :2] = scale[:, None, None] * rotation
+    matrices[:, :, 2] = dst_mean - np.einsum("fjk,fk->fj", matrices[:, :, :2], src_mean[:, 0])
+    return matrices
+
+
+def align_faces(
+    image: Image,
+    points: np.ndarray,
+    *,
+    size: int = DEFAULT_ALIGNED_SIZE,
+    template: np.ndarray = ALIGNMENT_TEMPLATE
+) -> Result:
+    """Warp faces into aligned, fixed-size chips.
+
+    Computes the similarity transforms of all faces at once (see
+    ``estimate_similarity_transforms``) and warps every face straight
+    into its slot of one preallocated array. Areas outside the frame are
+    filled with zeros, so every chip has the same shape.
+
+    Args:
+        image: Source image.
+        points: Pixel coordinates of left eye, right eye, nose tip, left
+            and right mouth corner per face, shape (F, 5, 2), or of the
+            points of a custom template, shape (F, N, 2).
+        size: Side of the square chips in pixels; the template is
+            scaled from 112.
+            Default: 112
+        template: Target points in a 112x112 chip, shape (N, 2).
+            Default: ALIGNMENT_TEMPLATE (ArcFace five points)
+
+    Returns:
+        Result object with aligned faces:
+        - image: Array of shape (F, size, size, C), or (F, size, size)
+            for single-channel images
+        - data: Affine matrices of shape (F, 2, 3), image -> chip
+        - meta: Operation info and parameters
+
+    Raises:
+        TypeError: If image is not an Image instance
+        ValueError: If points does not have shape (F, N, 2) matching template
+        ValueError: If size is not a positive integer
+    """
+    if not isinstance(image, Image):
+        raise TypeError("'image' must be an Image instance")
+
+    if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+        raise ValueError("'size' must be a positive integer")
+
+    points = np.asarray(points, dtype=np.float64)
+    template = np.asarray(template, dtype=np.float64)
+    if points.ndim != 3 or points.shape[1:] != template.shape:
+        raise ValueError("'points' must have shape (F, N, 2) matching 'template'")
+
+    matrices = estimate_similarity_transforms(points, template * (size / DEFAULT_ALIGNED_SIZE))
+
+    chips = np.empty((len(points), size, size, *image.shape[2:]), dtype=image.dtype)
+    for chip, matrix in zip(chips, matrices):
+        # dst writes the warped face directly into the preallocated slot
+        cv2.warpAffine(
+            image._data, matrix, (size, size), dst=chip,
+            flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=0
+        )
+
+    return Result(
+        image=chips,
+        data=matrices,
+        meta={
+            "source": image,
+            "operation": "align_faces",
+            "size": size
+        }
+    )
+
+
+def _detect_face_boxes(
+    image: Image,
+    *,
+    max_faces: int,
+    min_confidence: float,
+    face_detection_obj: mp.solutions.face_detection.FaceDetection | None,
+    inference_max_side: int | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Run MediaPipe FaceDetection; normalized boxes (F, 4), scores (F,) and keypoints (F, 6, 2), best first."""
+    inference_frame = inference_image(image, inference_max_side)
+
+    try:
+        import mediapipe as mp
+    except ImportError as err:
+        raise ImportError(
+            "The optional 'mediapipe' dependency is required for face "
+            'detection. Install it with: pip install "ImagePRO-Python[mediapipe]"'
+        ) from err
+
+    if face_detection_obj is None:
+        face_detection_obj = mp.solutions.face_detection.FaceDetection(
+            model_selection=FACE_DETECTION_MODEL,
+            min_detection_confidence=min_confidence
+        )
+
+    results = face_detection_obj.process(inference_frame.as_rgb())
+    if not results.detections:
+        return None
+
+    boxes, scores, keypoints = [], [], []
+    for detection in results.detections:
+        box = detection.location_data.relative_bounding_box
+        boxes.append((box.xmin, box.ymin, box.xmin + box.width, box.ymin + box.height))
+        scores.append(detection.score[0])
+        keypoints.append([(kp.x, kp.y) for kp in detection.location_data.relative_keypoints])
+
+    order = np.argsort(scores)[::-1][:max_faces]
+    return (
+        np.asarray(boxes, dtype=np.float64)[order],
+        np.asarray(scores, dtype=np.float64)[order],
+        np.asarray(keypoints, dtype=np.float64).reshape(len(boxes), -1, 2)[order]
+    )
 
 
 def detect_faces(
@@ -36,12 +221,23 @@ def detect_faces(
     *,
     max_faces: int = DEFAULT_MAX_FACES,
     min_confidence: float = DEFAULT_MIN_CONFIDENCE,
-    face_mesh_obj: mp.solutions.face_mesh.FaceMesh | None = None
+    face_mesh_obj: mp.solutions.face_mesh.FaceMesh | None = None,
+    inference_max_side: int | None = None,
+    aligned_size: int | None = None,
+    backend: str = "face_mesh",
+    face_detection_obj: mp.solutions.face_detection.FaceDetection | None = None,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
 ) -> Result:
     """Detect and crop face regions using facial landmarks.
 
-    Uses face mesh to locate face outline points,
+    The "face_mesh" backend uses face mesh to locate face outline points,
     then extracts rectangular regions containing each face.
+    The "face_detection" backend runs MediaPipe's short-range
+    FaceDetection instead, which only predicts a box and six keypoints
+    per face and is much cheaper when no landmarks are needed.
+    With ``aligned_size``, every face is also warped into an aligned chip
+    (see ``align_faces``), from mesh landmarks requested in the same mesh
+    call or from the detector's keypoints.
 
     Args:
         image: Input image to process.
@@ -54,20 +250,45 @@ def detect_faces(
         face_mesh_obj: Pre-initialized face mesh detector.
             If None, creates new instance.
             Default: None
+        inference_max_side: Run the face mesh on a copy downscaled to this
+            longest side (see ``analyze_face_mesh``). Polygons and crops
+            still refer to the full-resolution image.
+            Default: None (full resolution)
+        aligned_size: Side of aligned face chips in pixels.
+            Default: None (no alignment)
+        backend: "face_mesh" or "face_detection".
+            Default: "face_mesh"
+        face_detection_obj: Pre-initialized FaceDetection for the
+            "face_detection" backend.
+            If None, creates new instance.
+            Default: None
+        speed_profile: "fast", "balanced" or "accurate" for the FaceMesh
+            created when face_mesh_obj is None, see ``analyze_face_mesh``.
+            FaceDetection has a single model per range, so the
+            "face_detection" backend ignores it.
+            Default: "balanced"
 
     Returns:
         Result object with detections:
         - image: List of cropped face images
             None if no faces detected
-        - data: List of face outline polygons
+        - data: List of face outline polygons (the four box corners
+            with the "face_detection" backend)
             None if no faces detected
-        - meta: Operation info and parameters
+        - meta: Operation info and parameters; with aligned_size also
+            "aligned_faces" (array of shape (F, S, S, C)) and
+            "alignment_matrices" (F, 2, 3); with the "face_detection"
+            backend also "scores" (F,)
             Includes error info if detection fails
 
     Raises:
         TypeError: If image is not an Image instance
         ValueError: If max_faces is not positive
         ValueError: If min_confidence not in [0,1]
+        ValueError: If inference_max_side is not a positive integer
+        ValueError: If aligned_size is not a positive integer
+        ValueError: If backend is not "face_mesh" or "face_detection"
+        ValueError: If speed_profile is unknown
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
@@ -78,16 +299,46 @@ def detect_faces(
     if not isinstance(min_confidence, (int, float)) or not (0 <= min_confidence <= 1):
         raise ValueError("'min_confidence' must be between 0 and 1")
 
+    if aligned_size is not None and (
+        not isinstance(aligned_size, int) or isinstance(aligned_size, bool) or aligned_size <= 0
+    ):
+        raise ValueError("'aligned_size' must be a positive integer or None")
+
+    if backend not in FACE_DETECTION_BACKENDS:
+        raise ValueError(f"'backend' must be one of {FACE_DETECTION_BACKENDS}")
+
+    profile_settings(speed_profile, "face_mesh")  # Validate for both backends
+
     # Get image dimensions
     height, width = image.shape[:2]
+    meta = {
+        "source": image,
+        "operation": "detect_faces",
+        "max_faces": max_faces,
+        "min_confidence": min_confidence,
+        "inference_max_side": inference_max_side,
+        "aligned_size": aligned_size,
+        "backend": backend,
+        "speed_profile": speed_profile
+    }
+
+    if backend == "face_detection":
+        return _detect_faces_with_boxes(
+            image, meta=meta, face_detection_obj=face_detection_obj
+        )
 
-    # Get face landmarks
+    # Get face landmarks; alignment points come from the same mesh call
+    landmarks_idx = FACE_OUTLINE_INDICES
+    if aligned_size is not None:
+        landmarks_idx = FACE_OUTLINE_INDICES + ALIGNMENT_INDICES
     result_mesh = analyze_face_mesh(
         image=image,
         max_faces=max_faces,
         min_confidence=min_confidence,
-        landmarks_idx=FACE_OUTLINE_INDICES,
-        face_mesh_obj=face_mesh_obj
+        landmarks_idx=landmarks_idx,
+        face_mesh_obj=face_mesh_obj,
+        inference_max_side=inference_max_side,
+        speed_profile=speed_profile
     )
     raw_landmarks = result_mesh.data
 
@@ -96,38 +347,86 @@ def detect_faces(
         return Result(
             image=None,
             data=None,
-            meta={
-                "source": image,
-                "operation": "detect_faces",
-                "max_faces": max_faces,
-                "min_confidence": min_confidence,
-                "error": "No face landmarks detected"
-            }
+            meta={**meta, "error": "No face landmarks detected"}
         )
 
-    # Convert landmarks to pixel coordinates
-    face_polygons = []
-    for face in raw_landmarks:
-        polygon = [
-            (int(x * width), int(y * height))
-            for _, _, x, y, _ in face
-        ]
-        face_polygons.append(np.array(polygon, dtype=np.int32))
-
-    # Extract face regions
-    face_regions = []
-    for polygon in face_polygons:
-        x, y, w, h = cv2.boundingRect(polygon)
-        face_region = image._data[y:y + h, x:x + w]
-        face_regions.append(face_region)
+    # Convert landmarks of all faces to pixel coordinates at once, shape (F, K, 2);
+    # normalized coordinates are scaled by the full size even if inference ran downscaled
+    normalized = np.asarray(raw_landmarks, dtype=np.float64)[:, :len(FACE_OUTLINE_INDICES), 2:4]
+    polygons = (normalized * (width, height)).astype(np.int32)
+    face_polygons = list(polygons)
+
+    # Bounding boxes (x1, y1, x2, y2) of every outline, cropped as views
+    boxes = np.concatenate([polygons.min(axis=1), polygons.max(axis=1) + 1], axis=1)
+    face_regions = crop_many(image, boxes=boxes).image
+
+    if aligned_size is not None:
+        gathered = landmark_points(raw_landmarks, ALIGNMENT_INDICES)
+        if gathered is None:
+            meta["error"] = "Missing alignment landmarks"
+        else:
+            # (F, 7, 2) normalized -> (F, 5, 2) pixels: average the eye corners
+            points = gathered[1] * (width, height)
+            five_points = np.concatenate([
+                (points[:, 0:1] + points[:, 1:2]) / 2,
+                (points[:, 2:3] + points[:, 3:4]) / 2,
+                points[:, 4:7]
+            ], axis=1)
+            aligned = align_faces(image, five_points, size=aligned_size)
+            meta["aligned_faces"] = aligned.image
+            meta["alignment_matrices"] = aligned.data
 
     return Result(
         image=face_regions,
         data=face_polygons,
-        meta={
-            "source": image,
-            "operation": "detect_faces",
-            "max_faces": max_faces,
-            "min_confidence": min_confidence
-        }
+        meta=meta
+    )
+
+
+def _detect_faces_with_boxes(
+    image: Image,
+    *,
+    meta: dict,
+    face_detection_obj: mp.solutions.face_detection.FaceDetection | None
+) -> Result:
+    """The "face_detection" backend of ``detect_faces``."""
+    height, width = image.shape[:2]
+    detections = _detect_face_boxes(
+        image,
+        max_faces=meta["max_faces"],
+        min_confidence=meta["min_confidence"],
+        face_detection_obj=face_detection_obj,
+        inference_max_side=meta["inference_max_side"]
+    )
+
+    # Handle no detections
+    if detections is None:
+        return Result(image=None, data=None, meta={**meta, "error": "No faces detected"})
+
+    relative_boxes, scores, keypoints = detections
+    boxes = np.round(relative_boxes * (width, height, width, height)).astype(np.int32)
+
+    # Box corners as polygons, so data has the same form as the mesh backend
+    x1, y1, x2, y2 = (boxes[:, i] for i in range(4))
+    corners = np.stack([
+        np.stack([x1, y1], axis=1), np.stack([x2 - 1, y1], axis=1),
+        np.stack([x2 - 1, y2 - 1], axis=1), np.stack([x1, y2 - 1], axis=1)
+    ], axis=1)
+    face_regions = crop_many(image, boxes=boxes).image
+    meta["scores"] = scores
+
+    if meta["aligned_size"] is not None:
+        aligned = align_faces(
+            image,
+            keypoints[:, :len(DETECTION_ALIGNMENT_TEMPLATE)] * (width, height),
+            size=meta["aligned_size"],
+            template=DETECTION_ALIGNMENT_TEMPLATE
+        )
+        meta["aligned_faces"] = aligned.image
+        meta["alignment_matrices"] = aligned.data
+
+    return Result(
+        image=face_regions,
+        data=list(corners),
+        meta=meta
     )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,10 +11,19 @@ _src_path = _file_path.parents[3]  # Go up to src directory
 if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
+from ImagePRO.human_analysis.inference import inference_image
+from ImagePRO.human_analysis.roi_tracking import RoiTracker
+from ImagePRO.human_analysis.speed_profiles import (
+    DEFAULT_SPEED_PROFILE,
+    SpeedProfile,
+    profile_settings,
+)
 from ImagePRO.utils.image import Image
+from ImagePRO.utils.live import run_live
 from ImagePRO.utils.result import Result
 
 import cv2
+import numpy as np
 
 if TYPE_CHECKING:  # mediapipe is imported lazily inside the functions
     import mediapipe as mp
@@ -30,7 +40,9 @@ def analyze_face_mesh(
     max_faces: int = DEFAULT_MAX_FACES,
     min_confidence: float = DEFAULT_MIN_CONFIDENCE,
     landmarks_idx: list[int] | None = None,
-    face_mesh_obj: mp.solutions.face_mesh.FaceMesh | None = None
+    face_mesh_obj: mp.solutions.face_mesh.FaceMesh | None = None,
+    inference_max_side: int | None = None,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
 ) -> Result:
     """Detect facial landmarks using MediaPipe FaceMesh.
 
@@ -51,6 +63,15 @@ def analyze_face_mesh(
         face_mesh_obj: Pre-initialized face mesh detector.
             If None, creates new instance.
             Default: None
+        inference_max_side: Downscale the image so its longest side is at
+            most this many pixels before color conversion and inference.
+            Landmarks are normalized, so they stay valid for the original
+            image, and annotations are drawn at full resolution.
+            Default: None (full resolution)
+        speed_profile: "fast", "balanced" or "accurate"; "fast" skips the
+            iris refinement (refine_landmarks=False) when face_mesh_obj is
+            None, see ``speed_profiles``.
+            Default: "balanced"
 
     Returns:
         Result object with detections and visualization:
@@ -66,6 +87,8 @@ def analyze_face_mesh(
         ValueError: If max_faces is not positive
         ValueError: If min_confidence not in [0,1]
         TypeError: If landmarks_idx is not list[int]
+        ValueError: If inference_max_side is not a positive integer
+        ValueError: If speed_profile is unknown
 
     Notes:
         - Coordinates are normalized [0,1]. Multiply by width/height for pixels
@@ -87,6 +110,10 @@ def analyze_face_mesh(
     ):
         raise TypeError("'landmarks_idx' must be a list of integers")
 
+    inference_frame = inference_image(image, inference_max_side)
+
+    settings = profile_settings(speed_profile, "face_mesh")
+
     try:
         import mediapipe as mp
     except ImportError as err:
@@ -104,14 +131,14 @@ def analyze_face_mesh(
         face_mesh = mp_face_mesh.FaceMesh(
             max_num_faces=max_faces,
             min_detection_confidence=min_confidence,
-            refine_landmarks=True,
-            static_image_mode=True
+            static_image_mode=True,
+            **settings
         )
     else:
         face_mesh = face_mesh_obj
 
-    # Detect facial landmarks (cvtColor allocates a new RGB array)
-    img_rgb = cv2.cvtColor(image._data, cv2.COLOR_BGR2RGB)
+    # Detect facial landmarks
+    img_rgb = inference_frame.as_rgb()
     results = face_mesh.process(img_rgb)
 
     # Handle no detections
@@ -125,6 +152,8 @@ def analyze_face_mesh(
                 "landmarks_idx": landmarks_idx,
                 "max_faces": max_faces,
                 "min_confidence": min_confidence,
+                "inference_max_side": inference_max_side,
+                "speed_profile": speed_profile,
                 "error": "No face landmarks detected"
             }
         )
@@ -171,20 +200,64 @@ def analyze_face_mesh(
             "operation": "analyze_face_mesh",
             "landmarks_idx": landmarks_idx,
             "max_faces": max_faces,
-            "min_confidence": min_confidence
+            "min_confidence": min_confidence,
+            "inference_max_side": inference_max_side,
+            "speed_profile": speed_profile
         }
     )
 
 
+def landmark_points(faces: list, indices: list[int]) -> tuple[list[int], np.ndarray] | None:
+    """Gather x, y of the given landmarks of every face into one array.
+
+    Accepts ``analyze_face_mesh`` data (one list of ``[face_id, idx, x, y,
+    z]`` rows per face) or the rows of a single face. Rows may be in any
+    order; they are matched by landmark index.
+
+    Args:
+        faces: Landmark rows per face.
+        indices: Landmark indices to extract, in output order.
+
+    Returns:
+        The face ids and normalized x, y with shape (F, len(indices), 2),
+        or None if the rows are malformed or a face lacks one of the
+        indices.
+    """
+    try:
+        rows = np.asarray(faces, dtype=np.float64)
+    except (TypeError, ValueError):  # Faces with different landmark counts
+        return None
+    if rows.ndim == 2:
+        rows = rows[None]  # Rows of a single face
+    if rows.ndim != 3 or rows.shape[2] < 5:
+        return None
+
+    # matches[f, k, i]: row k of face f holds landmark indices[i]
+    matches = rows[:, :, 1, None] == np.asarray(indices, dtype=np.float64)
+    if not matches.any(axis=1).all():
+        return None
+    order = matches.argmax(axis=1)
+    face_ids = [int(face_id) for face_id in rows[:, 0, 0]]
+    return face_ids, np.take_along_axis(rows[:, :, 2:4], order[:, :, None], axis=1)
+
+
 def analyze_face_mesh_live(
     *,
     max_faces: int = DEFAULT_MAX_FACES,
-    min_confidence: float = DEFAULT_MIN_CONFIDENCE
-) -> None:
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    source: int | str | Path | Iterable[np.ndarray] = 0,
+    display: bool = True,
+    max_frames: int | None = None,
+    overlay: bool = False,
+    track_roi: bool = False,
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
+) -> Result:
     """Start live webcam feed with real-time face mesh visualization.
 
     Opens default camera and shows face landmarks in real-time.
     Uses tracking mode for better performance on video.
+    Capture, inference and display run on separate threads (see
+    ``run_live``), so a slow frame never stalls the camera.
     Press ESC to exit.
 
     Args:
@@ -194,6 +267,26 @@ def analyze_face_mesh_live(
         min_confidence: Detection confidence threshold.
             Must be between 0 and 1.
             Default: 0.7
+        source: Camera index, video file, image directory, or iterable
+            of BGR frames.
+            Default: 0 (default camera)
+        display: Show the annotated frames in a window.
+            Default: True
+        max_frames: Stop after this many frames.
+            Default: None (until ESC or the end of the source)
+        overlay: Draw FPS and per-stage latency percentiles on the frames.
+            Default: False
+        track_roi: Analyze the full frame only every few frames (or when
+            the subject is lost) and a crop around it in between, see
+            ``RoiTracker``. Runs the model in static image mode.
+            Default: False
+        speed_profile: "fast", "balanced" or "accurate", see
+            ``analyze_face_mesh``.
+            Default: "balanced"
+
+    Returns:
+        Result object with loop statistics in meta, including per-stage
+        latency percentiles and FPS (see ``run_live``)
 
     Raises:
         ValueError: If parameters are invalid
@@ -206,6 +299,8 @@ def analyze_face_mesh_live(
     if not isinstance(min_confidence, (int, float)) or not (0 <= min_confidence <= 1):
         raise ValueError("'min_confidence' must be between 0 and 1")
 
+    settings = profile_settings(speed_profile, "face_mesh")
+
     try:
         import mediapipe as mp
     except ImportError as err:
@@ -214,50 +309,47 @@ def analyze_face_mesh_live(
             'analysis. Install it with: pip install "ImagePRO-Python[mediapipe]"'
         ) from err
 
-    # Initialize camera
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    if not cap.isOpened():
-        raise RuntimeError("Cannot access webcam")
-
     # Initialize detector in tracking mode for better performance
     face_mesh = mp.solutions.face_mesh.FaceMesh(
         max_num_faces=max_faces,
         min_detection_confidence=min_confidence,
-        refine_landmarks=True,
-        static_image_mode=False
+        static_image_mode=track_roi,
+        **settings
     )
 
-    try:
-        while True:
-            # Get frame
-            success, frame = cap.read()
-            if not success:
-                print("Failed to capture frame, skipping...")
-                continue
-
-            # Process frame
-            try:
-                result = analyze_face_mesh(
-                    image=Image.from_array(frame),
-                    max_faces=max_faces,
-                    min_confidence=min_confidence,
-                    face_mesh_obj=face_mesh
-                )
-                display_frame = result.image if result.image is not None else frame
-            except (TypeError, ValueError):
-                # Fall back to raw frame if detection fails
-                display_frame = frame
-
-            # Show result
-            cv2.imshow("ImagePRO - Face Mesh", display_frame)
-
-            # Check for ESC key
-            if cv2.waitKey(1) & 0xFF == 27:
-                break
-    finally:
-        # Clean up resources
-        cap.release()
-        cv2.destroyAllWindows()
+    def analyze(image: Image) -> Result:
+        return analyze_face_mesh(
+            image=image,
+            max_faces=max_faces,
+            min_confidence=min_confidence,
+            face_mesh_obj=face_mesh,
+            speed_profile=speed_profile
+        )
+
+    tracker = RoiTracker(analyze) if track_roi else None
+
+    def infer(image: Image) -> Result | None:
+        try:
+            return tracker.process(image) if tracker is not None else analyze(image)
+        except (TypeError, ValueError):
+            return None
+
+    def postprocess(frame: np.ndarray, result: Result | None) -> np.ndarray:
+        # Fall back to raw frame if detection fails
+        return result.image if result is not None and result.image is not None else frame
+
+    return run_live(
+        source,
+        preprocess=Image.from_array,
+        infer=infer,
+        postprocess=postprocess,
+        render=lambda frame, annotated: annotated,
+        window_name="ImagePRO - Face Mesh",
+        display=display,
+        max_frames=max_frames,
+        camera_api=cv2.CAP_DSHOW,
+        overlay=overlay
+    )
 
 
 if __name__ == "__main__":
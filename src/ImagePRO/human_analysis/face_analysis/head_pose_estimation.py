@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import sys
+import time
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,11 +13,19 @@ _src_path = _file_path.parents[3]  # Go up to src directory
 if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
-from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh
+from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh, landmark_points
+from ImagePRO.human_analysis.speed_profiles import (
+    DEFAULT_SPEED_PROFILE,
+    SpeedProfile,
+    profile_settings,
+)
 from ImagePRO.utils.image import Image
+from ImagePRO.utils.live import run_live
 from ImagePRO.utils.result import Result
+from ImagePRO.utils.temporal import AdaptiveFrameScheduler, TrackSmoother
 
 import cv2
+import numpy as np
 
 if TYPE_CHECKING:  # mediapipe is imported lazily inside the functions
     import mediapipe as mp
@@ -23,6 +34,119 @@ if TYPE_CHECKING:  # mediapipe is imported lazily inside the functions
 DEFAULT_MAX_FACES = 1
 DEFAULT_MIN_CONFIDENCE = 0.7
 HEAD_POSE_INDICES = [1, 152, 33, 263, 168]  # nose_tip, chin, left_eye, right_eye, nasion
+HEAD_POSE_METHODS = ("geometric", "pnp")
+PNP_INDICES = [1, 152, 33, 263, 61, 291]  # nose_tip, chin, eye corners, mouth corners
+# Canonical face for solvePnP, in millimetres, matching PNP_INDICES. Axes
+# follow the camera (x right, y down, z away from the camera), so a frontal
+# face has zero rotation.
+PNP_MODEL_POINTS = np.array([
+    [0.0, 0.0, 0.0],          # Nose tip
+    [0.0, 330.0, 65.0],       # Chin
+    [-225.0, -170.0, 135.0],  # Outer corner of the eye on the image's left
+    [225.0, -170.0, 135.0],   # Outer corner of the eye on the image's right
+    [-150.0, 150.0, 125.0],   # Mouth corner on the image's left
+    [150.0, 150.0, 125.0],    # Mouth corner on the image's right
+])
+PNP_MODEL_POINTS.setflags(write=False)
+INTRINSICS_CACHE_SIZE = 8
+
+
+def compute_head_pose_angles(points: np.ndarray) -> np.ndarray:
+    """Yaw and pitch of many faces at once from five landmarks each.
+
+    Args:
+        points: Normalized x, y of HEAD_POSE_INDICES per face,
+            shape (F, 5, 2).
+
+    Returns:
+        Array of shape (F, 2) with yaw and pitch per face (proportional
+        units, 0 for a frontal face).
+
+    Raises:
+        ValueError: If points does not have shape (F, 5, 2)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 3 or points.shape[1:] != (len(HEAD_POSE_INDICES), 2):
+        raise ValueError("'points' must have shape (F, 5, 2)")
+
+    nose, chin, left, right, nasion = (points[:, i] for i in range(len(HEAD_POSE_INDICES)))
+    yaw = 100 * ((right[:, 0] - nasion[:, 0]) - (nasion[:, 0] - left[:, 0]))  # Horizontal rotation
+    pitch = 100 * ((chin[:, 1] - nose[:, 1]) - (nose[:, 1] - nasion[:, 1]))   # Vertical rotation
+    return np.stack([yaw, pitch], axis=1)
+
+
+@lru_cache(maxsize=INTRINSICS_CACHE_SIZE)
+def _camera_matrix(width: int, height: int) -> np.ndarray:
+    """Pinhole intrinsics for an uncalibrated camera: focal length = width, centered principal point.
+
+    Cached per frame size; the returned matrix is read-only.
+    """
+    matrix = np.array([
+        [width, 0.0, width / 2],
+        [0.0, width, height / 2],
+        [0.0, 0.0, 1.0],
+    ])
+    matrix.setflags(write=False)
+    return matrix
+
+
+def solve_head_pose_pnp(
+    points: np.ndarray,
+    image_size: tuple[int, int],
+    *,
+    camera_matrix: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Full 3D head pose of many faces with ``cv2.solvePnP``.
+
+    Fits PNP_MODEL_POINTS to the landmarks of every face. The image
+    points of all faces are scaled to pixels in one operation and the
+    camera matrix is cached per frame size, so only the solver itself runs
+    per face.
+
+    Args:
+        points: Normalized x, y of PNP_INDICES per face, shape (F, 6, 2).
+        image_size: Frame (width, height) in pixels.
+        camera_matrix: 3x3 intrinsics of a calibrated camera.
+            Default: None (focal length = frame width, centered
+            principal point, no distortion)
+
+    Returns:
+        Tuple of two arrays of shape (F, 3): yaw, pitch and roll in
+        degrees (rotations about the camera's y, x and z axes; 0 for a
+        frontal, upright face), and the translation of the nose tip from
+        the camera in model units (about millimetres).
+
+    Raises:
+        ValueError: If points does not have shape (F, 6, 2)
+        ValueError: If camera_matrix is not 3x3
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 3 or points.shape[1:] != (len(PNP_INDICES), 2):
+        raise ValueError("'points' must have shape (F, 6, 2)")
+
+    width, height = (int(side) for side in image_size)
+    if camera_matrix is None:
+        camera_matrix = _camera_matrix(width, height)
+    else:
+        camera_matrix = np.asarray(camera_matrix, dtype=np.float64)
+        if camera_matrix.shape != (3, 3):
+            raise ValueError("'camera_matrix' must be a 3x3 matrix")
+
+    image_points = points * (width, height)
+    rotations = np.empty((len(points), 3, 3))
+    translations = np.empty((len(points), 3))
+    for face, face_points in enumerate(image_points):
+        _, rvec, tvec = cv2.solvePnP(
+            PNP_MODEL_POINTS, face_points, camera_matrix, None, flags=cv2.SOLVEPNP_SQPNP
+        )
+        rotations[face] = cv2.Rodrigues(rvec)[0]
+        translations[face] = tvec.ravel()
+
+    # Decompose R = Rz(roll) @ Ry(yaw) @ Rx(pitch) for all faces at once
+    yaw = np.arcsin(np.clip(-rotations[:, 2, 0], -1.0, 1.0))
+    pitch = np.arctan2(rotations[:, 2, 1], rotations[:, 2, 2])
+    roll = np.arctan2(rotations[:, 1, 0], rotations[:, 0, 0])
+    return np.degrees(np.stack([yaw, pitch, roll], axis=1)), translations
 
 
 def estimate_head_pose(
@@ -30,12 +154,21 @@ def estimate_head_pose(
     *,
     max_faces: int = DEFAULT_MAX_FACES,
     min_confidence: float = DEFAULT_MIN_CONFIDENCE,
-    face_mesh_obj: mp.solutions.face_mesh.FaceMesh | None = None
+    face_mesh_obj: mp.solutions.face_mesh.FaceMesh | None = None,
+    smoother: TrackSmoother | None = None,
+    timestamp: float | None = None,
+    method: str = "geometric",
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
 ) -> Result:
     """Estimate head pose angles using facial landmarks.
 
-    Calculates approximate yaw and pitch angles based on relative
-    positions of key facial landmarks (nose, eyes, chin).
+    The default "geometric" method calculates approximate yaw and pitch
+    angles based on relative positions of key facial landmarks (nose,
+    eyes, chin), for all faces in one vectorized step. The "pnp" method
+    fits a canonical 3D face with ``cv2.solvePnP`` and returns yaw, pitch
+    and roll in degrees plus the head's translation.
+    For video, pass the same ``smoother`` for every frame to filter the
+    angles over time per face id.
 
     Args:
         image: Input image to process.
@@ -48,18 +181,33 @@ def estimate_head_pose(
         face_mesh_obj: Pre-initialized face mesh detector.
             If None, creates new instance.
             Default: None
+        smoother: One Euro filters keyed by face id; the returned angles
+            are smoothed and faces that disappear are dropped from it.
+            Default: None (raw angles)
+        timestamp: Frame time in seconds for the smoother.
+            Default: None (time.perf_counter())
+        method: "geometric" or "pnp".
+            Default: "geometric"
+        speed_profile: "fast", "balanced" or "accurate" for the FaceMesh
+            created when face_mesh_obj is None, see ``analyze_face_mesh``.
+            Default: "balanced"
 
     Returns:
         Result object with pose estimates:
-        - data: List of [face_id, yaw, pitch] per face
+        - data: List of [face_id, yaw, pitch] per face, or
+            [face_id, yaw, pitch, roll] in degrees with method="pnp"
             None if no faces detected
-        - meta: Operation info and parameters
+        - meta: Operation info and parameters; with method="pnp" also
+            "translation", one [x, y, z] per face in model units (mm)
             Includes error info if detection fails
 
     Raises:
         TypeError: If image is not an Image instance
         ValueError: If max_faces is not positive
         ValueError: If min_confidence not in [0,1]
+        TypeError: If smoother is not a TrackSmoother
+        ValueError: If method is not "geometric" or "pnp"
+        ValueError: If speed_profile is unknown
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
@@ -70,18 +218,29 @@ def estimate_head_pose(
     if not isinstance(min_confidence, (int, float)) or not (0 <= min_confidence <= 1):
         raise ValueError("'min_confidence' must be between 0 and 1")
 
+    if smoother is not None and not isinstance(smoother, TrackSmoother):
+        raise TypeError("'smoother' must be a TrackSmoother instance")
+
+    if method not in HEAD_POSE_METHODS:
+        raise ValueError(f"'method' must be one of {HEAD_POSE_METHODS}")
+
+    landmarks_idx = HEAD_POSE_INDICES if method == "geometric" else PNP_INDICES
+
     # Get face landmarks
     mesh_result = analyze_face_mesh(
         image=image,
         max_faces=max_faces,
         min_confidence=min_confidence,
-        landmarks_idx=HEAD_POSE_INDICES,
-        face_mesh_obj=face_mesh_obj
+        landmarks_idx=landmarks_idx,
+        face_mesh_obj=face_mesh_obj,
+        speed_profile=speed_profile
     )
     landmarks = mesh_result.data
 
     # Handle no detections
     if not landmarks:
+        if smoother is not None:
+            smoother.reset()
         return Result(
             image=None,
             data=None,
@@ -90,40 +249,47 @@ def estimate_head_pose(
                 "operation": "estimate_head_pose",
                 "max_faces": max_faces,
                 "min_confidence": min_confidence,
+                "method": method,
                 "error": "No face landmarks detected"
             }
         )
 
-    # Calculate angles for each face
-    pose_data = []
-    for face in landmarks:
-        # Map landmarks by index
-        points = {lm[1]: lm for lm in face}
-
-        try:
-            # Extract key points
-            nose_x, nose_y = points[1][2:4]      # Nose tip
-            chin_y = points[152][3]              # Chin
-            left_x = points[33][2]               # Left eye
-            right_x = points[263][2]             # Right eye
-            nasion_x, nasion_y = points[168][2:4] # Nose bridge
-        except KeyError:
-            return Result(
-                image=None,
-                data=None,
-                meta={
-                    "source": image,
-                    "operation": "estimate_head_pose",
-                    "max_faces": max_faces,
-                    "min_confidence": min_confidence,
-                    "error": "Missing required landmarks"
-                }
-            )
+    # Gather the key points of all faces into one (F, K, 2) array
+    gathered = landmark_points(landmarks, landmarks_idx)
+    if gathered is None:
+        return Result(
+            image=None,
+            data=None,
+            meta={
+                "source": image,
+                "operation": "estimate_head_pose",
+                "max_faces": max_faces,
+                "min_confidence": min_confidence,
+                "method": method,
+                "error": "Missing required landmarks"
+            }
+        )
 
-        # Calculate angles
-        yaw = 100 * ((right_x - nasion_x) - (nasion_x - left_x))    # Horizontal rotation
-        pitch = 100 * ((chin_y - nose_y) - (nose_y - nasion_y))     # Vertical rotation
-        pose_data.append([face[0][0], yaw, pitch])
+    # Calculate angles for all faces at once
+    face_ids, points = gathered
+    extra_meta = {}
+    if method == "geometric":
+        angles = compute_head_pose_angles(points)
+    else:
+        height, width = image.shape[:2]
+        angles, translations = solve_head_pose_pnp(points, (width, height))
+        extra_meta["translation"] = translations.tolist()
+    pose_data = [[face_id, *map(float, row)] for face_id, row in zip(face_ids, angles)]
+
+    if smoother is not None:
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        face_ids, angles = smoother.update(
+            [row[0] for row in pose_data],
+            [row[1:] for row in pose_data],
+            timestamp=timestamp
+        )
+        pose_data = [[face_id, *map(float, row)] for face_id, row in zip(face_ids, angles)]
 
     return Result(
         image=None,
@@ -132,7 +298,10 @@ def estimate_head_pose(
             "source": image,
             "operation": "estimate_head_pose",
             "max_faces": max_faces,
-            "min_confidence": min_confidence
+            "min_confidence": min_confidence,
+            "method": method,
+            "smoothed": smoother is not None,
+            **extra_meta
         }
     )
 
@@ -140,12 +309,27 @@ def estimate_head_pose(
 def estimate_head_pose_live(
     *,
     max_faces: int = DEFAULT_MAX_FACES,
-    min_confidence: float = DEFAULT_MIN_CONFIDENCE
-) -> None:
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    source: int | str | Path | Iterable[np.ndarray] = 0,
+    display: bool = True,
+    max_frames: int | None = None,
+    overlay: bool = False,
+    smoothing: bool = False,
+    target_latency: float | None = None,
+    method: str = "geometric",
+    speed_profile: SpeedProfile = DEFAULT_SPEED_PROFILE
+) -> Result:
     """Run live head pose estimation using webcam feed.
 
     Opens a window displaying webcam feed with overlaid head pose angles.
-    Press ESC to exit.
+    Frames are captured, analyzed and drawn on separate threads (see
+    ``run_live``). Press ESC to exit.
+
+    With ``target_latency``, an ``AdaptiveFrameScheduler`` runs FaceMesh
+    only on as many frames as needed to keep the angles at most that old
+    and the angles of the other frames are extrapolated from One Euro
+    filtered tracks, so the output stays continuous at a fraction of the
+    compute.
 
     Args:
         max_faces: Maximum number of faces to analyze per frame.
@@ -154,11 +338,40 @@ def estimate_head_pose_live(
         min_confidence: Detection confidence threshold.
             Must be between 0 and 1.
             Default: 0.7
+        source: Camera index, video file, image directory, or iterable
+            of BGR frames.
+            Default: 0 (default camera)
+        display: Show the annotated frames in a window.
+            Default: True
+        max_frames: Stop after this many frames.
+            Default: None (until ESC or the end of the source)
+        overlay: Draw FPS and per-stage latency percentiles on the frames.
+            Default: False
+        smoothing: Filter the angles of every face with a One Euro filter.
+            Default: False
+        target_latency: Maximum age of measured angles in seconds; enables
+            adaptive frame skipping (implies smoothing).
+            Default: None (analyze every frame)
+        method: "geometric" (yaw, pitch) or "pnp" (yaw, pitch, roll in
+            degrees); see ``estimate_head_pose``.
+            Default: "geometric"
+        speed_profile: "fast", "balanced" or "accurate", see
+            ``analyze_face_mesh``.
+            Default: "balanced"
+
+    Returns:
+        Result object with loop statistics in meta, including per-stage
+        latency percentiles and FPS (see ``run_live``), plus
+        frames_analyzed and frames_extrapolated with target_latency
 
     Raises:
         TypeError: If max_faces is not an integer
         ValueError: If max_faces is not positive
         ValueError: If min_confidence not in [0,1]
+        TypeError: If smoothing is not a boolean
+        ValueError: If target_latency is not positive
+        ValueError: If method is not "geometric" or "pnp"
+        ValueError: If speed_profile is unknown
         RuntimeError: If webcam cannot be accessed
     """
     # Validate inputs
@@ -170,6 +383,14 @@ def estimate_head_pose_live(
         raise TypeError("'min_confidence' must be a number")
     if not 0 <= min_confidence <= 1:
         raise ValueError("'min_confidence' must be between 0 and 1")
+    if not isinstance(smoothing, bool):
+        raise TypeError("'smoothing' must be a boolean")
+    if method not in HEAD_POSE_METHODS:
+        raise ValueError(f"'method' must be one of {HEAD_POSE_METHODS}")
+    settings = profile_settings(speed_profile, "face_mesh")
+
+    scheduler = AdaptiveFrameScheduler(target_latency) if target_latency is not None else None
+    smoother = TrackSmoother() if smoothing or scheduler is not None else None
 
     try:
         import mediapipe as mp
@@ -179,61 +400,70 @@ def estimate_head_pose_live(
             'estimation. Install it with: pip install "ImagePRO-Python[mediapipe]"'
         ) from err
 
-    # Initialize webcam
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    if not cap.isOpened():
-        raise RuntimeError("Failed to access webcam")
-
     # Initialize face mesh detector for video
     face_mesh = mp.solutions.face_mesh.FaceMesh(
         max_num_faces=max_faces,
         min_detection_confidence=min_confidence,
-        refine_landmarks=True,
-        static_image_mode=False
+        static_image_mode=False,
+        **settings
     )
 
-    try:
-        while True:
-            # Read frame
-            ret, frame = cap.read()
-            if not ret:
-                print("Warning: Failed to read frame, skipping...")
-                continue
-
-            # Process frame
-            try:
-                img = Image.from_array(frame)
-                result = estimate_head_pose(
-                    image=img,
-                    max_faces=max_faces,
-                    min_confidence=min_confidence,
-                    face_mesh_obj=face_mesh
-                )
-                face_angles = result.data or []
-            except (TypeError, ValueError):
-                face_angles = []
-
-            # Draw results
-            for i, face in enumerate(face_angles):
-                face_id, yaw, pitch = face
-                text = f"Face {int(face_id)+1}: Yaw={yaw:.1f}, Pitch={pitch:.1f}"
-                cv2.putText(
-                    frame, text,
-                    (10, 30 + i * 25),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6, (0, 255, 0), 2
-                )
-
-            # Display frame
-            cv2.imshow("ImagePRO - Head Pose Estimation", frame)
-
-            # Check for ESC key
-            if cv2.waitKey(5) & 0xFF == 27:
-                break
-
-    finally:
-        cap.release()
-        cv2.destroyAllWindows()
+    def infer(image: Image) -> list:
+        now = time.perf_counter()
+        if scheduler is not None and not scheduler.should_process(now):
+            # Fill skipped frames by extrapolating the tracked faces
+            face_ids, angles = smoother.predict(now)
+            return [[face_id, *map(float, row)] for face_id, row in zip(face_ids, angles)]
+
+        try:
+            result = estimate_head_pose(
+                image=image,
+                max_faces=max_faces,
+                min_confidence=min_confidence,
+                face_mesh_obj=face_mesh,
+                smoother=smoother,
+                timestamp=now,
+                method=method,
+                speed_profile=speed_profile
+            )
+            face_angles = result.data or []
+        except (TypeError, ValueError):
+            face_angles = []
+
+        if scheduler is not None:
+            scheduler.record(time.perf_counter() - now)
+        return face_angles
+
+    def render(frame: np.ndarray, face_angles: list) -> np.ndarray:
+        frame = frame.copy()
+        for i, face in enumerate(face_angles):
+            face_id, yaw, pitch, *roll = face
+            text = f"Face {int(face_id)+1}: Yaw={yaw:.1f}, Pitch={pitch:.1f}"
+            if roll:
+                text += f", Roll={roll[0]:.1f}"
+            cv2.putText(
+                frame, text,
+                (10, 30 + i * 25),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.6, (0, 255, 0), 2
+            )
+        return frame
+
+    result = run_live(
+        source,
+        preprocess=Image.from_array,
+        infer=infer,
+        render=render,
+        window_name="ImagePRO - Head Pose Estimation",
+        display=display,
+        max_frames=max_frames,
+        camera_api=cv2.CAP_DSHOW,
+        overlay=overlay
+    )
+    if scheduler is not None:
+        result.meta["frames_analyzed"] = scheduler.processed
+        result.meta["frames_extrapolated"] = scheduler.skipped
+    return result
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Add src directory to path for absolute imports
+_file_path = Path(__file__).resolve()
+_src_path = _file_path.parents[2]  # Go up to src directory
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from ImagePRO.pre_processing.resize import resize_image
+from ImagePRO.utils.image import Image
+
+
+def inference_image(image: Image, max_side: int | None) -> Image:
+    """
+    Image to run a MediaPipe solution on, downscaled to at most max_side.
+
+    MediaPipe resizes every input to its own model size anyway, so
+    downscaling before the RGB conversion saves converting and copying
+    the full-resolution frame. Landmarks and boxes are normalized, so
+    they stay valid for the original image. Images that already fit are
+    returned as they are and reuse their cached RGB conversion.
+
+    Args:
+        image (Image): Full-resolution input.
+        max_side (int | None): Longest side of the inference image in
+            pixels, or None for full resolution.
+
+    Returns:
+        Image: ``image`` itself, or a downscaled copy in its colorspace.
+
+    Raises:
+        ValueError: If max_side is not a positive integer or None.
+    """
+    if max_side is not None and (
+        not isinstance(max_side, int) or isinstance(max_side, bool) or max_side <= 0
+    ):
+        raise ValueError("'inference_max_side' must be a positive integer or None")
+
+    if max_side is None or max(image.shape[:2]) <= max_side:
+        return image
+    return Image.from_array(
+        resize_image(image, new_size=(max_side, max_side), mode="fit").image,
+        colorspace=image.colorspace
+    )
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+# Add src directory to path for absolute imports
+_file_path = Path(__file__).resolve()
+_src_path = _file_path.parents[2]  # Go up to src directory
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+import numpy as np
+
+from ImagePRO.utils.image import Image
+from ImagePRO.utils.result import Result
+
+
+# Constants
+DEFAULT_KEYFRAME_INTERVAL = 10
+DEFAULT_ROI_MARGIN = 0.5  # Added on every side, as a fraction of the subject's box size
+DEFAULT_MIN_ROI_SIZE = 64  # Smallest crop side in pixels
+
+
+class RoiTracker:
+    """
+    Run a landmark model on a crop around the subject between keyframes.
+
+    Landmark models (``analyze_face_mesh``, ``detect_hands``,
+    ``detect_body_pose``) spend most of their time finding the subject in
+    the full frame, yet in a video the subject barely moves between frames.
+    The tracker runs the wrapped analysis on the full frame every
+    ``keyframe_interval`` frames; on the frames in between it only analyzes
+    an expanded crop around the previous landmarks and maps the results
+    back into full-frame coordinates. If nothing is found in the crop, the
+    subject is considered lost and the same frame is re-analyzed in full.
+
+    Results keep the wrapped function's format: normalized x/y (and z,
+    which MediaPipe scales like x) refer to the full frame, and an
+    annotated crop is pasted back into a copy of the frame. The ROI is the
+    union box of all detected subjects, so it works best for one subject.
+
+    Use solutions created with ``static_image_mode=True``; in tracking
+    mode MediaPipe keeps its own ROI in the coordinates of the previous
+    input, which the changing crops would invalidate.
+
+    Attributes:
+        frames (int): Frames processed.
+        keyframes (int): Frames analyzed in full (scheduled or after a loss).
+        losses (int): Crops in which the subject was not found.
+
+    Example:
+        >>> mesh = mp.solutions.face_mesh.FaceMesh(static_image_mode=True, refine_landmarks=True)
+        >>> tracker = RoiTracker(lambda image: analyze_face_mesh(image=image, face_mesh_obj=mesh))
+        >>> for frame in FrameSource("talk.mp4"):
+        ...     result = tracker.process(Image.from_array(frame))
+    """
+
+    def __init__(
+        self,
+        analyze: Callable[[Image], Result],
+        *,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+        roi_margin: float = DEFAULT_ROI_MARGIN,
+        min_roi_size: int = DEFAULT_MIN_ROI_SIZE
+    ) -> None:
+        """
+        Configure the tracker.
+
+        Args:
+            analyze (Callable[[Image], Result]):
+                Landmark function returning rows that end in normalized
+                ``x, y, z`` (all ImagePRO landmark functions do).
+            keyframe_interval (int, optional):
+                Analyze the full frame every n-th frame. 1 disables
+                cropping. Defaults to 10.
+            roi_margin (float, optional):
+                Margin added on each side of the subject's box, as a
+                fraction of its width/height. Defaults to 0.5.
+            min_roi_size (int, optional):
+                Minimum crop width and height in pixels. Defaults to 64.
+
+        Raises:
+            TypeError: If analyze is not callable.
+            ValueError: If keyframe_interval or min_roi_size is not a
+                positive integer, or roi_margin is negative.
+        """
+        if not callable(analyze):
+            raise TypeError("'analyze' must be callable")
+
+        for label, value in (("keyframe_interval", keyframe_interval), ("min_roi_size", min_roi_size)):
+            if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+                raise ValueError(f"'{label}' must be a positive integer")
+
+        if not isinstance(roi_margin, (int, float)) or roi_margin < 0:
+            raise ValueError("'roi_margin' must be a non-negative number")
+
+        self.analyze = analyze
+        self.keyframe_interval = keyframe_interval
+        self.roi_margin = float(roi_margin)
+        self.min_roi_size = min_roi_size
+
+        self.frames = 0
+        self.keyframes = 0
+        self.losses = 0
+        self._roi: Optional[tuple[int, int, int, int]] = None
+        self._since_keyframe = 0
+
+    def reset(self) -> None:
+        """Forget the subject so the next frame is analyzed in full."""
+        self._roi = None
+        self._since_keyframe = 0
+
+    def process(self, image: Image) -> Result:
+        """
+        Analyze one frame, using the crop around the last subject if possible.
+
+        Args:
+            image (Image): Next video frame.
+
+        Returns:
+            Result: The wrapped function's Result in full-frame coordinates,
+            with extra meta: ``roi`` (x1, y1, x2, y2 of the crop used, None
+            for a full-frame pass), ``keyframe`` and ``tracker_lost``.
+
+        Raises:
+            TypeError: If image is not an Image instance.
+        """
+        if not isinstance(image, Image):
+            raise TypeError("'image' must be an Image instance")
+
+        self.frames += 1
+        height, width = image.shape[:2]
+        lost = False
+
+        if self._roi is not None and self._since_keyframe < self.keyframe_interval - 1:
+            x1, y1, x2, y2 = self._roi
+            crop = Image.from_array(image._data[y1:y2, x1:x2], colorspace=image.colorspace)
+            result = self.analyze(crop)
+            if _has_landmarks(result.data):
+                self._since_keyframe += 1
+                result = self._to_frame(result, image, self._roi)
+                self._roi = self._subject_roi(result.data, width, height)
+                result.meta.update(roi=(x1, y1, x2, y2), keyframe=False, tracker_lost=False)
+                return result
+            self.losses += 1
+            lost = True
+
+        # Scheduled keyframe, first frame, or subject lost in the crop
+        self.keyframes += 1
+        self._since_keyframe = 0
+        result = self.analyze(image)
+        if _has_landmarks(result.data):
+            self._roi = self._subject_roi(result.data, width, height)
+        else:
+            self._roi = None
+        result.meta.update(roi=None, keyframe=True, tracker_lost=lost)
+        return result
+
+    def _subject_roi(self, data: Any, width: int, height: int) -> Optional[tuple[int, int, int, int]]:
+        """Expanded, clipped pixel box around every landmark."""
+        xy = _landmark_xy(data)
+        x_min, y_min = xy.min(axis=0) * (width, height)
+        x_max, y_max = xy.max(axis=0) * (width, height)
+
+        margin_x = (x_max - x_min) * self.roi_margin
+        margin_y = (y_max - y_min) * self.roi_margin
+        # Grow small boxes around their center up to the minimum size
+        pad_x = max(margin_x, (self.min_roi_size - (x_max - x_min)) / 2)
+        pad_y = max(margin_y, (self.min_roi_size - (y_max - y_min)) / 2)
+
+        x1 = int(np.clip(np.floor(x_min - pad_x), 0, width))
+        y1 = int(np.clip(np.floor(y_min - pad_y), 0, height))
+        x2 = int(np.clip(np.ceil(x_max + pad_x), 0, width))
+        y2 = int(np.clip(np.ceil(y_max + pad_y), 0, height))
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return None
+        return x1, y1, x2, y2
+
+    @staticmethod
+    def _to_frame(result: Result, image: Image, roi: tuple[int, int, int, int]) -> Result:
+        """Map a crop Result into full-frame coordinates and paste its annotation back."""
+        height, width = image.shape[:2]
+        x1, y1, x2, y2 = roi
+        scale_x, scale_y = (x2 - x1) / width, (y2 - y1) / height
+
+        def map_rows(rows: list) -> list:
+            mapped = []
+            for row in rows:
+                *ids, x, y, z = row
+                mapped.append([*ids, x * scale_x + x1 / width, y * scale_y + y1 / height, z * scale_x])
+            return mapped
+
+        data = result.data
+        if data and isinstance(data[0][0], (list, tuple)):
+            data = [map_rows(group) for group in data]  # e.g. faces -> rows
+        else:
+            data = map_rows(data)
+
+        annotated = result.image
+        if isinstance(annotated, np.ndarray):
+            canvas = image._data.copy()
+            canvas[y1:y2, x1:x2] = annotated
+            annotated = canvas
+
+        meta = dict(result.meta)
+        meta["source"] = image
+        return Result(image=annotated, data=data, meta=meta)
+
+
+def _has_landmarks(data: Any) -> bool:
+    return bool(data)
+
+
+def _landmark_xy(data: Any) -> np.ndarray:
+    """(N, 2) normalized x, y of every landmark row, flattening per-subject groups."""
+    rows = np.asarray(data, dtype=np.float64)
+    return rows.reshape(-1, rows.shape[-1])[:, -3:-1]
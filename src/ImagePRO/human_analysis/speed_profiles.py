@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Literal
+
+# Add src directory to path for absolute imports
+_file_path = Path(__file__).resolve()
+_src_path = _file_path.parents[2]  # Go up to src directory
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+import numpy as np
+
+from ImagePRO.utils.image import Image
+from ImagePRO.utils.result import Result
+
+
+SpeedProfile = Literal["fast", "balanced", "accurate"]
+ProfileSolution = Literal["face_mesh", "hands", "body_pose"]
+
+# Constants
+SPEED_PROFILES = ("fast", "balanced", "accurate")
+DEFAULT_SPEED_PROFILE = "balanced"  # The settings ImagePRO always used
+# MediaPipe constructor settings per profile and solution. FaceMesh has a
+# single model, so "accurate" equals "balanced" there; "fast" drops the
+# iris refinement (468 instead of 478 landmarks). Hands has no heavier
+# model than complexity 1.
+PROFILE_SETTINGS = {
+    "fast": {
+        "face_mesh": {"refine_landmarks": False},
+        "hands": {"model_complexity": 0},
+        "body_pose": {"model_complexity": 0},
+    },
+    "balanced": {
+        "face_mesh": {"refine_landmarks": True},
+        "hands": {"model_complexity": 1},
+        "body_pose": {"model_complexity": 1},
+    },
+    "accurate": {
+        "face_mesh": {"refine_landmarks": True},
+        "hands": {"model_complexity": 1},
+        "body_pose": {"model_complexity": 2},
+    },
+}
+BENCHMARK_PERCENTILES = (50, 95)
+
+
+def profile_settings(speed_profile: SpeedProfile, solution: ProfileSolution) -> dict[str, Any]:
+    """
+    MediaPipe constructor keyword arguments for a speed profile.
+
+    Args:
+        speed_profile (SpeedProfile): "fast", "balanced" or "accurate".
+        solution (ProfileSolution): "face_mesh", "hands" or "body_pose".
+
+    Returns:
+        dict[str, Any]: A fresh dict, e.g. ``{"refine_landmarks": False}``.
+
+    Raises:
+        ValueError: If speed_profile or solution is unknown.
+    """
+    if speed_profile not in PROFILE_SETTINGS:
+        raise ValueError(f"'speed_profile' must be one of {SPEED_PROFILES}")
+    if solution not in PROFILE_SETTINGS[speed_profile]:
+        raise ValueError(f"'solution' must be one of {tuple(PROFILE_SETTINGS[speed_profile])}")
+    return dict(PROFILE_SETTINGS[speed_profile][solution])
+
+
+def benchmark_speed_profiles(
+    images: Iterable[Image],
+    *,
+    solution: ProfileSolution = "face_mesh",
+    speed_profiles: Iterable[SpeedProfile] = SPEED_PROFILES,
+    repeats: int = 1
+) -> Result:
+    """
+    Measure the inference latency of each speed profile on your own images.
+
+    Latency depends on the CPU, the MediaPipe build and the image content,
+    so ImagePRO ships no reference numbers; run this on representative
+    frames of a deployment to choose its profile. Each profile gets one
+    long-lived solution in static image mode, and its first call (model
+    loading and warm-up) is not counted.
+
+    Args:
+        images (Iterable[Image]): Frames to analyze.
+        solution (ProfileSolution, optional): "face_mesh", "hands" or
+            "body_pose". Defaults to "face_mesh".
+        speed_profiles (Iterable[SpeedProfile], optional): Profiles to
+            compare. Defaults to all three.
+        repeats (int, optional): Passes over the images per profile.
+            Defaults to 1.
+
+    Returns:
+        Result: ``data`` maps every profile to ``mean_ms``, ``p50_ms``,
+        ``p95_ms``, ``frames`` and ``detected`` (frames with landmarks).
+
+    Raises:
+        TypeError: If an item of images is not an Image instance.
+        ValueError: If images is empty, repeats is not a positive integer,
+            or a profile or the solution is unknown.
+    """
+    images = list(images)
+    if not images:
+        raise ValueError("'images' must not be empty")
+    if not all(isinstance(image, Image) for image in images):
+        raise TypeError("'images' must contain Image instances")
+    if not isinstance(repeats, int) or isinstance(repeats, bool) or repeats <= 0:
+        raise ValueError("'repeats' must be a positive integer")
+    speed_profiles = list(speed_profiles)
+    for speed_profile in speed_profiles:
+        profile_settings(speed_profile, solution)  # Validate before loading models
+
+    try:
+        import mediapipe as mp
+    except ImportError as err:
+        raise ImportError(
+            "The optional 'mediapipe' dependency is required for benchmarking. "
+            'Install it with: pip install "ImagePRO-Python[mediapipe]"'
+        ) from err
+
+    # Imported here: the analysis modules import this module
+    from ImagePRO.human_analysis.body_analysis.body_pose_estimation import detect_body_pose
+    from ImagePRO.human_analysis.body_analysis.hand_tracking import detect_hands
+    from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh
+
+    report = {}
+    for speed_profile in speed_profiles:
+        settings = profile_settings(speed_profile, solution)
+        if solution == "face_mesh":
+            model = mp.solutions.face_mesh.FaceMesh(static_image_mode=True, **settings)
+            analyze = lambda image: analyze_face_mesh(image=image, face_mesh_obj=model)
+        elif solution == "hands":
+            model = mp.solutions.hands.Hands(static_image_mode=True, **settings)
+            analyze = lambda image: detect_hands(image=image, hands_obj=model)
+        else:
+            model = mp.solutions.pose.Pose(static_image_mode=True, **settings)
+            analyze = lambda image: detect_body_pose(image=image, pose_obj=model)
+
+        try:
+            analyze(images[0])  # Warm-up
+            timings = []
+            detected = 0
+            for _ in range(repeats):
+                for image in images:
+                    start = time.perf_counter()
+                    result = analyze(image)
+                    timings.append(time.perf_counter() - start)
+                    detected += bool(result.data)
+        finally:
+            model.close()  # Release the graph before loading the next profile
+
+        milliseconds = np.asarray(timings) * 1000.0
+        p50, p95 = np.percentile(milliseconds, BENCHMARK_PERCENTILES)
+        report[speed_profile] = {
+            "mean_ms": float(milliseconds.mean()),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "frames": len(timings),
+            "detected": detected,
+        }
+
+    return Result(
+        image=None,
+        data=report,
+        meta={
+            "source": images,
+            "operation": "benchmark_speed_profiles",
+            "solution": solution,
+            "repeats": repeats
+        }
+    )
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import os
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Literal
+
+# Add src directory to path for absolute imports
+_file_path = Path(__file__).resolve()
+_src_path = _file_path.parents[2]  # Go up to src directory
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+import numpy as np
+
+from ImagePRO.human_analysis.body_analysis.body_pose_estimation import detect_body_pose
+from ImagePRO.human_analysis.body_analysis.hand_tracking import detect_hands
+from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh
+from ImagePRO.human_analysis.speed_profiles import DEFAULT_SPEED_PROFILE, profile_settings
+from ImagePRO.utils.image import Image
+from ImagePRO.utils.result import Result
+from ImagePRO.utils.shared_frames import SharedFrameRing
+
+
+PoolTask = Literal["face_mesh", "hands", "body_pose"]
+
+# Constants
+IN_FLIGHT_PER_PROCESS = 2  # Queued items per worker; keeps every core busy
+TASK_OPTIONS = {
+    "face_mesh": frozenset({"max_faces", "min_confidence", "landmarks_idx", "speed_profile"}),
+    "hands": frozenset({"max_hands", "min_confidence", "landmarks_idx", "speed_profile"}),
+    "body_pose": frozenset({"min_confidence", "landmarks_idx", "speed_profile"}),
+}
+
+# Per-process worker state, filled by _init_worker
+_worker_state: dict[str, Any] = {}
+
+
+class MediaPipePool:
+    """
+    Process pool that runs one MediaPipe solution per worker process.
+
+    MediaPipe graphs are not thread-safe and each analysis call is
+    single-threaded, so batch jobs scale by running one long-lived
+    solution object (FaceMesh, Hands or Pose in static image mode) in every
+    worker process and reusing it for all images that worker receives.
+
+    Images go to workers by path (decoded in the worker) or, for in-memory
+    frames, through a ``SharedFrameRing`` so pixels are never pickled.
+    Workers send back compact Results: landmark data and meta, without the
+    annotated image unless ``include_image=True``. Results are yielded in
+    input order, and ``meta["source"]`` is set back to the caller's input.
+
+    Example:
+        >>> with MediaPipePool("face_mesh", processes=4, options={"max_faces": 2}) as pool:
+        ...     for result in pool.map(Path("frames").glob("*.jpg")):
+        ...         print(result.data)
+    """
+
+    def __init__(
+        self,
+        task: PoolTask,
+        *,
+        processes: int | None = None,
+        options: dict[str, Any] | None = None,
+        include_image: bool = False,
+        shared_memory: bool = True
+    ) -> None:
+        """
+        Validate settings and start the worker processes.
+
+        Args:
+            task (PoolTask):
+                "face_mesh" (analyze_face_mesh), "hands" (detect_hands) or
+                "body_pose" (detect_body_pose).
+            processes (int | None, optional):
+                Number of worker processes. Defaults to os.cpu_count().
+            options (dict[str, Any] | None, optional):
+                Keyword arguments for the analysis function, e.g.
+                ``{"max_faces": 2, "landmarks_idx": [1, 33]}``. A
+                ``"speed_profile"`` also configures the solution every
+                worker creates. Defaults to None.
+            include_image (bool, optional):
+                Return the annotated image from workers. Defaults to False.
+            shared_memory (bool, optional):
+                Send in-memory frames through shared memory instead of
+                pickling them. Defaults to True.
+
+        Raises:
+            ValueError: If task, processes, an option name or the
+                speed profile is invalid.
+            TypeError: If include_image or shared_memory is not a boolean.
+            ImportError: If mediapipe is not installed.
+        """
+        if task not in TASK_OPTIONS:
+            raise ValueError(f"'task' must be one of {sorted(TASK_OPTIONS)}")
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if not isinstance(processes, int) or isinstance(processes, bool) or processes <= 0:
+            raise ValueError("'processes' must be a positive integer")
+
+        options = dict(options or {})
+        unknown = set(options) - TASK_OPTIONS[task]
+        if unknown:
+            raise ValueError(f"Unsupported options for '{task}': {sorted(unknown)}")
+        profile_settings(options.get("speed_profile", DEFAULT_SPEED_PROFILE), task)
+
+        if not isinstance(include_image, bool) or not isinstance(shared_memory, bool):
+            raise TypeError("'include_image' and 'shared_memory' must be booleans")
+
+        try:
+            import mediapipe  # noqa: F401  (fail here rather than inside every worker)
+        except ImportError as err:
+            raise ImportError(
+                "The optional 'mediapipe' dependency is required for the MediaPipe "
+                'worker pool. Install it with: pip install "ImagePRO-Python[mediapipe]"'
+            ) from err
+
+        self.task = task
+        self.processes = processes
+        self.options = options
+        self.include_image = include_image
+        self.shared_memory = shared_memory
+        self._ring: SharedFrameRing | None = None
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(task, options, include_image)
+        )
+
+    def map(self, images: Iterable[Image | np.ndarray | str | Path]) -> Iterator[Result]:
+        """
+        Analyze images in parallel and yield their Results in input order.
+
+        At most a few items per worker are in flight at once, so arbitrarily
+        long inputs (e.g. a generator over a video) use bounded memory.
+
+        Args:
+            images: Image instances, BGR arrays, or image file paths.
+
+        Yields:
+            Result: One per input, in order. ``meta["source"]`` is the input
+            item and ``meta["worker_pid"]`` the process that analyzed it.
+
+        Raises:
+            TypeError: If an item is not an Image, array or path
+            RuntimeError: If the pool has been closed
+            Exception: Errors raised by the analysis function are re-raised
+        """
+        if self._executor is None:
+            raise RuntimeError("MediaPipePool is closed")
+
+        max_in_flight = self.processes * IN_FLIGHT_PER_PROCESS
+        pending: deque[tuple[Any, Future]] = deque()
+        for item in images:
+            if len(pending) >= max_in_flight:
+                yield self._collect(*pending.popleft())
+            pending.append((item, self._executor.submit(_analyze, self._encode(item))))
+        while pending:
+            yield self._collect(*pending.popleft())
+
+    def close(self) -> None:
+        """Stop the worker processes and release the shared frame ring."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._ring is not None:
+            self._ring.close()
+            self._ring.unlink()
+            self._ring = None
+
+    def __enter__(self) -> MediaPipePool:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _encode(self, item: Image | np.ndarray | str | Path) -> tuple[Any, ...]:
+        """Describe an input so that only a path, a FrameRef or (fallback) pixels are pickled."""
+        if isinstance(item, (str, Path)):
+            return ("path", str(item))
+
+        if isinstance(item, Image):
+            array, colorspace = item._data, item.colorspace
+        elif isinstance(item, np.ndarray):
+            array, colorspace = item, "BGR"
+        else:
+            raise TypeError("Items must be Image instances, numpy arrays, or file paths")
+
+        if self.shared_memory and not array.dtype.hasobject:
+            if self._ring is None:
+                # Sized for the first frame; one slot per in-flight item is
+                # enough because results are collected oldest-first
+                self._ring = SharedFrameRing.create(
+                    slots=self.processes * IN_FLIGHT_PER_PROCESS + 1,
+                    slot_bytes=max(array.nbytes, 1)
+                )
+            if array.nbytes <= self._ring.slot_bytes:
+                ref = self._ring.write(array, colorspace=colorspace)
+                return ("shared", self._ring.name, ref)
+
+        return ("array", array, colorspace)
+
+    @staticmethod
+    def _collect(item: Any, future: Future) -> Result:
+        result = future.result()
+        result.meta["source"] = item
+        return result
+
+
+def _init_worker(task: PoolTask, options: dict[str, Any], include_image: bool) -> None:
+    """Create the long-lived MediaPipe solution for this worker process."""
+    import mediapipe as mp
+
+    min_confidence = options.get("min_confidence", 0.7)
+    settings = profile_settings(options.get("speed_profile", DEFAULT_SPEED_PROFILE), task)
+    if task == "face_mesh":
+        solution = mp.solutions.face_mesh.FaceMesh(
+            max_num_faces=options.get("max_faces", 1),
+            min_detection_confidence=min_confidence,
+            static_image_mode=True,
+            **settings
+        )
+        analyze = lambda image: analyze_face_mesh(image=image, face_mesh_obj=solution, **options)
+    elif task == "hands":
+        solution = mp.solutions.hands.Hands(
+            min_detection_confidence=min_confidence,
+            max_num_hands=options.get("max_hands", 2),
+            static_image_mode=True,
+            **settings
+        )
+        analyze = lambda image: detect_hands(image=image, hands_obj=solution, **options)
+    else:
+        solution = mp.solutions.pose.Pose(
+            min_detection_confidence=min_confidence,
+            static_image_mode=True,
+            **settings
+        )
+        analyze = lambda image: detect_body_pose(image=image, pose_obj=solution, **options)
+
+    _worker_state.clear()
+    _worker_state.update(analyze=analyze, include_image=include_image, rings={})
+
+
+def _analyze(encoded: tuple[Any, ...]) -> Result:
+    """Run the worker's solution on one encoded input and return a compact Result."""
+    kind = encoded[0]
+    if kind == "path":
+        image = Image.from_path(encoded[1])
+    elif kind == "shared":
+        _, name, ref = encoded
+        rings = _worker_state["rings"]
+        if name not in rings:
+            rings[name] = SharedFrameRing.attach(name)
+        image = rings[name].read(ref)
+    else:
+        _, array, colorspace = encoded
+        image = Image.from_array(array, colorspace=colorspace)
+
+    result = _worker_state["analyze"](image)
+
+    # The source Image may be a view into shared memory; never send it back
+    meta = {key: value for key, value in result.meta.items() if key != "source"}
+    meta["worker_pid"] = os.getpid()
+    return Result(
+        image=result.image if _worker_state["include_image"] else None,
+        data=result.data,
+        meta=meta
+    )
@@ -10,6 +10,7 @@ if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
 import cv2
+import numpy as np
 
 from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
@@ -18,8 +19,13 @@ from ImagePRO.utils.result import Result
 # Constants for blur operations
 DEFAULT_KERNEL_SIZE = (5, 5)  # For average and Gaussian blur
 DEFAULT_FILTER_SIZE = 5       # For median blur
+MAX_NATIVE_16U_MEDIAN = 5     # Largest filter size cv2.medianBlur accepts for non-uint8
 DEFAULT_SIGMA_COLOR = 75      # For bilateral filter
 DEFAULT_SIGMA_SPACE = 75      # For bilateral filter
+DEFAULT_SUBSAMPLE = 4         # For approximate bilateral filter
+# Guided-filter regularization is (GUIDED_EPS_SCALE * sigma_color) ** 2;
+# matched empirically to the smoothing strength of cv2.bilateralFilter
+GUIDED_EPS_SCALE = 0.4
 
 
 def apply_average_blur(
@@ -124,6 +130,44 @@ def apply_gaussian_blur(
     )
 
 
+def _median_blur_16u(channel: np.ndarray, filter_size: int) -> np.ndarray:
+    """Exact large-kernel median filter for a single uint16 channel.
+
+    Coarse/fine decomposition in the spirit of Perreault & Hebert's two-tier
+    histograms. The median commutes with monotone maps, so:
+
+    1. The high byte of the median is the uint8 median of the high bytes.
+    2. For every distinct high byte ``c``, clamping ``value - 256 * c`` into
+       [0, 255] is monotone, and its uint8 median is the low byte of the
+       median wherever the coarse median equals ``c``.
+
+    Each pass runs cv2.medianBlur on uint8 data, which is constant-time per
+    pixel in the kernel size. Fine passes only cover the bounding band of
+    the pixels they resolve. Borders are replicated, like cv2.medianBlur.
+    """
+    radius = filter_size // 2
+    height, width = channel.shape
+    coarse = cv2.medianBlur((channel >> 8).astype(np.uint8), filter_size)
+    filtered = np.empty_like(channel)
+
+    for high in np.unique(coarse).tolist():
+        mask = coarse == high
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        top, bottom = max(0, rows[0] - radius), min(height, rows[-1] + radius + 1)
+        left, right = max(0, cols[0] - radius), min(width, cols[-1] + radius + 1)
+
+        band = channel[top:bottom, left:right].astype(np.int32) - (high << 8)
+        np.clip(band, 0, 255, out=band)
+        fine = cv2.medianBlur(band.astype(np.uint8), filter_size)
+
+        selected = mask[top:bottom, left:right]
+        low = fine[selected].astype(np.uint16)
+        filtered[top:bottom, left:right][selected] = low + (high << 8)
+
+    return filtered
+
+
 def apply_median_blur(
     image: Image,
     *,
@@ -135,23 +179,30 @@ def apply_median_blur(
     Uses median filtering which is particularly effective at removing salt-and-pepper
     noise while preserving edges better than linear filters (average, Gaussian).
 
+    uint8 images use cv2.medianBlur, whose cost is constant per pixel for
+    large kernels. cv2.medianBlur only accepts 16-bit data up to size 5, so
+    larger kernels on uint16 images use an exact coarse/fine histogram
+    decomposition built on the uint8 filter. Its cost does not grow with
+    filter_size either.
+
     Args:
         image (Image):
-            Input image to blur. Can be BGR (default) or RGB.
+            Input image to blur. Can be BGR (default) or RGB, uint8 or uint16.
         filter_size (int, optional):
             Size of the median filter kernel. Must be an odd integer > 1.
-            Larger values create stronger noise reduction but slower processing.
+            Sizes above 5 require a uint8 or uint16 image.
             Defaults to 5.
 
     Returns:
         Result: Result object with denoised image.
             - image (np.ndarray): Denoised output image
             - data (None): No additional data
-            - meta (dict): Contains filter size and operation info
+            - meta (dict): Contains filter size, method and operation info
 
     Raises:
         TypeError: If image is not an Image instance
         ValueError: If filter_size is not an odd integer > 1
+        ValueError: If filter_size > 5 and the image is not uint8 or uint16
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance.")
@@ -159,25 +210,96 @@ def apply_median_blur(
     if not isinstance(filter_size, int) or filter_size <= 1 or filter_size % 2 == 0:
         raise ValueError("'filter_size' must be an odd integer greater than 1.")
 
-    # Apply median filtering
-    blurred = cv2.medianBlur(image._data, filter_size)
+    if filter_size <= MAX_NATIVE_16U_MEDIAN or image.dtype == np.uint8:
+        # Apply median filtering
+        method = "opencv"
+        blurred = cv2.medianBlur(image._data, filter_size)
+    elif image.dtype == np.uint16:
+        # Large 16-bit kernel: filter each channel with the histogram method
+        method = "histogram"
+        data = image._data
+        if data.ndim == 2:
+            blurred = _median_blur_16u(data, filter_size)
+        else:
+            blurred = np.empty_like(data)
+            for c in range(data.shape[2]):
+                blurred[..., c] = _median_blur_16u(
+                    np.ascontiguousarray(data[..., c]), filter_size
+                )
+    else:
+        raise ValueError(
+            "'filter_size' above 5 requires a uint8 or uint16 image, "
+            f"got {image.dtype}."
+        )
 
     return Result(
         image=blurred,
         meta={
             "source": image,
             "operation": "apply_median_blur",
-            "filter_size": filter_size
+            "filter_size": filter_size,
+            "method": method
         }
     )
 
 
+def _fast_guided_filter(
+    data: np.ndarray,
+    *,
+    radius: int,
+    eps: float,
+    subsample: int
+) -> np.ndarray:
+    """Self-guided fast guided filter (He & Sun, 2015).
+
+    Every channel guides itself. The linear coefficients are estimated on a
+    copy downscaled by ``subsample`` and upsampled bilinearly, so the cost is
+    a handful of box filters on the small image plus one multiply-add at full
+    resolution, independent of ``radius``.
+    """
+    height, width = data.shape[:2]
+    guide = data.astype(np.float32)
+
+    if subsample > 1:
+        small_size = (max(1, width // subsample), max(1, height // subsample))
+        small = cv2.resize(guide, small_size, interpolation=cv2.INTER_AREA)
+        radius = max(1, round(radius / subsample))
+    else:
+        small = guide
+
+    box = (2 * radius + 1, 2 * radius + 1)
+    mean = cv2.boxFilter(small, -1, box)
+    variance = cv2.boxFilter(small * small, -1, box) - mean * mean
+    gain = variance / (variance + eps)
+    offset = mean - gain * mean
+    gain = cv2.boxFilter(gain, -1, box)
+    offset = cv2.boxFilter(offset, -1, box)
+
+    if subsample > 1:
+        gain = cv2.resize(gain, (width, height), interpolation=cv2.INTER_LINEAR)
+        offset = cv2.resize(offset, (width, height), interpolation=cv2.INTER_LINEAR)
+    if gain.ndim < guide.ndim:
+        # cv2 drops the trailing axis of single-channel 3D arrays
+        gain = gain.reshape(guide.shape)
+        offset = offset.reshape(guide.shape)
+
+    filtered = gain * guide
+    filtered += offset
+    if np.issubdtype(data.dtype, np.integer):
+        limits = np.iinfo(data.dtype)
+        np.rint(filtered, out=filtered)
+        np.clip(filtered, limits.min, limits.max, out=filtered)
+    return filtered.astype(data.dtype)
+
+
 def apply_bilateral_blur(
     image: Image,
     *,
     filter_size: int = 9,
     sigma_color: float = DEFAULT_SIGMA_COLOR,
-    sigma_space: float = DEFAULT_SIGMA_SPACE
+    sigma_space: float = DEFAULT_SIGMA_SPACE,
+    approximate: bool = False,
+    subsample: int = DEFAULT_SUBSAMPLE
 ) -> Result:
     """
     Apply bilateral blur for edge-preserving smoothing.
@@ -186,6 +308,12 @@ def apply_bilateral_blur(
     domain and range filtering. Effective for noise reduction while keeping sharp edges,
     but significantly slower than other blurring methods.
 
+    With ``approximate=True`` a fast guided filter replaces the exact bilateral
+    filter. Its cost does not grow with ``filter_size`` and drops further with
+    ``subsample``, which makes large-radius smoothing (e.g. skin smoothing on
+    megapixel video) practical in real time at the price of small deviations
+    from the exact result.
+
     Args:
         image (Image):
             Input image to blur. Can be BGR (default) or RGB.
@@ -197,7 +325,16 @@ def apply_bilateral_blur(
             will be mixed together. Defaults to 75.
         sigma_space (float, optional):
             Filter sigma in coordinate space. Larger values mean more distant pixels
-            will influence each other. Defaults to 75.
+            will influence each other. Defaults to 75. Not used by the
+            approximate mode, whose window radius is ``filter_size // 2``.
+        approximate (bool, optional):
+            Use the fast guided-filter approximation instead of the exact
+            bilateral filter. Defaults to False.
+        subsample (int, optional):
+            Quality/speed knob for the approximate mode: the factor by which
+            filter coefficients are computed at reduced resolution. 1 gives
+            the highest fidelity, larger values are faster. Must be a positive
+            integer. Defaults to 4.
 
     Returns:
         Result: Result object with smoothed image.
@@ -218,14 +355,25 @@ def apply_bilateral_blur(
         raise ValueError("'sigma_color' must be a positive number.")
     if not isinstance(sigma_space, (int, float)) or sigma_space <= 0:
         raise ValueError("'sigma_space' must be a positive number.")
-
-    # Apply bilateral filter
-    blurred = cv2.bilateralFilter(
-        image._data,
-        filter_size,
-        sigma_color,
-        sigma_space
-    )
+    if not isinstance(subsample, int) or subsample <= 0:
+        raise ValueError("'subsample' must be a positive integer.")
+
+    if approximate:
+        # Edge-preserving approximation with cost independent of filter_size
+        blurred = _fast_guided_filter(
+            image._data,
+            radius=max(1, filter_size // 2),
+            eps=(GUIDED_EPS_SCALE * sigma_color) ** 2,
+            subsample=subsample
+        )
+    else:
+        # Apply bilateral filter
+        blurred = cv2.bilateralFilter(
+            image._data,
+            filter_size,
+            sigma_color,
+            sigma_space
+        )
 
     return Result(
         image=blurred,
@@ -235,5 +383,7 @@ def apply_bilateral_blur(
             "filter_size": filter_size,
             "sigma_color": sigma_color,
             "sigma_space": sigma_space,
+            "approximate": approximate,
+            "subsample": subsample if approximate else None,
         }
     )
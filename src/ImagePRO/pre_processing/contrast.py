@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Literal
 
 # Add src directory to path for absolute imports
 _file_path = Path(__file__).resolve()
@@ -10,6 +13,7 @@ if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
 import cv2
+import numpy as np
 
 from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
@@ -18,18 +22,95 @@ from ImagePRO.utils.result import Result
 # Constants for contrast enhancement
 DEFAULT_CLIP_LIMIT = 2.0      # For CLAHE
 DEFAULT_TILE_GRID_SIZE = (8, 8)  # For CLAHE
+LUT_CACHE_SIZE = 256             # Distinct (alpha, beta) tables kept in memory
+DEFAULT_COLOR_MODE = "gray"
+
+ColorMode = Literal["gray", "ycrcb", "lab"]
+COLOR_MODES = ("gray", "ycrcb", "lab")
+
+# (colorspace, color_mode) -> (forward, backward) conversions for the
+# luminance-only modes; channel 0 is Y (YCrCb) or L (LAB) in both spaces
+LUMINANCE_CONVERSIONS = {
+    ("BGR", "ycrcb"): (cv2.COLOR_BGR2YCrCb, cv2.COLOR_YCrCb2BGR),
+    ("RGB", "ycrcb"): (cv2.COLOR_RGB2YCrCb, cv2.COLOR_YCrCb2RGB),
+    ("BGR", "lab"): (cv2.COLOR_BGR2LAB, cv2.COLOR_LAB2BGR),
+    ("RGB", "lab"): (cv2.COLOR_RGB2LAB, cv2.COLOR_LAB2RGB),
+}
+
+# cv2.CLAHE objects are not safe to share between threads, so each thread
+# keeps its own instances keyed by (clip_limit, tile_grid_size)
+_clahe_cache = threading.local()
+
+
+def _get_clahe(clip_limit: float, tile_grid_size: tuple[int, int]) -> cv2.CLAHE:
+    """Return this thread's cached CLAHE object for the given parameters."""
+    instances = getattr(_clahe_cache, "instances", None)
+    if instances is None:
+        instances = _clahe_cache.instances = {}
+
+    key = (float(clip_limit), tile_grid_size)
+    clahe = instances.get(key)
+    if clahe is None:
+        clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
+        instances[key] = clahe
+    return clahe
+
+
+def _to_grayscale(image: Image) -> np.ndarray:
+    """Return a single-channel view of the image, honoring its colorspace."""
+    return image.as_gray()
+
+
+def _enhance(
+    image: Image,
+    color_mode: ColorMode,
+    enhance: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """Apply a single-channel enhancement according to color_mode.
+
+    "gray" enhances the grayscale version of the image. The luminance modes
+    enhance only the Y/L channel and convert back to the input colorspace,
+    keeping chroma untouched. GRAY inputs skip every conversion.
+    """
+    if color_mode == "gray" or image.colorspace == "GRAY":
+        return enhance(_to_grayscale(image))
+
+    forward, backward = LUMINANCE_CONVERSIONS[(image.colorspace, color_mode)]
+    channels = list(cv2.split(cv2.cvtColor(image._data, forward)))
+    channels[0] = enhance(channels[0])
+    return cv2.cvtColor(cv2.merge(channels), backward)
+
+
+def _validate_color_mode(color_mode: ColorMode) -> None:
+    if color_mode not in COLOR_MODES:
+        raise ValueError(f"'color_mode' must be one of {COLOR_MODES}")
+
+
+@lru_cache(maxsize=LUT_CACHE_SIZE)
+def _stretching_lut(alpha: float, beta: int) -> np.ndarray:
+    """Build the 256-entry table for new_pixel = |alpha * pixel + beta|.
+
+    The table is produced by convertScaleAbs itself, so cv2.LUT reproduces
+    its rounding and saturation exactly. Cached tables are read-only.
+    """
+    lut = cv2.convertScaleAbs(np.arange(256, dtype=np.uint8), alpha=alpha, beta=beta)
+    lut.setflags(write=False)
+    return lut
 
 
 def apply_clahe_contrast(
     image: Image,
     *,
     clip_limit: float = DEFAULT_CLIP_LIMIT,
-    tile_grid_size: tuple[int, int] = DEFAULT_TILE_GRID_SIZE
+    tile_grid_size: tuple[int, int] = DEFAULT_TILE_GRID_SIZE,
+    color_mode: ColorMode = DEFAULT_COLOR_MODE
 ) -> Result:
     """Enhance image contrast using CLAHE (adaptive histogram equalization).
 
     CLAHE applies histogram equalization on small regions for better local contrast.
-    Works well for images with varying lighting conditions.
+    Works well for images with varying lighting conditions. CLAHE objects are
+    cached per thread and per (clip_limit, tile_grid_size), so repeated calls
+    on video frames do not rebuild them.
 
     Args:
         image: Input image to enhance.
@@ -37,6 +118,9 @@ def apply_clahe_contrast(
             Default: 2.0
         tile_grid_size: Size of grid for local histograms as (width, height).
             Default: (8, 8)
+        color_mode: "gray" returns a grayscale result; "ycrcb" or "lab"
+            enhance only the luminance channel and keep the input colorspace.
+            Default: "gray"
 
     Returns:
         Result object with enhanced image and metadata:
@@ -48,6 +132,7 @@ def apply_clahe_contrast(
         TypeError: If image is not an Image instance
         TypeError: If tile_grid_size is invalid
         ValueError: If clip_limit is not positive
+        ValueError: If color_mode is not supported
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
@@ -62,10 +147,11 @@ def apply_clahe_contrast(
     ):
         raise TypeError("'tile_grid_size' must be a tuple of two positive integers")
 
-    # Convert and apply CLAHE (cvtColor returns a new array; input untouched)
-    grayscale = cv2.cvtColor(image._data, cv2.COLOR_BGR2GRAY)
-    clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
-    enhanced = clahe.apply(grayscale)
+    _validate_color_mode(color_mode)
+
+    # Apply CLAHE (conversions return new arrays; input untouched)
+    clahe = _get_clahe(clip_limit, tile_grid_size)
+    enhanced = _enhance(image, color_mode, clahe.apply)
 
     return Result(
         image=enhanced,
@@ -73,13 +159,16 @@ def apply_clahe_contrast(
             "source": image,
             "operation": "apply_clahe_contrast",
             "clip_limit": clip_limit,
-            "tile_grid_size": tile_grid_size
+            "tile_grid_size": tile_grid_size,
+            "color_mode": color_mode
         }
     )
 
 
 def apply_histogram_equalization(
-    image: Image
+    image: Image,
+    *,
+    color_mode: ColorMode = DEFAULT_COLOR_MODE
 ) -> Result:
     """Global histogram equalization for contrast enhancement.
 
@@ -88,6 +177,9 @@ def apply_histogram_equalization(
 
     Args:
         image: Input image to enhance.
+        color_mode: "gray" returns a grayscale result; "ycrcb" or "lab"
+            equalize only the luminance channel and keep the input colorspace.
+            Default: "gray"
 
     Returns:
         Result object with enhanced image and metadata:
@@ -97,19 +189,22 @@ def apply_histogram_equalization(
 
     Raises:
         TypeError: If image is not an Image instance
+        ValueError: If color_mode is not supported
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
 
-    # Convert and apply global histogram equalization
-    grayscale = cv2.cvtColor(image._data, cv2.COLOR_BGR2GRAY)
-    enhanced = cv2.equalizeHist(grayscale)
+    _validate_color_mode(color_mode)
+
+    # Apply global histogram equalization
+    enhanced = _enhance(image, color_mode, cv2.equalizeHist)
 
     return Result(
         image=enhanced,
         meta={
             "source": image,
-            "operation": "apply_histogram_equalization"
+            "operation": "apply_histogram_equalization",
+            "color_mode": color_mode
         }
     )
 
@@ -118,12 +213,15 @@ def apply_contrast_stretching(
     image: Image,
     *,
     alpha: float = 1.0,
-    beta: int = 130
+    beta: int = 130,
+    color_mode: ColorMode = DEFAULT_COLOR_MODE
 ) -> Result:
     """Linear contrast stretching using alpha and beta.
 
     Applies the formula: new_pixel = alpha × pixel + beta
-    Simple but effective for basic contrast adjustment.
+    Simple but effective for basic contrast adjustment. The mapping is
+    precomputed as a 256-entry lookup table (cached per alpha/beta), so each
+    call costs a single cv2.LUT pass.
 
     Args:
         image: Input image to enhance.
@@ -131,6 +229,9 @@ def apply_contrast_stretching(
             Default: 1.0
         beta: Addition factor (bias). Must be 0-255.
             Default: 130
+        color_mode: "gray" returns a grayscale result; "ycrcb" or "lab"
+            stretch only the luminance channel and keep the input colorspace.
+            Default: "gray"
 
     Returns:
         Result object with enhanced image and metadata:
@@ -142,6 +243,7 @@ def apply_contrast_stretching(
         TypeError: If image is not an Image instance
         ValueError: If alpha is negative
         ValueError: If beta is not in range 0-255
+        ValueError: If color_mode is not supported
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
@@ -152,9 +254,11 @@ def apply_contrast_stretching(
     if not isinstance(beta, int) or not (0 <= beta <= 255):
         raise ValueError("'beta' must be an integer between 0 and 255")
 
-    # Convert and apply linear stretching
-    grayscale = cv2.cvtColor(image._data, cv2.COLOR_BGR2GRAY)
-    enhanced = cv2.convertScaleAbs(grayscale, alpha=alpha, beta=beta)
+    _validate_color_mode(color_mode)
+
+    # Apply linear stretching as a single table lookup
+    lut = _stretching_lut(float(alpha), beta)
+    enhanced = _enhance(image, color_mode, lambda channel: cv2.LUT(channel, lut))
 
     return Result(
         image=enhanced,
@@ -162,6 +266,7 @@ def apply_contrast_stretching(
             "source": image,
             "operation": "apply_contrast_stretching",
             "alpha": alpha,
-            "beta": beta
+            "beta": beta,
+            "color_mode": color_mode
         }
     )
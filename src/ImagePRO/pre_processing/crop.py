@@ -9,6 +9,8 @@ _src_path = _file_path.parents[2]  # Go up to src directory
 if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
+import numpy as np
+
 from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
 
@@ -17,7 +19,8 @@ def crop_image(
     image: Image,
     *,
     start_point: tuple[int, int],
-    end_point: tuple[int, int]
+    end_point: tuple[int, int],
+    copy: bool = False
 ) -> Result:
     """Crop an image using top-left and bottom-right coordinates.
 
@@ -28,20 +31,28 @@ def crop_image(
         image: Input image to crop.
         start_point: (x1, y1) coordinates of the top-left corner.
         end_point: (x2, y2) coordinates of the bottom-right corner.
+        copy: If False, return a view that shares memory with the source,
+            so writes to the crop modify the source image.
+            If True, return an independent C-contiguous copy.
+            Default: False
 
     Returns:
         Result object with cropped image and metadata:
-        - image: Cropped image array
+        - image: Cropped image array (view or copy, see ``copy``)
         - meta: Operation info and coordinates used
 
     Raises:
         TypeError: If image is not an Image instance
         TypeError: If coordinates are not tuples of two integers
+        TypeError: If copy is not a boolean
         ValueError: If coordinates are invalid or outside image bounds
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
 
+    if not isinstance(copy, bool):
+        raise TypeError("'copy' must be a boolean")
+
     # Validate coordinates format
     if (
         not isinstance(start_point, tuple) or
@@ -67,6 +78,8 @@ def crop_image(
 
     # Extract the region
     cropped = image._data[y1:y2, x1:x2]
+    if copy:
+        cropped = cropped.copy()
 
     return Result(
         image=cropped,
@@ -74,6 +87,93 @@ def crop_image(
             "source": image,
             "operation": "crop_image",
             "start_point": start_point,
-            "end_point": end_point
+            "end_point": end_point,
+            "copy": copy
+        }
+    )
+
+
+def crop_many(
+    image: Image,
+    *,
+    boxes: np.ndarray,
+    copy: bool = False,
+    pack: bool = False
+) -> Result:
+    """Crop several regions from one image in a single call.
+
+    Boxes are clipped to the image bounds in one vectorized step, so
+    detections that spill over the border still yield valid crops. A box
+    that lies entirely outside the image produces an empty crop.
+
+    Args:
+        image: Input image to crop.
+        boxes: Array-like of shape (N, 4) with (x1, y1, x2, y2) rows,
+            where (x1, y1) is the top-left and (x2, y2) the exclusive
+            bottom-right corner.
+        copy: If False, crops are views into the source image.
+            If True, each crop is an independent contiguous copy.
+            Ignored when ``pack`` is True.
+            Default: False
+        pack: If True, gather all crops into one contiguous array of shape
+            (N, h, w[, C]). Every clipped box must have the same size.
+            Default: False
+
+    Returns:
+        Result object with crops and metadata:
+        - image: List of N crop arrays, or one packed array if ``pack``
+        - data: (N, 4) int array of the clipped boxes
+        - meta: Operation info and crop policy
+
+    Raises:
+        TypeError: If image is not an Image instance
+        TypeError: If copy or pack is not a boolean
+        ValueError: If boxes is not an (N, 4) numeric array
+        ValueError: If pack is True and the clipped boxes differ in size
+    """
+    if not isinstance(image, Image):
+        raise TypeError("'image' must be an Image instance")
+
+    if not isinstance(copy, bool) or not isinstance(pack, bool):
+        raise TypeError("'copy' and 'pack' must be booleans")
+
+    try:
+        boxes = np.asarray(boxes)
+    except ValueError as exc:
+        raise ValueError("'boxes' must be an (N, 4) array of (x1, y1, x2, y2)") from exc
+    if boxes.ndim != 2 or boxes.shape[1] != 4 or not np.issubdtype(boxes.dtype, np.number):
+        raise ValueError("'boxes' must be an (N, 4) array of (x1, y1, x2, y2)")
+
+    height, width = image.shape[:2]
+
+    # Clip every corner to the image, then force x2 >= x1 and y2 >= y1
+    clipped = np.floor(boxes).astype(np.intp) if boxes.dtype.kind == "f" else boxes.astype(np.intp)
+    clipped = np.clip(clipped, 0, [width, height, width, height])
+    clipped[:, 2:] = np.maximum(clipped[:, 2:], clipped[:, :2])
+
+    data = image._data
+    if pack:
+        sizes = clipped[:, 2:] - clipped[:, :2]
+        if len(sizes) and np.any(sizes != sizes[0]):
+            raise ValueError("'pack' requires all clipped boxes to have the same size")
+        crop_w, crop_h = sizes[0] if len(sizes) else (0, 0)
+        # One fancy-index gather writes every crop into a fresh contiguous buffer
+        rows = clipped[:, 1, None] + np.arange(crop_h)
+        cols = clipped[:, 0, None] + np.arange(crop_w)
+        crops = data[rows[:, :, None], cols[:, None, :]]
+    else:
+        crops = [data[y1:y2, x1:x2] for x1, y1, x2, y2 in clipped.tolist()]
+        if copy:
+            crops = [crop.copy() for crop in crops]
+
+    return Result(
+        image=crops,
+        data=clipped,
+        meta={
+            "source": image,
+            "operation": "crop_many",
+            "num_boxes": len(clipped),
+            "copy": copy or pack,
+            "pack": pack
         }
     )
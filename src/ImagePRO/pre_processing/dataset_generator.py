@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-import random
+import hashlib
+import json
+import os
 import sys
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 # Add src directory to path for absolute imports
 _file_path = Path(__file__).resolve()
@@ -12,10 +18,16 @@ if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
 import cv2
+import numpy as np
 
 from ImagePRO.human_analysis.face_analysis.face_detection import detect_faces
+from ImagePRO.human_analysis.speed_profiles import SpeedProfile, profile_settings
 from ImagePRO.pre_processing import blur, grayscale, resize, rotate, sharpen
+from ImagePRO.utils.atomic_io import write_json_atomic
+from ImagePRO.utils.frame_source import IMAGE_EXTENSIONS, FrameSource
 from ImagePRO.utils.image import Image
+from ImagePRO.utils.pipeline import Stage, run_pipeline
+from ImagePRO.utils.result import Result
 
 # Constants
 DEFAULT_NUM_IMAGES = 200
@@ -24,6 +36,14 @@ DEFAULT_MIN_CONFIDENCE = 0.7
 DEFAULT_CAMERA_INDEX = 0
 DEFAULT_DELAY = 0.1
 DEFAULT_FACE_ID = "unknown"
+DEFAULT_FRAME_STRIDE = 1
+DEFAULT_DEDUP_THRESHOLD = 0.0
+DEFAULT_QUEUE_SIZE = 8
+PIPELINE_STAGES = ("augment", "detect", "write")
+ROTATION_RANGE = 45  # Random rotation angle is drawn from [-45°, 45°]
+ROTATION_SCALES = (1.0, 1.1, 1.2, 1.3)
+MANIFEST_CHECKPOINT_EVERY = 50  # Items processed between shard manifest updates
+DATASET_SPEED_PROFILE = "fast"  # Crops need the face outline only, not the iris
 
 
 def capture_bulk_pictures(
@@ -39,16 +59,35 @@ def capture_bulk_pictures(
     apply_sharpen: bool = False,
     apply_rotate: bool = False,
     apply_resize: tuple[int, int] | bool = False,
-    delay: float = DEFAULT_DELAY
-) -> None:
-    """Generate a dataset by capturing faces from webcam.
-
-    Captures frames from the webcam, detects faces, applies optional preprocessing,
-    and saves cropped face images to disk. This function is useful for creating
+    delay: float = DEFAULT_DELAY,
+    source: int | str | Path | Iterable[np.ndarray] | None = None,
+    frame_stride: int = DEFAULT_FRAME_STRIDE,
+    dedup_threshold: float = DEFAULT_DEDUP_THRESHOLD,
+    workers: dict[str, int] | None = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    seed: int | None = None,
+    speed_profile: SpeedProfile = DATASET_SPEED_PROFILE
+) -> Result:
+    """Generate a dataset by capturing faces from a webcam or recorded footage.
+
+    Reads frames from the webcam (default), a video file, an image folder or
+    an iterable of arrays, detects faces, applies optional preprocessing, and
+    saves cropped face images to disk. This function is useful for creating
     face recognition datasets with data augmentation.
 
+    Offline sources are processed as fast as frames can be decoded: ``delay``
+    only applies to live cameras, and generation stops early when the source
+    runs out before ``num_images`` faces were saved.
+
+    The work runs as a threaded pipeline of bounded queues,
+    capture → augment → detect → write, so decoding, augmentation, face
+    mesh inference and JPEG encoding overlap. Each stage can be given its
+    own worker count; per-stage counters in the result meta show which
+    stage is the bottleneck.
+
     Processing pipeline (if enabled):
     median blur → laplacian sharpen → grayscale → resize → random rotate
+    (resize and rotate are fused into a single cached affine warp)
 
     Args:
         folder_path: Base directory for dataset.
@@ -60,7 +99,7 @@ def capture_bulk_pictures(
             Default: 0
         min_confidence: Face detection confidence threshold.
             Default: 0.7
-        camera_index: OpenCV camera device index.
+        camera_index: OpenCV camera device index, used when source is None.
             Default: 0
         apply_blur: Apply median blur (size=3).
             Default: False
@@ -72,14 +111,43 @@ def capture_bulk_pictures(
             Default: False
         apply_resize: Optional (width,height).
             Default: False (no resize)
-        delay: Time between captures (seconds).
+        delay: Time between captures (seconds), live cameras only.
             Default: 0.1
+        source: Camera index, video file, image directory, or iterable of
+            BGR arrays (see ``FrameSource``).
+            Default: None (camera ``camera_index``)
+        frame_stride: Use every n-th frame of the source.
+            Default: 1
+        dedup_threshold: Skip frames whose thumbnail differs from the last
+            used frame by less than this mean intensity (0-255).
+            Default: 0 (disabled)
+        workers: Worker threads per stage, keyed by "augment", "detect" and
+            "write"; missing stages get 1. Each detect worker owns its own
+            FaceMesh. With several workers, files are numbered in
+            completion order rather than frame order.
+            Default: None (one worker per stage)
+        queue_size: Capacity of each inter-stage queue (backpressure limit).
+            Default: 8
+        seed: Master seed for the random rotation. Each frame draws from its
+            own stream derived from (seed, frame index), so augmentation is
+            reproducible regardless of thread scheduling.
+            Default: None (fresh entropy, reported in meta["seed"])
+        speed_profile: FaceMesh speed profile, see ``speed_profiles``.
+            Default: "fast" (no iris refinement; crops only use the
+            face outline)
+
+    Returns:
+        Result object with capture statistics:
+        - data: List of saved file paths
+        - meta: Operation info and counters (frames_read, duplicates_skipped,
+          frames_without_face, saved), per-stage statistics under
+          "stages" and the busiest stage under "bottleneck"
 
     Raises:
         TypeError: If input types are invalid
         ValueError: If numeric values are out of range
         FileExistsError: If output folder exists
-        RuntimeError: If camera access fails
+        RuntimeError: If the camera or video file cannot be opened
     """
     # Validate numeric parameters to ensure safe operation
     if not isinstance(num_images, int) or num_images <= 0:
@@ -94,6 +162,27 @@ def capture_bulk_pictures(
     if not isinstance(delay, (int, float)) or delay < 0:
         raise ValueError("'delay' must be a non-negative number")
 
+    if workers is None:
+        workers = {}
+    if not isinstance(workers, dict) or not set(workers) <= set(PIPELINE_STAGES):
+        raise ValueError(f"'workers' must be a dict with keys from {PIPELINE_STAGES}")
+    stage_workers = {name: workers.get(name, 1) for name in PIPELINE_STAGES}
+    if any(not isinstance(n, int) or isinstance(n, bool) or n <= 0 for n in stage_workers.values()):
+        raise ValueError("Worker counts must be positive integers")
+
+    if not isinstance(queue_size, int) or queue_size <= 0:
+        raise ValueError("'queue_size' must be a positive integer")
+
+    face_mesh_settings = profile_settings(speed_profile, "face_mesh")
+    seed = _resolve_seed(seed)
+
+    # Validates stride, threshold and source type before touching the disk
+    frames = FrameSource(
+        camera_index if source is None else source,
+        frame_stride=frame_stride,
+        dedup_threshold=dedup_threshold
+    )
+
     try:
         import mediapipe as mp
     except ImportError as err:
@@ -112,100 +201,523 @@ def capture_bulk_pictures(
     except FileExistsError as e:
         raise FileExistsError(f"Output folder already exists: {face_folder}") from e
 
-    # Initialize camera capture
-    cap = cv2.VideoCapture(camera_index)
-    if not cap.isOpened():
-        raise RuntimeError(f"Cannot access camera (index={camera_index})")
-
-    # Initialize MediaPipe face mesh detector for face detection
-    # Using face_mesh instead of face_detection for better accuracy
-    face_mesh = mp.solutions.face_mesh.FaceMesh(
-        max_num_faces=1,
-        min_detection_confidence=min_confidence,
-        refine_landmarks=True,
-        static_image_mode=False
-    )
+    # Open camera or video file
+    frames.open()
+
+    # One FaceMesh per detect worker: MediaPipe graphs are not thread-safe.
+    # Tracking across frames only makes sense when a single worker sees
+    # every frame in order
+    def create_face_mesh():
+        # Using face_mesh instead of face_detection for better accuracy
+        return mp.solutions.face_mesh.FaceMesh(
+            max_num_faces=1,
+            min_detection_confidence=min_confidence,
+            static_image_mode=stage_workers["detect"] > 1,
+            **face_mesh_settings
+        )
+
+    def augment(item):
+        # Apply preprocessing pipeline in sequence
+        index, frame = item
+        return _augment_frame(
+            frame,
+            rng=_item_rng(seed, 0, index),
+            apply_blur=apply_blur,
+            apply_sharpen=apply_sharpen,
+            apply_grayscale=apply_grayscale,
+            apply_rotate=apply_rotate,
+            apply_resize=apply_resize
+        )
+
+    frames_without_face = 0
+    counter_lock = threading.Lock()
+
+    def detect(processed, face_mesh):
+        nonlocal frames_without_face
+        # Detect face and crop to face region only
+        result = detect_faces(
+            image=Image.from_array(processed),
+            max_faces=1,
+            min_confidence=min_confidence,
+            face_mesh_obj=face_mesh
+        )
+        if result.image is None:
+            # Skip frames with no detected faces (silent failure)
+            with counter_lock:
+                frames_without_face += 1
+            return None
+        return result
 
     saved_count = 0
+    done = threading.Event()
+
+    def write(result):
+        nonlocal saved_count
+        # Reserve the next filename; surplus faces after the target are dropped
+        with counter_lock:
+            if saved_count >= num_images:
+                return None
+            index = start_index + saved_count
+            saved_count += 1
+            if saved_count >= num_images:
+                done.set()
+
+        output_path = face_folder / f"{index:04d}.jpg"
+        result.save_as_img(str(output_path))
+
+        # Give a live subject time to move; offline sources never wait
+        if delay > 0 and frames.live and not done.is_set():
+            time.sleep(delay)
+        return output_path
+
     try:
-        while saved_count < num_images:
-            # Capture frame
-            success, frame = cap.read()
-            if not success:
-                print("Failed to capture frame, skipping...")
-                continue
+        report = run_pipeline(
+            enumerate(frames),
+            [
+                Stage("augment", augment, workers=stage_workers["augment"]),
+                Stage("detect", detect, workers=stage_workers["detect"], setup=create_face_mesh),
+                Stage("write", write, workers=stage_workers["write"])
+            ],
+            source_name="capture",
+            queue_size=queue_size,
+            stop_event=done
+        )
+    finally:
+        # Release camera/video; no windows are opened, so none need closing
+        frames.close()
+
+    saved_paths = sorted(report.outputs, key=lambda path: int(path.stem))
+    return Result(
+        image=None,
+        data=saved_paths,
+        meta={
+            "source": frames.source,
+            "operation": "capture_bulk_pictures",
+            "source_kind": frames.kind,
+            "folder": face_folder,
+            "frame_stride": frame_stride,
+            "dedup_threshold": dedup_threshold,
+            "frames_read": frames.frames_read,
+            "duplicates_skipped": frames.duplicates_skipped,
+            "frames_without_face": frames_without_face,
+            "saved": len(saved_paths),
+            "workers": stage_workers,
+            "queue_size": queue_size,
+            "seed": seed,
+            "speed_profile": speed_profile,
+            "stages": report.stats_dict(),
+            "bottleneck": report.bottleneck
+        }
+    )
 
-            # Apply preprocessing pipeline in sequence
-            # Each step transforms the image and passes it to the next step
-            processed = frame
 
-            if apply_blur:
-                # Reduce noise while preserving facial features
-                processed = blur.apply_median_blur(
-                    image=Image.from_array(processed),
-                    filter_size=3
-                ).image
+def generate_sharded_dataset(
+    folder_path: str | Path,
+    face_id: str | int = DEFAULT_FACE_ID,
+    *,
+    source: str | Path,
+    num_shards: int | None = None,
+    processes: int | None = None,
+    seed: int | None = None,
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    apply_blur: bool = False,
+    apply_grayscale: bool = False,
+    apply_sharpen: bool = False,
+    apply_rotate: bool = False,
+    apply_resize: tuple[int, int] | bool = False,
+    frame_stride: int = DEFAULT_FRAME_STRIDE,
+    resume: bool = True,
+    speed_profile: SpeedProfile = DATASET_SPEED_PROFILE
+) -> Result:
+    """Generate a face dataset from recorded footage with a process pool.
+
+    Splits a video file or image folder into contiguous shards of source
+    items and processes each shard in a worker process with its own
+    FaceMesh. Every item draws its augmentation from a random stream
+    derived from (seed, shard, item), so output is identical for a given
+    seed no matter how many processes run or how often a job is resumed.
+
+    Each shard writes to its own filename range, "<shard:04d>_<item:06d>.jpg",
+    and keeps a JSON manifest "shard_<shard:04d>.json" in the output folder
+    that is replaced atomically as it progresses. Re-running with the same
+    arguments after a crash skips finished shards and continues the others
+    from their last checkpoint. A manifest records the seed, source,
+    detection and augmentation settings, so a run with any of them changed
+    is refused instead of mixing two datasets.
+
+    Processing pipeline (if enabled) is the same as ``capture_bulk_pictures``.
 
-            if apply_sharpen:
-                # Enhance edges with gentle sharpening for better feature detection
-                processed = sharpen.apply_laplacian_sharpening(
-                    image=Image.from_array(processed),
-                    coefficient=1.0
-                ).image
-
-            if apply_grayscale:
-                # Convert to single-channel for reduced storage and faster processing
-                processed = grayscale.convert_to_grayscale(
-                    image=Image.from_array(processed)
-                ).image
-
-            if apply_resize is not False:
-                # Resize to consistent dimensions (e.g., 224x224 for ML models)
-                processed = resize.resize_image(
-                    image=Image.from_array(processed),
-                    new_size=apply_resize
-                ).image
-
-            if apply_rotate:
-                # Apply random rotation with scaling for data augmentation
-                # Rotation range: -45° to +45° with random scale factors
-                angle = float(random.randint(-45, 45))
-                scale = random.choice([1.0, 1.1, 1.2, 1.3])
-                processed = rotate.rotate_image_custom(
-                    image=Image.from_array(processed),
-                    angle=angle,
-                    scale=scale
-                ).image
+    Args:
+        folder_path: Base directory for dataset.
+        face_id: Subject identifier, creates folder "<base_dir>/<face_id>".
+            Default: "unknown"
+        source: Video file or directory of images.
+        num_shards: Number of shards to split the source into.
+            Default: None (same as processes)
+        processes: Worker processes. 1 runs every shard in the calling process.
+            Default: None (os.cpu_count())
+        seed: Master seed for augmentation.
+            Default: None (fresh entropy, reported in meta["seed"]; pass it
+            back in to resume)
+        min_confidence: Face detection confidence threshold.
+            Default: 0.7
+        apply_blur: Apply median blur (size=3).
+            Default: False
+        apply_grayscale: Convert to single-channel.
+            Default: False
+        apply_sharpen: Apply Laplacian (coef=1.0).
+            Default: False
+        apply_rotate: Random rotation [-45°,45°].
+            Default: False
+        apply_resize: Optional (width,height).
+            Default: False (no resize)
+        frame_stride: Use every n-th frame or image of the source.
+            Default: 1
+        resume: Continue from existing shard manifests. An existing output
+            folder is only accepted if resume is True and it already holds
+            shard manifests.
+            Default: True
+        speed_profile: FaceMesh speed profile, see ``speed_profiles``.
+            Default: "fast" (no iris refinement; crops only use the
+            face outline)
+
+    Returns:
+        Result object with generation statistics:
+        - data: List of saved file paths, ordered by shard and item
+        - meta: Operation info, seed, item/save counters and the number of
+          shards that were resumed or already complete
+
+    Raises:
+        TypeError: If source is not a path
+        ValueError: If source does not exist or numeric values are out of range
+        ValueError: If an existing manifest was written with other settings
+        FileExistsError: If the output folder exists and resume is False
+            or it holds no shard manifests
+        RuntimeError: If the video file cannot be opened
+    """
+    if not isinstance(source, (str, Path)):
+        raise TypeError("'source' must be a path to a video file or image directory")
+
+    source = Path(source)
+    if not source.exists():
+        raise ValueError(f"Source path does not exist: {source}")
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if not isinstance(processes, int) or isinstance(processes, bool) or processes <= 0:
+        raise ValueError("'processes' must be a positive integer")
+
+    if num_shards is None:
+        num_shards = processes
+    if not isinstance(num_shards, int) or isinstance(num_shards, bool) or num_shards <= 0:
+        raise ValueError("'num_shards' must be a positive integer")
 
-            # Detect and crop face from processed frame
-            filename = f"{start_index + saved_count:04d}.jpg"
-            output_path = face_folder / filename
+    if not isinstance(min_confidence, (int, float)) or not (0 <= min_confidence <= 1):
+        raise ValueError("'min_confidence' must be between 0 and 1")
+
+    if not isinstance(frame_stride, int) or isinstance(frame_stride, bool) or frame_stride <= 0:
+        raise ValueError("'frame_stride' must be a positive integer")
+
+    if not isinstance(resume, bool):
+        raise TypeError("'resume' must be a boolean")
+
+    profile_settings(speed_profile, "face_mesh")  # Validate before spawning workers
+    seed = _resolve_seed(seed)
 
-            try:
-                # Detect face and crop to face region only
+    try:
+        import mediapipe as mp  # noqa: F401  (fail early, before spawning workers)
+    except ImportError as err:
+        raise ImportError(
+            "The optional 'mediapipe' dependency is required for dataset "
+            'generation. Install it with: pip install "ImagePRO-Python[mediapipe]"'
+        ) from err
+
+    # Only a folder written by an earlier run may be resumed; anything else
+    # is treated like capture_bulk_pictures treats an existing folder
+    face_folder = Path(folder_path) / str(face_id)
+    if face_folder.exists() and not (resume and any(face_folder.glob("shard_*.json"))):
+        raise FileExistsError(f"Output folder already exists: {face_folder}")
+    face_folder.mkdir(parents=True, exist_ok=True)
+
+    base_task = {
+        "folder": str(face_folder),
+        "num_shards": num_shards,
+        "seed": seed,
+        "source": str(source.resolve()),
+        "min_confidence": min_confidence,
+        "frame_stride": frame_stride,
+        "speed_profile": speed_profile,
+        "resume": resume,
+        "augment": {
+            "apply_blur": apply_blur,
+            "apply_sharpen": apply_sharpen,
+            "apply_grayscale": apply_grayscale,
+            "apply_rotate": apply_rotate,
+            "apply_resize": apply_resize
+        }
+    }
+    tasks = [{**base_task, **shard} for shard in _plan_shards(source, num_shards, frame_stride)]
+
+    if processes == 1:
+        summaries = [_generate_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(processes, num_shards)) as pool:
+            summaries = list(pool.map(_generate_shard, tasks))
+
+    saved_paths = [face_folder / name for summary in summaries for name in summary["saved"]]
+    return Result(
+        image=None,
+        data=saved_paths,
+        meta={
+            "source": source,
+            "operation": "generate_sharded_dataset",
+            "folder": face_folder,
+            "num_shards": num_shards,
+            "processes": processes,
+            "seed": seed,
+            "frame_stride": frame_stride,
+            "speed_profile": speed_profile,
+            "items": sum(summary["items"] for summary in summaries),
+            "read_failures": sum(summary["read_failures"] for summary in summaries),
+            "frames_without_face": sum(summary["frames_without_face"] for summary in summaries),
+            "saved": len(saved_paths),
+            "shards_resumed": sum(
+                summary["resumed_from"] > 0 and not summary["was_done"] for summary in summaries
+            ),
+            "shards_already_done": sum(summary["was_done"] for summary in summaries)
+        }
+    )
+
+
+def _plan_shards(source: Path, num_shards: int, frame_stride: int) -> list[dict[str, Any]]:
+    """Split a video or image folder into contiguous ranges of source items."""
+    if source.is_dir():
+        files = sorted(
+            str(p) for p in source.iterdir()
+            if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS
+        )[::frame_stride]
+        total = len(files)
+    else:
+        capture = cv2.VideoCapture(str(source))
+        if not capture.isOpened():
+            raise RuntimeError(f"Cannot open video file: {source}")
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        capture.release()
+        if frame_count <= 0:
+            raise ValueError(f"Cannot determine the frame count of {source} to shard it")
+        total = -(-frame_count // frame_stride)
+
+    bounds = np.linspace(0, total, num_shards + 1).astype(int)
+    shards = []
+    for shard, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+        spec = {"shard": shard, "items": int(stop - start)}
+        if source.is_dir():
+            spec.update(
+                kind="directory",
+                files=files[start:stop],
+                fingerprint=_fingerprint(Path(name).name for name in files[start:stop])
+            )
+        else:
+            spec.update(
+                kind="video",
+                path=str(source),
+                first_frame=int(start) * frame_stride,
+                frame_stride=frame_stride,
+                fingerprint=_fingerprint([str(source.stat().st_size), str(frame_count)])
+            )
+        shards.append(spec)
+    return shards
+
+
+def _fingerprint(parts: Iterable[str]) -> str:
+    """Short digest identifying the contents of a shard's source."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def _iter_shard_frames(task: dict[str, Any], first_item: int) -> Iterable[tuple[int, np.ndarray | None]]:
+    """Yield (item index, frame) for a shard, None for unreadable items."""
+    if task["kind"] == "directory":
+        for index in range(first_item, task["items"]):
+            yield index, cv2.imread(task["files"][index])
+        return
+
+    capture = cv2.VideoCapture(task["path"])
+    if not capture.isOpened():
+        raise RuntimeError(f"Cannot open video file: {task['path']}")
+    try:
+        stride = task["frame_stride"]
+        capture.set(cv2.CAP_PROP_POS_FRAMES, task["first_frame"] + first_item * stride)
+        for index in range(first_item, task["items"]):
+            success, frame = capture.read()
+            if not success:
+                # Reported frame counts can overshoot; the video just ended early
+                return
+            yield index, frame
+            for _ in range(stride - 1):
+                capture.grab()
+    finally:
+        capture.release()
+
+
+def _generate_shard(task: dict[str, Any]) -> dict[str, Any]:
+    """Process one shard in the current process and return its final manifest."""
+    import mediapipe as mp
+
+    shard = task["shard"]
+    folder = Path(task["folder"])
+    manifest_path = folder / f"shard_{shard:04d}.json"
+    manifest = {
+        "shard": shard,
+        "num_shards": task["num_shards"],
+        "seed": task["seed"],
+        "items": task["items"],
+        "source": task["source"],
+        "fingerprint": task["fingerprint"],
+        "min_confidence": task["min_confidence"],
+        "frame_stride": task["frame_stride"],
+        "speed_profile": task["speed_profile"],
+        # JSON round trip so tuples compare equal to the reloaded lists
+        "augment": json.loads(json.dumps(task["augment"])),
+        "next_item": 0,
+        "saved": [],
+        "read_failures": 0,
+        "frames_without_face": 0,
+        "done": False
+    }
+
+    if task["resume"] and manifest_path.exists():
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        settings = (
+            "num_shards", "seed", "items", "source", "fingerprint",
+            "min_confidence", "frame_stride", "speed_profile", "augment"
+        )
+        if any(previous.get(key) != manifest[key] for key in settings):
+            raise ValueError(
+                f"Manifest {manifest_path} was written with different settings; "
+                "use the same seed, shards, source, detection settings and "
+                "augmentation to resume"
+            )
+        manifest = previous
+    resumed_from = manifest["next_item"]
+    was_done = manifest["done"]
+
+    if not was_done:
+        # Record the shard before any work so an early crash leaves a resumable folder
+        write_json_atomic(manifest_path, manifest)
+        face_mesh = mp.solutions.face_mesh.FaceMesh(
+            max_num_faces=1,
+            min_detection_confidence=task["min_confidence"],
+            static_image_mode=True,
+            **profile_settings(task["speed_profile"], "face_mesh")
+        )
+        for index, frame in _iter_shard_frames(task, manifest["next_item"]):
+            if frame is None:
+                manifest["read_failures"] += 1
+            else:
+                processed = _augment_frame(
+                    frame, rng=_item_rng(task["seed"], shard, index), **task["augment"]
+                )
                 result = detect_faces(
                     image=Image.from_array(processed),
                     max_faces=1,
-                    min_confidence=min_confidence,
+                    min_confidence=task["min_confidence"],
                     face_mesh_obj=face_mesh
                 )
+                if result.image is None:
+                    manifest["frames_without_face"] += 1
+                else:
+                    filename = f"{shard:04d}_{index:06d}.jpg"
+                    result.save_as_img(str(folder / filename))
+                    manifest["saved"].append(filename)
 
-                # Save cropped face image
-                result.save_as_img(str(output_path))
-                saved_count += 1
+            manifest["next_item"] = index + 1
+            if manifest["next_item"] % MANIFEST_CHECKPOINT_EVERY == 0:
+                write_json_atomic(manifest_path, manifest)
 
-                # Add delay between captures to allow subject movement
-                if delay > 0:
-                    time.sleep(delay)
+        manifest["next_item"] = manifest["items"]
+        manifest["done"] = True
+        write_json_atomic(manifest_path, manifest)
 
-            except ValueError:
-                # Skip frames with no detected faces (silent failure)
-                continue
+    return {**manifest, "resumed_from": resumed_from, "was_done": was_done}
 
-    finally:
-        # Clean up resources: release camera and close OpenCV windows
-        cap.release()
-        cv2.destroyAllWindows()
+
+def _resolve_seed(seed: int | None) -> int:
+    """Validate a master seed, drawing fresh entropy when it is None."""
+    if seed is None:
+        return int(np.random.SeedSequence().entropy)
+    if not isinstance(seed, int) or isinstance(seed, bool) or seed < 0:
+        raise ValueError("'seed' must be a non-negative integer")
+    return seed
+
+
+def _item_rng(seed: int, shard: int, index: int) -> np.random.Generator:
+    """Independent random stream for one source item of one shard."""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(shard, index)))
+
+
+def _augment_frame(
+    frame: np.ndarray,
+    *,
+    rng: np.random.Generator,
+    apply_blur: bool,
+    apply_sharpen: bool,
+    apply_grayscale: bool,
+    apply_rotate: bool,
+    apply_resize: tuple[int, int] | bool
+) -> np.ndarray:
+    """Apply the enabled preprocessing steps to one frame."""
+    # Each step transforms the image and passes it to the next step
+    processed = frame
+
+    if apply_blur:
+        # Reduce noise while preserving facial features
+        processed = blur.apply_median_blur(
+            image=Image.from_array(processed),
+            filter_size=3
+        ).image
+
+    if apply_sharpen:
+        # Enhance edges with gentle sharpening for better feature detection
+        processed = sharpen.apply_laplacian_sharpening(
+            image=Image.from_array(processed),
+            coefficient=1.0
+        ).image
+
+    if apply_grayscale:
+        # Convert to single-channel for reduced storage and faster processing
+        processed = grayscale.convert_to_grayscale(
+            image=Image.from_array(processed)
+        ).image
+
+    if apply_rotate:
+        # Apply random rotation with scaling for data augmentation
+        # Rotation range: -45° to +45° with random scale factors.
+        # Resize (if requested) is fused into the same cached affine
+        # plan, so the frame is resampled only once
+        angle = float(rng.integers(-ROTATION_RANGE, ROTATION_RANGE, endpoint=True))
+        scale = float(rng.choice(ROTATION_SCALES))
+        plan = rotate.plan_rotation(
+            processed.shape,
+            angle=angle,
+            scale=scale,
+            resize_to=apply_resize if apply_resize is not False else None
+        )
+        processed = rotate.apply_rotation_plan(
+            image=Image.from_array(processed),
+            plan=plan
+        ).image
+
+    elif apply_resize is not False:
+        # Resize to consistent dimensions (e.g., 224x224 for ML models)
+        processed = resize.resize_image(
+            image=Image.from_array(processed),
+            new_size=apply_resize
+        ).image
+
+    return processed
 
 
 if __name__ == "__main__":
@@ -9,8 +9,6 @@ _src_path = _file_path.parents[2]  # Go up to src directory
 if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
-import cv2
-
 from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
 
@@ -43,11 +41,9 @@ def convert_to_grayscale(image: Image) -> Result:
     if image.colorspace == "GRAY":
         raise ValueError("Image is already in grayscale format.")
 
-    # Convert based on source colorspace
-    if image.colorspace == "RGB":
-        grayscale = cv2.cvtColor(image._data, cv2.COLOR_RGB2GRAY)
-    else:  # BGR is default
-        grayscale = cv2.cvtColor(image._data, cv2.COLOR_BGR2GRAY)
+    # Convert based on source colorspace; copy the cached conversion so
+    # callers may modify the result
+    grayscale = image.as_gray().copy()
 
     return Result(
         image=grayscale,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Literal
 
 # Add src directory to path for absolute imports
 _file_path = Path(__file__).resolve()
@@ -10,35 +11,105 @@ if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
 import cv2
+import numpy as np
 
 from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
 
 
+ResizeMode = Literal["stretch", "fit", "fill", "letterbox"]
+Interpolation = Literal["auto", "nearest", "linear", "cubic", "area", "lanczos", "pyramid"]
+
+# Constants for resize operations
+DEFAULT_MODE = "stretch"
+DEFAULT_INTERPOLATION = "auto"
+DEFAULT_PAD_COLOR = 0
+PYRAMID_MIN_FACTOR = 2  # Stop pyrDown before the image drops below this multiple of the target
+RESIZE_MODES = ("stretch", "fit", "fill", "letterbox")
+INTERPOLATION_FLAGS = {
+    "nearest": cv2.INTER_NEAREST,
+    "linear": cv2.INTER_LINEAR,
+    "cubic": cv2.INTER_CUBIC,
+    "area": cv2.INTER_AREA,
+    "lanczos": cv2.INTER_LANCZOS4,
+}
+
+
+def _resolve_interpolation(
+    interpolation: Interpolation,
+    source_size: tuple[int, int],
+    target_size: tuple[int, int]
+) -> str:
+    """Pick the concrete interpolation for a (width, height) size change."""
+    shrinking = target_size[0] <= source_size[0] and target_size[1] <= source_size[1]
+    if interpolation == "auto":
+        return "area" if shrinking else "linear"
+    if interpolation == "pyramid" and not shrinking:
+        return "linear"
+    return interpolation
+
+
+def _resize(data: np.ndarray, size: tuple[int, int], interpolation: str) -> np.ndarray:
+    """Resize to (width, height); "pyramid" halves with pyrDown, then uses area."""
+    if interpolation == "pyramid":
+        width, height = size
+        while (
+            data.shape[1] >= PYRAMID_MIN_FACTOR * width * 2
+            and data.shape[0] >= PYRAMID_MIN_FACTOR * height * 2
+        ):
+            data = cv2.pyrDown(data)
+        interpolation = "area"
+    return cv2.resize(data, size, interpolation=INTERPOLATION_FLAGS[interpolation])
+
+
 def resize_image(
     image: Image,
     *,
-    new_size: tuple[int, int]
+    new_size: tuple[int, int],
+    mode: ResizeMode = DEFAULT_MODE,
+    interpolation: Interpolation = DEFAULT_INTERPOLATION,
+    pad_color: int | tuple[int, ...] = DEFAULT_PAD_COLOR
 ) -> Result:
     """Resize an image to specified dimensions.
 
-    Changes image size to the exact (width, height) given.
-    Uses bilinear interpolation for smooth resizing.
+    By default changes image size to the exact (width, height) given.
+    Aspect-preserving modes size the image against the (width, height) box:
+
+    - "stretch": exact new_size, aspect ratio not preserved
+    - "fit": largest size that fits inside new_size (output may be smaller)
+    - "fill": covers new_size and center-crops the overflow (crop is taken
+      from the source before resizing, so only one resize runs)
+    - "letterbox": "fit", then padded to exactly new_size with pad_color
+
+    Interpolation "auto" uses area averaging when shrinking (no aliasing) and
+    bilinear when enlarging. "pyramid" repeatedly halves the image with
+    cv2.pyrDown before a final area resize, which is faster for large
+    reductions (e.g. 4K to 224).
 
     Args:
         image: Input image to resize.
         new_size: Target size as (width, height) in pixels.
             Both dimensions must be positive integers.
+        mode: "stretch", "fit", "fill" or "letterbox".
+            Default: "stretch"
+        interpolation: "auto", "nearest", "linear", "cubic", "area",
+            "lanczos" or "pyramid".
+            Default: "auto"
+        pad_color: Border value for "letterbox", a number or per-channel tuple.
+            Default: 0
 
     Returns:
         Result object with resized image and metadata:
         - image: Resized image array
         - data: None
-        - meta: Operation info and new size used
+        - meta: Operation info, new size, mode and the mapping
+          output = input * scale + offset, with scale=(sx, sy) and
+          offset=(dx, dy) in pixels
 
     Raises:
         TypeError: If image is not an Image instance
         ValueError: If new_size is not valid (tuple of 2 positive ints)
+        ValueError: If mode or interpolation is not supported
     """
     if not isinstance(image, Image):
         raise TypeError("'image' must be an Image instance")
@@ -50,14 +121,66 @@ def resize_image(
     ):
         raise ValueError("'new_size' must be a tuple of two positive integers")
 
-    # Resize using bilinear interpolation
-    resized = cv2.resize(image._data, new_size, interpolation=cv2.INTER_LINEAR)
+    if mode not in RESIZE_MODES:
+        raise ValueError(f"'mode' must be one of {RESIZE_MODES}")
+
+    if interpolation not in ("auto", "pyramid", *INTERPOLATION_FLAGS):
+        raise ValueError(
+            "'interpolation' must be one of "
+            f"{('auto', 'pyramid', *INTERPOLATION_FLAGS)}"
+        )
+
+    data = image._data
+    height, width = data.shape[:2]
+    target_w, target_h = new_size
+    offset = (0.0, 0.0)
+
+    if mode == "stretch":
+        size = new_size
+        scale = (target_w / width, target_h / height)
+    elif mode == "fill":
+        # Center-crop the source to the target aspect ratio, then resize
+        factor = max(target_w / width, target_h / height)
+        crop_w = min(width, max(1, round(target_w / factor)))
+        crop_h = min(height, max(1, round(target_h / factor)))
+        x0, y0 = (width - crop_w) // 2, (height - crop_h) // 2
+        data = data[y0:y0 + crop_h, x0:x0 + crop_w]
+        size = new_size
+        scale = (target_w / crop_w, target_h / crop_h)
+        offset = (-x0 * scale[0], -y0 * scale[1])
+    else:  # fit and letterbox share the aspect-preserving size
+        factor = min(target_w / width, target_h / height)
+        size = (max(1, round(width * factor)), max(1, round(height * factor)))
+        scale = (size[0] / width, size[1] / height)
+
+    resolved = _resolve_interpolation(interpolation, (data.shape[1], data.shape[0]), size)
+    resized = _resize(data, size, resolved)
+
+    if mode == "letterbox":
+        # Pad the fitted image to the exact target size; cv2 treats a bare
+        # number as (value, 0, 0, 0), so broadcast it to every channel
+        if isinstance(pad_color, (int, float)):
+            pad_color = (pad_color,) * 4
+        left = (target_w - size[0]) // 2
+        top = (target_h - size[1]) // 2
+        resized = cv2.copyMakeBorder(
+            resized,
+            top, target_h - size[1] - top,
+            left, target_w - size[0] - left,
+            cv2.BORDER_CONSTANT,
+            value=pad_color
+        )
+        offset = (float(left), float(top))
 
     return Result(
         image=resized,
         meta={
             "source": image,
             "operation": "resize_image",
-            "new_size": new_size
+            "new_size": new_size,
+            "mode": mode,
+            "interpolation": resolved,
+            "scale": scale,
+            "offset": offset
         }
     )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 # Add src directory to path for absolute imports
@@ -10,6 +12,7 @@ if str(_src_path) not in sys.path:
     sys.path.insert(0, str(_src_path))
 
 import cv2
+import numpy as np
 
 from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
@@ -17,6 +20,241 @@ from ImagePRO.utils.result import Result
 
 # Constants for rotation operations
 DEFAULT_SCALE = 1.0
+PLAN_CACHE_SIZE = 1024    # Cached (shape, angle, scale, ...) transform plans
+REMAP_CACHE_SIZE = 8      # Cached remap grids (each is a full-size map pair)
+
+
+@dataclass(frozen=True)
+class RotationPlan:
+    """
+    Precomputed affine warp for rotations, optionally fused with resize/crop.
+
+    Plans are immutable and hashable, so they can be cached and shared across
+    frames and threads. Build them with ``plan_rotation`` and apply them with
+    ``apply_rotation_plan``.
+
+    Attributes:
+        input_shape (tuple[int, int]):
+            (height, width) of the images the plan applies to.
+        output_size (tuple[int, int]):
+            (width, height) of the warped output.
+        matrix (tuple[tuple[float, ...], tuple[float, ...]]):
+            2x3 affine matrix mapping input to output pixel coordinates.
+    """
+
+    input_shape: tuple[int, int]
+    output_size: tuple[int, int]
+    matrix: tuple[tuple[float, float, float], tuple[float, float, float]]
+
+    def as_array(self) -> np.ndarray:
+        """
+        Returns the affine matrix as a (2, 3) float64 array.
+
+        Returns:
+            np.ndarray: The affine matrix.
+        """
+        return np.array(self.matrix, dtype=np.float64)
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _build_rotation_plan(
+    height: int,
+    width: int,
+    angle: float,
+    scale: float,
+    expand: bool,
+    resize_to: tuple[int, int] | None,
+    crop_box: tuple[int, int, int, int] | None
+) -> RotationPlan:
+    """Compose resize -> rotate -> crop into one cached affine plan."""
+    # Resize: map pixel centers onto the (canvas_w, canvas_h) canvas the same
+    # way cv2.resize does: x' = (x + 0.5) * sx - 0.5
+    transform = np.eye(3)
+    canvas_w, canvas_h = width, height
+    if resize_to is not None:
+        canvas_w, canvas_h = resize_to
+        sx, sy = canvas_w / width, canvas_h / height
+        transform = np.array([
+            [sx, 0.0, 0.5 * (sx - 1.0)],
+            [0.0, sy, 0.5 * (sy - 1.0)],
+            [0.0, 0.0, 1.0]
+        ])
+
+    # Rotate about the canvas center, optionally growing the canvas to fit
+    rotation = np.vstack([
+        cv2.getRotationMatrix2D((canvas_w / 2, canvas_h / 2), angle, scale),
+        [0.0, 0.0, 1.0]
+    ])
+    if expand:
+        cos, sin = abs(rotation[0, 0]), abs(rotation[0, 1])
+        expanded_w = int(round(canvas_w * cos + canvas_h * sin))
+        expanded_h = int(round(canvas_w * sin + canvas_h * cos))
+        rotation[0, 2] += expanded_w / 2 - canvas_w / 2
+        rotation[1, 2] += expanded_h / 2 - canvas_h / 2
+        canvas_w, canvas_h = max(1, expanded_w), max(1, expanded_h)
+    transform = rotation @ transform
+
+    # Crop: translate the box origin to (0, 0)
+    if crop_box is not None:
+        x1, y1, x2, y2 = crop_box
+        if x2 > canvas_w or y2 > canvas_h:
+            raise ValueError(
+                f"'crop_box' exceeds the rotated canvas ({canvas_w}x{canvas_h})"
+            )
+        translation = np.array([[1.0, 0.0, -x1], [0.0, 1.0, -y1], [0.0, 0.0, 1.0]])
+        transform = translation @ transform
+        canvas_w, canvas_h = x2 - x1, y2 - y1
+
+    matrix = tuple(tuple(float(v) for v in row) for row in transform[:2])
+    return RotationPlan(
+        input_shape=(height, width),
+        output_size=(canvas_w, canvas_h),
+        matrix=matrix
+    )
+
+
+@lru_cache(maxsize=REMAP_CACHE_SIZE)
+def _remap_grids(plan: RotationPlan) -> tuple[np.ndarray, np.ndarray]:
+    """Fixed-point cv2.remap grids equivalent to warping with the plan."""
+    width, height = plan.output_size
+    inverse = cv2.invertAffineTransform(plan.as_array())
+    xs, ys = np.meshgrid(
+        np.arange(width, dtype=np.float32),
+        np.arange(height, dtype=np.float32)
+    )
+    map_x = inverse[0, 0] * xs + inverse[0, 1] * ys + inverse[0, 2]
+    map_y = inverse[1, 0] * xs + inverse[1, 1] * ys + inverse[1, 2]
+    map_1, map_2 = cv2.convertMaps(
+        map_x.astype(np.float32), map_y.astype(np.float32), cv2.CV_16SC2
+    )
+    map_1.setflags(write=False)
+    map_2.setflags(write=False)
+    return map_1, map_2
+
+
+def plan_rotation(
+    shape: tuple[int, ...],
+    *,
+    angle: float,
+    scale: float = DEFAULT_SCALE,
+    expand: bool = False,
+    resize_to: tuple[int, int] | None = None,
+    crop_box: tuple[int, int, int, int] | None = None
+) -> RotationPlan:
+    """Build (or fetch from cache) a fused resize/rotate/crop affine plan.
+
+    Steps are applied in order: optional resize to ``resize_to``, rotation
+    about the center by ``angle``/``scale``, then an optional crop. The whole
+    chain collapses into one matrix, so applying the plan costs a single
+    warp instead of one resampling per step. Plans are cached per
+    (shape, angle, scale, expand, resize_to, crop_box).
+
+    Args:
+        shape: Input image shape; only (height, width) is used.
+        angle: Rotation angle in degrees. Positive is counter-clockwise.
+        scale: Rotation scaling factor, must be > 0. Default: 1.0
+        expand: Grow the canvas so the rotated image is not clipped.
+            Default: False
+        resize_to: Optional (width, height) to resize to before rotating.
+            Default: None
+        crop_box: Optional (x1, y1, x2, y2) crop in rotated-canvas pixels.
+            Default: None
+
+    Returns:
+        RotationPlan with the composed matrix and output size.
+
+    Raises:
+        TypeError: If shape is not a tuple of at least two integers
+        TypeError: If angle or scale are not numbers
+        ValueError: If scale is not positive
+        ValueError: If resize_to or crop_box are invalid
+    """
+    if (
+        not isinstance(shape, tuple)
+        or len(shape) < 2
+        or not all(isinstance(d, (int, np.integer)) and d > 0 for d in shape[:2])
+    ):
+        raise TypeError("'shape' must be a tuple starting with (height, width)")
+    if not isinstance(angle, (int, float)):
+        raise TypeError("'angle' must be a number")
+    if not isinstance(scale, (int, float)) or scale <= 0:
+        raise ValueError("'scale' must be a positive number")
+    if resize_to is not None and (
+        not isinstance(resize_to, tuple)
+        or len(resize_to) != 2
+        or not all(isinstance(d, int) and d > 0 for d in resize_to)
+    ):
+        raise ValueError("'resize_to' must be a tuple of two positive integers")
+    if crop_box is not None:
+        if (
+            not isinstance(crop_box, tuple)
+            or len(crop_box) != 4
+            or not all(isinstance(c, int) for c in crop_box)
+        ):
+            raise ValueError("'crop_box' must be an (x1, y1, x2, y2) tuple of integers")
+        x1, y1, x2, y2 = crop_box
+        if x1 < 0 or y1 < 0 or x2 <= x1 or y2 <= y1:
+            raise ValueError(
+                "Invalid 'crop_box': ensure (x1, y1) is top-left "
+                "and (x2, y2) is bottom-right"
+            )
+
+    return _build_rotation_plan(
+        int(shape[0]), int(shape[1]), float(angle), float(scale),
+        bool(expand), resize_to, crop_box
+    )
+
+
+def apply_rotation_plan(
+    image: Image,
+    *,
+    plan: RotationPlan,
+    use_remap: bool = False
+) -> Result:
+    """Warp an image with a precomputed plan in a single resampling pass.
+
+    Args:
+        image: Input image; its (height, width) must match the plan.
+        plan: Plan built by ``plan_rotation``.
+        use_remap: Use cached fixed-point remap grids instead of warpAffine.
+            Worth it when the same plan is applied to many frames.
+            Default: False
+
+    Returns:
+        Result object with warped image and metadata:
+        - image: Warped image array
+        - data: None
+        - meta: Operation info and the plan used
+
+    Raises:
+        TypeError: If image is not an Image instance
+        TypeError: If plan is not a RotationPlan
+        ValueError: If the image size does not match the plan
+    """
+    if not isinstance(image, Image):
+        raise TypeError("'image' must be an Image instance")
+    if not isinstance(plan, RotationPlan):
+        raise TypeError("'plan' must be a RotationPlan")
+    if tuple(image.shape[:2]) != plan.input_shape:
+        raise ValueError(
+            f"Image size {image.shape[:2]} does not match plan {plan.input_shape}"
+        )
+
+    if use_remap:
+        map_1, map_2 = _remap_grids(plan)
+        warped = cv2.remap(image._data, map_1, map_2, cv2.INTER_LINEAR)
+    else:
+        warped = cv2.warpAffine(image._data, plan.as_array(), plan.output_size)
+
+    return Result(
+        image=warped,
+        meta={
+            "source": image,
+            "operation": "apply_rotation_plan",
+            "plan": plan,
+            "use_remap": use_remap
+        }
+    )
 
 
 def rotate_image_90(image: Image) -> Result:
@@ -110,18 +348,22 @@ def rotate_image_custom(
     image: Image,
     *,
     angle: float,
-    scale: float = DEFAULT_SCALE
+    scale: float = DEFAULT_SCALE,
+    expand: bool = False
 ) -> Result:
     """Rotate image by custom angle with optional scaling.
 
     Rotates around image center. Positive angles are counter-clockwise.
-    The output canvas keeps the original image dimensions, so corners of
-    the rotated image may be clipped.
+    By default the output canvas keeps the original image dimensions, so
+    corners of the rotated image may be clipped; ``expand=True`` grows the
+    canvas to fit. Rotation matrices are cached per (shape, angle, scale).
 
     Args:
         image: Input image to rotate.
         angle: Rotation angle in degrees.
         scale: Image scaling factor, must be > 0. Default: 1.0
+        expand: Enlarge the output to contain the whole rotated image.
+            Default: False
 
     Returns:
         Result object with rotated image and metadata:
@@ -141,9 +383,8 @@ def rotate_image_custom(
     if not isinstance(scale, (int, float)) or scale <= 0:
         raise ValueError("'scale' must be a positive number")
 
-    h, w = image.shape[:2]
-    matrix = cv2.getRotationMatrix2D((w/2, h/2), angle, scale)
-    rotated = cv2.warpAffine(image._data, matrix, (w, h))
+    plan = plan_rotation(image.shape, angle=angle, scale=scale, expand=expand)
+    rotated = cv2.warpAffine(image._data, plan.as_array(), plan.output_size)
 
     return Result(
         image=rotated,
@@ -151,6 +392,7 @@ def rotate_image_custom(
             "source": image,
             "operation": "rotate_image_custom",
             "angle": angle,
-            "scale": scale
+            "scale": scale,
+            "expand": expand
         }
     )
@@ -1,7 +1,14 @@
 # Utils Module
 # Provides shared utilities for image I/O operations and data handling
 
+from .frame_source import FrameSource
 from .image import Image
+from .live import LiveStats, run_live
 from .result import Result
+from .shared_frames import FrameRef, SharedFrameRing
+from .temporal import AdaptiveFrameScheduler, OneEuroFilter, TrackSmoother
 
-__all__ = ["Image", "Result"]
+__all__ = [
+    "AdaptiveFrameScheduler", "FrameRef", "FrameSource", "Image", "LiveStats",
+    "OneEuroFilter", "Result", "SharedFrameRing", "TrackSmoother", "run_live"
+]
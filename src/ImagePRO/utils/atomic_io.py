@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def write_json_atomic(path: str | Path, data: Any) -> None:
+    """
+    Write data as JSON, replacing path atomically.
+
+    The JSON is written to a sibling ``.tmp`` file first and then moved
+    over ``path`` with ``os.replace``, so a crash never leaves a
+    half-written file behind. Used for resumable job manifests.
+
+    Args:
+        path (str | Path): Destination file.
+        data (Any): JSON-serializable value.
+
+    Raises:
+        TypeError: If data is not JSON-serializable.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp_path, path)
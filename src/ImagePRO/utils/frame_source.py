@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+import cv2
+import numpy as np
+
+
+SourceKind = Literal["camera", "video", "directory", "iterable"]
+
+# Constants
+DEFAULT_FRAME_STRIDE = 1
+DEFAULT_DEDUP_THRESHOLD = 0.0  # 0 disables duplicate detection
+DEDUP_THUMBNAIL_SIZE = (32, 32)  # (width, height) of the grayscale comparison thumbnail
+IMAGE_EXTENSIONS = frozenset({".bmp", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp"})
+
+
+class FrameSource:
+    """
+    Uniform frame iterator over cameras, video files, image folders and arrays.
+
+    Yields BGR frames as NumPy arrays regardless of where they come from, so
+    callers can process archived footage with the same loop as a live
+    webcam. Offline sources (video, directory, iterable) are read as fast
+    as they can be decoded and simply end when exhausted; only cameras are
+    ``live``.
+
+    Frame skipping happens before decoding where the backend allows it:
+    skipped video/camera frames are only grabbed, and skipped directory
+    entries are never read from disk.
+
+    Attributes:
+        kind (SourceKind):
+            "camera", "video", "directory" or "iterable".
+        frame_stride (int):
+            Keep every n-th frame of the source.
+        dedup_threshold (float):
+            Minimum mean absolute difference (0-255 scale) between the
+            grayscale thumbnails of a frame and the last yielded frame;
+            closer frames are skipped as near-duplicates. 0 disables it.
+        frames_read (int):
+            Frames decoded from the source so far.
+        frames_yielded (int):
+            Frames handed to the caller so far.
+        duplicates_skipped (int):
+            Frames dropped as near-duplicates so far.
+        read_failures (int):
+            Camera reads or directory files that could not be decoded.
+
+    Example:
+        >>> with FrameSource("interview.mp4", frame_stride=5, dedup_threshold=2.0) as frames:
+        ...     for frame in frames:
+        ...         process(frame)
+        >>> print(frames.frames_yielded, frames.duplicates_skipped)
+    """
+
+    def __init__(
+        self,
+        source: int | str | Path | Iterable[np.ndarray],
+        *,
+        frame_stride: int = DEFAULT_FRAME_STRIDE,
+        dedup_threshold: float = DEFAULT_DEDUP_THRESHOLD,
+        camera_api: Optional[int] = None
+    ) -> None:
+        """
+        Validate the source description without opening it.
+
+        Args:
+            source (int | str | Path | Iterable[np.ndarray]):
+                Camera index, video file path, image directory path, or an
+                iterable of BGR arrays.
+            frame_stride (int, optional):
+                Keep every n-th frame. Defaults to 1 (every frame).
+            dedup_threshold (float, optional):
+                Near-duplicate threshold, see class docs. Defaults to 0 (off).
+            camera_api (Optional[int], optional):
+                OpenCV capture backend for camera sources (e.g.
+                ``cv2.CAP_DSHOW``). Defaults to None (OpenCV's choice).
+
+        Raises:
+            TypeError: If source is not a supported type.
+            ValueError: If frame_stride is not a positive integer.
+            ValueError: If dedup_threshold is negative.
+            ValueError: If a path source does not exist.
+        """
+        if not isinstance(frame_stride, int) or isinstance(frame_stride, bool) or frame_stride <= 0:
+            raise ValueError("'frame_stride' must be a positive integer")
+
+        if not isinstance(dedup_threshold, (int, float)) or dedup_threshold < 0:
+            raise ValueError("'dedup_threshold' must be a non-negative number")
+
+        if isinstance(source, bool):
+            raise TypeError("'source' must be a camera index, path, or iterable of arrays")
+
+        if isinstance(source, int):
+            kind: SourceKind = "camera"
+        elif isinstance(source, (str, Path)):
+            source = Path(source)
+            if source.is_dir():
+                kind = "directory"
+            elif source.is_file():
+                kind = "video"
+            else:
+                raise ValueError(f"Source path does not exist: {source}")
+        elif isinstance(source, Iterable):
+            kind = "iterable"
+        else:
+            raise TypeError("'source' must be a camera index, path, or iterable of arrays")
+
+        self.source = source
+        self.kind = kind
+        self.frame_stride = frame_stride
+        self.dedup_threshold = float(dedup_threshold)
+        self.camera_api = camera_api
+
+        self.frames_read = 0
+        self.frames_yielded = 0
+        self.duplicates_skipped = 0
+        self.read_failures = 0
+
+        self._capture: Any = None
+        self._last_thumbnail: Optional[np.ndarray] = None
+
+    @property
+    def live(self) -> bool:
+        """
+        Whether frames arrive in real time (cameras) rather than from storage.
+
+        Returns:
+            bool: True for camera sources.
+        """
+        return self.kind == "camera"
+
+    def open(self) -> FrameSource:
+        """
+        Open the underlying capture device or video file.
+
+        Directory and iterable sources need no opening; calling this is
+        harmless for them.
+
+        Returns:
+            FrameSource: Self, for use as a context manager.
+
+        Raises:
+            RuntimeError: If the camera or video file cannot be opened.
+        """
+        if self._capture is not None or self.kind not in ("camera", "video"):
+            return self
+
+        if self.kind == "camera":
+            if self.camera_api is None:
+                capture = cv2.VideoCapture(self.source)
+            else:
+                capture = cv2.VideoCapture(self.source, self.camera_api)
+            if not capture.isOpened():
+                raise RuntimeError(f"Cannot access camera (index={self.source})")
+        else:
+            capture = cv2.VideoCapture(str(self.source))
+            if not capture.isOpened():
+                raise RuntimeError(f"Cannot open video file: {self.source}")
+
+        self._capture = capture
+        return self
+
+    def close(self) -> None:
+        """Release the capture device or video file, if one is open."""
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+    def __enter__(self) -> FrameSource:
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        self.open()
+        for frame in self._raw_frames():
+            self.frames_read += 1
+            if self._is_duplicate(frame):
+                self.duplicates_skipped += 1
+                continue
+            self.frames_yielded += 1
+            yield frame
+
+    def _raw_frames(self) -> Iterator[np.ndarray]:
+        """Yield every frame_stride-th decoded frame of the source."""
+        if self.kind == "directory":
+            files = sorted(
+                p for p in self.source.iterdir()
+                if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS
+            )
+            for path in files[::self.frame_stride]:
+                frame = cv2.imread(str(path))
+                if frame is None:
+                    self.read_failures += 1
+                    continue
+                yield frame
+
+        elif self.kind == "iterable":
+            for frame in islice(self.source, 0, None, self.frame_stride):
+                if not isinstance(frame, np.ndarray):
+                    raise TypeError("Iterable sources must yield numpy.ndarray frames")
+                yield frame
+
+        else:
+            capture = self._capture
+            while capture is not None:
+                success, frame = capture.read()
+                if not success:
+                    if not self.live:
+                        return
+                    # Cameras drop frames occasionally; keep waiting for the next one
+                    self.read_failures += 1
+                    continue
+                yield frame
+                # grab() advances without decoding, so skipped frames are cheap
+                for _ in range(self.frame_stride - 1):
+                    if not capture.grab() and not self.live:
+                        return
+                capture = self._capture
+
+    def _is_duplicate(self, frame: np.ndarray) -> bool:
+        """Compare a frame's thumbnail against the last kept frame."""
+        if self.dedup_threshold <= 0:
+            return False
+
+        gray = frame
+        if frame.ndim == 3 and frame.shape[2] == 3:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        elif frame.ndim == 3:
+            gray = frame[..., 0]
+        thumbnail = cv2.resize(gray, DEDUP_THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+
+        last = self._last_thumbnail
+        if last is not None and thumbnail.dtype == last.dtype:
+            if float(cv2.absdiff(thumbnail, last).mean()) < self.dedup_threshold:
+                return True
+
+        self._last_thumbnail = thumbnail
+        return False
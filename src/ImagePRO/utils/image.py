@@ -3,14 +3,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Tuple, Literal
+from typing import Dict, Optional, Tuple, Literal
 
 import cv2
 import numpy as np
 
 
 Colorspace = Literal["BGR", "RGB", "GRAY"]
-SourceType = Literal["path", "array"]
+SourceType = Literal["path", "array", "shared"]
+
+# (source colorspace, target) -> cv2 conversion code
+_CONVERSIONS = {
+    ("BGR", "RGB"): cv2.COLOR_BGR2RGB,
+    ("GRAY", "RGB"): cv2.COLOR_GRAY2RGB,
+    ("RGB", "BGR"): cv2.COLOR_RGB2BGR,
+    ("GRAY", "BGR"): cv2.COLOR_GRAY2BGR,
+    ("BGR", "GRAY"): cv2.COLOR_BGR2GRAY,
+    ("RGB", "GRAY"): cv2.COLOR_RGB2GRAY,
+}
 
 
 @dataclass
@@ -30,7 +40,14 @@ class Image:
         colorspace (Colorspace):
             Image colorspace ("BGR", "RGB", or "GRAY"). Defaults to "BGR".
         source_type (SourceType):
-            Indicates if image was loaded from "path" or "array".
+            Indicates if image was loaded from "path", wraps an "array", or
+            is a view into a ``SharedFrameRing`` slot ("shared").
+
+    ``as_rgb()`` and ``as_gray()`` return the image in another colorspace,
+    converting at most once per instance: the result is cached on the
+    Image, so several analyses of the same frame share one conversion. If
+    the image is already in the requested colorspace, its own array is
+    returned without a copy.
 
     Example:
         >>> # Load from file (default BGR)
@@ -45,6 +62,7 @@ class Image:
     path: Optional[Path] = None
     colorspace: Colorspace = "BGR"
     source_type: SourceType = "array"
+    _derived: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
     def from_path(
@@ -126,3 +144,50 @@ class Image:
             np.dtype: Data type of the image array.
         """
         return self._data.dtype
+
+    def as_rgb(self) -> np.ndarray:
+        """
+        Return the image as a 3-channel RGB array.
+
+        The conversion runs on the first call only; later calls return the
+        cached array. Converted arrays are read-only because they are
+        shared; copy them before modifying.
+
+        Returns:
+            np.ndarray: RGB array (the image's own array if it is already RGB).
+        """
+        return self._converted("RGB")
+
+    def as_bgr(self) -> np.ndarray:
+        """
+        Return the image as a 3-channel BGR array.
+
+        Cached like ``as_rgb``; used for models that take OpenCV-order input.
+
+        Returns:
+            np.ndarray: BGR array (the image's own array if it is already BGR).
+        """
+        return self._converted("BGR")
+
+    def as_gray(self) -> np.ndarray:
+        """
+        Return the image as a single-channel grayscale array.
+
+        Cached like ``as_rgb``.
+
+        Returns:
+            np.ndarray: Grayscale array (the image's own array if it is already GRAY).
+        """
+        return self._converted("GRAY")
+
+    def _converted(self, target: Colorspace) -> np.ndarray:
+        """Convert to ``target`` once and cache the read-only result."""
+        if self.colorspace == target:
+            return self._data
+
+        converted = self._derived.get(target)
+        if converted is None:
+            converted = cv2.cvtColor(self._data, _CONVERSIONS[(self.colorspace, target)])
+            converted.setflags(write=False)
+            self._derived[target] = converted
+        return converted
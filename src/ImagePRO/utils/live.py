@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+import cv2
+import numpy as np
+
+from ImagePRO.utils.frame_source import FrameSource
+from ImagePRO.utils.result import Result
+
+
+# Constants
+ESC_KEY = 27
+RENDER_POLL_SECONDS = 0.01  # How long the render loop waits before pumping GUI events
+LIVE_STAGES = ("capture", "preprocess", "infer", "postprocess", "render", "end_to_end")
+STATS_WINDOW = 120  # Samples kept per stage (about 4 s at 30 FPS)
+STATS_PERCENTILES = (50, 95, 99)
+OVERLAY_ORIGIN = (10, 20)
+OVERLAY_LINE_HEIGHT = 18
+OVERLAY_COLOR = (0, 255, 255)
+_CLOSED = object()
+
+
+class LiveStats:
+    """
+    Rolling per-stage latency and FPS statistics for a live loop.
+
+    Each stage keeps its last ``window`` durations, so percentiles follow
+    the current load instead of averaging over the whole session. Stages:
+
+    - capture: reading/decoding one frame from the source
+    - preprocess: turning the frame into model input
+    - infer: running the model
+    - postprocess: turning raw model output into what is drawn
+    - render: drawing the output onto the frame
+    - end_to_end: from the end of capture to the frame being shown
+
+    ``record`` is thread-safe, so a ``LiveStats`` passed to ``run_live``
+    can be read from another thread while the loop is running.
+
+    Attributes:
+        window (int): Samples kept per stage.
+
+    Example:
+        >>> stats = LiveStats()
+        >>> run_live("clip.mp4", infer=model, render=draw, display=False, stats=stats)
+        >>> stats.percentiles("infer")["p95"]  # milliseconds
+    """
+
+    def __init__(self, window: int = STATS_WINDOW) -> None:
+        """
+        Create empty statistics.
+
+        Args:
+            window (int, optional):
+                Samples kept per stage and for the FPS estimate.
+                Defaults to 120.
+
+        Raises:
+            ValueError: If window is not an integer of at least 2.
+        """
+        if not isinstance(window, int) or isinstance(window, bool) or window < 2:
+            raise ValueError("'window' must be an integer of at least 2")
+
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {stage: deque(maxlen=window) for stage in LIVE_STAGES}
+        self._frame_times: deque[float] = deque(maxlen=window)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Add one duration sample.
+
+        Args:
+            stage (str): One of ``LIVE_STAGES``.
+            seconds (float): Measured duration.
+
+        Raises:
+            ValueError: If stage is unknown.
+        """
+        if stage not in self._samples:
+            raise ValueError(f"'stage' must be one of {LIVE_STAGES}")
+        with self._lock:
+            self._samples[stage].append(seconds)
+
+    def mark_frame(self, timestamp: Optional[float] = None) -> None:
+        """Record that a frame was shown, for the FPS estimate."""
+        with self._lock:
+            self._frame_times.append(time.perf_counter() if timestamp is None else timestamp)
+
+    @property
+    def fps(self) -> float:
+        """Shown frames per second over the rolling window."""
+        with self._lock:
+            times = list(self._frame_times)
+        if len(times) < 2 or times[-1] <= times[0]:
+            return 0.0
+        return (len(times) - 1) / (times[-1] - times[0])
+
+    def percentiles(self, stage: str) -> dict[str, Optional[float]]:
+        """
+        Rolling latency percentiles of one stage.
+
+        Args:
+            stage (str): One of ``LIVE_STAGES``.
+
+        Returns:
+            dict[str, Optional[float]]: ``p50``, ``p95`` and ``p99`` in
+            milliseconds (None while the stage has no samples) and ``count``.
+
+        Raises:
+            ValueError: If stage is unknown.
+        """
+        if stage not in self._samples:
+            raise ValueError(f"'stage' must be one of {LIVE_STAGES}")
+        with self._lock:
+            samples = np.fromiter(self._samples[stage], dtype=np.float64)
+
+        if samples.size == 0:
+            values: list[Optional[float]] = [None] * len(STATS_PERCENTILES)
+        else:
+            values = (np.percentile(samples, STATS_PERCENTILES) * 1000.0).tolist()
+        result: dict[str, Optional[float]] = {
+            f"p{q}": value for q, value in zip(STATS_PERCENTILES, values)
+        }
+        result["count"] = int(samples.size)
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Export all statistics.
+
+        Returns:
+            dict[str, Any]: ``fps`` plus ``percentiles(stage)`` for every stage.
+        """
+        stats: dict[str, Any] = {"fps": self.fps}
+        stats.update({stage: self.percentiles(stage) for stage in LIVE_STAGES})
+        return stats
+
+    def overlay_lines(self) -> list[str]:
+        """Short text lines summarizing FPS and the p50/p95 of every measured stage."""
+        lines = [f"FPS {self.fps:.1f}"]
+        for stage in LIVE_STAGES:
+            pct = self.percentiles(stage)
+            if pct["count"]:
+                lines.append(f"{stage} p50 {pct['p50']:.1f} / p95 {pct['p95']:.1f} ms")
+        return lines
+
+    def draw(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Draw the overlay lines onto a copy of a frame.
+
+        Args:
+            frame (np.ndarray): BGR or grayscale frame.
+
+        Returns:
+            np.ndarray: Annotated copy.
+        """
+        annotated = frame.copy()
+        x, y = OVERLAY_ORIGIN
+        for i, line in enumerate(self.overlay_lines()):
+            cv2.putText(
+                annotated, line,
+                (x, y + i * OVERLAY_LINE_HEIGHT),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5, OVERLAY_COLOR, 1
+            )
+        return annotated
+
+
+class _LatestValue:
+    """Single-slot mailbox; with ``latest_only`` a new value replaces an unread one."""
+
+    def __init__(self, *, latest_only: bool) -> None:
+        self._cond = threading.Condition()
+        self._value: Any = None
+        self._unread = False
+        self._closed = False
+        self.latest_only = latest_only
+        self.dropped = 0
+
+    def put(self, value: Any) -> None:
+        with self._cond:
+            if not self.latest_only:
+                # Lossless mode: wait until the consumer took the previous value
+                self._cond.wait_for(lambda: not self._unread or self._closed)
+            if self._closed:
+                return
+            if self._unread:
+                self.dropped += 1
+            self._value, self._unread = value, True
+            self._cond.notify_all()
+
+    def take(self, timeout: Optional[float] = None) -> Any:
+        """Return the next unread value, None on timeout, or _CLOSED when finished."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._unread or self._closed, timeout):
+                return None
+            if not self._unread:
+                return _CLOSED
+            value, self._value, self._unread = self._value, None, False
+            self._cond.notify_all()
+            return value
+
+    def close(self, *, discard: bool = False) -> None:
+        """Stop accepting values; readers still get an unread value unless discarded."""
+        with self._cond:
+            self._closed = True
+            if discard:
+                self._value, self._unread = None, False
+            self._cond.notify_all()
+
+
+def run_live(
+    source: int | str | Path | Iterable[np.ndarray],
+    *,
+    infer: Callable[[Any], Any],
+    render: Callable[[np.ndarray, Any], np.ndarray],
+    preprocess: Callable[[np.ndarray], Any] | None = None,
+    postprocess: Callable[[np.ndarray, Any], Any] | None = None,
+    window_name: str = "ImagePRO",
+    display: bool = True,
+    max_frames: int | None = None,
+    latest_only: bool | None = None,
+    camera_api: int | None = None,
+    exit_key: int = ESC_KEY,
+    stats: LiveStats | None = None,
+    overlay: bool = False
+) -> Result:
+    """Run a capture → inference → render loop on decoupled threads.
+
+    A grabber thread reads the source continuously and keeps only the newest
+    frame, an inference thread always works on the most recent frame it has
+    not seen yet, and the calling thread renders and displays the latest
+    finished result (OpenCV windows must live on the main thread). Frames
+    that arrive while inference is busy are dropped instead of queueing in
+    the camera buffer, so the displayed latency stays around one inference
+    time no matter how slow the model is.
+
+    Per frame, the inference thread calls ``preprocess(frame)``,
+    ``infer(...)`` on its result and ``postprocess(frame, raw)``; the
+    calling thread then calls ``render(frame, output)``. Every step is timed
+    into ``stats`` (see ``LiveStats``).
+
+    Args:
+        source: Camera index, video file, image directory, or iterable of
+            BGR arrays (see ``FrameSource``).
+        infer: Called with the preprocessed frame; runs on the inference thread.
+        render: Called as ``render(frame, output)`` and returns the frame to
+            show. Runs on the calling thread.
+        preprocess: Turns a BGR frame into the input of ``infer``.
+            Default: None (the frame itself)
+        postprocess: Called as ``postprocess(frame, raw)`` with the return
+            value of ``infer``; its result is passed to ``render``.
+            Default: None (the raw value)
+        window_name: Title of the display window.
+            Default: "ImagePRO"
+        display: Show frames with ``cv2.imshow``; set False to run headless.
+            Default: True
+        max_frames: Stop after rendering this many frames.
+            Default: None (until the source ends or the exit key is pressed)
+        latest_only: Drop frames that arrive while inference is busy.
+            Default: None (True for cameras, False for offline sources so
+            that every frame of a file is processed)
+        camera_api: OpenCV capture backend for camera sources.
+            Default: None
+        exit_key: Key code that closes the window.
+            Default: 27 (ESC)
+        stats: Statistics to fill; pass one to watch them while running.
+            Default: None (a new ``LiveStats``)
+        overlay: Draw FPS and stage latencies onto the shown frame.
+            Default: False
+
+    Returns:
+        Result object with loop statistics:
+        - meta: frames_captured, frames_inferred, frames_rendered,
+          frames_dropped, elapsed_seconds, fps (rendered frames per second
+          over the whole run) and stats (``LiveStats.as_dict()``)
+
+    Raises:
+        TypeError: If infer, render or a given hook is not callable
+        TypeError: If stats is not a LiveStats instance
+        ValueError: If max_frames is not a positive integer
+        RuntimeError: If the camera or video file cannot be opened
+        Exception: Errors raised by the source or a callback are re-raised
+    """
+    if not callable(infer) or not callable(render):
+        raise TypeError("'infer' and 'render' must be callable")
+
+    if any(hook is not None and not callable(hook) for hook in (preprocess, postprocess)):
+        raise TypeError("'preprocess' and 'postprocess' must be callable or None")
+
+    if max_frames is not None and (
+        not isinstance(max_frames, int) or isinstance(max_frames, bool) or max_frames <= 0
+    ):
+        raise ValueError("'max_frames' must be a positive integer")
+
+    if stats is None:
+        stats = LiveStats()
+    elif not isinstance(stats, LiveStats):
+        raise TypeError("'stats' must be a LiveStats instance")
+
+    frames = FrameSource(source, camera_api=camera_api)
+    if latest_only is None:
+        latest_only = frames.live
+
+    captured = _LatestValue(latest_only=latest_only)
+    inferred = _LatestValue(latest_only=latest_only)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    counts = {"captured": 0, "inferred": 0, "rendered": 0}
+
+    def timed(stage: str, func: Callable[..., Any], *args: Any) -> Any:
+        start = time.perf_counter()
+        value = func(*args)
+        stats.record(stage, time.perf_counter() - start)
+        return value
+
+    def grab() -> None:
+        iterator = iter(frames)
+        try:
+            while not stop.is_set():
+                start = time.perf_counter()
+                frame = next(iterator, None)
+                if frame is None:
+                    break
+                captured_at = time.perf_counter()
+                stats.record("capture", captured_at - start)
+                counts["captured"] += 1
+                captured.put((captured_at, frame))
+        except BaseException as exc:  # surfaced in the calling thread
+            errors.append(exc)
+            stop.set()
+        finally:
+            frames.close()
+            captured.close()
+
+    def analyze() -> None:
+        try:
+            while not stop.is_set():
+                item = captured.take()
+                if item is _CLOSED:
+                    break
+                captured_at, frame = item
+                model_input = frame if preprocess is None else timed("preprocess", preprocess, frame)
+                output = timed("infer", infer, model_input)
+                if postprocess is not None:
+                    output = timed("postprocess", postprocess, frame, output)
+                counts["inferred"] += 1
+                inferred.put((captured_at, frame, output))
+        except BaseException as exc:
+            errors.append(exc)
+            stop.set()
+        finally:
+            inferred.close()
+
+    # Open in the calling thread so access errors raise immediately
+    frames.open()
+    threads = [
+        threading.Thread(target=grab, name="live-grab", daemon=True),
+        threading.Thread(target=analyze, name="live-infer", daemon=True)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    try:
+        while not stop.is_set():
+            item = inferred.take(timeout=RENDER_POLL_SECONDS)
+            if item is _CLOSED:
+                break
+            if item is not None:
+                captured_at, frame, output = item
+                display_frame = timed("render", render, frame, output)
+                if overlay:
+                    display_frame = stats.draw(display_frame)
+                if display:
+                    cv2.imshow(window_name, display_frame)
+                shown_at = time.perf_counter()
+                stats.record("end_to_end", shown_at - captured_at)
+                stats.mark_frame(shown_at)
+                counts["rendered"] += 1
+            if display and cv2.waitKey(1) & 0xFF == exit_key:
+                break
+            if max_frames is not None and counts["rendered"] >= max_frames:
+                break
+    finally:
+        stop.set()
+        captured.close(discard=True)
+        inferred.close(discard=True)
+        for thread in threads:
+            thread.join()
+        if display:
+            cv2.destroyAllWindows()
+
+    elapsed = time.perf_counter() - started
+    if errors:
+        raise errors[0]
+
+    return Result(
+        image=None,
+        data=None,
+        meta={
+            "source": frames.source,
+            "operation": "run_live",
+            "source_kind": frames.kind,
+            "latest_only": latest_only,
+            "frames_captured": counts["captured"],
+            "frames_inferred": counts["inferred"],
+            "frames_rendered": counts["rendered"],
+            "frames_dropped": captured.dropped + inferred.dropped,
+            "elapsed_seconds": elapsed,
+            "fps": counts["rendered"] / elapsed if elapsed > 0 else 0.0,
+            "stats": stats.as_dict()
+        }
+    )
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+# Constants
+DEFAULT_QUEUE_SIZE = 8
+_SENTINEL = object()
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of a threaded pipeline.
+
+    Attributes:
+        name (str):
+            Stage name used in the statistics.
+        func (Callable[..., Any]):
+            Called as ``func(item)``, or ``func(item, state)`` when ``setup``
+            is given. Returning None drops the item.
+        workers (int):
+            Number of threads running this stage. Defaults to 1.
+        setup (Optional[Callable[[], Any]]):
+            Called once per worker thread to build per-thread state (e.g. a
+            detector that must not be shared between threads).
+    """
+
+    name: str
+    func: Callable[..., Any]
+    workers: int = 1
+    setup: Optional[Callable[[], Any]] = None
+
+
+@dataclass
+class StageStats:
+    """
+    Counters collected for one pipeline stage.
+
+    Attributes:
+        name (str): Stage name.
+        workers (int): Number of worker threads.
+        items_in (int): Items taken from the input queue (or source).
+        items_out (int): Items passed downstream (None results excluded).
+        busy_seconds (float): Summed time spent inside the stage function.
+        idle_seconds (float): Summed time spent waiting for input.
+        blocked_seconds (float): Summed time spent waiting for room downstream
+            (backpressure from a slower stage).
+        elapsed_seconds (float): Wall time of the whole pipeline run.
+    """
+
+    name: str
+    workers: int
+    items_in: int = 0
+    items_out: int = 0
+    busy_seconds: float = 0.0
+    idle_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def throughput(self) -> float:
+        """Items passed downstream per second of wall time."""
+        return self.items_out / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the stage's worker time spent doing work (0-1)."""
+        capacity = self.workers * self.elapsed_seconds
+        return self.busy_seconds / capacity if capacity > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Export the counters as a plain dictionary.
+
+        Returns:
+            dict[str, Any]: Counters plus derived throughput and utilization.
+        """
+        return {
+            "workers": self.workers,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "busy_seconds": self.busy_seconds,
+            "idle_seconds": self.idle_seconds,
+            "blocked_seconds": self.blocked_seconds,
+            "throughput": self.throughput,
+            "utilization": self.utilization
+        }
+
+    def _add(self, *, items_in: int = 0, items_out: int = 0, busy: float = 0.0,
+             idle: float = 0.0, blocked: float = 0.0) -> None:
+        with self._lock:
+            self.items_in += items_in
+            self.items_out += items_out
+            self.busy_seconds += busy
+            self.idle_seconds += idle
+            self.blocked_seconds += blocked
+
+
+@dataclass
+class PipelineReport:
+    """
+    Outputs and statistics of a finished pipeline run.
+
+    Attributes:
+        outputs (list[Any]): Non-None results of the last stage, in completion order.
+        stages (list[StageStats]): Statistics for the source and every stage.
+        elapsed_seconds (float): Wall time of the run.
+        stopped (bool): True if the run ended through ``stop_event``.
+    """
+
+    outputs: list[Any]
+    stages: list[StageStats]
+    elapsed_seconds: float
+    stopped: bool
+
+    @property
+    def bottleneck(self) -> Optional[str]:
+        """Name of the stage with the highest utilization, None if nothing ran."""
+        busiest = max(self.stages, key=lambda s: s.utilization, default=None)
+        return busiest.name if busiest is not None and busiest.busy_seconds > 0 else None
+
+    def stats_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Export per-stage statistics keyed by stage name.
+
+        Returns:
+            dict[str, dict[str, Any]]: ``StageStats.as_dict()`` per stage.
+        """
+        return {stats.name: stats.as_dict() for stats in self.stages}
+
+
+def run_pipeline(
+    source: Iterable[Any],
+    stages: Sequence[Stage],
+    *,
+    source_name: str = "source",
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    stop_event: Optional[threading.Event] = None
+) -> PipelineReport:
+    """Run items through threaded stages connected by bounded queues.
+
+    The source is iterated on its own thread and every stage runs on
+    ``stage.workers`` threads, so slow steps (decoding, inference, disk
+    writes) overlap instead of running back to back. Bounded queues apply
+    backpressure: a fast stage blocks once ``queue_size`` items wait for the
+    next one, which keeps memory flat and shows up as ``blocked_seconds``.
+    With more than one worker per stage, items may complete out of order.
+
+    Args:
+        source: Iterable of input items; iterated on a dedicated thread.
+        stages: Stages to apply in order.
+        source_name: Name reported for the source in the statistics.
+            Default: "source"
+        queue_size: Capacity of each inter-stage queue.
+            Default: 8
+        stop_event: Event that ends the run early when set, e.g. by the
+            last stage once enough items were produced. In-flight items are
+            discarded. If None, a private event is used.
+            Default: None
+
+    Returns:
+        PipelineReport with outputs of the last stage and per-stage statistics.
+
+    Raises:
+        TypeError: If stages contains non-Stage items
+        ValueError: If stages is empty, queue_size or a worker count is not positive
+        Exception: The first exception raised by the source or a stage
+            is re-raised after all threads have stopped
+    """
+    if not stages:
+        raise ValueError("'stages' must contain at least one Stage")
+
+    if not all(isinstance(stage, Stage) for stage in stages):
+        raise TypeError("'stages' must contain only Stage instances")
+
+    if any(not isinstance(s.workers, int) or s.workers <= 0 for s in stages):
+        raise ValueError("Stage 'workers' must be a positive integer")
+
+    if not isinstance(queue_size, int) or queue_size <= 0:
+        raise ValueError("'queue_size' must be a positive integer")
+
+    stop = stop_event if stop_event is not None else threading.Event()
+    errors: list[BaseException] = []
+    outputs: list[Any] = []
+    outputs_lock = threading.Lock()
+
+    source_stats = StageStats(name=source_name, workers=1)
+    stage_stats = [StageStats(name=s.name, workers=s.workers) for s in stages]
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+
+    def fail(exc: BaseException) -> None:
+        with outputs_lock:
+            errors.append(exc)
+        stop.set()
+
+    def put(q: queue.Queue, item: Any, stats: StageStats) -> None:
+        start = time.perf_counter()
+        q.put(item)
+        stats._add(blocked=time.perf_counter() - start)
+
+    def produce() -> None:
+        iterator = iter(source)
+        try:
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                source_stats._add(items_in=1, items_out=1, busy=time.perf_counter() - start)
+                put(queues[0], item, source_stats)
+        except BaseException as exc:  # surfaced in the calling thread
+            fail(exc)
+        finally:
+            for _ in range(stages[0].workers):
+                queues[0].put(_SENTINEL)
+
+    # Last worker of each stage forwards end-of-stream to the next stage
+    remaining = [s.workers for s in stages]
+    remaining_lock = threading.Lock()
+
+    def work(index: int) -> None:
+        stage, stats = stages[index], stage_stats[index]
+        in_q = queues[index]
+        out_q = queues[index + 1] if index + 1 < len(stages) else None
+        state = None
+        try:
+            if stage.setup is not None:
+                state = stage.setup()
+        except BaseException as exc:
+            fail(exc)
+
+        while True:
+            start = time.perf_counter()
+            item = in_q.get()
+            stats._add(idle=time.perf_counter() - start)
+            if item is _SENTINEL:
+                break
+            if stop.is_set():
+                continue  # Drain without processing
+            start = time.perf_counter()
+            try:
+                result = stage.func(item) if stage.setup is None else stage.func(item, state)
+            except BaseException as exc:
+                fail(exc)
+                continue
+            produced = result is not None
+            stats._add(items_in=1, items_out=int(produced), busy=time.perf_counter() - start)
+            if not produced:
+                continue
+            if out_q is not None:
+                put(out_q, result, stats)
+            else:
+                with outputs_lock:
+                    outputs.append(result)
+
+        with remaining_lock:
+            remaining[index] -= 1
+            last = remaining[index] == 0
+        if last and out_q is not None:
+            for _ in range(stages[index + 1].workers):
+                out_q.put(_SENTINEL)
+
+    threads = [threading.Thread(target=produce, name=f"{source_name}-0", daemon=True)]
+    for index, stage in enumerate(stages):
+        threads.extend(
+            threading.Thread(target=work, args=(index,), name=f"{stage.name}-{n}", daemon=True)
+            for n in range(stage.workers)
+        )
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    all_stats = [source_stats, *stage_stats]
+    for stats in all_stats:
+        stats.elapsed_seconds = elapsed
+
+    if errors:
+        raise errors[0]
+
+    return PipelineReport(
+        outputs=outputs,
+        stages=all_stats,
+        elapsed_seconds=elapsed,
+        stopped=stop.is_set()
+    )
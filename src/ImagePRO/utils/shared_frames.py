@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+import numpy as np
+
+from ImagePRO.utils.image import Colorspace, Image
+
+
+# Constants
+RING_MAGIC = b"IPRORING"
+HEADER_BYTES = 64  # Ring header and every slot header occupy one 64-byte block
+MAX_DIMS = 4
+RING_HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("slots", "<u4"),
+    ("slot_bytes", "<u8"),
+])
+SLOT_HEADER_DTYPE = np.dtype([
+    ("seq", "<u8"),  # 0 while a slot is empty or being written
+    ("ndim", "<u4"),
+    ("shape", "<u4", (MAX_DIMS,)),
+    ("dtype", "S8"),
+    ("colorspace", "S8"),
+])
+
+
+@dataclass(frozen=True)
+class FrameRef:
+    """
+    Small, picklable handle to one frame stored in a ``SharedFrameRing``.
+
+    Attributes:
+        slot (int): Ring slot holding the frame.
+        seq (int): Write sequence number; a read fails once the slot is reused.
+    """
+
+    slot: int
+    seq: int
+
+
+class SharedFrameRing:
+    """
+    Fixed-size ring of image slots in ``multiprocessing.shared_memory``.
+
+    A producer writes frames into the next slot and passes the returned
+    ``FrameRef`` (two integers) to worker processes instead of pickling the
+    pixels. Workers attach to the same block by name and ``read`` returns an
+    ``Image`` whose array is a read-only view straight into shared memory,
+    so a 1080p frame crosses the process boundary without being copied.
+
+    Every slot starts with a small header holding the frame's shape, dtype,
+    colorspace and a sequence number. Slots are reused round-robin, so a
+    reader must be done with a frame before ``slots`` newer frames are
+    written; reading a reused slot raises instead of returning wrong pixels.
+    Only one process should write to a ring.
+
+    Attributes:
+        name (str):
+            Shared memory block name, used by ``attach``.
+        slots (int):
+            Number of frames the ring holds.
+        slot_bytes (int):
+            Maximum pixel payload per frame.
+
+    Example:
+        >>> ring = SharedFrameRing.create(slots=8, slot_bytes=1920 * 1080 * 3)
+        >>> ref = ring.write(Image.from_array(frame))
+        >>> # In a worker process:
+        >>> worker_ring = SharedFrameRing.attach(ring.name)
+        >>> image = worker_ring.read(ref)  # zero-copy, source_type="shared"
+        >>> ...
+        >>> ring.close()
+        >>> ring.unlink()
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, *, owner: bool) -> None:
+        """
+        Wrap an existing shared memory block; use ``create`` or ``attach``.
+
+        Args:
+            shm (shared_memory.SharedMemory):
+                Block laid out by ``create``.
+            owner (bool):
+                Whether this instance created the block.
+
+        Raises:
+            ValueError: If the block is not a SharedFrameRing.
+        """
+        if bytes(shm.buf[:len(RING_MAGIC)]) != RING_MAGIC:
+            raise ValueError(f"Shared memory block '{shm.name}' is not a SharedFrameRing")
+
+        ring_header = np.ndarray((), RING_HEADER_DTYPE, buffer=shm.buf)
+        self._shm = shm
+        self._owner = owner
+        self.slots = int(ring_header["slots"])
+        self.slot_bytes = int(ring_header["slot_bytes"])
+        self._slot_stride = HEADER_BYTES + self.slot_bytes
+        self._headers = np.ndarray(
+            (self.slots,),
+            SLOT_HEADER_DTYPE,
+            buffer=shm.buf,
+            offset=HEADER_BYTES,
+            strides=(self._slot_stride,)
+        )
+        self._next_seq = 1
+
+    @classmethod
+    def create(cls, *, slots: int, slot_bytes: int, name: Optional[str] = None) -> SharedFrameRing:
+        """
+        Allocate a new ring in shared memory.
+
+        Args:
+            slots (int):
+                Number of frames the ring holds.
+            slot_bytes (int):
+                Largest frame payload in bytes (e.g. H * W * C for uint8).
+                Rounded up to a multiple of 64.
+            name (Optional[str], optional):
+                Block name; a unique one is generated if None. Defaults to None.
+
+        Returns:
+            SharedFrameRing: Owning ring; call ``close`` and ``unlink`` when done.
+
+        Raises:
+            ValueError: If slots or slot_bytes is not a positive integer.
+        """
+        for label, value in (("slots", slots), ("slot_bytes", slot_bytes)):
+            if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+                raise ValueError(f"'{label}' must be a positive integer")
+
+        slot_bytes = -(-slot_bytes // HEADER_BYTES) * HEADER_BYTES
+        size = HEADER_BYTES + slots * (HEADER_BYTES + slot_bytes)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        ring_header = np.ndarray((), RING_HEADER_DTYPE, buffer=shm.buf)
+        ring_header["magic"] = RING_MAGIC
+        ring_header["slots"] = slots
+        ring_header["slot_bytes"] = slot_bytes
+        del ring_header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedFrameRing:
+        """
+        Attach to a ring created by another process.
+
+        On the supported Python versions (before 3.13) attaching also
+        registers the block with the calling process's resource tracker.
+        Child processes of the creator share its tracker, so this is
+        harmless for worker pools. An unrelated process, however, has a
+        tracker of its own that unlinks the block when that process exits,
+        which destroys the ring for everyone else; attach from unrelated
+        processes only if the ring may end with them.
+
+        Args:
+            name (str):
+                ``name`` of the ring returned by ``create``.
+
+        Returns:
+            SharedFrameRing: Non-owning ring; call ``close`` when done.
+
+        Raises:
+            FileNotFoundError: If no block with that name exists.
+            ValueError: If the block is not a SharedFrameRing.
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            return cls(shm, owner=False)
+        except ValueError:
+            shm.close()
+            raise
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name."""
+        return self._shm.name
+
+    def write(self, image: Image | np.ndarray, *, colorspace: Colorspace = "BGR") -> FrameRef:
+        """
+        Copy a frame into the next slot.
+
+        Args:
+            image (Image | np.ndarray):
+                Frame to store. An Image keeps its own colorspace.
+            colorspace (Colorspace, optional):
+                Colorspace recorded for raw arrays. Defaults to "BGR".
+
+        Returns:
+            FrameRef: Handle to pass to ``read`` in any attached process.
+
+        Raises:
+            TypeError: If image is not an Image or NumPy array.
+            TypeError: If the array has an object dtype.
+            ValueError: If the frame has more than 4 dimensions or does not
+                fit in a slot.
+        """
+        if isinstance(image, Image):
+            array, colorspace = image._data, image.colorspace
+        elif isinstance(image, np.ndarray):
+            array = image
+        else:
+            raise TypeError("'image' must be an Image instance or numpy.ndarray")
+
+        if array.dtype.hasobject:
+            raise TypeError("Frames with object dtype cannot be stored in shared memory")
+        if not 1 <= array.ndim <= MAX_DIMS:
+            raise ValueError(f"Frames must have 1 to {MAX_DIMS} dimensions")
+        if array.nbytes > self.slot_bytes:
+            raise ValueError(
+                f"Frame of {array.nbytes} bytes does not fit in a {self.slot_bytes}-byte slot"
+            )
+
+        seq = self._next_seq
+        self._next_seq += 1
+        slot = (seq - 1) % self.slots
+        header = self._headers[slot]
+
+        # Invalidate first so readers never see a half-written frame
+        header["seq"] = 0
+        target = np.ndarray(array.shape, array.dtype, buffer=self._shm.buf, offset=self._data_offset(slot))
+        target[...] = array
+        header["ndim"] = array.ndim
+        header["shape"] = array.shape + (0,) * (MAX_DIMS - array.ndim)
+        header["dtype"] = array.dtype.str.encode()
+        header["colorspace"] = colorspace.encode()
+        header["seq"] = seq
+        return FrameRef(slot=slot, seq=seq)
+
+    def read(self, ref: FrameRef, *, copy: bool = False) -> Image:
+        """
+        Return the frame behind a handle as an Image.
+
+        Args:
+            ref (FrameRef):
+                Handle returned by ``write``.
+            copy (bool, optional):
+                If False, the array is a read-only view into shared memory
+                that is only valid until the slot is reused or the ring is
+                closed. If True, return an independent copy. Defaults to False.
+
+        Returns:
+            Image: Frame with ``source_type="shared"``.
+
+        Raises:
+            TypeError: If ref is not a FrameRef.
+            ValueError: If ref.slot is outside the ring.
+            RuntimeError: If the slot no longer holds that frame.
+        """
+        if not isinstance(ref, FrameRef):
+            raise TypeError("'ref' must be a FrameRef")
+        if not 0 <= ref.slot < self.slots:
+            raise ValueError(f"Slot {ref.slot} is outside the ring (slots={self.slots})")
+
+        header = self._headers[ref.slot]
+        if int(header["seq"]) != ref.seq:
+            raise RuntimeError(f"Frame seq={ref.seq} in slot {ref.slot} was overwritten")
+
+        ndim = int(header["ndim"])
+        array = np.ndarray(
+            tuple(int(n) for n in header["shape"][:ndim]),
+            np.dtype(header["dtype"].decode()),
+            buffer=self._shm.buf,
+            offset=self._data_offset(ref.slot)
+        )
+        if copy:
+            array = array.copy()
+        else:
+            array.flags.writeable = False
+
+        return Image(
+            _data=array,
+            path=None,
+            colorspace=header["colorspace"].decode(),
+            source_type="shared"
+        )
+
+    def close(self) -> None:
+        """
+        Detach from the shared block.
+
+        All arrays returned by ``read(copy=False)`` must be released first.
+
+        Raises:
+            BufferError: If views into the block are still alive.
+        """
+        self._headers = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared block; only the creating process should call this."""
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedFrameRing:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickles as a name so pool initializers attach instead of copying
+        return (SharedFrameRing.attach, (self.name,))
+
+    def _data_offset(self, slot: int) -> int:
+        return HEADER_BYTES + slot * self._slot_stride + HEADER_BYTES
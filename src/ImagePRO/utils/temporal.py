@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Hashable, Iterable
+from typing import Optional
+
+import numpy as np
+
+
+# Constants
+DEFAULT_MIN_CUTOFF = 1.0  # Hz; lower = smoother at rest
+DEFAULT_BETA = 0.05  # Cutoff increase per unit of speed; higher = less lag when moving
+DEFAULT_D_CUTOFF = 1.0  # Hz; cutoff for the speed estimate
+DEFAULT_MAX_EXTRAPOLATION = 0.25  # seconds
+DEFAULT_TARGET_LATENCY = 0.1  # seconds
+DEFAULT_TIMING_ALPHA = 0.2  # EMA weight of the newest inference time
+MIN_DT = 1e-6
+
+
+class OneEuroFilter:
+    """
+    One Euro filter for a vector of values, with velocity extrapolation.
+
+    The filter is a low-pass whose cutoff rises with the signal's speed:
+    at rest it removes landmark jitter, during fast motion it follows with
+    little lag (Casiez et al., CHI 2012). All components of the vector are
+    filtered independently in one NumPy operation.
+
+    The filtered speed also allows ``predict`` to extrapolate the value to
+    a later time, which fills frames that were not analyzed.
+
+    Attributes:
+        min_cutoff (float): Cutoff frequency at rest, in Hz.
+        beta (float): Speed coefficient.
+        d_cutoff (float): Cutoff frequency of the speed estimate, in Hz.
+        max_extrapolation (float): Longest extrapolation in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_cutoff: float = DEFAULT_MIN_CUTOFF,
+        beta: float = DEFAULT_BETA,
+        d_cutoff: float = DEFAULT_D_CUTOFF,
+        max_extrapolation: float = DEFAULT_MAX_EXTRAPOLATION
+    ) -> None:
+        """
+        Create an empty filter; the first sample passes through unchanged.
+
+        Raises:
+            ValueError: If a cutoff is not positive, or beta or
+                max_extrapolation is negative.
+        """
+        for label, value in (("min_cutoff", min_cutoff), ("d_cutoff", d_cutoff)):
+            if not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(f"'{label}' must be a positive number")
+        for label, value in (("beta", beta), ("max_extrapolation", max_extrapolation)):
+            if not isinstance(value, (int, float)) or value < 0:
+                raise ValueError(f"'{label}' must be a non-negative number")
+
+        self.min_cutoff = float(min_cutoff)
+        self.beta = float(beta)
+        self.d_cutoff = float(d_cutoff)
+        self.max_extrapolation = float(max_extrapolation)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the signal history."""
+        self._value: Optional[np.ndarray] = None
+        self._speed: Optional[np.ndarray] = None
+        self._timestamp: Optional[float] = None
+
+    def __call__(self, value: np.ndarray | Iterable[float], timestamp: float) -> np.ndarray:
+        """
+        Filter one sample.
+
+        Args:
+            value (np.ndarray | Iterable[float]): Sample of any shape; the
+                shape must stay the same between calls.
+            timestamp (float): Sample time in seconds.
+
+        Returns:
+            np.ndarray: Filtered sample (float64).
+
+        Raises:
+            ValueError: If the shape differs from previous samples.
+        """
+        value = np.asarray(value, dtype=np.float64)
+        if self._value is None:
+            self._value = value.copy()
+            self._speed = np.zeros_like(value)
+            self._timestamp = timestamp
+            return self._value.copy()
+
+        if value.shape != self._value.shape:
+            raise ValueError("Sample shape changed; call reset() first")
+
+        dt = max(timestamp - self._timestamp, MIN_DT)
+        speed = (value - self._value) / dt
+        self._speed += _alpha(self.d_cutoff, dt) * (speed - self._speed)
+        cutoff = self.min_cutoff + self.beta * np.abs(self._speed)
+        self._value += _alpha(cutoff, dt) * (value - self._value)
+        self._timestamp = timestamp
+        return self._value.copy()
+
+    def predict(self, timestamp: float) -> Optional[np.ndarray]:
+        """
+        Extrapolate the filtered value to a later time along its speed.
+
+        Args:
+            timestamp (float): Target time in seconds; the step is clamped
+                to ``[0, max_extrapolation]``.
+
+        Returns:
+            Optional[np.ndarray]: Predicted value, or None before the first sample.
+        """
+        if self._value is None:
+            return None
+        step = min(max(timestamp - self._timestamp, 0.0), self.max_extrapolation)
+        return self._value + self._speed * step
+
+
+def _alpha(cutoff: float | np.ndarray, dt: float) -> float | np.ndarray:
+    """Smoothing factor of an exponential low-pass with the given cutoff."""
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class TrackSmoother:
+    """
+    One ``OneEuroFilter`` per tracked id (face, hand, ...).
+
+    ``update`` filters the measurements of the ids seen in a frame and
+    drops filters of ids that disappeared; ``predict`` extrapolates every
+    tracked id for frames that were not analyzed.
+
+    Example:
+        >>> smoother = TrackSmoother()
+        >>> ids, values = smoother.update([0, 1], [[10.0, 2.0], [-4.0, 1.0]], timestamp=t)
+        >>> ids, values = smoother.predict(t + 0.033)
+    """
+
+    def __init__(self, **filter_options: float) -> None:
+        """
+        Args:
+            **filter_options: Keyword arguments for every ``OneEuroFilter``.
+
+        Raises:
+            ValueError: If a filter option is invalid.
+        """
+        OneEuroFilter(**filter_options)  # Validate once up front
+        self.filter_options = filter_options
+        self._filters: dict[Hashable, OneEuroFilter] = {}
+
+    @property
+    def ids(self) -> list[Hashable]:
+        """Ids currently tracked."""
+        return list(self._filters)
+
+    def reset(self) -> None:
+        """Drop every track."""
+        self._filters.clear()
+
+    def update(
+        self,
+        ids: Iterable[Hashable],
+        values: np.ndarray | Iterable[Iterable[float]],
+        *,
+        timestamp: float
+    ) -> tuple[list[Hashable], np.ndarray]:
+        """
+        Filter one frame of measurements.
+
+        Args:
+            ids: Track id of every row.
+            values: One row of values per id, shape (N, D).
+            timestamp: Frame time in seconds.
+
+        Returns:
+            tuple[list[Hashable], np.ndarray]: The ids and their filtered
+            values, shape (N, D).
+
+        Raises:
+            ValueError: If ids and values differ in length.
+        """
+        ids = list(ids)
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) != len(ids):
+            raise ValueError("'ids' and 'values' must have the same length")
+        if not ids:
+            self._filters = {}
+            return [], np.empty((0, 0))
+        values = values.reshape(len(ids), -1)
+
+        self._filters = {
+            track_id: self._filters.get(track_id) or OneEuroFilter(**self.filter_options)
+            for track_id in ids
+        }
+        smoothed = np.empty_like(values)
+        for row, track_id in enumerate(ids):
+            smoothed[row] = self._filters[track_id](values[row], timestamp)
+        return ids, smoothed
+
+    def predict(self, timestamp: float) -> tuple[list[Hashable], np.ndarray]:
+        """
+        Extrapolate every tracked id to a frame that was not analyzed.
+
+        Args:
+            timestamp: Frame time in seconds.
+
+        Returns:
+            tuple[list[Hashable], np.ndarray]: Ids and predicted values,
+            shape (N, D); (0, 0) when nothing is tracked.
+        """
+        ids = list(self._filters)
+        if not ids:
+            return [], np.empty((0, 0))
+        return ids, np.stack([self._filters[track_id].predict(timestamp) for track_id in ids])
+
+
+class AdaptiveFrameScheduler:
+    """
+    Decide which frames of a stream to analyze for a target latency.
+
+    The scheduler keeps an exponential moving average of the inference
+    time and analyzes a frame once waiting any longer would let the newest
+    measurement become older than ``target_latency`` by the time the next
+    result is ready. It never schedules inference more often than one
+    inference time, so a slow model skips frames instead of building a
+    backlog. Frames in between are meant to be filled by extrapolation
+    (see ``TrackSmoother.predict``).
+
+    With a 100 ms target and 20 ms inference, about every 80 ms of video is
+    analyzed (roughly 1 in 2-3 frames at 30 FPS); with 150 ms inference,
+    every 150 ms.
+
+    Attributes:
+        target_latency (float): Maximum age of a measurement, in seconds.
+        inference_seconds (Optional[float]): Current inference time estimate.
+        processed (int): Frames scheduled for analysis.
+        skipped (int): Frames skipped.
+    """
+
+    def __init__(
+        self,
+        target_latency: float = DEFAULT_TARGET_LATENCY,
+        *,
+        timing_alpha: float = DEFAULT_TIMING_ALPHA
+    ) -> None:
+        """
+        Args:
+            target_latency (float, optional):
+                Maximum age of a measurement in seconds. Defaults to 0.1.
+            timing_alpha (float, optional):
+                EMA weight of the newest inference time, in (0, 1].
+                Defaults to 0.2.
+
+        Raises:
+            ValueError: If target_latency is not positive or timing_alpha
+                is outside (0, 1].
+        """
+        if not isinstance(target_latency, (int, float)) or target_latency <= 0:
+            raise ValueError("'target_latency' must be a positive number")
+        if not isinstance(timing_alpha, (int, float)) or not 0 < timing_alpha <= 1:
+            raise ValueError("'timing_alpha' must be in (0, 1]")
+
+        self.target_latency = float(target_latency)
+        self.timing_alpha = float(timing_alpha)
+        self.inference_seconds: Optional[float] = None
+        self.processed = 0
+        self.skipped = 0
+        self._last_start: Optional[float] = None
+
+    @property
+    def interval(self) -> float:
+        """Current time between analyzed frames, in seconds."""
+        if self.inference_seconds is None:
+            return 0.0
+        return max(self.inference_seconds, self.target_latency - self.inference_seconds)
+
+    def should_process(self, timestamp: float) -> bool:
+        """
+        Decide whether to analyze the frame at ``timestamp``.
+
+        Call ``record`` with the inference time of every frame this
+        returns True for.
+
+        Args:
+            timestamp (float): Frame time in seconds.
+
+        Returns:
+            bool: True to analyze the frame, False to extrapolate it.
+        """
+        if self._last_start is not None and timestamp - self._last_start < self.interval:
+            self.skipped += 1
+            return False
+        self._last_start = timestamp
+        self.processed += 1
+        return True
+
+    def record(self, seconds: float) -> None:
+        """
+        Feed back the measured inference time of a processed frame.
+
+        Args:
+            seconds (float): Inference duration.
+        """
+        if self.inference_seconds is None:
+            self.inference_seconds = float(seconds)
+        else:
+            self.inference_seconds += self.timing_alpha * (seconds - self.inference_seconds)
@@ -58,6 +58,9 @@ def _build_mediapipe_stub() -> types.ModuleType:
                 FaceMesh=_UnavailableModel,
                 FACEMESH_TESSELATION=frozenset(),
             ),
+            face_detection=types.SimpleNamespace(
+                FaceDetection=_UnavailableModel,
+            ),
             pose=types.SimpleNamespace(
                 Pose=_UnavailableModel,
                 POSE_CONNECTIONS=frozenset(),
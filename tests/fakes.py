@@ -34,6 +34,7 @@ class FakeFaceMesh:
     def __init__(self, detection_result=None, **kwargs):
         self.kwargs = kwargs
         self.processed_images = []
+        self.closed = False
         # Sentinel so tests notice when no detection result was wired up.
         self._detection_result = (
             detection_result
@@ -45,6 +46,50 @@ class FakeFaceMesh:
         self.processed_images.append(image)
         return self._detection_result
 
+    def close(self):
+        self.closed = True
+
+
+def make_face_detections(faces):
+    """Build fake ``detections`` of mediapipe FaceDetection.
+
+    faces: list of (score, (xmin, ymin, width, height), keypoints) with
+    six normalized (x, y) keypoints per face.
+    """
+    return [
+        SimpleNamespace(
+            score=[score],
+            location_data=SimpleNamespace(
+                relative_bounding_box=SimpleNamespace(
+                    xmin=box[0], ymin=box[1], width=box[2], height=box[3]
+                ),
+                relative_keypoints=[SimpleNamespace(x=x, y=y) for x, y in keypoints],
+            ),
+        )
+        for score, box, keypoints in faces
+    ]
+
+
+class FakeFaceDetection:
+    """Stand-in for mediapipe.solutions.face_detection.FaceDetection."""
+
+    def __init__(self, detection_result=None, **kwargs):
+        self.kwargs = kwargs
+        self.processed_images = []
+        self.closed = False
+        self._detection_result = (
+            detection_result
+            if detection_result is not None
+            else SimpleNamespace(detections=None)
+        )
+
+    def process(self, image):
+        self.processed_images.append(image)
+        return self._detection_result
+
+    def close(self):
+        self.closed = True
+
 
 class FakePose:
     """Stand-in for mediapipe.solutions.pose.Pose."""
@@ -52,6 +97,7 @@ class FakePose:
     def __init__(self, detection_result=None, **kwargs):
         self.kwargs = kwargs
         self.processed_images = []
+        self.closed = False
         self._detection_result = (
             detection_result
             if detection_result is not None
@@ -62,6 +108,9 @@ class FakePose:
         self.processed_images.append(image)
         return self._detection_result
 
+    def close(self):
+        self.closed = True
+
 
 class FakeHands:
     """Stand-in for mediapipe.solutions.hands.Hands."""
@@ -69,6 +118,7 @@ class FakeHands:
     def __init__(self, detection_result=None, **kwargs):
         self.kwargs = kwargs
         self.processed_images = []
+        self.closed = False
         self._detection_result = (
             detection_result
             if detection_result is not None
@@ -79,26 +129,76 @@ class FakeHands:
         self.processed_images.append(image)
         return self._detection_result
 
+    def close(self):
+        self.closed = True
+
 
 class FakeFaceAnalysisApp:
     """Stand-in for insightface.app.FaceAnalysis."""
 
-    def __init__(self, faces_per_image):
+    def __init__(self, faces_per_image=(), det_model=None, recognizer=None):
         self.faces_per_image = faces_per_image
         self.prepared = False
         self.calls = 0
+        self.images = []
+        self.det_model = det_model
+        self.models = {"detection": det_model, "recognition": recognizer}
 
-    def prepare(self, ctx_id):
+    def prepare(self, ctx_id, det_size=(640, 640)):
         self.prepared = True
+        self.det_size = det_size
 
     def get(self, image):
         self.calls += 1
+        self.images.append(image)
         faces = self.faces_per_image[min(self.calls - 1, len(self.faces_per_image) - 1)]
         return [
             SimpleNamespace(embedding=np.array(emb, dtype=np.float32)) for emb in faces
         ]
 
 
+class FakeInsightDetector:
+    """Stand-in for an InsightFace detection model (``app.det_model``).
+
+    faces_for(image) returns the keypoints (five (x, y) pairs) of every
+    face in the image; boxes span the keypoints and scores count down from
+    0.9 in the order given.
+    """
+
+    def __init__(self, faces_for):
+        self.faces_for = faces_for
+        self.calls = []
+
+    def detect(self, image, max_num=0, metric="default"):
+        self.calls.append((image, max_num))
+        kpss = np.asarray(self.faces_for(image), dtype=np.float32).reshape(-1, 5, 2)
+        if max_num:
+            kpss = kpss[:max_num]
+        scores = 0.9 - 0.1 * np.arange(len(kpss), dtype=np.float32)
+        bboxes = np.column_stack([kpss.min(axis=1), kpss.max(axis=1), scores])
+        return bboxes.reshape(-1, 5), kpss
+
+
+class FakeInsightRecognizer:
+    """Stand-in for an InsightFace recognition model.
+
+    The embedding of a crop is its center pixel in the first entry and
+    ones elsewhere; ``batches`` records the size of every call.
+    """
+
+    def __init__(self, input_size=(112, 112), embedding_size=512):
+        self.input_size = input_size
+        self.embedding_size = embedding_size
+        self.batches = []
+
+    def get_feat(self, imgs):
+        self.batches.append(len(imgs))
+        features = np.ones((len(imgs), self.embedding_size), dtype=np.float32)
+        center = self.input_size[0] // 2
+        features[:, 0] = [float(img[center, center, 0]) for img in imgs]
+        return features
+
+
 class FakeYOLOBox:
     """Mimics the ultralytics box attributes used by detect_objects."""
 
@@ -17,7 +17,12 @@ import time
 import numpy as np
 import pytest
 
-from ImagePRO.pre_processing.blur import apply_average_blur, apply_gaussian_blur
+from ImagePRO.pre_processing.blur import (
+    apply_average_blur,
+    apply_bilateral_blur,
+    apply_gaussian_blur,
+    apply_median_blur,
+)
 from ImagePRO.pre_processing.grayscale import convert_to_grayscale
 from ImagePRO.pre_processing.resize import resize_image
 from ImagePRO.pre_processing.rotate import rotate_image_90
@@ -77,3 +82,35 @@ def test_repeated_operations_stay_fast(large_image):
         _, elapsed = _timed(lambda: rotate_image_90(image=large_image))
         budgets.append(elapsed)
     assert max(budgets) < BUDGET_SECONDS
+
+
+def test_approximate_bilateral_faster_than_exact(large_image):
+    """Large-radius bilateral: the approximate mode must beat the exact filter."""
+    _, exact = _timed(
+        lambda: apply_bilateral_blur(image=large_image, filter_size=25)
+    )
+    _, approximate = _timed(
+        lambda: apply_bilateral_blur(
+            image=large_image, filter_size=25, approximate=True
+        )
+    )
+    assert approximate < exact
+    assert approximate < BUDGET_SECONDS
+
+
+def test_large_kernel_median_16bit_document():
+    """31 px median on a 16-bit page; cv2.medianBlur cannot run this at all."""
+    rng = np.random.default_rng(7)
+    page = np.full((1536, 2048), 60000, np.uint16)
+    page[rng.random(page.shape) < 0.05] = 2000
+    page += rng.integers(0, 500, page.shape, dtype=np.uint16)
+    image = Image.from_array(page, colorspace="GRAY")
+
+    _, elapsed = _timed(lambda: apply_median_blur(image=image, filter_size=31))
+    assert elapsed < BUDGET_SECONDS
+
+
+def test_median_cost_does_not_grow_with_kernel(large_image):
+    _, small = _timed(lambda: apply_median_blur(image=large_image, filter_size=7))
+    _, large = _timed(lambda: apply_median_blur(image=large_image, filter_size=31))
+    assert large < max(4 * small, 1.0)
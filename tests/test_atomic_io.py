@@ -0,0 +1,30 @@
+"""Unit tests for ImagePRO.utils.atomic_io."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ImagePRO.utils.atomic_io import write_json_atomic
+
+
+class TestWriteJsonAtomic:
+    def test_writes_json(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        write_json_atomic(path, {"done": True, "items": [1, 2]})
+        assert json.loads(path.read_text(encoding="utf-8")) == {"done": True, "items": [1, 2]}
+
+    def test_replaces_existing_file_without_leftovers(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        write_json_atomic(str(path), {"next_item": 1})
+        write_json_atomic(path, {"next_item": 2})
+        assert json.loads(path.read_text(encoding="utf-8")) == {"next_item": 2}
+        assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+    def test_unserializable_data_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        write_json_atomic(path, {"next_item": 1})
+        with pytest.raises(TypeError):
+            write_json_atomic(path, {"next_item": object()})
+        assert json.loads(path.read_text(encoding="utf-8")) == {"next_item": 1}
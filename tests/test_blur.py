@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import cv2
 import numpy as np
 import pytest
 
@@ -95,6 +96,43 @@ class TestMedianBlur:
         result = apply_median_blur(image=sample_bgr_image)
         assert result.meta["operation"] == "apply_median_blur"
         assert result.meta["filter_size"] == 5
+        assert result.meta["method"] == "opencv"
+
+    @staticmethod
+    def reference_median(channel, size):
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        padded = np.pad(channel, size // 2, mode="edge")
+        windows = sliding_window_view(padded, (size, size))
+        return np.median(windows, axis=(-2, -1)).astype(channel.dtype)
+
+    @pytest.mark.parametrize("size", [7, 15, 31])
+    @pytest.mark.parametrize("low,high", [(0, 65536), (1000, 1400)])
+    def test_large_kernel_uint16_matches_reference(self, size, low, high):
+        rng = np.random.default_rng(size)
+        data = rng.integers(low, high, (37, 45), dtype=np.uint16)
+        result = apply_median_blur(image=Image.from_array(data, colorspace="GRAY"), filter_size=size)
+        assert result.image.dtype == np.uint16
+        assert result.meta["method"] == "histogram"
+        assert np.array_equal(result.image, self.reference_median(data, size))
+
+    def test_large_kernel_uint16_multichannel(self):
+        rng = np.random.default_rng(3)
+        data = rng.integers(0, 65536, (20, 24, 3), dtype=np.uint16)
+        result = apply_median_blur(image=Image.from_array(data), filter_size=9)
+        assert result.image.shape == data.shape
+        for c in range(3):
+            assert np.array_equal(result.image[..., c], self.reference_median(data[..., c], 9))
+
+    def test_large_kernel_uint8_uses_opencv(self, sample_bgr_image):
+        result = apply_median_blur(image=sample_bgr_image, filter_size=31)
+        assert result.meta["method"] == "opencv"
+        assert result.image.shape == sample_bgr_image.shape
+
+    def test_large_kernel_unsupported_dtype_raises(self):
+        image = Image.from_array(np.zeros((10, 10), np.float32), colorspace="GRAY")
+        with pytest.raises(ValueError, match="uint8 or uint16"):
+            apply_median_blur(image=image, filter_size=7)
 
     def test_non_image_raises(self):
         with pytest.raises(TypeError):
@@ -131,6 +169,50 @@ class TestBilateralBlur:
         with pytest.raises(TypeError):
             apply_bilateral_blur(image=123)
 
+    @pytest.mark.parametrize("subsample", [1, 2, 4])
+    def test_approximate_constant_image_unchanged(self, constant_image, subsample):
+        result = apply_bilateral_blur(
+            image=constant_image, approximate=True, subsample=subsample
+        )
+        assert np.array_equal(result.image, constant_image._data)
+
+    @pytest.mark.parametrize("shape", [(40, 60), (40, 60, 1), (40, 60, 3)])
+    def test_approximate_preserves_shape_and_dtype(self, shape):
+        rng = np.random.default_rng(0)
+        image = Image.from_array(rng.integers(0, 256, shape, dtype=np.uint8))
+        result = apply_bilateral_blur(image=image, approximate=True, filter_size=15)
+        assert result.image.shape == shape
+        assert result.image.dtype == np.uint8
+
+    def test_approximate_preserves_strong_edge(self):
+        step = np.zeros((64, 64, 3), np.uint8)
+        step[:, 32:] = 220
+        image = Image.from_array(step)
+        result = apply_bilateral_blur(
+            image=image, approximate=True, filter_size=15, sigma_color=20, subsample=1
+        )
+        assert np.abs(result.image.astype(int) - step).max() <= 2
+
+    def test_approximate_smooths_noise_like_exact_filter(self):
+        rng = np.random.default_rng(1)
+        clean = np.tile(np.linspace(60, 190, 96), (64, 1))
+        noisy = np.clip(clean + rng.normal(0, 8, clean.shape), 0, 255).astype(np.uint8)
+        image = Image.from_array(np.dstack([noisy] * 3))
+        exact = apply_bilateral_blur(image=image, filter_size=15).image
+        approx = apply_bilateral_blur(image=image, filter_size=15, approximate=True).image
+        assert approx.std(axis=1).mean() < noisy.std(axis=1).mean()
+        assert cv2.PSNR(exact, approx) > 30
+
+    def test_approximate_meta_contents(self, sample_bgr_image):
+        result = apply_bilateral_blur(image=sample_bgr_image, approximate=True, subsample=2)
+        assert result.meta["approximate"] is True
+        assert result.meta["subsample"] == 2
+
+    def test_exact_meta_has_no_subsample(self, sample_bgr_image):
+        result = apply_bilateral_blur(image=sample_bgr_image)
+        assert result.meta["approximate"] is False
+        assert result.meta["subsample"] is None
+
     @pytest.mark.parametrize(
         "kwargs",
         [
@@ -141,6 +223,8 @@ class TestBilateralBlur:
             {"sigma_color": -10},
             {"sigma_space": 0},
             {"sigma_space": "big"},
+            {"approximate": True, "subsample": 0},
+            {"approximate": True, "subsample": 1.5},
         ],
     )
     def test_invalid_parameters_raise(self, sample_bgr_image, kwargs):
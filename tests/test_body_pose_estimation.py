@@ -26,6 +26,36 @@ class TestDetectBodyPoseNoDetection:
         assert len(pose.processed_images) == 1
         assert pose.processed_images[0].shape == sample_bgr_image._data.shape
 
+    def test_rgb_image_is_passed_without_conversion(self, sample_rgb_image):
+        pose = FakePose()
+        detect_body_pose(image=sample_rgb_image, pose_obj=pose)
+        assert pose.processed_images[0] is sample_rgb_image._data
+
+    def test_conversion_is_shared_between_analyses(self, sample_bgr_image):
+        pose = FakePose()
+        detect_body_pose(image=sample_bgr_image, pose_obj=pose)
+        detect_body_pose(image=sample_bgr_image, pose_obj=pose)
+        assert pose.processed_images[0] is pose.processed_images[1]
+        assert np.array_equal(pose.processed_images[0], sample_bgr_image._data[..., ::-1])
+
+
+class TestDetectBodyPoseInferenceMaxSide:
+    def test_detector_receives_downscaled_image(self, sample_bgr_array, sample_bgr_image):
+        faces = make_landmarks([[(5, 0.5, 0.25, 0.1)]])
+        pose = FakePose(detection_result=SimpleNamespace(pose_landmarks=faces[0]))
+        result = detect_body_pose(
+            image=sample_bgr_image, landmarks_idx=[5], pose_obj=pose, inference_max_side=16
+        )
+        assert pose.processed_images[0].shape == (12, 16, 3)
+        assert result.image.shape == sample_bgr_array.shape
+        assert result.data == [[5, 0.5, 0.25, 0.1]]
+        assert result.meta["inference_max_side"] == 16
+
+    def test_small_images_are_not_resized(self, sample_bgr_image):
+        pose = FakePose()
+        detect_body_pose(image=sample_bgr_image, pose_obj=pose, inference_max_side=64)
+        assert pose.processed_images[0].shape == sample_bgr_image._data.shape
+
 
 class TestDetectBodyPoseWithDetection:
     def test_all_landmarks_reported(self, sample_bgr_image):
@@ -78,3 +108,8 @@ class TestDetectBodyPoseValidation:
     def test_invalid_landmarks_idx_raises(self, sample_bgr_image, landmarks_idx):
         with pytest.raises(TypeError):
             detect_body_pose(image=sample_bgr_image, landmarks_idx=landmarks_idx)
+
+    @pytest.mark.parametrize("inference_max_side", [0, -5, 12.5, True])
+    def test_invalid_inference_max_side_raises(self, sample_bgr_image, inference_max_side):
+        with pytest.raises(ValueError):
+            detect_body_pose(image=sample_bgr_image, inference_max_side=inference_max_side)
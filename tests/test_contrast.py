@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import threading
+
 import cv2
 import numpy as np
 import pytest
 
+from ImagePRO.pre_processing import contrast
 from ImagePRO.pre_processing.contrast import (
     apply_clahe_contrast,
     apply_contrast_stretching,
@@ -47,6 +50,30 @@ class TestClaheContrast:
         with pytest.raises(TypeError):
             apply_clahe_contrast(image=None)
 
+    def test_matches_fresh_clahe_object(self, sample_bgr_array, sample_bgr_image):
+        gray = cv2.cvtColor(sample_bgr_array, cv2.COLOR_BGR2GRAY)
+        expected = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(4, 4)).apply(gray)
+        for _ in range(2):
+            result = apply_clahe_contrast(
+                image=sample_bgr_image, clip_limit=3.0, tile_grid_size=(4, 4)
+            )
+            assert np.array_equal(result.image, expected)
+
+    def test_clahe_object_reused_within_thread(self):
+        first = contrast._get_clahe(2.0, (8, 8))
+        assert contrast._get_clahe(2.0, (8, 8)) is first
+        assert contrast._get_clahe(3.0, (8, 8)) is not first
+
+    def test_clahe_object_not_shared_between_threads(self):
+        main_clahe = contrast._get_clahe(2.0, (8, 8))
+        seen = []
+        worker = threading.Thread(
+            target=lambda: seen.append(contrast._get_clahe(2.0, (8, 8)))
+        )
+        worker.start()
+        worker.join()
+        assert seen[0] is not main_clahe
+
     @pytest.mark.parametrize("clip_limit", [0, -1.5, "2"])
     def test_invalid_clip_limit_raises(self, sample_bgr_image, clip_limit):
         with pytest.raises(ValueError):
@@ -95,6 +122,19 @@ class TestContrastStretching:
         result = apply_contrast_stretching(image=sample_bgr_image)
         assert result.image.ndim == 2
 
+    @pytest.mark.parametrize("alpha,beta", [(0.0, 0), (0.37, 11), (1.5, 10), (2.25, 200)])
+    def test_lut_matches_convert_scale_abs(self, sample_bgr_array, sample_bgr_image, alpha, beta):
+        gray = cv2.cvtColor(sample_bgr_array, cv2.COLOR_BGR2GRAY)
+        expected = cv2.convertScaleAbs(gray, alpha=alpha, beta=beta)
+        result = apply_contrast_stretching(image=sample_bgr_image, alpha=alpha, beta=beta)
+        assert np.array_equal(result.image, expected)
+
+    def test_lookup_table_cached_and_read_only(self):
+        lut = contrast._stretching_lut(1.5, 10)
+        assert contrast._stretching_lut(1.5, 10) is lut
+        assert lut.size == 256
+        assert not lut.flags.writeable
+
     def test_meta_contents(self, sample_bgr_image):
         result = apply_contrast_stretching(image=sample_bgr_image, alpha=1.5, beta=10)
         assert result.meta["operation"] == "apply_contrast_stretching"
@@ -114,3 +154,52 @@ class TestContrastStretching:
     def test_out_of_range_beta_raises(self, sample_bgr_image, beta):
         with pytest.raises(ValueError):
             apply_contrast_stretching(image=sample_bgr_image, beta=beta)
+
+
+class TestColorModes:
+    @pytest.mark.parametrize(
+        "operation",
+        [apply_clahe_contrast, apply_histogram_equalization, apply_contrast_stretching],
+    )
+    @pytest.mark.parametrize("color_mode", ["ycrcb", "lab"])
+    def test_luminance_mode_keeps_color(self, sample_bgr_image, operation, color_mode):
+        result = operation(image=sample_bgr_image, color_mode=color_mode)
+        assert result.image.shape == sample_bgr_image.shape
+        assert result.image.dtype == np.uint8
+        assert result.meta["color_mode"] == color_mode
+
+    def test_ycrcb_mode_only_changes_luminance(self, sample_bgr_array, sample_bgr_image):
+        result = apply_histogram_equalization(image=sample_bgr_image, color_mode="ycrcb")
+        ycrcb = cv2.cvtColor(sample_bgr_array, cv2.COLOR_BGR2YCrCb)
+        ycrcb[..., 0] = cv2.equalizeHist(np.ascontiguousarray(ycrcb[..., 0]))
+        expected = cv2.cvtColor(ycrcb, cv2.COLOR_YCrCb2BGR)
+        assert np.array_equal(result.image, expected)
+
+    def test_rgb_colorspace_round_trips_to_rgb(self, sample_bgr_array):
+        rgb = cv2.cvtColor(sample_bgr_array, cv2.COLOR_BGR2RGB)
+        bgr_result = apply_clahe_contrast(image=Image.from_array(sample_bgr_array), color_mode="lab")
+        rgb_result = apply_clahe_contrast(
+            image=Image.from_array(rgb, colorspace="RGB"), color_mode="lab"
+        )
+        assert np.array_equal(rgb_result.image, cv2.cvtColor(bgr_result.image, cv2.COLOR_BGR2RGB))
+
+    def test_gray_mode_honors_rgb_colorspace(self, sample_bgr_array):
+        rgb = cv2.cvtColor(sample_bgr_array, cv2.COLOR_BGR2RGB)
+        result = apply_contrast_stretching(
+            image=Image.from_array(rgb, colorspace="RGB"), alpha=1.0, beta=0
+        )
+        assert np.array_equal(result.image, cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY))
+
+    @pytest.mark.parametrize("color_mode", ["gray", "ycrcb", "lab"])
+    def test_gray_input_skips_conversion(self, sample_gray_image, color_mode):
+        result = apply_histogram_equalization(image=sample_gray_image, color_mode=color_mode)
+        assert np.array_equal(result.image, cv2.equalizeHist(sample_gray_image._data))
+
+    @pytest.mark.parametrize(
+        "operation",
+        [apply_clahe_contrast, apply_histogram_equalization, apply_contrast_stretching],
+    )
+    @pytest.mark.parametrize("color_mode", ["hsv", "GRAY", None])
+    def test_invalid_color_mode_raises(self, sample_bgr_image, operation, color_mode):
+        with pytest.raises(ValueError):
+            operation(image=sample_bgr_image, color_mode=color_mode)
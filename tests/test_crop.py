@@ -5,7 +5,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from ImagePRO.pre_processing.crop import crop_image
+from ImagePRO.pre_processing.crop import crop_image, crop_many
 
 
 class TestCropImage:
@@ -80,3 +80,83 @@ class TestCropImage:
     def test_non_tuple_or_non_int_coordinates_raise(self, sample_bgr_image, start, end):
         with pytest.raises(TypeError):
             crop_image(image=sample_bgr_image, start_point=start, end_point=end)
+
+
+class TestCropCopyPolicy:
+    def test_default_returns_view(self, sample_bgr_image):
+        result = crop_image(image=sample_bgr_image, start_point=(1, 1), end_point=(5, 5))
+        assert np.shares_memory(result.image, sample_bgr_image._data)
+        assert result.meta["copy"] is False
+
+    def test_copy_is_independent_and_contiguous(self, sample_bgr_array, sample_bgr_image):
+        result = crop_image(
+            image=sample_bgr_image, start_point=(1, 1), end_point=(5, 5), copy=True
+        )
+        assert not np.shares_memory(result.image, sample_bgr_image._data)
+        assert result.image.flags["C_CONTIGUOUS"]
+        result.image[:] = 0
+        assert np.array_equal(sample_bgr_image._data, sample_bgr_array)
+
+    def test_non_bool_copy_raises(self, sample_bgr_image):
+        with pytest.raises(TypeError):
+            crop_image(image=sample_bgr_image, start_point=(0, 0), end_point=(2, 2), copy=1)
+
+
+class TestCropMany:
+    def test_views_match_slices(self, sample_bgr_array, sample_bgr_image):
+        boxes = np.array([[0, 0, 4, 3], [5, 2, 12, 9]])
+        result = crop_many(sample_bgr_image, boxes=boxes)
+        assert isinstance(result.image, list)
+        assert np.array_equal(result.image[0], sample_bgr_array[0:3, 0:4])
+        assert np.array_equal(result.image[1], sample_bgr_array[2:9, 5:12])
+        assert all(np.shares_memory(c, sample_bgr_image._data) for c in result.image)
+        assert result.meta["operation"] == "crop_many"
+        assert result.meta["num_boxes"] == 2
+
+    def test_boxes_are_clipped_to_bounds(self, sample_bgr_array, sample_bgr_image):
+        height, width = sample_bgr_image.shape[:2]
+        boxes = [[-5, -3, 4, 4], [width - 2, height - 2, width + 10, height + 10], [50, 50, 60, 60]]
+        result = crop_many(sample_bgr_image, boxes=boxes)
+        assert result.data.tolist() == [
+            [0, 0, 4, 4],
+            [width - 2, height - 2, width, height],
+            [width, height, width, height],
+        ]
+        assert np.array_equal(result.image[1], sample_bgr_array[-2:, -2:])
+        assert result.image[2].size == 0
+
+    def test_copy_detaches_crops(self, sample_bgr_image):
+        result = crop_many(sample_bgr_image, boxes=[[0, 0, 3, 3]], copy=True)
+        assert not np.shares_memory(result.image[0], sample_bgr_image._data)
+
+    def test_pack_gathers_equal_size_crops(self, sample_bgr_array, sample_bgr_image):
+        boxes = np.array([[0, 0, 5, 4], [3, 6, 8, 10], [10, 1, 15, 5]])
+        result = crop_many(sample_bgr_image, boxes=boxes, pack=True)
+        assert result.image.shape == (3, 4, 5, 3)
+        assert result.image.flags["C_CONTIGUOUS"]
+        assert not np.shares_memory(result.image, sample_bgr_image._data)
+        for crop, (x1, y1, x2, y2) in zip(result.image, boxes):
+            assert np.array_equal(crop, sample_bgr_array[y1:y2, x1:x2])
+
+    def test_pack_with_mismatched_sizes_raises(self, sample_bgr_image):
+        with pytest.raises(ValueError):
+            crop_many(sample_bgr_image, boxes=[[0, 0, 4, 4], [0, 0, 5, 4]], pack=True)
+
+    def test_empty_boxes(self, sample_bgr_image):
+        result = crop_many(sample_bgr_image, boxes=np.empty((0, 4), int))
+        assert result.image == []
+        packed = crop_many(sample_bgr_image, boxes=np.empty((0, 4), int), pack=True)
+        assert packed.image.shape[0] == 0
+
+    def test_float_boxes_are_floored(self, sample_bgr_image):
+        result = crop_many(sample_bgr_image, boxes=[[1.7, 2.2, 5.9, 6.5]])
+        assert result.data.tolist() == [[1, 2, 5, 6]]
+
+    def test_non_image_raises(self):
+        with pytest.raises(TypeError):
+            crop_many(np.zeros((5, 5, 3)), boxes=[[0, 0, 2, 2]])
+
+    @pytest.mark.parametrize("boxes", [[0, 0, 2, 2], [[0, 0, 2]], [["a", "b", "c", "d"]]])
+    def test_malformed_boxes_raise(self, sample_bgr_image, boxes):
+        with pytest.raises(ValueError):
+            crop_many(sample_bgr_image, boxes=boxes)
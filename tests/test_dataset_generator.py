@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import multiprocessing
 from types import SimpleNamespace
 
+import mediapipe as mp
+import numpy as np
 import pytest
 
-from ImagePRO.pre_processing.dataset_generator import capture_bulk_pictures
+from ImagePRO.pre_processing import dataset_generator
+from ImagePRO.pre_processing.dataset_generator import (
+    capture_bulk_pictures,
+    generate_sharded_dataset,
+)
+from ImagePRO.utils.result import Result
+from fakes import FakeFaceMesh
 
 
 class TestValidation:
@@ -70,3 +80,359 @@ class TestCameraFailure:
         )
         with pytest.raises(RuntimeError, match="Cannot access camera"):
             capture_bulk_pictures(tmp_path / "dataset", "carol", num_images=1)
+
+
+@pytest.fixture
+def fake_detection(monkeypatch):
+    """Treat frames whose first pixel is non-zero as containing a face."""
+    monkeypatch.setattr(mp.solutions.face_mesh, "FaceMesh", FakeFaceMesh)
+
+    def fake_detect_faces(*, image, **kwargs):
+        data = image._data
+        if data.flat[0] == 0:
+            return Result(image=None, data=None, meta={"error": "No face landmarks detected"})
+        return Result(image=[data[:4, :4]], data=[None], meta={})
+
+    monkeypatch.setattr(dataset_generator, "detect_faces", fake_detect_faces)
+
+
+class TestOfflineSources:
+    def test_iterable_source_saves_faces_without_sleeping(self, tmp_path, fake_detection, monkeypatch):
+        monkeypatch.setattr(
+            dataset_generator.time, "sleep", lambda s: pytest.fail("offline source slept")
+        )
+        frames = [np.full((8, 8, 3), v, np.uint8) for v in (10, 0, 20, 30)]
+        result = capture_bulk_pictures(tmp_path, "dave", num_images=5, source=frames, delay=1.0)
+
+        assert result.meta["operation"] == "capture_bulk_pictures"
+        assert result.meta["source_kind"] == "iterable"
+        assert result.meta["saved"] == 3
+        assert result.meta["frames_read"] == 4
+        assert result.meta["frames_without_face"] == 1
+        assert [p.name for p in result.data] == ["0000.jpg", "0001.jpg", "0002.jpg"]
+        assert all(p.exists() for p in result.data)
+
+    def test_stops_after_num_images(self, tmp_path, fake_detection):
+        frames = [np.full((8, 8, 3), 50, np.uint8)] * 10
+        result = capture_bulk_pictures(
+            tmp_path, "erin", num_images=2, start_index=7, source=frames
+        )
+        # Capture may read ahead of the writer, but no extra files are written
+        assert [p.name for p in result.data] == ["0007.jpg", "0008.jpg"]
+        assert sorted(p.name for p in (tmp_path / "erin").iterdir()) == ["0007.jpg", "0008.jpg"]
+
+    def test_stride_and_dedup(self, tmp_path, fake_detection):
+        frames = [np.full((8, 8, 3), v, np.uint8) for v in (10, 99, 11, 99, 60, 99, 61)]
+        result = capture_bulk_pictures(
+            tmp_path, "frank", num_images=10, source=frames, frame_stride=2, dedup_threshold=5
+        )
+        assert result.meta["frames_read"] == 4
+        assert result.meta["duplicates_skipped"] == 2
+        assert result.meta["saved"] == 2
+
+    def test_directory_source(self, tmp_path, fake_detection):
+        import cv2
+
+        folder = tmp_path / "frames"
+        folder.mkdir()
+        for i in range(3):
+            cv2.imwrite(str(folder / f"{i}.png"), np.full((8, 8, 3), 40 + i * 40, np.uint8))
+        result = capture_bulk_pictures(tmp_path / "out", "gina", num_images=10, source=folder)
+        assert result.meta["source_kind"] == "directory"
+        assert result.meta["saved"] == 3
+
+    @pytest.mark.parametrize("kwargs", [{"frame_stride": 0}, {"dedup_threshold": -1}])
+    def test_invalid_source_options_raise_before_creating_folder(self, tmp_path, kwargs):
+        with pytest.raises(ValueError):
+            capture_bulk_pictures(tmp_path, "hank", source=[], **kwargs)
+        assert not (tmp_path / "hank").exists()
+
+
+class TestPipelineStages:
+    def test_stage_statistics_in_meta(self, tmp_path, fake_detection):
+        frames = [np.full((8, 8, 3), v, np.uint8) for v in (10, 0, 20)]
+        result = capture_bulk_pictures(tmp_path, "ivy", num_images=5, source=frames)
+        stages = result.meta["stages"]
+        assert list(stages) == ["capture", "augment", "detect", "write"]
+        assert stages["capture"]["items_out"] == 3
+        assert stages["detect"]["items_in"] == 3
+        assert stages["detect"]["items_out"] == 2
+        assert stages["write"]["items_out"] == 2
+        assert result.meta["bottleneck"] in stages
+        assert result.meta["workers"] == {"augment": 1, "detect": 1, "write": 1}
+
+    def test_one_face_mesh_per_detect_worker(self, tmp_path, fake_detection, monkeypatch):
+        created = []
+
+        class RecordingFaceMesh(FakeFaceMesh):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(mp.solutions.face_mesh, "FaceMesh", RecordingFaceMesh)
+        frames = [np.full((8, 8, 3), 50, np.uint8)] * 20
+        result = capture_bulk_pictures(
+            tmp_path, "jay", num_images=20, source=frames,
+            workers={"augment": 2, "detect": 3, "write": 2}
+        )
+        assert result.meta["saved"] == 20
+        assert len(created) == 3
+        assert all(mesh.kwargs["static_image_mode"] for mesh in created)
+        names = sorted(p.name for p in result.data)
+        assert names == [f"{i:04d}.jpg" for i in range(20)]
+
+    @pytest.mark.parametrize("profile, refine", [(None, False), ("accurate", True)])
+    def test_face_mesh_follows_speed_profile(self, tmp_path, fake_detection, monkeypatch, profile, refine):
+        created = []
+
+        class RecordingFaceMesh(FakeFaceMesh):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(mp.solutions.face_mesh, "FaceMesh", RecordingFaceMesh)
+        kwargs = {} if profile is None else {"speed_profile": profile}
+        result = capture_bulk_pictures(
+            tmp_path, "lee", num_images=1, source=[np.full((8, 8, 3), 50, np.uint8)], **kwargs
+        )
+        assert created[0].kwargs["refine_landmarks"] is refine
+        assert result.meta["speed_profile"] == (profile or "fast")
+
+    def test_invalid_speed_profile_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            capture_bulk_pictures(tmp_path, "lee", source=[], speed_profile="turbo")
+
+    @pytest.mark.parametrize(
+        "workers", [{"detect": 0}, {"encode": 2}, {"write": 1.5}, ["detect"]]
+    )
+    def test_invalid_workers_raise(self, tmp_path, workers):
+        with pytest.raises(ValueError):
+            capture_bulk_pictures(tmp_path, "kim", source=[], workers=workers)
+
+    @pytest.mark.parametrize("queue_size", [0, -1, 2.5])
+    def test_invalid_queue_size_raises(self, tmp_path, queue_size):
+        with pytest.raises(ValueError):
+            capture_bulk_pictures(tmp_path, "lee", source=[], queue_size=queue_size)
+
+
+class TestDeterministicAugmentation:
+    def test_same_seed_gives_identical_files(self, tmp_path, fake_detection):
+        frames = [np.tile(np.arange(32, dtype=np.uint8) * 8, (32, 1))[..., None].repeat(3, 2) + 1] * 6
+        runs = []
+        for name in ("a", "b"):
+            result = capture_bulk_pictures(
+                tmp_path, name, num_images=6, source=frames, apply_rotate=True, seed=123,
+                workers={"augment": 3},
+            )
+            assert result.meta["seed"] == 123
+            # Several augment workers number files in completion order
+            runs.append(sorted(p.read_bytes() for p in result.data))
+        assert runs[0] == runs[1]
+
+    def test_seed_is_reported_when_not_given(self, tmp_path, fake_detection):
+        result = capture_bulk_pictures(tmp_path, "m", num_images=1, source=[np.ones((8, 8, 3), np.uint8)])
+        assert isinstance(result.meta["seed"], int)
+
+    @pytest.mark.parametrize("seed", [-1, 1.5, "7"])
+    def test_invalid_seed_raises(self, tmp_path, seed):
+        with pytest.raises(ValueError):
+            capture_bulk_pictures(tmp_path, "n", source=[], seed=seed)
+
+
+@pytest.fixture
+def image_folder(tmp_path):
+    import cv2
+
+    folder = tmp_path / "frames"
+    folder.mkdir()
+    ramp = np.tile(np.arange(24, dtype=np.uint8) * 10, (24, 1))
+    for i in range(10):
+        # Every third image has no "face" (first pixel zero)
+        frame = np.dstack([ramp + 5] * 3)
+        if i % 3 == 2:
+            frame[0, 0] = 0
+        cv2.imwrite(str(folder / f"{i:02d}.png"), frame)
+    return folder
+
+
+class TestShardedGeneration:
+    def test_shards_write_disjoint_filename_ranges(self, tmp_path, image_folder, fake_detection):
+        result = generate_sharded_dataset(
+            tmp_path / "out", "p", source=image_folder, num_shards=3, processes=1, seed=5
+        )
+        names = [p.name for p in result.data]
+        # 10 items split 3/3/4; images 2, 5 and 8 have no face
+        assert names == [
+            "0000_000000.jpg", "0000_000001.jpg",
+            "0001_000000.jpg", "0001_000001.jpg",
+            "0002_000000.jpg", "0002_000001.jpg", "0002_000003.jpg",
+        ]
+        assert all(p.exists() for p in result.data)
+        assert result.meta["operation"] == "generate_sharded_dataset"
+        assert result.meta["items"] == 10
+        assert result.meta["frames_without_face"] == 3
+        assert result.meta["saved"] == 7
+
+        manifests = sorted((tmp_path / "out" / "p").glob("shard_*.json"))
+        assert len(manifests) == 3
+        manifest = json.loads(manifests[0].read_text())
+        assert manifest["done"] and manifest["seed"] == 5
+
+    def test_output_is_independent_of_process_layout(self, tmp_path, image_folder, fake_detection):
+        kwargs = dict(source=image_folder, num_shards=2, seed=9, apply_rotate=True)
+        first = generate_sharded_dataset(tmp_path / "x", "p", processes=1, **kwargs)
+        second = generate_sharded_dataset(tmp_path / "y", "p", processes=1, **kwargs)
+        assert [p.name for p in first.data] == [p.name for p in second.data]
+        assert [p.read_bytes() for p in first.data] == [p.read_bytes() for p in second.data]
+
+    def test_resume_skips_finished_and_continues_partial_shards(
+        self, tmp_path, image_folder, fake_detection
+    ):
+        kwargs = dict(source=image_folder, num_shards=2, processes=1, seed=3)
+        full = generate_sharded_dataset(tmp_path / "full", "p", **kwargs)
+
+        out = tmp_path / "crashed"
+        generate_sharded_dataset(out, "p", **kwargs)
+        # Simulate a crash in shard 1 after its first two items
+        manifest_path = out / "p" / "shard_0001.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest.update(done=False, next_item=2, saved=manifest["saved"][:1])
+        manifest_path.write_text(json.dumps(manifest))
+
+        resumed = generate_sharded_dataset(out, "p", **kwargs)
+        assert resumed.meta["shards_already_done"] == 1
+        assert resumed.meta["shards_resumed"] == 1
+        assert [p.name for p in resumed.data] == [p.name for p in full.data]
+
+    def test_crash_before_first_checkpoint_can_resume(
+        self, tmp_path, image_folder, fake_detection, monkeypatch
+    ):
+        kwargs = dict(source=image_folder, num_shards=2, processes=1, seed=3)
+        full = generate_sharded_dataset(tmp_path / "full", "p", **kwargs)
+
+        class Interrupted(Exception):
+            pass
+
+        detect = dataset_generator.detect_faces
+        calls = []
+
+        def crash_on_fifth(**kw):
+            calls.append(1)
+            if len(calls) == 5:
+                raise Interrupted
+            return detect(**kw)
+
+        monkeypatch.setattr(dataset_generator, "detect_faces", crash_on_fifth)
+        out = tmp_path / "crashed"
+        with pytest.raises(Interrupted):
+            generate_sharded_dataset(out, "p", **kwargs)
+        assert sorted(p.name for p in (out / "p").glob("shard_*.json")) == ["shard_0000.json"]
+
+        monkeypatch.setattr(dataset_generator, "detect_faces", detect)
+        resumed = generate_sharded_dataset(out, "p", **kwargs)
+        assert [p.name for p in resumed.data] == [p.name for p in full.data]
+
+    def test_resume_with_other_seed_raises(self, tmp_path, image_folder, fake_detection):
+        generate_sharded_dataset(tmp_path, "p", source=image_folder, num_shards=2, processes=1, seed=1)
+        with pytest.raises(ValueError, match="different settings"):
+            generate_sharded_dataset(tmp_path, "p", source=image_folder, num_shards=2, processes=1, seed=2)
+
+    def test_no_resume_requires_fresh_folder(self, tmp_path, image_folder):
+        (tmp_path / "p").mkdir()
+        with pytest.raises(FileExistsError):
+            generate_sharded_dataset(tmp_path, "p", source=image_folder, processes=1, resume=False)
+
+    def test_resume_refuses_folder_without_manifests(self, tmp_path, image_folder):
+        (tmp_path / "p").mkdir()
+        (tmp_path / "p" / "notes.txt").write_text("not a dataset")
+        with pytest.raises(FileExistsError):
+            generate_sharded_dataset(tmp_path, "p", source=image_folder, processes=1)
+
+    @pytest.mark.parametrize("changed", [{"min_confidence": 0.5}, {"frame_stride": 2}])
+    def test_resume_with_other_detection_settings_raises(
+        self, tmp_path, image_folder, fake_detection, changed
+    ):
+        kwargs = dict(source=image_folder, num_shards=2, processes=1, seed=1)
+        generate_sharded_dataset(tmp_path, "p", **kwargs)
+        with pytest.raises(ValueError, match="different settings"):
+            generate_sharded_dataset(tmp_path, "p", **{**kwargs, **changed})
+
+    def test_resume_with_other_source_of_same_size_raises(
+        self, tmp_path, image_folder, fake_detection
+    ):
+        import shutil
+
+        other = tmp_path / "other"
+        shutil.copytree(image_folder, other)
+        generate_sharded_dataset(tmp_path / "out", "p", source=image_folder, processes=1, seed=1)
+        with pytest.raises(ValueError, match="different settings"):
+            generate_sharded_dataset(tmp_path / "out", "p", source=other, processes=1, seed=1)
+
+    def test_manifest_records_source_and_detection_settings(
+        self, tmp_path, image_folder, fake_detection
+    ):
+        generate_sharded_dataset(tmp_path, "p", source=image_folder, processes=1, seed=1)
+        manifest = json.loads((tmp_path / "p" / "shard_0000.json").read_text())
+        assert manifest["source"] == str(image_folder.resolve())
+        assert manifest["min_confidence"] == 0.7
+        assert manifest["frame_stride"] == 1
+        assert len(manifest["fingerprint"]) == 40
+
+    def test_video_source_is_split_by_frame_ranges(self, tmp_path, fake_detection):
+        import cv2
+
+        video = tmp_path / "clip.avi"
+        writer = cv2.VideoWriter(str(video), cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+        if not writer.isOpened():
+            pytest.skip("No video encoder available")
+        for i in range(8):
+            writer.write(np.full((24, 32, 3), 20 + i * 20, np.uint8))
+        writer.release()
+
+        result = generate_sharded_dataset(
+            tmp_path / "out", "v", source=video, num_shards=2, processes=1, frame_stride=2, seed=0
+        )
+        assert result.meta["items"] == 4
+        assert [p.name for p in result.data] == [
+            "0000_000000.jpg", "0000_000001.jpg", "0001_000000.jpg", "0001_000001.jpg",
+        ]
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="worker processes only inherit the patched detector when forked",
+    )
+    def test_process_pool(self, tmp_path, image_folder, fake_detection):
+        serial = generate_sharded_dataset(
+            tmp_path / "serial", "p", source=image_folder, num_shards=3, processes=1, seed=4
+        )
+        pooled = generate_sharded_dataset(
+            tmp_path / "pool", "p", source=image_folder, num_shards=3, processes=2, seed=4
+        )
+        assert [p.name for p in pooled.data] == [p.name for p in serial.data]
+        assert [p.read_bytes() for p in pooled.data] == [p.read_bytes() for p in serial.data]
+
+
+class TestShardedValidation:
+    def test_non_path_source_raises(self, tmp_path):
+        with pytest.raises(TypeError):
+            generate_sharded_dataset(tmp_path, source=[np.zeros((4, 4, 3), np.uint8)])
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            generate_sharded_dataset(tmp_path, source=tmp_path / "missing")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"num_shards": 0},
+            {"processes": 0},
+            {"processes": 1.5},
+            {"frame_stride": 0},
+            {"seed": -3},
+            {"min_confidence": 2},
+        ],
+    )
+    def test_invalid_numbers_raise(self, tmp_path, image_folder, kwargs):
+        with pytest.raises(ValueError):
+            generate_sharded_dataset(tmp_path / "out", source=image_folder, **kwargs)
+        assert not (tmp_path / "out").exists()
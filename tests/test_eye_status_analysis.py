@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import mediapipe as mp  # real package or the conftest stub
+import numpy as np
 import pytest
 
 from ImagePRO.human_analysis.face_analysis import eye_status_analysis
-from ImagePRO.human_analysis.face_analysis.eye_status_analysis import analyze_eye_status
+from ImagePRO.human_analysis.face_analysis.eye_status_analysis import (
+    LEFT_EYE_EAR_INDICES,
+    RIGHT_EYE_EAR_INDICES,
+    BlinkDetector,
+    analyze_eye_status,
+    analyze_eye_status_live,
+    analyze_eyes,
+    compute_eye_aspect_ratios,
+)
 from ImagePRO.utils.result import Result
 
+from fakes import FakeFaceMesh
+
 
 def patch_mesh(monkeypatch, faces_data):
     monkeypatch.setattr(
@@ -27,6 +39,30 @@ def eye_rows(x_left, x_right, y_top, y_bottom):
     ]
 
 
+def eye_points(center_x, width, opening):
+    # p1..p6 of an eye in pixels: corners at +-width/2, lids at +-opening/2
+    half_w, half_o = width / 2, opening / 2
+    return [
+        [center_x - half_w, 0.0],
+        [center_x - half_w / 3, -half_o], [center_x + half_w / 3, -half_o],
+        [center_x + half_w, 0.0],
+        [center_x + half_w / 3, half_o], [center_x - half_w / 3, half_o],
+    ]
+
+
+def both_eye_rows(face_id, left_opening, right_opening, size=(32, 24)):
+    # Normalized [face_id, idx, x, y, z] rows for both six-point eyes (eye width 8 px)
+    width, height = size
+    rows = []
+    for indices, center, opening in (
+        (LEFT_EYE_EAR_INDICES, 8.0, left_opening),
+        (RIGHT_EYE_EAR_INDICES, 24.0, right_opening),
+    ):
+        for idx, (x, y) in zip(indices, eye_points(center, 8.0, opening)):
+            rows.append([face_id, idx, x / width, (y + 12.0) / height, 0.0])
+    return rows
+
+
 class TestAnalyzeEyeStatus:
     def test_open_eye_returns_true(self, sample_bgr_image, monkeypatch):
         # vertical 0.1, horizontal 0.2 -> EAR = 0.5 > 0.2 threshold.
@@ -94,6 +130,159 @@ class TestAnalyzeEyeStatus:
         assert result.meta["threshold"] == 0.3
 
 
+class TestComputeEyeAspectRatios:
+    def test_six_point_formula(self):
+        # (2 + 2) / (2 * 8) = 0.25
+        assert compute_eye_aspect_ratios(eye_points(0.0, 8.0, 2.0)) == pytest.approx(0.25)
+
+    def test_vectorized_over_faces_and_eyes(self):
+        points = np.array([
+            [eye_points(0.0, 8.0, 2.0), eye_points(10.0, 8.0, 0.0)],
+            [eye_points(0.0, 10.0, 4.0), eye_points(10.0, 10.0, 4.0)],
+        ])
+        ears = compute_eye_aspect_ratios(points)
+        assert ears.shape == (2, 2)
+        assert ears == pytest.approx(np.array([[0.25, 0.0], [0.4, 0.4]]))
+
+    def test_zero_width_eye_gives_zero(self):
+        assert compute_eye_aspect_ratios(np.zeros((6, 2))) == 0.0
+
+    def test_invalid_shape_raises(self):
+        with pytest.raises(ValueError):
+            compute_eye_aspect_ratios(np.zeros((3, 4, 2)))
+
+
+class TestAnalyzeEyes:
+    def test_both_eyes_of_every_face(self, sample_bgr_image, monkeypatch):
+        faces = [both_eye_rows(0, 2.0, 2.0), both_eye_rows(1, 0.0, 0.4)[::-1]]
+        patch_mesh(monkeypatch, faces)
+        result = analyze_eyes(image=sample_bgr_image, max_faces=2, face_mesh_obj=object())
+        assert len(result.data) == 2
+        face_id, left, right, is_open = result.data[0]
+        assert (face_id, is_open) == (0, True)
+        assert (left, right) == (pytest.approx(0.25), pytest.approx(0.25))
+        face_id, left, right, is_open = result.data[1]
+        assert (face_id, is_open) == (1, False)
+        assert (left, right) == (pytest.approx(0.0), pytest.approx(0.05))
+
+    def test_requests_both_eyes_in_one_mesh_call(self, sample_bgr_image, monkeypatch):
+        captured = {}
+
+        def fake_mesh(**kwargs):
+            captured.update(kwargs)
+            return Result(image=None, data=None, meta={})
+
+        monkeypatch.setattr(eye_status_analysis, "analyze_face_mesh", fake_mesh)
+        result = analyze_eyes(image=sample_bgr_image, max_faces=3, face_mesh_obj=object())
+        assert captured["landmarks_idx"] == LEFT_EYE_EAR_INDICES + RIGHT_EYE_EAR_INDICES
+        assert captured["max_faces"] == 3
+        assert result.data is None
+        assert result.meta["error"] == "No face landmarks detected"
+
+    def test_missing_landmarks_return_error(self, sample_bgr_image, monkeypatch):
+        patch_mesh(monkeypatch, [both_eye_rows(0, 2.0, 2.0)[:-1]])
+        result = analyze_eyes(image=sample_bgr_image, face_mesh_obj=object())
+        assert result.data is None
+        assert result.meta["error"] == "Missing required landmarks"
+
+    @pytest.mark.parametrize("max_faces", [0, -1, 1.5, True])
+    def test_invalid_max_faces_raises(self, sample_bgr_image, max_faces):
+        with pytest.raises(ValueError):
+            analyze_eyes(image=sample_bgr_image, max_faces=max_faces)
+
+
+class TestBlinkDetector:
+    def feed(self, detector, ears, fps=30.0, face_id=0):
+        return [
+            detector.update([face_id], [ear], timestamp=i / fps)[0]
+            for i, ear in enumerate(ears)
+        ]
+
+    def test_short_closure_is_a_blink(self):
+        states = self.feed(BlinkDetector(), [0.3] * 5 + [0.1] * 4 + [0.3] * 3)
+        assert [state["blink"] for state in states].count(True) == 1
+        assert states[9]["blink"] is True
+        assert states[-1]["blinks"] == 1
+        assert states[7]["closed"] is True
+        assert states[7]["closed_for"] == pytest.approx(2 / 30)
+
+    def test_hysteresis_ignores_noise_between_thresholds(self):
+        # Dips below 0.2 once, then hovers at 0.22 (neither open nor closed)
+        states = self.feed(BlinkDetector(), [0.3, 0.19, 0.22, 0.19, 0.22, 0.19, 0.3])
+        assert states[-1]["blinks"] == 1
+
+    def test_too_short_closure_is_ignored(self):
+        states = self.feed(BlinkDetector(min_blink=0.1), [0.3, 0.1, 0.3])
+        assert states[-1]["blinks"] == 0
+
+    def test_long_closure(self):
+        states = self.feed(BlinkDetector(max_blink=0.5), [0.3] + [0.1] * 30 + [0.3])
+        assert states[-1]["long_closure"] is True
+        assert states[-1]["long_closures"] == 1
+        assert states[-1]["blinks"] == 0
+
+    def test_perclos_tracks_closed_share_of_time(self):
+        detector = BlinkDetector(perclos_window=1.0)
+        # Closed half of the time for 20 s in 0.5 s blocks
+        ears = ([0.1] * 15 + [0.3] * 15) * 40
+        states = self.feed(detector, ears)
+        assert states[-1]["perclos"] == pytest.approx(0.5, abs=0.15)
+        assert self.feed(BlinkDetector(), [0.3] * 60)[-1]["perclos"] == 0.0
+
+    def test_state_per_face_is_constant_size(self):
+        detector = BlinkDetector()
+        for i in range(1000):
+            detector.update([0, 1], [0.3, 0.1 if i % 10 < 3 else 0.3], timestamp=i / 30)
+        assert detector.ids == [0, 1]
+        assert vars(detector._tracks[1]).keys() == vars(detector._tracks[0]).keys()
+        assert len(vars(detector._tracks[1])) == 6
+
+    def test_missing_faces_time_out(self):
+        detector = BlinkDetector(track_timeout=0.5)
+        detector.update([0, 1], [0.3, 0.3], timestamp=0.0)
+        detector.update([0], [0.3], timestamp=0.3)
+        assert detector.ids == [0, 1]
+        detector.update([0], [0.3], timestamp=0.6)
+        assert detector.ids == [0]
+
+    def test_mismatched_lengths_raise(self):
+        with pytest.raises(ValueError):
+            BlinkDetector().update([0, 1], [0.3], timestamp=0.0)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"close_threshold": 0}, {"min_blink": -1}, {"perclos_window": True},
+        {"close_threshold": 0.3, "open_threshold": 0.2},
+        {"min_blink": 0.5, "max_blink": 0.1},
+    ])
+    def test_invalid_settings_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            BlinkDetector(**kwargs)
+
+
+class TestAnalyzeEyeStatusLive:
+    def test_reports_blinks_per_face(self, sample_bgr_array, monkeypatch):
+        monkeypatch.setattr(mp.solutions.face_mesh, "FaceMesh", FakeFaceMesh)
+        openings = iter([3.0, 0.0, 0.0, 3.0, 3.0])
+
+        def fake_mesh(**kwargs):
+            opening = next(openings)
+            return Result(image=None, data=[both_eye_rows(0, opening, opening)], meta={})
+
+        monkeypatch.setattr(eye_status_analysis, "analyze_face_mesh", fake_mesh)
+        detector = BlinkDetector(min_blink=1e-9)
+        frames = [sample_bgr_array.copy() for _ in range(5)]
+        result = analyze_eye_status_live(
+            source=frames, display=False, blink_detector=detector
+        )
+        assert result.meta["frames_rendered"] == 5
+        assert result.meta["blinks"][0]["blinks"] == 1
+        assert all(np.array_equal(frame, sample_bgr_array) for frame in frames)
+
+    def test_invalid_blink_detector_raises(self):
+        with pytest.raises(TypeError):
+            analyze_eye_status_live(display=False, blink_detector=object())
+
+
 class TestAnalyzeEyeStatusValidation:
     def test_non_image_raises(self):
         with pytest.raises(TypeError):
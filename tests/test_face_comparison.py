@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import json
 import os
+import threading
+import time
+from pathlib import Path
 
+import cv2
+import insightface.app
 import numpy as np
 import pytest
 
-from ImagePRO.human_analysis.face_analysis.face_comparison import compare_faces
+from ImagePRO.human_analysis.face_analysis import face_comparison
+from ImagePRO.human_analysis.face_analysis.face_comparison import (
+    compare_faces,
+    extract_face_embeddings,
+    get_face_analysis_app,
+)
+from ImagePRO.human_analysis.face_analysis.face_detection import ALIGNMENT_TEMPLATE
 from ImagePRO.utils.image import Image
 
-from fakes import FakeFaceAnalysisApp
+from fakes import FakeFaceAnalysisApp, FakeInsightDetector, FakeInsightRecognizer
 
 
 @pytest.fixture
@@ -19,6 +31,24 @@ def isolated_cwd(tmp_path, monkeypatch):
     return tmp_path
 
 
+@pytest.fixture
+def created_apps(monkeypatch):
+    """Replace FaceAnalysis with a fake and start from an empty app cache."""
+    created = []
+
+    def factory(**kwargs):
+        time.sleep(0.01)  # Widen the window for concurrent first calls
+        app = FakeFaceAnalysisApp(faces_per_image=[[[1.0, 0.0]]])
+        app.kwargs = kwargs
+        created.append(app)
+        return app
+
+    monkeypatch.setattr(insightface.app, "FaceAnalysis", factory)
+    face_comparison._load_face_analysis_app.cache_clear()
+    yield created
+    face_comparison._load_face_analysis_app.cache_clear()
+
+
 class TestCompareFacesValidation:
     @pytest.mark.parametrize("first,second", [(None, None), ("a", "b"), (1, 2)])
     def test_non_image_inputs_raise(self, first, second):
@@ -57,6 +87,12 @@ class TestCompareFacesBehavior:
         assert result.data is None
         assert "error" in result.meta
 
+    def test_models_receive_bgr(self, sample_bgr_image, sample_rgb_image, sample_bgr_array):
+        app = FakeFaceAnalysisApp(faces_per_image=[[[1.0]], [[1.0]]])
+        compare_faces(sample_bgr_image, sample_rgb_image, app=app)
+        assert app.images[0] is sample_bgr_image._data
+        assert np.array_equal(app.images[1], sample_bgr_array[:, :, ::-1])
+
     def test_temp_files_cleaned_up(self, isolated_cwd, sample_bgr_array):
         app = FakeFaceAnalysisApp(faces_per_image=[[[1.0]], [[1.0]]])
         image_1 = Image.from_array(sample_bgr_array.copy())
@@ -65,3 +101,209 @@ class TestCompareFacesBehavior:
         compare_faces(image_1, image_2, app=app)
         assert not os.path.exists("tmp1.jpg")
         assert not os.path.exists("tmp2.jpg")
+
+
+def uniform_images(values, size=128):
+    return [Image.from_array(np.full((size, size, 3), value, np.uint8)) for value in values]
+
+
+def faces_by_value(counts):
+    """Detector callback: an image filled with v holds counts.get(v, 1) faces."""
+    def faces_for(image):
+        return [ALIGNMENT_TEMPLATE] * counts.get(int(image[0, 0, 0]), 1)
+    return faces_for
+
+
+def embedding_app(counts=None):
+    return FakeFaceAnalysisApp(
+        det_model=FakeInsightDetector(faces_by_value(counts or {})),
+        recognizer=FakeInsightRecognizer(),
+    )
+
+
+class TestExtractFaceEmbeddings:
+    def test_embeddings_follow_faces_in_input_order(self):
+        app = embedding_app({20: 2, 30: 0})
+        result = extract_face_embeddings(uniform_images([10, 20, 30, 40]), app=app, normalize=False)
+        assert result.data.shape == (4, 512)
+        assert result.data.dtype == np.float32
+        assert result.data[:, 0].tolist() == [10, 20, 20, 40]
+        assert result.meta["image_indices"].tolist() == [0, 1, 1, 3]
+        assert result.meta["images_without_faces"] == 1
+        assert result.meta["scores"].tolist() == pytest.approx([0.9, 0.9, 0.8, 0.9])
+        assert result.meta["boxes"].shape == (4, 4)
+
+    def test_crops_are_embedded_in_full_batches(self):
+        app = embedding_app({2: 3})
+        extract_face_embeddings(uniform_images(range(6)), app=app, batch_size=4)
+        # 8 faces: two full batches, no per-image recognition calls
+        assert app.models["recognition"].batches == [4, 4]
+        assert app.calls == 0
+
+    def test_normalized_embeddings_have_unit_length(self):
+        result = extract_face_embeddings(uniform_images([50, 60]), app=embedding_app())
+        assert np.linalg.norm(result.data, axis=1) == pytest.approx([1.0, 1.0])
+
+    def test_max_faces_is_passed_to_detector(self):
+        app = embedding_app({5: 3})
+        result = extract_face_embeddings(uniform_images([5]), app=app, max_faces=2)
+        assert app.det_model.calls[0][1] == 2
+        assert len(result.data) == 2
+
+    def test_detector_receives_bgr(self, sample_bgr_image, sample_rgb_image, sample_bgr_array):
+        app = embedding_app()
+        extract_face_embeddings([sample_bgr_image, sample_rgb_image], app=app)
+        assert app.det_model.calls[0][0] is sample_bgr_image._data
+        assert np.array_equal(app.det_model.calls[1][0], sample_bgr_array[:, :, ::-1])
+
+    def test_paths_are_loaded_and_failures_reported(self, tmp_path):
+        path = tmp_path / "face.png"
+        cv2.imwrite(str(path), np.full((128, 128, 3), 70, np.uint8))
+        result = extract_face_embeddings(
+            [path, tmp_path / "missing.png"], app=embedding_app(), normalize=False
+        )
+        assert result.data[:, 0].tolist() == [70]
+        assert result.meta["read_failures"] == [1]
+
+    def test_no_faces_returns_empty_array(self):
+        result = extract_face_embeddings(uniform_images([1]), app=embedding_app({1: 0}))
+        assert result.data.shape == (0, 512)
+        assert result.meta["image_indices"].shape == (0,)
+
+
+class TestExtractFaceEmbeddingsCheckpoints:
+    def test_checkpoints_are_written(self, tmp_path):
+        result = extract_face_embeddings(
+            uniform_images(range(5)), app=embedding_app(), checkpoint_dir=tmp_path,
+            checkpoint_every=2
+        )
+        manifest = json.loads((tmp_path / "embeddings.json").read_text())
+        assert manifest["done"] is True
+        assert manifest["next_item"] == 5
+        assert manifest["chunks"] == ["embeddings_00000.npz", "embeddings_00001.npz", "embeddings_00002.npz"]
+        assert not list(tmp_path.glob("*.tmp"))
+        assert len(result.data) == 5
+
+    def test_resume_continues_after_last_checkpoint(self, tmp_path):
+        images = uniform_images(range(10, 70, 10))
+
+        class Interrupted(Exception):
+            pass
+
+        def crash_on_50(image):
+            if image[0, 0, 0] == 50:
+                raise Interrupted
+            return [ALIGNMENT_TEMPLATE]
+
+        crashing = FakeFaceAnalysisApp(
+            det_model=FakeInsightDetector(crash_on_50), recognizer=FakeInsightRecognizer()
+        )
+        with pytest.raises(Interrupted):
+            extract_face_embeddings(
+                images, app=crashing, normalize=False, checkpoint_dir=tmp_path, checkpoint_every=2
+            )
+
+        app = embedding_app()
+        result = extract_face_embeddings(
+            images, app=app, normalize=False, checkpoint_dir=tmp_path, checkpoint_every=2
+        )
+        assert result.meta["resumed_from"] == 4
+        assert len(app.det_model.calls) == 2
+        assert result.data[:, 0].tolist() == [10, 20, 30, 40, 50, 60]
+        assert result.meta["image_indices"].tolist() == list(range(6))
+
+    def test_finished_run_is_loaded_without_inference(self, tmp_path):
+        images = uniform_images([10, 20])
+        first = extract_face_embeddings(images, app=embedding_app(), checkpoint_dir=tmp_path)
+        app = embedding_app()
+        second = extract_face_embeddings(images, app=app, checkpoint_dir=tmp_path)
+        assert app.det_model.calls == []
+        assert np.array_equal(first.data, second.data)
+
+    def test_changed_settings_raise(self, tmp_path):
+        images = uniform_images([10])
+        extract_face_embeddings(images, app=embedding_app(), checkpoint_dir=tmp_path)
+        with pytest.raises(ValueError, match="different settings"):
+            extract_face_embeddings(images, app=embedding_app(), checkpoint_dir=tmp_path, normalize=False)
+
+    def test_different_images_of_same_length_raise(self, tmp_path):
+        paths = []
+        for name in ("a.png", "b.png", "c.png"):
+            cv2.imwrite(str(tmp_path / name), np.full((128, 128, 3), 70, np.uint8))
+            paths.append(tmp_path / name)
+        checkpoints = tmp_path / "checkpoints"
+        extract_face_embeddings(paths[:2], app=embedding_app(), checkpoint_dir=checkpoints)
+        with pytest.raises(ValueError, match="different settings"):
+            extract_face_embeddings(paths[1:], app=embedding_app(), checkpoint_dir=checkpoints)
+
+    def test_existing_folder_without_resume_raises(self, tmp_path):
+        with pytest.raises(FileExistsError):
+            extract_face_embeddings(
+                uniform_images([10]), app=embedding_app(), checkpoint_dir=tmp_path, resume=False
+            )
+
+
+class TestExtractFaceEmbeddingsValidation:
+    @pytest.mark.parametrize("images", ["face.png", Path("face.png"), None, 3])
+    def test_non_sequence_raises(self, images):
+        with pytest.raises(TypeError):
+            extract_face_embeddings(images, app=embedding_app())
+
+    def test_invalid_item_raises(self):
+        with pytest.raises(TypeError):
+            extract_face_embeddings([42], app=embedding_app())
+
+    @pytest.mark.parametrize("kwargs", [
+        {"max_faces": -1},
+        {"batch_size": 0},
+        {"batch_size": True},
+        {"checkpoint_every": 0},
+    ])
+    def test_invalid_numbers_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            extract_face_embeddings(uniform_images([1]), app=embedding_app(), **kwargs)
+
+
+class TestGetFaceAnalysisApp:
+    def test_loads_only_detection_and_recognition(self, created_apps):
+        app = get_face_analysis_app(det_size=(320, 320))
+        assert created_apps == [app]
+        assert app.kwargs["allowed_modules"] == ["detection", "recognition"]
+        assert app.kwargs["name"] == "buffalo_l"
+        assert app.prepared
+        assert app.det_size == (320, 320)
+
+    def test_app_is_shared_per_setting(self, created_apps):
+        assert get_face_analysis_app() is get_face_analysis_app()
+        assert get_face_analysis_app(det_size=[640, 640]) is get_face_analysis_app()
+        assert get_face_analysis_app(det_size=(320, 320)) is not get_face_analysis_app()
+        assert len(created_apps) == 2
+
+    def test_concurrent_first_calls_load_once(self, created_apps):
+        apps = []
+        threads = [
+            threading.Thread(target=lambda: apps.append(get_face_analysis_app()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(created_apps) == 1
+        assert all(app is created_apps[0] for app in apps)
+
+    def test_compare_faces_reuses_shared_app(self, created_apps, sample_bgr_image):
+        compare_faces(sample_bgr_image, sample_bgr_image)
+        compare_faces(sample_bgr_image, sample_bgr_image)
+        assert len(created_apps) == 1
+        assert created_apps[0].calls == 4
+
+    def test_compare_faces_det_size(self, created_apps, sample_bgr_image):
+        compare_faces(sample_bgr_image, sample_bgr_image, det_size=(160, 160))
+        assert created_apps[0].det_size == (160, 160)
+
+    @pytest.mark.parametrize("det_size", [(0, 640), (100, 640), (640,), 640, (640.0, 640), (True, 640)])
+    def test_invalid_det_size_raises(self, created_apps, det_size):
+        with pytest.raises(ValueError):
+            get_face_analysis_app(det_size=det_size)
+        assert created_apps == []
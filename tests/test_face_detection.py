@@ -5,13 +5,24 @@ from __future__ import annotations
 from types import SimpleNamespace
 
 import cv2
+import mediapipe as mp  # real package or the conftest stub
 import numpy as np
 import pytest
 
 from ImagePRO.human_analysis.face_analysis import face_detection
-from ImagePRO.human_analysis.face_analysis.face_detection import detect_faces
+from ImagePRO.human_analysis.face_analysis.face_detection import (
+    ALIGNMENT_INDICES,
+    ALIGNMENT_TEMPLATE,
+    FACE_OUTLINE_INDICES,
+    align_faces,
+    detect_faces,
+    estimate_similarity_transforms,
+)
+from ImagePRO.utils.image import Image
 from ImagePRO.utils.result import Result
 
+from fakes import FakeFaceDetection, make_face_detections
+
 
 def mesh_result_with_faces(faces_data):
     return Result(
@@ -73,6 +84,13 @@ class TestDetectFaces:
         assert len(result.image) == 2
         assert len(result.data) == 2
 
+    def test_outline_past_border_is_clipped(self, sample_bgr_array, sample_bgr_image, patch_mesh):
+        height, width = sample_bgr_image.shape[:2]
+        patch_mesh([[[0, 10, -0.1, 0.5, 0.0], [0, 33, 0.3, 1.2, 0.0]]])
+        result = detect_faces(image=sample_bgr_image)
+        x2 = int(0.3 * width) + 1
+        assert np.array_equal(result.image[0], sample_bgr_array[int(0.5 * height):, :x2])
+
     def test_meta_contents(self, sample_bgr_image, patch_mesh):
         patch_mesh([])
         result = detect_faces(image=sample_bgr_image, max_faces=2, min_confidence=0.9)
@@ -94,12 +112,226 @@ class TestDetectFaces:
         assert captured["max_faces"] == 4
         assert captured["min_confidence"] == 0.6
 
+    def test_inference_max_side_passed_through_and_polygons_full_size(
+        self, sample_bgr_image, monkeypatch
+    ):
+        captured = {}
+
+        def fake_mesh(**kwargs):
+            captured.update(kwargs)
+            return mesh_result_with_faces([[[0, 10, 0.25, 0.5, 0.0], [0, 33, 0.75, 1.0, 0.0]]])
+
+        monkeypatch.setattr(face_detection, "analyze_face_mesh", fake_mesh)
+        result = detect_faces(image=sample_bgr_image, inference_max_side=8)
+        assert captured["inference_max_side"] == 8
+        assert result.data[0].tolist() == [[8, 12], [24, 24]]
+        assert result.meta["inference_max_side"] == 8
+
+
+def similarity(points, angle, scale, shift):
+    cos, sin = np.cos(np.radians(angle)), np.sin(np.radians(angle))
+    rotation = scale * np.array([[cos, -sin], [sin, cos]])
+    return points @ rotation.T + shift
+
+
+def apply(matrix, points):
+    return points @ matrix[:, :2].T + matrix[:, 2]
+
+
+class TestEstimateSimilarityTransforms:
+    def test_recovers_transforms_of_all_faces(self):
+        faces = np.stack([
+            similarity(ALIGNMENT_TEMPLATE, 0, 1.0, (0, 0)),
+            similarity(ALIGNMENT_TEMPLATE, 30, 2.5, (40, -10)),
+            similarity(ALIGNMENT_TEMPLATE, -75, 0.4, (5, 90)),
+        ])
+        matrices = estimate_similarity_transforms(faces, ALIGNMENT_TEMPLATE)
+        assert matrices.shape == (3, 2, 3)
+        for face, matrix in zip(faces, matrices):
+            assert apply(matrix, face) == pytest.approx(np.asarray(ALIGNMENT_TEMPLATE), abs=1e-6)
+
+    def test_mirrored_points_still_give_a_rotation(self):
+        mirrored = ALIGNMENT_TEMPLATE * (-1, 1)
+        matrix = estimate_similarity_transforms(mirrored[None], ALIGNMENT_TEMPLATE)[0]
+        assert np.linalg.det(matrix[:, :2]) > 0
+
+    def test_shape_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            estimate_similarity_transforms(np.zeros((1, 4, 2)), ALIGNMENT_TEMPLATE)
+
+
+class TestAlignFaces:
+    def test_chips_preallocated_in_one_array(self):
+        frame = np.random.default_rng(0).integers(0, 255, (240, 320, 3), dtype=np.uint8)
+        image = Image.from_array(frame)
+        points = np.stack([
+            similarity(ALIGNMENT_TEMPLATE, 0, 1.0, (50, 40)),
+            similarity(ALIGNMENT_TEMPLATE, 20, 1.5, (150, 30)),
+        ])
+        result = align_faces(image, points, size=112)
+        assert result.image.shape == (2, 112, 112, 3)
+        assert result.image.dtype == np.uint8
+        # An upright face at template scale is a plain translated crop
+        assert np.array_equal(result.image[0][5:100, 5:100], frame[45:140, 55:150])
+        assert result.data.shape == (2, 2, 3)
+        assert result.meta["operation"] == "align_faces"
+
+    def test_size_scales_the_template(self):
+        image = Image.from_array(np.zeros((100, 100), dtype=np.uint8), colorspace="GRAY")
+        result = align_faces(image, ALIGNMENT_TEMPLATE[None], size=56)
+        assert result.image.shape == (1, 56, 56)
+        assert apply(result.data[0], np.asarray(ALIGNMENT_TEMPLATE)) == pytest.approx(
+            np.asarray(ALIGNMENT_TEMPLATE) / 2, abs=1e-6
+        )
+
+    def test_face_leaving_the_frame_is_zero_padded(self):
+        frame = np.full((60, 60, 3), 200, dtype=np.uint8)
+        points = similarity(ALIGNMENT_TEMPLATE, 0, 1.0, (-50, -50))[None]
+        chip = align_faces(Image.from_array(frame), points).image[0]
+        assert chip.shape == (112, 112, 3)
+        assert np.all(chip[:40, :40] == 0)
+        assert np.all(chip[60:100, 60:100] == 200)
+
+    def test_empty_batch(self, sample_bgr_image):
+        assert align_faces(sample_bgr_image, np.empty((0, 5, 2))).image.shape == (0, 112, 112, 3)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"points": np.zeros((1, 4, 2))}, {"size": 0}, {"size": 1.5},
+    ])
+    def test_invalid_arguments_raise(self, sample_bgr_image, kwargs):
+        kwargs = {"points": np.zeros((1, 5, 2)), **kwargs}
+        with pytest.raises(ValueError):
+            align_faces(sample_bgr_image, **kwargs)
+
+
+class TestDetectFacesAlignment:
+    def face_rows(self, face_id, dx):
+        # Outline box plus alignment landmarks built from the template (32x24 frame)
+        outline = [[face_id, idx, 0.1 + dx, 0.1, 0.0] for idx in FACE_OUTLINE_INDICES]
+        outline[-1][2:4] = [0.4 + dx, 0.9]
+        five = np.asarray(ALIGNMENT_TEMPLATE) / 112 * 0.3 + (dx + 0.1, 0.1)
+        eyes = [five[0] - (0.01, 0), five[0] + (0.01, 0), five[1] - (0.01, 0), five[1] + (0.01, 0)]
+        alignment = [*eyes, *five[2:]]
+        return outline + [
+            [face_id, idx, x, y, 0.0] for idx, (x, y) in zip(ALIGNMENT_INDICES, alignment)
+        ]
+
+    def test_aligned_chips_in_meta(self, sample_bgr_image, monkeypatch):
+        captured = {}
+
+        def fake_mesh(**kwargs):
+            captured.update(kwargs)
+            return mesh_result_with_faces([self.face_rows(0, 0.0), self.face_rows(1, 0.5)])
+
+        monkeypatch.setattr(face_detection, "analyze_face_mesh", fake_mesh)
+        result = detect_faces(image=sample_bgr_image, max_faces=2, aligned_size=32)
+        assert captured["landmarks_idx"] == FACE_OUTLINE_INDICES + ALIGNMENT_INDICES
+        assert result.meta["aligned_faces"].shape == (2, 32, 32, 3)
+        assert result.meta["alignment_matrices"].shape == (2, 2, 3)
+        assert len(result.data) == 2
+        assert result.data[0].shape == (len(FACE_OUTLINE_INDICES), 2)
+        # Alignment points map onto the template scaled to 32 px
+        width, height = 32, 24
+        five = (np.asarray(ALIGNMENT_TEMPLATE) / 112 * 0.3 + (0.1, 0.1)) * (width, height)
+        mapped = apply(result.meta["alignment_matrices"][0], five)
+        assert mapped[2:] == pytest.approx(np.asarray(ALIGNMENT_TEMPLATE)[2:] * 32 / 112, abs=1.5)
+
+    def test_missing_alignment_landmarks(self, sample_bgr_image, patch_mesh):
+        patch_mesh([self.face_rows(0, 0.0)[:len(FACE_OUTLINE_INDICES)]])
+        result = detect_faces(image=sample_bgr_image, aligned_size=32)
+        assert result.meta["error"] == "Missing alignment landmarks"
+        assert len(result.image) == 1
+        assert "aligned_faces" not in result.meta
+
+
+def keypoints_for_box(xmin, ymin, size):
+    # Six FaceDetection keypoints laid out like the alignment template
+    template = np.asarray(face_detection.DETECTION_ALIGNMENT_TEMPLATE) / 112
+    points = [(xmin + x * size, ymin + y * size) for x, y in template]
+    return points + [(xmin, ymin + size / 2), (xmin + size, ymin + size / 2)]  # ears
+
+
+class TestDetectFacesBoxBackend:
+    def detector(self, faces):
+        return FakeFaceDetection(
+            detection_result=SimpleNamespace(detections=make_face_detections(faces))
+        )
+
+    def test_boxes_without_mesh(self, sample_bgr_array, sample_bgr_image, monkeypatch):
+        def no_mesh(**kwargs):
+            raise AssertionError("face mesh must not run")
+
+        monkeypatch.setattr(face_detection, "analyze_face_mesh", no_mesh)
+        detector = self.detector([(0.9, (0.25, 0.25, 0.5, 0.5), keypoints_for_box(0.25, 0.25, 0.5))])
+        result = detect_faces(
+            image=sample_bgr_image, backend="face_detection", face_detection_obj=detector
+        )
+        # Box 8..24 x 6..18 on the 32x24 frame
+        assert np.array_equal(result.image[0], sample_bgr_array[6:18, 8:24])
+        assert result.data[0].tolist() == [[8, 6], [23, 6], [23, 17], [8, 17]]
+        assert cv2.boundingRect(result.data[0]) == (8, 6, 16, 12)
+        assert result.meta["backend"] == "face_detection"
+        assert result.meta["scores"].tolist() == [0.9]
+        assert detector.processed_images[0].shape == sample_bgr_array.shape
+
+    def test_best_scores_first_up_to_max_faces(self, sample_bgr_image):
+        detector = self.detector([
+            (0.6, (0.0, 0.0, 0.25, 0.25), keypoints_for_box(0.0, 0.0, 0.25)),
+            (0.95, (0.5, 0.5, 0.25, 0.25), keypoints_for_box(0.5, 0.5, 0.25)),
+            (0.8, (0.5, 0.0, 0.25, 0.25), keypoints_for_box(0.5, 0.0, 0.25)),
+        ])
+        result = detect_faces(
+            image=sample_bgr_image, max_faces=2, backend="face_detection", face_detection_obj=detector
+        )
+        assert result.meta["scores"].tolist() == [0.95, 0.8]
+        assert [polygon[0].tolist() for polygon in result.data] == [[16, 12], [16, 0]]
+
+    def test_aligned_chips_from_keypoints(self, sample_bgr_image):
+        detector = self.detector([(0.9, (0.2, 0.2, 0.5, 0.5), keypoints_for_box(0.2, 0.2, 0.5))])
+        result = detect_faces(
+            image=sample_bgr_image, aligned_size=24, backend="face_detection",
+            face_detection_obj=detector,
+        )
+        assert result.meta["aligned_faces"].shape == (1, 24, 24, 3)
+        assert result.meta["alignment_matrices"].shape == (1, 2, 3)
+
+    def test_no_detection(self, sample_bgr_image):
+        result = detect_faces(
+            image=sample_bgr_image, backend="face_detection", face_detection_obj=FakeFaceDetection()
+        )
+        assert result.data is None
+        assert result.meta["error"] == "No faces detected"
+
+    def test_default_detector_is_short_range(self, sample_bgr_image, monkeypatch):
+        created = []
+
+        def factory(**kwargs):
+            created.append(FakeFaceDetection(**kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(mp.solutions.face_detection, "FaceDetection", factory)
+        detect_faces(
+            image=sample_bgr_image, min_confidence=0.6, backend="face_detection",
+            inference_max_side=16,
+        )
+        assert created[0].kwargs == {"model_selection": 0, "min_detection_confidence": 0.6}
+        assert created[0].processed_images[0].shape == (12, 16, 3)
+
 
 class TestDetectFacesValidation:
     def test_non_image_raises(self):
         with pytest.raises(TypeError):
             detect_faces(image=np.zeros((10, 10, 3)))
 
+    def test_invalid_backend_raises(self, sample_bgr_image):
+        with pytest.raises(ValueError):
+            detect_faces(image=sample_bgr_image, backend="yunet")
+
+    @pytest.mark.parametrize("aligned_size", [0, -1, 2.5, True])
+    def test_invalid_aligned_size_raises(self, sample_bgr_image, aligned_size):
+        with pytest.raises(ValueError):
+            detect_faces(image=sample_bgr_image, aligned_size=aligned_size)
+
     @pytest.mark.parametrize("max_faces", [0, -2, 1.5, "2"])
     def test_invalid_max_faces_raises(self, sample_bgr_image, max_faces):
         with pytest.raises(ValueError):
@@ -7,7 +7,11 @@ import mediapipe as mp  # real package or the conftest stub
 import numpy as np
 import pytest
 
-from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh
+from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import (
+    analyze_face_mesh,
+    analyze_face_mesh_live,
+    landmark_points,
+)
 
 from fakes import FakeFaceMesh, make_landmarks
 
@@ -181,6 +185,49 @@ class TestAnalyzeFaceMeshConfiguration:
         assert result.meta["source"] is sample_bgr_image
 
 
+class TestAnalyzeFaceMeshInferenceMaxSide:
+    def test_detector_receives_downscaled_image(self, sample_bgr_image, patch_facemesh):
+        from types import SimpleNamespace
+
+        faces = make_landmarks([[(0, 0.25, 0.5, 0.0)]])
+        holder = patch_facemesh(result=SimpleNamespace(multi_face_landmarks=faces))
+        result = analyze_face_mesh(image=sample_bgr_image, landmarks_idx=[0], inference_max_side=16)
+        assert holder["instance"].processed_images[0].shape == (12, 16, 3)
+        assert result.image.shape == sample_bgr_image.shape
+        assert result.data == [[[0, 0, 0.25, 0.5, 0.0]]]
+        assert result.meta["inference_max_side"] == 16
+
+    @pytest.mark.parametrize("inference_max_side", [0, -1, 2.5, "64"])
+    def test_invalid_inference_max_side_raises(self, sample_bgr_image, inference_max_side):
+        with pytest.raises(ValueError):
+            analyze_face_mesh(image=sample_bgr_image, inference_max_side=inference_max_side)
+
+
+class TestLandmarkPoints:
+    def test_gathers_indices_in_requested_order(self):
+        faces = [
+            [[0, 5, 0.1, 0.2, 0.0], [0, 9, 0.3, 0.4, 0.0]],
+            [[1, 9, 0.7, 0.8, 0.0], [1, 5, 0.5, 0.6, 0.0]],
+        ]
+        face_ids, points = landmark_points(faces, [9, 5])
+        assert face_ids == [0, 1]
+        assert points.shape == (2, 2, 2)
+        assert points.tolist() == [[[0.3, 0.4], [0.1, 0.2]], [[0.7, 0.8], [0.5, 0.6]]]
+
+    def test_rows_of_a_single_face(self):
+        face_ids, points = landmark_points([[0, 5, 0.1, 0.2, 0.0]], [5])
+        assert face_ids == [0]
+        assert points.tolist() == [[[0.1, 0.2]]]
+
+    @pytest.mark.parametrize("faces", [
+        [[[0, 5, 0.1, 0.2, 0.0]]],  # index 9 missing
+        [[[0, 5, 0.1, 0.2, 0.0], [0, 9, 0.3, 0.4, 0.0]], [[1, 5, 0.5, 0.6, 0.0]]],  # ragged
+        [[0, 5, 0.1]],  # short rows
+    ])
+    def test_incomplete_data_returns_none(self, faces):
+        assert landmark_points(faces, [5, 9]) is None
+
+
 class TestAnalyzeFaceMeshValidation:
     def test_non_image_raises(self):
         with pytest.raises(TypeError):
@@ -200,3 +247,23 @@ class TestAnalyzeFaceMeshValidation:
     def test_invalid_landmarks_idx_raises(self, sample_bgr_image, landmarks_idx):
         with pytest.raises(TypeError):
             analyze_face_mesh(image=sample_bgr_image, landmarks_idx=landmarks_idx)
+
+
+class TestAnalyzeFaceMeshLive:
+    def test_runs_headless_over_frame_source(self, sample_bgr_array, patch_facemesh):
+        from types import SimpleNamespace
+
+        faces = make_landmarks([[(0, 0.5, 0.5, 0.0)]])
+        holder = patch_facemesh(result=SimpleNamespace(multi_face_landmarks=faces))
+        result = analyze_face_mesh_live(
+            source=[sample_bgr_array] * 4, display=False
+        )
+        assert result.meta["frames_rendered"] == 4
+        assert holder["instance"].kwargs["static_image_mode"] is False
+
+    def test_max_frames(self, sample_bgr_array, patch_facemesh):
+        patch_facemesh(result=None)
+        result = analyze_face_mesh_live(
+            source=[sample_bgr_array] * 10, display=False, max_frames=2
+        )
+        assert result.meta["frames_rendered"] == 2
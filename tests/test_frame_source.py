@@ -0,0 +1,151 @@
+"""Unit tests for ImagePRO.utils.frame_source.FrameSource."""
+
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+
+from ImagePRO.utils.frame_source import FrameSource
+
+
+def make_frames(count, *, step=40):
+    return [np.full((16, 16, 3), (i * step) % 256, np.uint8) for i in range(count)]
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    path = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    if not writer.isOpened():
+        pytest.skip("No video encoder available")
+    for i in range(6):
+        writer.write(np.full((24, 32, 3), i * 40, np.uint8))
+    writer.release()
+    return path
+
+
+class TestSourceKinds:
+    def test_iterable(self):
+        frames = make_frames(3)
+        source = FrameSource(frames)
+        assert source.kind == "iterable"
+        assert not source.live
+        assert [f[0, 0, 0] for f in source] == [0, 40, 80]
+        assert source.frames_read == source.frames_yielded == 3
+
+    def test_directory_reads_sorted_images_only(self, tmp_path):
+        for i, frame in enumerate(make_frames(3)):
+            cv2.imwrite(str(tmp_path / f"{2 - i}.png"), frame)
+        (tmp_path / "notes.txt").write_text("not an image")
+        source = FrameSource(tmp_path)
+        assert source.kind == "directory"
+        assert [f[0, 0, 0] for f in source] == [80, 40, 0]
+
+    def test_unreadable_directory_file_is_counted(self, tmp_path):
+        (tmp_path / "broken.jpg").write_bytes(b"not a jpeg")
+        source = FrameSource(tmp_path)
+        assert list(source) == []
+        assert source.read_failures == 1
+
+    def test_video_file(self, video_file):
+        with FrameSource(video_file) as source:
+            frames = list(source)
+        assert source.kind == "video"
+        assert len(frames) == 6
+        assert frames[0].shape == (24, 32, 3)
+
+    def test_camera_open_failure(self, monkeypatch):
+        class ClosedCamera:
+            def __init__(self, *args):
+                self.args = args
+
+            def isOpened(self):
+                return False
+
+        monkeypatch.setattr(cv2, "VideoCapture", ClosedCamera)
+        source = FrameSource(3)
+        assert source.live
+        with pytest.raises(RuntimeError, match=r"Cannot access camera \(index=3\)"):
+            source.open()
+
+    def test_camera_api_is_forwarded(self, monkeypatch):
+        calls = []
+
+        class Camera:
+            def __init__(self, *args):
+                calls.append(args)
+
+            def isOpened(self):
+                return True
+
+            def release(self):
+                pass
+
+        monkeypatch.setattr(cv2, "VideoCapture", Camera)
+        with FrameSource(0, camera_api=cv2.CAP_DSHOW):
+            pass
+        assert calls == [(0, cv2.CAP_DSHOW)]
+
+
+class TestStride:
+    def test_iterable_stride(self):
+        source = FrameSource(make_frames(7), frame_stride=3)
+        assert [f[0, 0, 0] for f in source] == [0, 120, 240]
+
+    def test_directory_stride(self, tmp_path):
+        for i, frame in enumerate(make_frames(5)):
+            cv2.imwrite(str(tmp_path / f"{i}.png"), frame)
+        assert len(list(FrameSource(tmp_path, frame_stride=2))) == 3
+
+    def test_video_stride_grabs_skipped_frames(self, video_file):
+        with FrameSource(video_file, frame_stride=4) as source:
+            frames = list(source)
+        assert len(frames) == 2
+        assert source.frames_read == 2
+
+
+class TestDeduplication:
+    def test_disabled_by_default(self):
+        frames = [np.zeros((8, 8, 3), np.uint8)] * 4
+        assert len(list(FrameSource(frames))) == 4
+
+    def test_near_identical_frames_are_skipped(self):
+        base = np.full((20, 20, 3), 100, np.uint8)
+        frames = [base, base + 1, base + 2, base + 30, base + 31]
+        source = FrameSource(frames, dedup_threshold=5)
+        kept = list(source)
+        assert [int(f[0, 0, 0]) for f in kept] == [100, 130]
+        assert source.duplicates_skipped == 3
+        assert source.frames_read == 5
+
+    def test_comparison_is_against_last_kept_frame(self):
+        # A slow drift eventually exceeds the threshold
+        frames = [np.full((8, 8), v, np.uint8) for v in range(0, 10, 2)]
+        kept = list(FrameSource(frames, dedup_threshold=3))
+        assert [int(f[0, 0]) for f in kept] == [0, 4, 8]
+
+
+class TestValidation:
+    @pytest.mark.parametrize("frame_stride", [0, -1, 1.5, True])
+    def test_invalid_stride_raises(self, frame_stride):
+        with pytest.raises(ValueError):
+            FrameSource([], frame_stride=frame_stride)
+
+    @pytest.mark.parametrize("dedup_threshold", [-1, "1"])
+    def test_invalid_threshold_raises(self, dedup_threshold):
+        with pytest.raises(ValueError):
+            FrameSource([], dedup_threshold=dedup_threshold)
+
+    @pytest.mark.parametrize("source", [1.5, None, True])
+    def test_invalid_source_type_raises(self, source):
+        with pytest.raises(TypeError):
+            FrameSource(source)
+
+    def test_missing_path_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            FrameSource(tmp_path / "missing.mp4")
+
+    def test_non_array_items_raise(self):
+        with pytest.raises(TypeError):
+            list(FrameSource(["frame"]))
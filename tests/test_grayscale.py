@@ -45,6 +45,12 @@ class TestConvertToGrayscale:
         rgb_result = convert_to_grayscale(image=Image.from_array(array, colorspace="RGB"))
         assert not np.array_equal(bgr_result.image, rgb_result.image)
 
+    def test_result_is_a_writable_copy_of_the_cached_conversion(self, sample_bgr_image):
+        result = convert_to_grayscale(image=sample_bgr_image)
+        assert result.image.flags.writeable
+        assert result.image is not sample_bgr_image.as_gray()
+        assert np.array_equal(result.image, sample_bgr_image.as_gray())
+
     def test_meta_contents(self, sample_bgr_image):
         result = convert_to_grayscale(image=sample_bgr_image)
         assert result.data is None
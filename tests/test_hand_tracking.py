@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import mediapipe as mp  # real package or the conftest stub
 import numpy as np
 import pytest
 
-from ImagePRO.human_analysis.body_analysis.hand_tracking import detect_hands
+from ImagePRO.human_analysis.body_analysis.hand_tracking import detect_hands, detect_hands_live
 
 from fakes import FakeHands, make_landmarks
 
@@ -25,6 +26,19 @@ class TestDetectHandsNoDetection:
         assert len(hands.processed_images) == 1
 
 
+class TestDetectHandsInferenceMaxSide:
+    def test_detector_receives_downscaled_image(self, sample_bgr_array, sample_bgr_image):
+        hands = FakeHands()
+        result = detect_hands(image=sample_bgr_image, hands_obj=hands, inference_max_side=8)
+        assert hands.processed_images[0].shape == (6, 8, 3)
+        assert result.image.shape == sample_bgr_array.shape
+        assert result.meta["inference_max_side"] == 8
+
+    def test_invalid_inference_max_side_raises(self, sample_bgr_image):
+        with pytest.raises(ValueError):
+            detect_hands(image=sample_bgr_image, inference_max_side=0)
+
+
 class TestDetectHandsWithDetection:
     def test_all_landmarks_for_single_hand(self, sample_bgr_image):
         faces = make_landmarks([[(0, 0.1, 0.2, 0.3), (20, 0.6, 0.7, 0.8)]])
@@ -100,3 +114,31 @@ class TestDetectHandsValidation:
     def test_invalid_landmarks_idx_raises(self, sample_bgr_image, landmarks_idx):
         with pytest.raises(TypeError):
             detect_hands(image=sample_bgr_image, landmarks_idx=landmarks_idx)
+
+
+class TestDetectHandsLive:
+    def test_runs_headless_with_tracking_detector(self, sample_bgr_array, monkeypatch):
+        created = []
+
+        def factory(**kwargs):
+            created.append(FakeHands(**kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(mp.solutions.hands, "Hands", factory)
+        result = detect_hands_live(source=[sample_bgr_array] * 3, display=False)
+        assert result.meta["frames_rendered"] == 3
+        assert len(created) == 1
+        assert created[0].kwargs["static_image_mode"] is False
+        assert len(created[0].processed_images) == 3
+
+    def test_track_roi_uses_static_image_mode(self, sample_bgr_array, monkeypatch):
+        created = []
+
+        def factory(**kwargs):
+            created.append(FakeHands(**kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(mp.solutions.hands, "Hands", factory)
+        result = detect_hands_live(source=[sample_bgr_array] * 2, display=False, track_roi=True)
+        assert result.meta["frames_rendered"] == 2
+        assert created[0].kwargs["static_image_mode"] is True
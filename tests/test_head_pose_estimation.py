@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import cv2
+import mediapipe as mp  # real package or the conftest stub
+import numpy as np
 import pytest
 
 from ImagePRO.human_analysis.face_analysis import head_pose_estimation
-from ImagePRO.human_analysis.face_analysis.head_pose_estimation import estimate_head_pose
+from ImagePRO.human_analysis.face_analysis.head_pose_estimation import (
+    PNP_INDICES,
+    PNP_MODEL_POINTS,
+    compute_head_pose_angles,
+    estimate_head_pose,
+    estimate_head_pose_live,
+    solve_head_pose_pnp,
+)
 from ImagePRO.utils.result import Result
+from ImagePRO.utils.temporal import TrackSmoother
+
+from fakes import FakeFaceMesh
 
 
 def patch_mesh(monkeypatch, faces_data):
@@ -29,6 +42,23 @@ def pose_rows(left_x, nasion_x, right_x, nasion_y, nose_y, chin_y):
     ]
 
 
+def pnp_rows(yaw, pitch, roll, size=(32, 24), face_id=0, distance=1500.0):
+    # Project the canonical model rotated by R = Rz(roll) @ Ry(yaw) @ Rx(pitch)
+    width, height = size
+    angles = np.radians([yaw, pitch, roll])
+    rotation = (
+        cv2.Rodrigues(np.array([0.0, 0.0, angles[2]]))[0]
+        @ cv2.Rodrigues(np.array([0.0, angles[0], 0.0]))[0]
+        @ cv2.Rodrigues(np.array([angles[1], 0.0, 0.0]))[0]
+    )
+    camera = np.array([[width, 0, width / 2], [0, width, height / 2], [0, 0, 1]], float)
+    projected, _ = cv2.projectPoints(
+        PNP_MODEL_POINTS, cv2.Rodrigues(rotation)[0], np.array([0.0, 0.0, distance]), camera, None
+    )
+    xy = projected.reshape(-1, 2) / (width, height)
+    return [[face_id, idx, x, y, 0.0] for idx, (x, y) in zip(PNP_INDICES, xy)]
+
+
 class TestEstimateHeadPose:
     def test_frontal_face_gives_zero_yaw(self, sample_bgr_image, monkeypatch):
         rows = pose_rows(
@@ -75,6 +105,135 @@ class TestEstimateHeadPose:
         assert result.meta["min_confidence"] == 0.6
         assert result.image is None
 
+    def test_many_faces_in_one_pass(self, sample_bgr_image, monkeypatch):
+        frontal = pose_rows(0.3, 0.5, 0.7, 0.4, 0.5, 0.9)
+        turned = [[1, *row[1:]] for row in pose_rows(0.2, 0.35, 0.8, 0.4, 0.5, 0.9)]
+        patch_mesh(monkeypatch, [frontal, turned[::-1]])  # row order does not matter
+        result = estimate_head_pose(image=sample_bgr_image, max_faces=2, face_mesh_obj=object())
+        assert [row[0] for row in result.data] == [0, 1]
+        assert result.data[0][1] == pytest.approx(0.0)
+        assert result.data[1][1] == pytest.approx(30.0)
+        assert result.meta["method"] == "geometric"
+
+
+class TestComputeHeadPoseAngles:
+    def test_vectorized_over_faces(self):
+        points = np.array([
+            [[0.5, 0.5], [0.5, 0.9], [0.3, 0.5], [0.7, 0.5], [0.5, 0.4]],
+            [[0.5, 0.5], [0.5, 0.9], [0.2, 0.5], [0.8, 0.5], [0.35, 0.4]],
+        ])
+        angles = compute_head_pose_angles(points)
+        assert angles.shape == (2, 2)
+        assert angles[:, 0] == pytest.approx([0.0, 30.0])
+        assert angles[:, 1] == pytest.approx([30.0, 30.0])
+
+    def test_empty_batch(self):
+        assert compute_head_pose_angles(np.empty((0, 5, 2))).shape == (0, 2)
+
+    @pytest.mark.parametrize("shape", [(5, 2), (1, 4, 2), (1, 5, 3)])
+    def test_invalid_shape_raises(self, shape):
+        with pytest.raises(ValueError):
+            compute_head_pose_angles(np.zeros(shape))
+
+
+class TestHeadPosePnP:
+    @pytest.mark.parametrize("yaw,pitch,roll", [(0, 0, 0), (20, 0, 0), (0, -15, 0), (10, 5, -8)])
+    def test_recovers_rotation(self, sample_bgr_image, monkeypatch, yaw, pitch, roll):
+        patch_mesh(monkeypatch, [pnp_rows(yaw, pitch, roll)])
+        result = estimate_head_pose(image=sample_bgr_image, face_mesh_obj=object(), method="pnp")
+        face_id, *angles = result.data[0]
+        assert face_id == 0
+        assert angles == pytest.approx([yaw, pitch, roll], abs=0.5)
+        assert result.meta["translation"][0] == pytest.approx([0.0, 0.0, 1500.0], abs=5.0)
+        assert result.meta["method"] == "pnp"
+
+    def test_batched_faces_and_cached_intrinsics(self):
+        from ImagePRO.human_analysis.face_analysis import head_pose_estimation as module
+
+        faces = [pnp_rows(15, 0, 0, size=(640, 480)), pnp_rows(-15, 0, 0, size=(640, 480))]
+        points = np.array([[row[2:4] for row in face] for face in faces])
+        module._camera_matrix.cache_clear()
+        angles, translations = solve_head_pose_pnp(points, (640, 480))
+        solve_head_pose_pnp(points, (640, 480))
+        assert angles[:, 0] == pytest.approx([15.0, -15.0], abs=0.5)
+        assert translations.shape == (2, 3)
+        assert module._camera_matrix.cache_info().hits >= 1
+        assert not module._camera_matrix(640, 480).flags.writeable
+
+    def test_pnp_requests_its_own_landmarks(self, sample_bgr_image, monkeypatch):
+        captured = {}
+
+        def fake_mesh(**kwargs):
+            captured.update(kwargs)
+            return Result(image=None, data=[pnp_rows(0, 0, 0)], meta={})
+
+        monkeypatch.setattr(head_pose_estimation, "analyze_face_mesh", fake_mesh)
+        estimate_head_pose(image=sample_bgr_image, face_mesh_obj=object(), method="pnp")
+        assert captured["landmarks_idx"] == PNP_INDICES
+
+    def test_invalid_points_raise(self):
+        with pytest.raises(ValueError):
+            solve_head_pose_pnp(np.zeros((1, 5, 2)), (32, 24))
+        with pytest.raises(ValueError):
+            solve_head_pose_pnp(np.zeros((1, 6, 2)), (32, 24), camera_matrix=np.eye(2))
+
+
+class TestEstimateHeadPoseSmoothing:
+    def test_smoother_filters_angles_over_frames(self, sample_bgr_image, monkeypatch):
+        smoother = TrackSmoother(min_cutoff=0.5, beta=0.0)
+        patch_mesh(monkeypatch, [pose_rows(0.3, 0.5, 0.7, 0.4, 0.5, 0.9)])
+        first = estimate_head_pose(
+            image=sample_bgr_image, face_mesh_obj=object(), smoother=smoother, timestamp=0.0
+        )
+        assert first.data[0] == [0, pytest.approx(0.0), pytest.approx(30.0)]
+        assert first.meta["smoothed"] is True
+
+        patch_mesh(monkeypatch, [pose_rows(0.2, 0.35, 0.8, 0.4, 0.5, 0.9)])  # yaw jumps to 30
+        second = estimate_head_pose(
+            image=sample_bgr_image, face_mesh_obj=object(), smoother=smoother, timestamp=1 / 30
+        )
+        assert 0.0 < second.data[0][1] < 30.0
+
+    def test_no_face_resets_smoother(self, sample_bgr_image, monkeypatch):
+        smoother = TrackSmoother()
+        patch_mesh(monkeypatch, [pose_rows(0.3, 0.5, 0.7, 0.4, 0.5, 0.9)])
+        estimate_head_pose(image=sample_bgr_image, face_mesh_obj=object(), smoother=smoother)
+        patch_mesh(monkeypatch, [])
+        estimate_head_pose(image=sample_bgr_image, face_mesh_obj=object(), smoother=smoother)
+        assert smoother.ids == []
+
+    def test_invalid_smoother_raises(self, sample_bgr_image):
+        with pytest.raises(TypeError):
+            estimate_head_pose(image=sample_bgr_image, smoother=object())
+
+
+class TestEstimateHeadPoseLive:
+    def test_overlay_does_not_modify_source_frames(self, sample_bgr_array, monkeypatch):
+        monkeypatch.setattr(mp.solutions.face_mesh, "FaceMesh", FakeFaceMesh)
+        patch_mesh(monkeypatch, [pose_rows(0.3, 0.5, 0.7, 0.4, 0.5, 0.9)])
+        frames = [sample_bgr_array.copy() for _ in range(3)]
+        result = estimate_head_pose_live(source=frames, display=False)
+        assert result.meta["frames_rendered"] == 3
+        assert all(np.array_equal(frame, sample_bgr_array) for frame in frames)
+
+    def test_target_latency_skips_and_extrapolates(self, sample_bgr_array, monkeypatch):
+        monkeypatch.setattr(mp.solutions.face_mesh, "FaceMesh", FakeFaceMesh)
+        calls = []
+
+        def fake_mesh(**kwargs):
+            calls.append(1)
+            return Result(image=None, data=[pose_rows(0.3, 0.5, 0.7, 0.4, 0.5, 0.9)], meta={})
+
+        monkeypatch.setattr(head_pose_estimation, "analyze_face_mesh", fake_mesh)
+        # A 10 s target lets one measurement cover the whole short clip
+        result = estimate_head_pose_live(
+            source=[sample_bgr_array] * 6, display=False, target_latency=10.0
+        )
+        assert result.meta["frames_rendered"] == 6
+        assert result.meta["frames_analyzed"] + result.meta["frames_extrapolated"] == 6
+        assert result.meta["frames_extrapolated"] >= 1
+        assert len(calls) == result.meta["frames_analyzed"]
+
 
 class TestEstimateHeadPoseValidation:
     def test_non_image_raises(self):
@@ -90,3 +249,9 @@ class TestEstimateHeadPoseValidation:
     def test_invalid_confidence_raises(self, sample_bgr_image, min_confidence):
         with pytest.raises(ValueError):
             estimate_head_pose(image=sample_bgr_image, min_confidence=min_confidence)
+
+    def test_invalid_method_raises(self, sample_bgr_image):
+        with pytest.raises(ValueError):
+            estimate_head_pose(image=sample_bgr_image, method="solvepnp")
+        with pytest.raises(ValueError):
+            estimate_head_pose_live(method="solvepnp", display=False)
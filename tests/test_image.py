@@ -76,3 +76,57 @@ class TestProperties:
 
     def test_dtype(self, sample_bgr_image):
         assert sample_bgr_image.dtype == np.uint8
+
+
+class TestColorConversions:
+    def test_as_rgb_swaps_bgr_channels(self, sample_bgr_image, sample_bgr_array):
+        assert np.array_equal(sample_bgr_image.as_rgb(), sample_bgr_array[..., ::-1])
+
+    def test_as_rgb_of_rgb_image_is_its_own_array(self, sample_rgb_image):
+        assert sample_rgb_image.as_rgb() is sample_rgb_image._data
+
+    def test_as_bgr_of_bgr_image_is_its_own_array(self, sample_bgr_image):
+        assert sample_bgr_image.as_bgr() is sample_bgr_image._data
+
+    def test_as_bgr_swaps_rgb_channels(self, sample_rgb_image, sample_bgr_array):
+        assert np.array_equal(sample_rgb_image.as_bgr(), sample_bgr_array[..., ::-1])
+
+    def test_as_bgr_of_gray_image_has_three_channels(self, sample_gray_image):
+        assert sample_gray_image.as_bgr().shape == sample_gray_image.shape + (3,)
+
+    def test_as_gray_of_gray_image_is_its_own_array(self, sample_gray_image):
+        assert sample_gray_image.as_gray() is sample_gray_image._data
+
+    def test_gray_to_rgb(self, sample_gray_image):
+        rgb = sample_gray_image.as_rgb()
+        assert rgb.shape == (12, 10, 3)
+        assert np.array_equal(rgb[..., 0], sample_gray_image._data)
+
+    def test_as_gray_respects_colorspace(self, sample_bgr_array):
+        bgr = Image.from_array(sample_bgr_array, colorspace="BGR").as_gray()
+        rgb = Image.from_array(sample_bgr_array[..., ::-1].copy(), colorspace="RGB").as_gray()
+        assert np.array_equal(bgr, rgb)
+
+    def test_conversion_runs_once_and_is_read_only(self, sample_bgr_image, monkeypatch):
+        import cv2
+
+        calls = []
+        real = cv2.cvtColor
+
+        def counting(*args, **kwargs):
+            calls.append(args[1])
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr("ImagePRO.utils.image.cv2.cvtColor", counting)
+        first = sample_bgr_image.as_rgb()
+        assert sample_bgr_image.as_rgb() is first
+        sample_bgr_image.as_gray()
+        sample_bgr_image.as_gray()
+        assert len(calls) == 2
+        assert not first.flags.writeable
+        assert sample_bgr_image._data.flags.writeable
+
+    def test_cache_is_not_in_repr(self, sample_bgr_array):
+        image = Image.from_array(sample_bgr_array)
+        image.as_rgb()
+        assert "_derived" not in repr(image)
@@ -0,0 +1,31 @@
+"""Unit tests for the shared inference-resolution helper."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ImagePRO.human_analysis.inference import inference_image
+from ImagePRO.utils.image import Image
+
+
+class TestInferenceImage:
+    @pytest.mark.parametrize("max_side", [None, 32, 100])
+    def test_images_that_fit_are_returned_as_is(self, sample_bgr_image, max_side):
+        assert inference_image(sample_bgr_image, max_side) is sample_bgr_image
+
+    def test_longest_side_is_downscaled_keeping_aspect(self, sample_bgr_image):
+        small = inference_image(sample_bgr_image, 16)
+        assert small.shape[:2] == (12, 16)
+        assert small.colorspace == sample_bgr_image.colorspace
+
+    def test_colorspace_is_kept(self):
+        image = Image.from_array(np.zeros((40, 20, 3), np.uint8), colorspace="RGB")
+        small = inference_image(image, 10)
+        assert small.shape[:2] == (10, 5)
+        assert small.colorspace == "RGB"
+
+    @pytest.mark.parametrize("max_side", [0, -5, 2.5, True, "64"])
+    def test_invalid_max_side_raises(self, sample_bgr_image, max_side):
+        with pytest.raises(ValueError, match="inference_max_side"):
+            inference_image(sample_bgr_image, max_side)
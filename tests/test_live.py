@@ -0,0 +1,229 @@
+"""Unit tests for ImagePRO.utils.live."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from ImagePRO.utils.live import LIVE_STAGES, LiveStats, run_live
+from ImagePRO.utils.result import Result
+
+
+def make_frames(count, shape=(24, 32, 3)):
+    return [np.full(shape, i, dtype=np.uint8) for i in range(count)]
+
+
+def write_video(path, count):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    for frame in make_frames(count):
+        writer.write(frame)
+    writer.release()
+
+
+class TestRunLive:
+    def test_offline_source_processes_every_frame_in_order(self):
+        rendered = []
+
+        def render(frame, output):
+            rendered.append(output)
+            return frame
+
+        result = run_live(
+            make_frames(6), infer=lambda f: int(f[0, 0, 0]), render=render, display=False
+        )
+        assert isinstance(result, Result)
+        assert rendered == list(range(6))
+        assert result.meta["frames_captured"] == 6
+        assert result.meta["frames_inferred"] == 6
+        assert result.meta["frames_rendered"] == 6
+        assert result.meta["frames_dropped"] == 0
+        assert result.meta["source_kind"] == "iterable"
+        assert result.meta["latest_only"] is False
+
+    def test_video_file_source(self, tmp_path):
+        path = tmp_path / "clip.avi"
+        write_video(path, 5)
+        result = run_live(path, infer=lambda f: f.shape, render=lambda f, o: f, display=False)
+        assert result.meta["source_kind"] == "video"
+        assert result.meta["frames_rendered"] == 5
+
+    def test_max_frames_stops_early(self):
+        def endless():
+            while True:
+                yield np.zeros((4, 4, 3), dtype=np.uint8)
+
+        result = run_live(endless(), infer=lambda f: None, render=lambda f, o: f,
+                          display=False, max_frames=3)
+        assert result.meta["frames_rendered"] == 3
+
+    def test_latest_only_drops_frames_while_inference_is_busy(self):
+        seen = []
+
+        def slow_infer(frame):
+            seen.append(int(frame[0, 0, 0]))
+            time.sleep(0.02)
+            return None
+
+        result = run_live(make_frames(50), infer=slow_infer, render=lambda f, o: f,
+                          display=False, latest_only=True)
+        assert result.meta["frames_captured"] == 50
+        assert result.meta["frames_dropped"] > 0
+        assert len(seen) < 50
+        assert seen == sorted(seen)
+
+    def test_inference_runs_off_the_calling_thread(self):
+        threads = {}
+
+        def infer(frame):
+            threads["infer"] = threading.current_thread()
+
+        def render(frame, output):
+            threads["render"] = threading.current_thread()
+            return frame
+
+        run_live(make_frames(1), infer=infer, render=render, display=False)
+        assert threads["render"] is threading.current_thread()
+        assert threads["infer"] is not threading.current_thread()
+
+    def test_infer_errors_are_reraised(self):
+        def broken(frame):
+            raise KeyError("boom")
+
+        with pytest.raises(KeyError):
+            run_live(make_frames(3), infer=broken, render=lambda f, o: f, display=False)
+
+    def test_render_errors_are_reraised(self):
+        def broken(frame, output):
+            raise KeyError("boom")
+
+        with pytest.raises(KeyError):
+            run_live(make_frames(3), infer=lambda f: None, render=broken, display=False)
+
+    def test_missing_video_raises_value_error(self, tmp_path):
+        with pytest.raises(ValueError):
+            run_live(tmp_path / "missing.mp4", infer=lambda f: None, render=lambda f, o: f)
+
+    def test_unopenable_camera_raises_runtime_error(self, monkeypatch):
+        class ClosedCapture:
+            def __init__(self, *args):
+                pass
+
+            def isOpened(self):
+                return False
+
+        monkeypatch.setattr("ImagePRO.utils.frame_source.cv2.VideoCapture", ClosedCapture)
+        with pytest.raises(RuntimeError):
+            run_live(0, infer=lambda f: None, render=lambda f, o: f, display=False)
+
+    @pytest.mark.parametrize("max_frames", [0, -1, 1.5, True])
+    def test_invalid_max_frames(self, max_frames):
+        with pytest.raises(ValueError):
+            run_live([], infer=lambda f: None, render=lambda f, o: f, max_frames=max_frames)
+
+    def test_non_callable_raises_type_error(self):
+        with pytest.raises(TypeError):
+            run_live([], infer=None, render=lambda f, o: f)
+        with pytest.raises(TypeError):
+            run_live([], infer=lambda f: None, render=lambda f, o: f, preprocess="gray")
+
+    def test_hooks_run_in_order(self):
+        calls = []
+
+        def preprocess(frame):
+            calls.append("preprocess")
+            return int(frame[0, 0, 0])
+
+        def infer(value):
+            calls.append("infer")
+            return value * 10
+
+        def postprocess(frame, raw):
+            calls.append("postprocess")
+            return raw + 1
+
+        outputs = []
+
+        def render(frame, output):
+            outputs.append(output)
+            return frame
+
+        run_live(make_frames(3), preprocess=preprocess, infer=infer,
+                 postprocess=postprocess, render=render, display=False)
+        assert outputs == [1, 11, 21]
+        assert calls[:3] == ["preprocess", "infer", "postprocess"]
+
+
+class TestLiveStats:
+    def test_video_run_reports_every_stage(self, tmp_path):
+        path = tmp_path / "clip.avi"
+        write_video(path, 8)
+        result = run_live(
+            path,
+            preprocess=lambda f: f,
+            infer=lambda f: f.mean(),
+            postprocess=lambda f, raw: raw,
+            render=lambda f, o: f,
+            display=False,
+        )
+        stats = result.meta["stats"]
+        assert set(stats) == {"fps", *LIVE_STAGES}
+        for stage in LIVE_STAGES:
+            assert stats[stage]["count"] == 8
+            assert 0 <= stats[stage]["p50"] <= stats[stage]["p95"] <= stats[stage]["p99"]
+        assert stats["fps"] > 0
+
+    def test_skipped_hooks_have_no_samples(self):
+        result = run_live(make_frames(2), infer=lambda f: None, render=lambda f, o: f,
+                          display=False)
+        assert result.meta["stats"]["preprocess"] == {
+            "p50": None, "p95": None, "p99": None, "count": 0
+        }
+
+    def test_percentiles_in_milliseconds_over_rolling_window(self):
+        stats = LiveStats(window=4)
+        for seconds in (1.0, 0.001, 0.002, 0.003, 0.004):
+            stats.record("infer", seconds)
+        pct = stats.percentiles("infer")
+        assert pct["count"] == 4  # the 1 s sample fell out of the window
+        assert pct["p50"] == pytest.approx(2.5)
+        assert pct["p99"] <= 4.0
+
+    def test_fps_from_frame_timestamps(self):
+        stats = LiveStats()
+        for i in range(11):
+            stats.mark_frame(i * 0.1)
+        assert stats.fps == pytest.approx(10.0)
+
+    def test_caller_supplied_stats_are_filled(self):
+        stats = LiveStats()
+        run_live(make_frames(3), infer=lambda f: None, render=lambda f, o: f,
+                 display=False, stats=stats)
+        assert stats.percentiles("infer")["count"] == 3
+
+    def test_overlay_draws_on_a_copy(self, monkeypatch):
+        shown = []
+        monkeypatch.setattr("ImagePRO.utils.live.cv2.imshow", lambda name, frame: shown.append(frame))
+        monkeypatch.setattr("ImagePRO.utils.live.cv2.waitKey", lambda delay: -1)
+        monkeypatch.setattr("ImagePRO.utils.live.cv2.destroyAllWindows", lambda: None)
+        frames = make_frames(2, shape=(80, 320, 3))
+        run_live(frames, infer=lambda f: None, render=lambda f, o: f, overlay=True)
+        assert len(shown) == 2
+        assert not np.array_equal(shown[1], frames[1])
+        assert np.all(frames[1] == 1)
+
+    def test_unknown_stage_raises(self):
+        with pytest.raises(ValueError):
+            LiveStats().record("decode", 0.1)
+
+    @pytest.mark.parametrize("window", [0, 1, 2.5, True])
+    def test_invalid_window(self, window):
+        with pytest.raises(ValueError):
+            LiveStats(window=window)
+
+    def test_invalid_stats_type(self):
+        with pytest.raises(TypeError):
+            run_live([], infer=lambda f: None, render=lambda f, o: f, stats={})
@@ -0,0 +1,118 @@
+"""Unit tests for ImagePRO.utils.pipeline."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from ImagePRO.utils.pipeline import PipelineReport, Stage, run_pipeline
+
+
+class TestRunPipeline:
+    def test_single_worker_stages_preserve_order(self):
+        report = run_pipeline(
+            range(20),
+            [Stage("double", lambda x: x * 2), Stage("inc", lambda x: x + 1)],
+        )
+        assert isinstance(report, PipelineReport)
+        assert report.outputs == [x * 2 + 1 for x in range(20)]
+        assert not report.stopped
+
+    def test_multiple_workers_process_every_item(self):
+        report = run_pipeline(
+            range(100),
+            [Stage("square", lambda x: x * x, workers=4), Stage("neg", lambda x: -x, workers=3)],
+            queue_size=2,
+        )
+        assert sorted(report.outputs) == sorted(-x * x for x in range(100))
+
+    def test_none_drops_items(self):
+        report = run_pipeline(range(10), [Stage("even", lambda x: x if x % 2 == 0 else None)])
+        assert report.outputs == [0, 2, 4, 6, 8]
+        stats = report.stats_dict()["even"]
+        assert stats["items_in"] == 10
+        assert stats["items_out"] == 5
+
+    def test_setup_runs_once_per_worker(self):
+        states = []
+        lock = threading.Lock()
+
+        def setup():
+            state = object()
+            with lock:
+                states.append(state)
+            return state
+
+        report = run_pipeline(
+            range(30),
+            [Stage("tag", lambda x, state: (x, id(state)), workers=3, setup=setup)],
+        )
+        seen = {state_id for _, state_id in report.outputs}
+        assert len(states) == 3
+        assert seen <= {id(s) for s in states}
+
+    def test_stop_event_ends_early(self):
+        stop = threading.Event()
+
+        def take(x):
+            if x == 5:
+                stop.set()
+            return x
+
+        report = run_pipeline(iter(range(10_000)), [Stage("take", take)], stop_event=stop)
+        assert report.stopped
+        assert len(report.outputs) < 10_000
+
+    def test_slow_stage_is_reported_as_bottleneck(self):
+        def slow(x):
+            time.sleep(0.005)
+            return x
+
+        report = run_pipeline(
+            range(20), [Stage("fast", lambda x: x), Stage("slow", slow)], source_name="capture"
+        )
+        assert report.bottleneck == "slow"
+        stats = report.stats_dict()
+        assert list(stats) == ["capture", "fast", "slow"]
+        # The fast stage waits on the bounded queue in front of the slow one
+        assert stats["fast"]["blocked_seconds"] >= 0
+        assert stats["slow"]["utilization"] > stats["fast"]["utilization"]
+
+    def test_stage_error_is_reraised(self):
+        def boom(x):
+            if x == 3:
+                raise RuntimeError("boom")
+            return x
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_pipeline(range(10), [Stage("boom", boom, workers=2)])
+
+    def test_source_error_is_reraised(self):
+        def source():
+            yield 1
+            raise OSError("read failed")
+
+        with pytest.raises(OSError, match="read failed"):
+            run_pipeline(source(), [Stage("id", lambda x: x)])
+
+
+class TestValidation:
+    def test_empty_stages_raise(self):
+        with pytest.raises(ValueError):
+            run_pipeline([], [])
+
+    def test_non_stage_raises(self):
+        with pytest.raises(TypeError):
+            run_pipeline([], [lambda x: x])
+
+    @pytest.mark.parametrize("workers", [0, -1, 1.5])
+    def test_invalid_workers_raise(self, workers):
+        with pytest.raises(ValueError):
+            run_pipeline([], [Stage("s", lambda x: x, workers=workers)])
+
+    @pytest.mark.parametrize("queue_size", [0, "8"])
+    def test_invalid_queue_size_raises(self, queue_size):
+        with pytest.raises(ValueError):
+            run_pipeline([], [Stage("s", lambda x: x)], queue_size=queue_size)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import cv2
 import numpy as np
 import pytest
 
@@ -43,3 +44,100 @@ class TestResizeImage:
     def test_invalid_size_raises(self, sample_bgr_image, size):
         with pytest.raises(ValueError):
             resize_image(image=sample_bgr_image, new_size=size)
+
+
+class TestInterpolation:
+    @pytest.fixture
+    def checker_image(self):
+        from ImagePRO.utils.image import Image
+
+        ys, xs = np.mgrid[0:64, 0:96]
+        checker = (((xs + ys) % 2) * 255).astype(np.uint8)
+        return Image.from_array(np.dstack([checker] * 3))
+
+    def test_auto_uses_area_when_shrinking(self, checker_image):
+        result = resize_image(image=checker_image, new_size=(24, 16))
+        assert result.meta["interpolation"] == "area"
+        # Area averaging turns a 1-px checkerboard into flat mid-gray
+        assert np.abs(result.image.astype(int) - 128).max() <= 1
+
+    def test_auto_uses_linear_when_enlarging(self, sample_bgr_image):
+        result = resize_image(image=sample_bgr_image, new_size=(64, 48))
+        assert result.meta["interpolation"] == "linear"
+
+    def test_explicit_interpolation_matches_cv2(self, sample_bgr_array, sample_bgr_image):
+        result = resize_image(image=sample_bgr_image, new_size=(10, 8), interpolation="cubic")
+        expected = cv2.resize(sample_bgr_array, (10, 8), interpolation=cv2.INTER_CUBIC)
+        assert np.array_equal(result.image, expected)
+
+    def test_pyramid_downscale(self, checker_image):
+        result = resize_image(image=checker_image, new_size=(12, 8), interpolation="pyramid")
+        assert result.image.shape == (8, 12, 3)
+        assert result.meta["interpolation"] == "pyramid"
+        assert np.abs(result.image.astype(int) - 128).max() <= 2
+
+    def test_pyramid_falls_back_to_linear_when_enlarging(self, sample_bgr_image):
+        result = resize_image(image=sample_bgr_image, new_size=(64, 48), interpolation="pyramid")
+        assert result.meta["interpolation"] == "linear"
+
+    @pytest.mark.parametrize("interpolation", ["bilinear", cv2.INTER_LINEAR, None])
+    def test_invalid_interpolation_raises(self, sample_bgr_image, interpolation):
+        with pytest.raises(ValueError):
+            resize_image(image=sample_bgr_image, new_size=(8, 8), interpolation=interpolation)
+
+
+class TestAspectModes:
+    @pytest.fixture
+    def wide_image(self):
+        from ImagePRO.utils.image import Image
+
+        return Image.from_array(np.full((50, 100, 3), 200, np.uint8))
+
+    def test_stretch_is_default(self, wide_image):
+        result = resize_image(image=wide_image, new_size=(20, 20))
+        assert result.meta["mode"] == "stretch"
+        assert result.image.shape == (20, 20, 3)
+        assert result.meta["scale"] == (0.2, 0.4)
+
+    def test_fit_keeps_aspect_ratio(self, wide_image):
+        result = resize_image(image=wide_image, new_size=(40, 40), mode="fit")
+        assert result.image.shape == (20, 40, 3)
+        assert result.meta["scale"] == (0.4, 0.4)
+        assert result.meta["offset"] == (0.0, 0.0)
+
+    def test_fill_covers_and_center_crops(self, sample_bgr_array, sample_bgr_image):
+        # 32x24 source into a square: crop the central 24x24 region
+        result = resize_image(image=sample_bgr_image, new_size=(24, 24), mode="fill")
+        assert result.image.shape == (24, 24, 3)
+        assert np.array_equal(result.image, sample_bgr_array[:, 4:28])
+        assert result.meta["offset"] == (-4.0, 0.0)
+
+    def test_letterbox_pads_to_exact_size(self, wide_image):
+        result = resize_image(
+            image=wide_image, new_size=(40, 40), mode="letterbox", pad_color=114
+        )
+        assert result.image.shape == (40, 40, 3)
+        assert np.all(result.image[10:30] == 200)
+        assert np.all(result.image[:10] == 114)
+        assert np.all(result.image[30:] == 114)
+        assert result.meta["offset"] == (0.0, 10.0)
+
+    def test_letterbox_mapping_locates_source_pixels(self, wide_image):
+        result = resize_image(image=wide_image, new_size=(64, 64), mode="letterbox")
+        sx, sy = result.meta["scale"]
+        dx, dy = result.meta["offset"]
+        # Bottom-right source corner maps onto the last content pixel row/col
+        assert (100 * sx + dx, 50 * sy + dy) == (64.0, 48.0)
+
+    def test_letterbox_grayscale(self):
+        from ImagePRO.utils.image import Image
+
+        image = Image.from_array(np.full((10, 20), 50, np.uint8), colorspace="GRAY")
+        result = resize_image(image=image, new_size=(20, 20), mode="letterbox", pad_color=7)
+        assert result.image.shape == (20, 20)
+        assert result.image[0, 0] == 7
+
+    @pytest.mark.parametrize("mode", ["crop", "FIT", None])
+    def test_invalid_mode_raises(self, sample_bgr_image, mode):
+        with pytest.raises(ValueError):
+            resize_image(image=sample_bgr_image, new_size=(8, 8), mode=mode)
@@ -0,0 +1,146 @@
+"""Unit tests for ImagePRO.human_analysis.roi_tracking."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ImagePRO.human_analysis.roi_tracking import RoiTracker
+from ImagePRO.utils.image import Image
+from ImagePRO.utils.result import Result
+
+
+def frame_with_square(x, y, size=20, shape=(240, 320)):
+    frame = np.zeros((*shape, 3), dtype=np.uint8)
+    frame[y:y + size, x:x + size] = 255
+    return Image.from_array(frame)
+
+
+class SquareDetector:
+    """Fake landmark model: two corner landmarks of the bright square."""
+
+    def __init__(self, nested=True):
+        self.nested = nested
+        self.input_shapes = []
+
+    def __call__(self, image):
+        self.input_shapes.append(image.shape[:2])
+        ys, xs = np.nonzero(image._data[..., 0] > 200)
+        if xs.size == 0:
+            return Result(image=None, data=[] if not self.nested else None, meta={})
+        h, w = image.shape[:2]
+        rows = [
+            [0, 0, xs.min() / w, ys.min() / h, 0.1],
+            [0, 1, (xs.max() + 1) / w, (ys.max() + 1) / h, 0.2],
+        ]
+        annotated = image._data.copy()
+        annotated[..., 1] = 7
+        return Result(image=annotated, data=[rows] if self.nested else rows, meta={})
+
+
+class TestRoiTracker:
+    def test_first_frame_is_a_full_keyframe(self):
+        detector = SquareDetector()
+        tracker = RoiTracker(detector)
+        result = tracker.process(frame_with_square(100, 80))
+        assert result.meta["keyframe"] is True
+        assert result.meta["roi"] is None
+        assert detector.input_shapes == [(240, 320)]
+
+    def test_between_keyframes_only_the_crop_is_analyzed(self):
+        detector = SquareDetector()
+        tracker = RoiTracker(detector, keyframe_interval=5)
+        for _ in range(5):
+            tracker.process(frame_with_square(100, 80))
+        assert detector.input_shapes[0] == (240, 320)
+        assert all(shape[0] < 240 and shape[1] < 320 for shape in detector.input_shapes[1:])
+        assert tracker.keyframes == 1
+        tracker.process(frame_with_square(100, 80))
+        assert detector.input_shapes[-1] == (240, 320)
+        assert tracker.keyframes == 2
+
+    def test_crop_results_are_mapped_to_frame_coordinates(self):
+        tracker = RoiTracker(SquareDetector(), roi_margin=0.5, min_roi_size=16)
+        full = tracker.process(frame_with_square(100, 80))
+        moved = tracker.process(frame_with_square(104, 82))
+        assert moved.meta["keyframe"] is False
+        face = moved.data[0]
+        assert face[0][:2] == [0, 0]
+        assert face[0][2] == pytest.approx(104 / 320)
+        assert face[0][3] == pytest.approx(82 / 240)
+        assert face[1][2] == pytest.approx(124 / 320)
+        assert face[1][3] == pytest.approx(102 / 240)
+        # z scales with the crop width
+        x1, _, x2, _ = moved.meta["roi"]
+        assert face[0][4] == pytest.approx(0.1 * (x2 - x1) / 320)
+        assert full.data[0][0][2] == pytest.approx(100 / 320)
+
+    def test_annotated_crop_is_pasted_into_full_frame(self):
+        tracker = RoiTracker(SquareDetector())
+        tracker.process(frame_with_square(100, 80))
+        image = frame_with_square(100, 80)
+        result = tracker.process(image)
+        x1, y1, x2, y2 = result.meta["roi"]
+        assert result.image.shape == (240, 320, 3)
+        assert np.all(result.image[y1:y2, x1:x2, 1] == 7)
+        assert np.all(result.image[:y1, :, 1] == 0)
+        assert result.meta["source"] is image
+        assert np.all(image._data[..., 1] != 7)  # source untouched
+
+    def test_flat_rows_are_supported(self):
+        tracker = RoiTracker(SquareDetector(nested=False))
+        tracker.process(frame_with_square(100, 80))
+        result = tracker.process(frame_with_square(102, 80))
+        assert result.meta["keyframe"] is False
+        assert result.data[0][2] == pytest.approx(102 / 320)
+
+    def test_lost_subject_triggers_full_redetection(self):
+        detector = SquareDetector()
+        tracker = RoiTracker(detector, roi_margin=0.2, min_roi_size=16)
+        tracker.process(frame_with_square(20, 20))
+        result = tracker.process(frame_with_square(250, 180))
+        assert result.meta["tracker_lost"] is True
+        assert result.meta["keyframe"] is True
+        assert result.data[0][0][2] == pytest.approx(250 / 320)
+        assert tracker.losses == 1
+        assert detector.input_shapes[-1] == (240, 320)
+
+    def test_no_subject_keeps_running_full_frames(self):
+        detector = SquareDetector()
+        tracker = RoiTracker(detector)
+        blank = Image.from_array(np.zeros((240, 320, 3), dtype=np.uint8))
+        for _ in range(3):
+            result = tracker.process(blank)
+        assert result.data is None
+        assert detector.input_shapes == [(240, 320)] * 3
+
+    def test_reset_forces_keyframe(self):
+        tracker = RoiTracker(SquareDetector())
+        tracker.process(frame_with_square(100, 80))
+        tracker.reset()
+        assert tracker.process(frame_with_square(100, 80)).meta["keyframe"] is True
+
+    def test_keyframe_interval_one_never_crops(self):
+        detector = SquareDetector()
+        tracker = RoiTracker(detector, keyframe_interval=1)
+        for _ in range(3):
+            tracker.process(frame_with_square(100, 80))
+        assert detector.input_shapes == [(240, 320)] * 3
+
+
+class TestRoiTrackerValidation:
+    def test_non_callable_raises(self):
+        with pytest.raises(TypeError):
+            RoiTracker(None)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"keyframe_interval": 0}, {"keyframe_interval": 2.5},
+        {"min_roi_size": 0}, {"roi_margin": -0.1},
+    ])
+    def test_invalid_settings_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            RoiTracker(SquareDetector(), **kwargs)
+
+    def test_non_image_raises(self):
+        with pytest.raises(TypeError):
+            RoiTracker(SquareDetector()).process(np.zeros((4, 4, 3)))
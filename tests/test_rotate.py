@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import cv2
 import numpy as np
 import pytest
 
+from ImagePRO.pre_processing.resize import resize_image
 from ImagePRO.pre_processing.rotate import (
+    RotationPlan,
+    apply_rotation_plan,
+    plan_rotation,
     rotate_image_180,
     rotate_image_270,
     rotate_image_90,
     rotate_image_custom,
 )
+from ImagePRO.utils.image import Image
 
 
 class TestFixedRotations:
@@ -83,3 +89,114 @@ class TestCustomRotation:
     def test_non_numeric_scale_raises(self, sample_bgr_image):
         with pytest.raises(ValueError):
             rotate_image_custom(image=sample_bgr_image, angle=30.0, scale="big")
+
+    def test_matches_direct_warp(self, sample_bgr_array, sample_bgr_image):
+        h, w = sample_bgr_array.shape[:2]
+        matrix = cv2.getRotationMatrix2D((w / 2, h / 2), 30.0, 1.2)
+        expected = cv2.warpAffine(sample_bgr_array, matrix, (w, h))
+        result = rotate_image_custom(image=sample_bgr_image, angle=30.0, scale=1.2)
+        assert np.array_equal(result.image, expected)
+
+    @pytest.mark.parametrize("angle,expected_shape", [(90.0, (32, 24, 3)), (45.0, (40, 40, 3))])
+    def test_expand_fits_rotated_image(self, sample_bgr_image, angle, expected_shape):
+        result = rotate_image_custom(image=sample_bgr_image, angle=angle, expand=True)
+        assert result.image.shape == expected_shape
+        assert result.meta["expand"] is True
+
+    def test_expand_keeps_all_pixels(self):
+        image = Image.from_array(np.full((24, 32, 3), 200, np.uint8))
+        result = rotate_image_custom(image=image, angle=90.0, expand=True)
+        assert result.image.shape == (32, 24, 3)
+        assert (result.image[1:-1, 1:-1] == 200).all()
+
+
+class TestRotationPlan:
+    def test_plans_are_cached(self):
+        first = plan_rotation((24, 32, 3), angle=15.0, scale=1.1)
+        assert plan_rotation((24, 32), angle=15, scale=1.1) is first
+        assert plan_rotation((24, 32), angle=16.0, scale=1.1) is not first
+
+    def test_plan_is_hashable_and_immutable(self):
+        plan = plan_rotation((24, 32), angle=10.0)
+        assert isinstance(plan, RotationPlan)
+        hash(plan)
+        with pytest.raises(AttributeError):
+            plan.output_size = (1, 1)
+
+    @pytest.fixture
+    def smooth_image(self):
+        ys, xs = np.mgrid[0:48, 0:64]
+        gray = (xs * 2 + ys * 1.5).astype(np.uint8)
+        return Image.from_array(np.dstack([gray, 255 - gray, gray // 2]))
+
+    def test_resize_only_plan_matches_cv2_resize(self, smooth_image):
+        plan = plan_rotation(smooth_image.shape, angle=0.0, resize_to=(40, 30))
+        fused = apply_rotation_plan(image=smooth_image, plan=plan).image
+        expected = cv2.resize(smooth_image._data, (40, 30), interpolation=cv2.INTER_LINEAR)
+        diff = np.abs(fused.astype(int) - expected.astype(int))
+        assert diff[1:-1, 1:-1].max() <= 1
+
+    def test_fused_resize_matches_resize_then_rotate(self, smooth_image):
+        plan = plan_rotation(smooth_image.shape, angle=20.0, scale=1.1, resize_to=(32, 32))
+        assert plan.output_size == (32, 32)
+        fused = apply_rotation_plan(image=smooth_image, plan=plan).image
+
+        resized = resize_image(
+            image=smooth_image, new_size=(32, 32), interpolation="linear"
+        ).image
+        sequential = rotate_image_custom(
+            image=Image.from_array(resized), angle=20.0, scale=1.1
+        ).image
+        diff = np.abs(fused.astype(int) - sequential.astype(int))
+        assert fused.shape == (32, 32, 3)
+        assert diff[4:-4, 4:-4].max() <= 3
+
+    def test_crop_box_translates_output(self, sample_bgr_array, sample_bgr_image):
+        plan = plan_rotation(sample_bgr_image.shape, angle=0.0, crop_box=(4, 2, 20, 12))
+        result = apply_rotation_plan(image=sample_bgr_image, plan=plan)
+        assert plan.output_size == (16, 10)
+        assert np.array_equal(result.image, sample_bgr_array[2:12, 4:20])
+
+    def test_remap_matches_warp_affine(self, smooth_image):
+        plan = plan_rotation(smooth_image.shape, angle=33.0, scale=0.9, expand=True)
+        warped = apply_rotation_plan(image=smooth_image, plan=plan).image
+        remapped = apply_rotation_plan(image=smooth_image, plan=plan, use_remap=True)
+        assert remapped.meta["use_remap"] is True
+
+        # Compare away from the rotated borders, where border blending differs
+        support = apply_rotation_plan(
+            image=Image.from_array(np.full(smooth_image.shape, 255, np.uint8)), plan=plan
+        ).image
+        inside = cv2.erode((support == 255).all(axis=-1).astype(np.uint8), np.ones((3, 3))) > 0
+        diff = np.abs(warped.astype(int) - remapped.image.astype(int))
+        assert inside.sum() > 0
+        assert diff[inside].max() <= 1
+
+    def test_shape_mismatch_raises(self, sample_bgr_image):
+        plan = plan_rotation((10, 10), angle=5.0)
+        with pytest.raises(ValueError):
+            apply_rotation_plan(image=sample_bgr_image, plan=plan)
+
+    def test_non_plan_raises(self, sample_bgr_image):
+        with pytest.raises(TypeError):
+            apply_rotation_plan(image=sample_bgr_image, plan=np.eye(2, 3))
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"resize_to": (0, 10)},
+            {"resize_to": [10, 10]},
+            {"crop_box": (5, 5, 2, 8)},
+            {"crop_box": (-1, 0, 4, 4)},
+            {"crop_box": (0, 0, 100, 4)},
+            {"scale": 0},
+        ],
+    )
+    def test_invalid_plan_arguments_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            plan_rotation((24, 32), angle=10.0, **kwargs)
+
+    @pytest.mark.parametrize("shape", [(24,), "24x32", (0, 32)])
+    def test_invalid_shape_raises(self, shape):
+        with pytest.raises(TypeError):
+            plan_rotation(shape, angle=10.0)
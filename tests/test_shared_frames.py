@@ -0,0 +1,138 @@
+"""Unit tests for ImagePRO.utils.shared_frames."""
+
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from ImagePRO.utils.image import Image
+from ImagePRO.utils.shared_frames import FrameRef, SharedFrameRing
+
+
+@pytest.fixture
+def ring():
+    ring = SharedFrameRing.create(slots=3, slot_bytes=32 * 24 * 3)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def _mean_in_worker(ring, ref):
+    # Runs in a child process: attach by name, read zero-copy, return a scalar
+    image = ring.read(ref)
+    shared = image.source_type == "shared" and not image._data.flags.writeable
+    mean = float(image._data.mean())
+    del image
+    ring.close()
+    return mean, shared
+
+
+class TestWriteRead:
+    def test_round_trip_keeps_shape_dtype_and_colorspace(self, ring, sample_bgr_array):
+        ref = ring.write(Image.from_array(sample_bgr_array, colorspace="RGB"))
+        image = ring.read(ref)
+        assert isinstance(ref, FrameRef)
+        assert image.source_type == "shared"
+        assert image.colorspace == "RGB"
+        assert image.dtype == np.uint8
+        assert np.array_equal(image._data, sample_bgr_array)
+
+    def test_read_is_a_read_only_view(self, ring, sample_bgr_array):
+        image = ring.read(ring.write(sample_bgr_array))
+        assert not image._data.flags.writeable
+        assert not image._data.flags.owndata
+        with pytest.raises(ValueError):
+            image._data[0, 0, 0] = 1
+
+    def test_copy_detaches(self, ring, sample_bgr_array):
+        image = ring.read(ring.write(sample_bgr_array), copy=True)
+        assert image._data.flags.writeable
+        image._data[:] = 0
+
+    def test_other_dtypes_and_grayscale(self, ring):
+        depth = np.arange(20 * 10, dtype=np.float32).reshape(20, 10)
+        gray = np.arange(12 * 10, dtype=np.uint16).reshape(12, 10)
+        depth_ref = ring.write(depth, colorspace="GRAY")
+        gray_ref = ring.write(Image.from_array(gray, colorspace="GRAY"))
+        assert np.array_equal(ring.read(depth_ref)._data, depth)
+        assert ring.read(gray_ref).dtype == np.uint16
+        assert ring.read(gray_ref).colorspace == "GRAY"
+
+    def test_slots_are_reused_round_robin(self, ring, sample_bgr_array):
+        refs = [ring.write(sample_bgr_array + i) for i in range(4)]
+        assert [r.slot for r in refs] == [0, 1, 2, 0]
+        assert [r.seq for r in refs] == [1, 2, 3, 4]
+        with pytest.raises(RuntimeError, match="overwritten"):
+            ring.read(refs[0])
+        assert np.array_equal(ring.read(refs[3])._data, sample_bgr_array + 3)
+
+    def test_attach_sees_written_frames(self, ring, sample_bgr_array):
+        ref = ring.write(sample_bgr_array)
+        other = SharedFrameRing.attach(ring.name)
+        assert (other.slots, other.slot_bytes) == (ring.slots, ring.slot_bytes)
+        image = other.read(ref)
+        assert np.array_equal(image._data, sample_bgr_array)
+        del image
+        other.close()
+
+    def test_pickles_as_attachment(self, ring, sample_bgr_array):
+        ref = ring.write(sample_bgr_array)
+        clone = pickle.loads(pickle.dumps(ring))
+        assert clone.name == ring.name
+        assert np.array_equal(clone.read(ref)._data, sample_bgr_array)
+        clone.close()
+
+    def test_worker_process_reads_without_pickling_pixels(self, ring, sample_bgr_array):
+        refs = [ring.write(sample_bgr_array // (i + 1)) for i in range(3)]
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(_mean_in_worker, [ring] * 3, refs))
+        expected = [float((sample_bgr_array // (i + 1)).mean()) for i in range(3)]
+        assert [mean for mean, _ in results] == pytest.approx(expected)
+        assert all(shared for _, shared in results)
+
+
+class TestValidation:
+    @pytest.mark.parametrize("kwargs", [{"slots": 0, "slot_bytes": 8}, {"slots": 2, "slot_bytes": -1}])
+    def test_invalid_create_raises(self, kwargs):
+        with pytest.raises(ValueError):
+            SharedFrameRing.create(**kwargs)
+
+    def test_oversized_frame_raises(self, ring):
+        with pytest.raises(ValueError):
+            ring.write(np.zeros((64, 64, 3), np.uint8))
+
+    def test_invalid_frames_raise(self, ring):
+        with pytest.raises(TypeError):
+            ring.write([1, 2, 3])
+        with pytest.raises(TypeError):
+            ring.write(np.array([object()]))
+        with pytest.raises(ValueError):
+            ring.write(np.zeros((1, 1, 1, 1, 1), np.uint8))
+
+    def test_invalid_refs_raise(self, ring):
+        with pytest.raises(TypeError):
+            ring.read((0, 1))
+        with pytest.raises(ValueError):
+            ring.read(FrameRef(slot=5, seq=1))
+        with pytest.raises(RuntimeError):
+            ring.read(FrameRef(slot=0, seq=1))  # never written
+
+    def test_attach_to_non_ring_block_raises(self):
+        from multiprocessing import shared_memory
+
+        block = shared_memory.SharedMemory(create=True, size=128)
+        try:
+            with pytest.raises(ValueError):
+                SharedFrameRing.attach(block.name)
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_context_manager_unlinks_owner(self):
+        with SharedFrameRing.create(slots=1, slot_bytes=8) as ring:
+            name = ring.name
+        with pytest.raises(FileNotFoundError):
+            SharedFrameRing.attach(name)
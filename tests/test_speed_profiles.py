@@ -0,0 +1,193 @@
+"""Unit tests for the MediaPipe speed profiles (detectors faked)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import mediapipe as mp
+import pytest
+
+from fakes import FakeFaceMesh, FakeHands, FakePose, make_landmarks
+from ImagePRO.human_analysis import worker_pool
+from ImagePRO.human_analysis.body_analysis.body_pose_estimation import detect_body_pose
+from ImagePRO.human_analysis.body_analysis.hand_tracking import detect_hands, detect_hands_live
+from ImagePRO.human_analysis.face_analysis.eye_status_analysis import analyze_eye_status, analyze_eyes
+from ImagePRO.human_analysis.face_analysis.face_detection import detect_faces
+from ImagePRO.human_analysis.face_analysis.face_mesh_analysis import analyze_face_mesh
+from ImagePRO.human_analysis.face_analysis.head_pose_estimation import estimate_head_pose
+from ImagePRO.human_analysis.speed_profiles import (
+    PROFILE_SETTINGS,
+    SPEED_PROFILES,
+    benchmark_speed_profiles,
+    profile_settings,
+)
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Record every solution the code under test constructs."""
+    instances = []
+
+    def factory(cls, result=None):
+        def build(**kwargs):
+            instances.append(cls(result, **kwargs))
+            return instances[-1]
+        return build
+
+    monkeypatch.setattr(mp.solutions.face_mesh, "FaceMesh", factory(FakeFaceMesh))
+    monkeypatch.setattr(mp.solutions.hands, "Hands", factory(FakeHands))
+    monkeypatch.setattr(
+        mp.solutions.pose,
+        "Pose",
+        factory(FakePose, SimpleNamespace(pose_landmarks=make_landmarks([[(0, 0.4, 0.5, 0.6)]])[0])),
+    )
+    return instances
+
+
+class TestProfileSettings:
+    @pytest.mark.parametrize("speed_profile", SPEED_PROFILES)
+    def test_every_profile_covers_every_solution(self, speed_profile):
+        assert set(PROFILE_SETTINGS[speed_profile]) == {"face_mesh", "hands", "body_pose"}
+
+    def test_balanced_matches_previous_defaults(self):
+        assert profile_settings("balanced", "face_mesh") == {"refine_landmarks": True}
+        assert profile_settings("balanced", "hands") == {"model_complexity": 1}
+        assert profile_settings("balanced", "body_pose") == {"model_complexity": 1}
+
+    def test_profiles_order_by_cost(self):
+        complexities = [profile_settings(p, "body_pose")["model_complexity"] for p in SPEED_PROFILES]
+        assert complexities == [0, 1, 2]
+        assert profile_settings("fast", "face_mesh") == {"refine_landmarks": False}
+
+    def test_returns_a_copy(self):
+        profile_settings("fast", "hands")["model_complexity"] = 5
+        assert profile_settings("fast", "hands") == {"model_complexity": 0}
+
+    @pytest.mark.parametrize("speed_profile, solution", [
+        ("turbo", "face_mesh"),
+        ("fast", "objects"),
+        (None, "hands"),
+    ])
+    def test_invalid_raises(self, speed_profile, solution):
+        with pytest.raises(ValueError):
+            profile_settings(speed_profile, solution)
+
+
+class TestAnalysisFunctions:
+    def test_face_mesh_default_keeps_refinement(self, created, sample_bgr_image):
+        result = analyze_face_mesh(image=sample_bgr_image)
+        assert created[0].kwargs["refine_landmarks"] is True
+        assert result.meta["speed_profile"] == "balanced"
+
+    def test_face_mesh_fast_skips_refinement(self, created, sample_bgr_image):
+        result = analyze_face_mesh(image=sample_bgr_image, speed_profile="fast")
+        assert created[0].kwargs["refine_landmarks"] is False
+        assert created[0].kwargs["static_image_mode"] is True
+        assert result.meta["speed_profile"] == "fast"
+
+    @pytest.mark.parametrize("analyze", [
+        estimate_head_pose, analyze_eyes, analyze_eye_status, detect_faces,
+    ])
+    def test_face_mesh_callers_forward_profile(self, created, sample_bgr_image, analyze):
+        analyze(image=sample_bgr_image, speed_profile="fast")
+        assert [mesh.kwargs["refine_landmarks"] for mesh in created] == [False]
+
+    def test_body_pose_model_complexity(self, created, sample_bgr_image):
+        result = detect_body_pose(image=sample_bgr_image, speed_profile="accurate")
+        assert created[0].kwargs["model_complexity"] == 2
+        assert result.meta["speed_profile"] == "accurate"
+
+    def test_hands_model_complexity(self, created, sample_bgr_image):
+        detect_hands(image=sample_bgr_image, speed_profile="fast")
+        assert created[0].kwargs["model_complexity"] == 0
+
+    def test_given_solution_is_used_as_is(self, created, sample_bgr_image):
+        mesh = FakeFaceMesh()
+        analyze_face_mesh(image=sample_bgr_image, face_mesh_obj=mesh, speed_profile="fast")
+        assert created == []
+        assert len(mesh.processed_images) == 1
+
+    def test_live_forwards_profile(self, created, sample_bgr_array):
+        detect_hands_live(source=[sample_bgr_array], display=False, speed_profile="fast")
+        assert len(created) == 1
+        assert created[0].kwargs["model_complexity"] == 0
+
+    @pytest.mark.parametrize("analyze", [
+        analyze_face_mesh, estimate_head_pose, analyze_eyes, analyze_eye_status,
+        detect_faces, detect_hands, detect_body_pose,
+    ])
+    def test_invalid_profile_raises(self, created, sample_bgr_image, analyze):
+        with pytest.raises(ValueError, match="speed_profile"):
+            analyze(image=sample_bgr_image, speed_profile="turbo")
+        assert created == []
+
+
+class TestWorkerPool:
+    @pytest.mark.parametrize("task, key, expected", [
+        ("face_mesh", "refine_landmarks", False),
+        ("hands", "model_complexity", 0),
+        ("body_pose", "model_complexity", 0),
+    ])
+    def test_worker_solution_uses_profile(self, created, monkeypatch, task, key, expected):
+        monkeypatch.setattr(worker_pool, "_worker_state", {})
+        worker_pool._init_worker(task, {"speed_profile": "fast"}, False)
+        assert created[0].kwargs[key] == expected
+
+    def test_invalid_profile_raises_before_starting_workers(self):
+        with pytest.raises(ValueError, match="speed_profile"):
+            worker_pool.MediaPipePool("hands", processes=1, options={"speed_profile": "turbo"})
+
+
+class TestBenchmarkSpeedProfiles:
+    def test_reports_every_profile(self, created, sample_bgr_image):
+        result = benchmark_speed_profiles([sample_bgr_image] * 3, solution="body_pose", repeats=2)
+        assert list(result.data) == list(SPEED_PROFILES)
+        for speed_profile, stats in result.data.items():
+            assert stats["frames"] == 6
+            assert stats["detected"] == 6
+            assert 0 <= stats["p50_ms"] <= stats["p95_ms"]
+            assert stats["mean_ms"] >= 0
+        # One long-lived solution per profile, including the warm-up call
+        assert [pose.kwargs["model_complexity"] for pose in created] == [0, 1, 2]
+        assert all(len(pose.processed_images) == 7 for pose in created)
+        assert all(pose.closed for pose in created)
+        assert result.meta["solution"] == "body_pose"
+
+    def test_model_is_closed_when_analysis_fails(self, monkeypatch, sample_bgr_image):
+        class FailingHands(FakeHands):
+            instances = []
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.instances.append(self)
+
+            def process(self, image):
+                raise RuntimeError("graph failed")
+
+        monkeypatch.setattr(mp.solutions.hands, "Hands", FailingHands)
+        with pytest.raises(RuntimeError):
+            benchmark_speed_profiles([sample_bgr_image], solution="hands", speed_profiles=["fast"])
+        assert FailingHands.instances[0].closed
+
+    def test_subset_of_profiles(self, created, sample_bgr_image):
+        result = benchmark_speed_profiles([sample_bgr_image], speed_profiles=["fast"])
+        assert list(result.data) == ["fast"]
+        assert result.data["fast"]["detected"] == 0
+        assert created[0].kwargs["refine_landmarks"] is False
+
+    @pytest.mark.parametrize("kwargs", [
+        {"images": []},
+        {"repeats": 0},
+        {"repeats": True},
+        {"speed_profiles": ["turbo"]},
+        {"solution": "objects"},
+    ])
+    def test_invalid_arguments_raise(self, created, sample_bgr_image, kwargs):
+        kwargs = {"images": [sample_bgr_image], **kwargs}
+        with pytest.raises(ValueError):
+            benchmark_speed_profiles(**kwargs)
+        assert created == []
+
+    def test_non_image_raises(self):
+        with pytest.raises(TypeError):
+            benchmark_speed_profiles(["frame.png"])
@@ -0,0 +1,128 @@
+"""Unit tests for ImagePRO.utils.temporal."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ImagePRO.utils.temporal import AdaptiveFrameScheduler, OneEuroFilter, TrackSmoother
+
+
+class TestOneEuroFilter:
+    def test_first_sample_passes_through(self):
+        filt = OneEuroFilter()
+        assert np.array_equal(filt([1.0, 2.0], 0.0), [1.0, 2.0])
+
+    def test_reduces_jitter_of_static_signal(self):
+        rng = np.random.default_rng(0)
+        noisy = 10.0 + rng.normal(0, 1.0, size=200)
+        filt = OneEuroFilter(min_cutoff=0.5, beta=0.0)
+        smoothed = np.array([filt([v], i / 30)[0] for i, v in enumerate(noisy)])
+        assert smoothed[50:].std() < noisy[50:].std() / 2
+
+    def test_follows_fast_motion_with_beta(self):
+        ramp = np.arange(60, dtype=float) * 5.0
+        lagging = OneEuroFilter(min_cutoff=0.5, beta=0.0)
+        adaptive = OneEuroFilter(min_cutoff=0.5, beta=1.0)
+        for i, v in enumerate(ramp):
+            slow = lagging([v], i / 30)[0]
+            fast = adaptive([v], i / 30)[0]
+        assert abs(ramp[-1] - fast) < abs(ramp[-1] - slow)
+
+    def test_predict_extrapolates_along_speed_and_clamps(self):
+        filt = OneEuroFilter(min_cutoff=100.0, d_cutoff=100.0, max_extrapolation=0.5)
+        for i in range(30):
+            filt([i * 1.0], i * 0.1)  # 10 units per second
+        value_now = filt.predict(2.9)[0]
+        assert filt.predict(3.0)[0] == pytest.approx(value_now + 1.0, rel=0.05)
+        assert filt.predict(100.0)[0] == pytest.approx(filt.predict(3.4)[0])
+
+    def test_predict_before_samples_is_none(self):
+        assert OneEuroFilter().predict(1.0) is None
+
+    def test_shape_change_raises(self):
+        filt = OneEuroFilter()
+        filt([1.0, 2.0], 0.0)
+        with pytest.raises(ValueError):
+            filt([1.0], 0.1)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"min_cutoff": 0}, {"d_cutoff": -1}, {"beta": -0.1}, {"max_extrapolation": -1},
+    ])
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            OneEuroFilter(**kwargs)
+
+
+class TestTrackSmoother:
+    def test_tracks_are_independent_and_dropped_when_missing(self):
+        smoother = TrackSmoother()
+        smoother.update([0, 1], [[0.0, 0.0], [50.0, 50.0]], timestamp=0.0)
+        ids, values = smoother.update([1], [[52.0, 52.0]], timestamp=0.1)
+        assert ids == [1]
+        assert 50.0 < values[0, 0] <= 52.0
+        assert smoother.ids == [1]
+
+    def test_predict_returns_every_track(self):
+        smoother = TrackSmoother()
+        smoother.update(["a", "b"], [[1.0], [2.0]], timestamp=0.0)
+        ids, values = smoother.predict(0.05)
+        assert ids == ["a", "b"]
+        assert values.shape == (2, 1)
+
+    def test_empty_update_clears_tracks(self):
+        smoother = TrackSmoother()
+        smoother.update([0], [[1.0]], timestamp=0.0)
+        ids, values = smoother.update([], [], timestamp=0.1)
+        assert ids == [] and values.size == 0
+        assert smoother.predict(0.2)[0] == []
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            TrackSmoother().update([0, 1], [[1.0]], timestamp=0.0)
+
+    def test_invalid_filter_option_raises(self):
+        with pytest.raises(ValueError):
+            TrackSmoother(beta=-1)
+
+
+class TestAdaptiveFrameScheduler:
+    def run(self, scheduler, inference_seconds, frames=90, fps=30):
+        decisions = []
+        for i in range(frames):
+            t = i / fps
+            process = scheduler.should_process(t)
+            decisions.append(process)
+            if process:
+                scheduler.record(inference_seconds)
+        return decisions
+
+    def test_fast_model_is_run_just_often_enough_for_target(self):
+        scheduler = AdaptiveFrameScheduler(target_latency=0.1)
+        decisions = self.run(scheduler, inference_seconds=0.02)
+        # Interval is 80 ms, so about one in three frames at 30 FPS
+        assert 25 <= sum(decisions) <= 40
+        assert scheduler.processed + scheduler.skipped == 90
+
+    def test_slow_model_never_builds_a_backlog(self):
+        scheduler = AdaptiveFrameScheduler(target_latency=0.05)
+        decisions = self.run(scheduler, inference_seconds=0.2)
+        # One inference every 200 ms at most
+        assert sum(decisions) <= 90 * (1 / 30) / 0.2 + 2
+
+    def test_first_frame_is_always_processed(self):
+        assert AdaptiveFrameScheduler().should_process(0.0)
+
+    def test_interval_uses_ema(self):
+        scheduler = AdaptiveFrameScheduler(target_latency=1.0, timing_alpha=0.5)
+        scheduler.record(0.1)
+        scheduler.record(0.3)
+        assert scheduler.inference_seconds == pytest.approx(0.2)
+        assert scheduler.interval == pytest.approx(0.8)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"target_latency": 0}, {"target_latency": -1}, {"timing_alpha": 0}, {"timing_alpha": 1.5},
+    ])
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveFrameScheduler(**kwargs)
@@ -0,0 +1,150 @@
+"""Unit tests for the MediaPipe process-pool worker farm (detectors faked)."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from types import SimpleNamespace
+
+import cv2
+import mediapipe as mp
+import numpy as np
+import pytest
+
+from fakes import FakeFaceMesh, FakeHands, FakePose, make_landmarks
+from ImagePRO.human_analysis.worker_pool import MediaPipePool
+from ImagePRO.utils.image import Image
+
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="worker processes only inherit the faked detectors when forked",
+)
+
+
+class BrightnessFaceMesh(FakeFaceMesh):
+    """Reports one landmark whose x encodes the mean brightness of the frame."""
+
+    instances = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        type(self).instances += 1
+
+    def process(self, image):
+        self.processed_images.append(image)
+        faces = make_landmarks([[(1, float(image.mean()) / 255, 0.5, 0.0)]])
+        # The landmark z reports how many images this instance has processed
+        faces[0].landmark[2] = SimpleNamespace(x=0.0, y=0.0, z=len(self.processed_images))
+        return SimpleNamespace(multi_face_landmarks=faces)
+
+
+@pytest.fixture
+def fake_solutions(monkeypatch):
+    monkeypatch.setattr(mp.solutions.face_mesh, "FaceMesh", BrightnessFaceMesh)
+    monkeypatch.setattr(
+        mp.solutions.hands,
+        "Hands",
+        lambda **kw: FakeHands(
+            SimpleNamespace(multi_hand_landmarks=make_landmarks([[(0, 0.1, 0.2, 0.3)]], total_points=21)),
+            **kw,
+        ),
+    )
+    monkeypatch.setattr(
+        mp.solutions.pose,
+        "Pose",
+        lambda **kw: FakePose(
+            SimpleNamespace(pose_landmarks=make_landmarks([[(0, 0.4, 0.5, 0.6)]], total_points=33)[0]),
+            **kw,
+        ),
+    )
+
+
+def frames(count):
+    return [np.full((24, 32, 3), 10 * i, np.uint8) for i in range(count)]
+
+
+class TestMediaPipePool:
+    @pytest.mark.parametrize("shared_memory", [True, False])
+    def test_results_are_in_input_order(self, fake_solutions, shared_memory):
+        inputs = frames(12)
+        with MediaPipePool(
+            "face_mesh", processes=3, options={"landmarks_idx": [1]}, shared_memory=shared_memory
+        ) as pool:
+            results = list(pool.map(inputs))
+        assert len(results) == 12
+        xs = [r.data[0][0][2] for r in results]
+        assert xs == pytest.approx([10 * i / 255 for i in range(12)])
+        assert all(r.meta["source"] is item for r, item in zip(results, inputs))
+
+    def test_solution_is_reused_per_worker(self, fake_solutions):
+        with MediaPipePool("face_mesh", processes=2, options={"landmarks_idx": [2]}) as pool:
+            results = list(pool.map(frames(10)))
+        pids = {r.meta["worker_pid"] for r in results}
+        assert os.getpid() not in pids
+        # Per-instance call counters keep growing instead of restarting at 1
+        assert max(r.data[0][0][4] for r in results) > 1
+        assert sum(1 for r in results if r.data[0][0][4] == 1) <= len(pids)
+
+    def test_results_are_compact_by_default(self, fake_solutions):
+        with MediaPipePool("face_mesh", processes=1) as pool:
+            (compact,) = pool.map(frames(1))
+        with MediaPipePool("face_mesh", processes=1, include_image=True) as pool:
+            (full,) = pool.map(frames(1))
+        assert compact.image is None
+        assert full.image.shape == (24, 32, 3)
+        assert compact.meta["operation"] == "analyze_face_mesh"
+
+    def test_paths_and_images(self, fake_solutions, tmp_path):
+        path = tmp_path / "frame.png"
+        cv2.imwrite(str(path), np.full((8, 8, 3), 51, np.uint8))
+        image = Image.from_array(np.full((8, 8, 3), 102, np.uint8))
+        with MediaPipePool("face_mesh", processes=2, options={"landmarks_idx": [1]}) as pool:
+            by_path, by_image = pool.map([path, image])
+        assert by_path.data[0][0][2] == pytest.approx(0.2)
+        assert by_image.data[0][0][2] == pytest.approx(0.4)
+        assert by_path.meta["source"] == path
+
+    def test_long_stream_reuses_ring_slots(self, fake_solutions):
+        inputs = (np.full((16, 16, 3), i % 256, np.uint8) for i in range(50))
+        with MediaPipePool("face_mesh", processes=2, options={"landmarks_idx": [1]}) as pool:
+            xs = [r.data[0][0][2] for r in pool.map(inputs)]
+        assert xs == pytest.approx([i / 255 for i in range(50)])
+
+    def test_hands_and_body_pose(self, fake_solutions):
+        with MediaPipePool("hands", processes=1, options={"max_hands": 1}) as pool:
+            (hands,) = pool.map(frames(1))
+        with MediaPipePool("body_pose", processes=1, options={"landmarks_idx": [0]}) as pool:
+            (pose,) = pool.map(frames(1))
+        assert hands.meta["operation"] == "detect_hands"
+        assert pose.data == [[0, 0.4, 0.5, 0.6]]
+
+    def test_worker_errors_propagate(self, fake_solutions):
+        with MediaPipePool("face_mesh", processes=1) as pool:
+            with pytest.raises(ValueError):
+                list(pool.map(["missing.png"]))
+
+    def test_closed_pool_raises(self, fake_solutions):
+        pool = MediaPipePool("face_mesh", processes=1)
+        pool.close()
+        with pytest.raises(RuntimeError):
+            list(pool.map(frames(1)))
+
+
+class TestValidation:
+    def test_invalid_task_raises(self):
+        with pytest.raises(ValueError):
+            MediaPipePool("objects")
+
+    @pytest.mark.parametrize("processes", [0, -2, 1.5])
+    def test_invalid_processes_raise(self, processes):
+        with pytest.raises(ValueError):
+            MediaPipePool("hands", processes=processes)
+
+    def test_unknown_option_raises(self):
+        with pytest.raises(ValueError, match="max_faces"):
+            MediaPipePool("hands", options={"max_faces": 2})
+
+    def test_invalid_item_raises(self, fake_solutions):
+        with MediaPipePool("face_mesh", processes=1) as pool:
+            with pytest.raises(TypeError):
+                list(pool.map([42]))